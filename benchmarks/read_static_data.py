@@ -0,0 +1,78 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Time the vectorised decode of static synaptic rows against decoding\
+    each row on its own.
+
+Run from the top of the repository with::
+
+    python -m benchmarks.read_static_data [row_count ...]
+"""
+
+import sys
+import time
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsStatic)
+from spynnaker.pyNN.models.neuron.synapse_io import (
+    _get_row_data, _read_static_data)
+import spynnaker8
+from unittests.model_tests.neuron.test_synapse_io import (
+    _random_connections, _read_static_data_per_row)
+
+#: The numbers of rows timed if none are given
+ROW_COUNTS = (100, 1000, 10000, 100000)
+
+#: The number of synapses in each row
+N_PER_ROW = 16
+
+
+def benchmark_read_static_data(row_counts=ROW_COUNTS):
+    """ Time the vectorised decode of static rows against decoding each\
+        row on its own
+
+    :param iterable(int) row_counts: The numbers of rows to decode
+    :return: The number of rows, and the time of the per-row and the
+        vectorised decodes of each
+    :rtype: list(tuple(int, float, float))
+    """
+    spynnaker8.setup()
+    post_slice = Slice(0, 255)
+    dynamics = SynapseDynamicsStatic()
+    results = []
+    for n_rows in row_counts:
+        pre_slice = Slice(0, n_rows - 1)
+        connections = _random_connections(n_rows, N_PER_ROW, post_slice)
+        row_data = _get_row_data(
+            connections, connections["source"], n_rows, post_slice, 2,
+            dynamics, 2 * N_PER_ROW, 2 * N_PER_ROW).reshape(n_rows, -1)
+        start = time.perf_counter()
+        _read_static_data_per_row(
+            pre_slice, post_slice, 2, row_data, False, 16)
+        per_row = time.perf_counter() - start
+        start = time.perf_counter()
+        _read_static_data(
+            dynamics, pre_slice, post_slice, 2, row_data, False, 16)
+        vectorised = time.perf_counter() - start
+        results.append((n_rows, per_row, vectorised))
+    return results
+
+
+if __name__ == "__main__":
+    _row_counts = [int(arg) for arg in sys.argv[1:]] or ROW_COUNTS
+    for _n_rows, _per_row, _vectorised in benchmark_read_static_data(
+            _row_counts):
+        print("{} rows: per-row {:.4f}s, vectorised {:.4f}s ({:.1f}x)".format(
+            _n_rows, _per_row, _vectorised, _per_row / _vectorised))
@@ -148,6 +148,7 @@ void resume_callback(void) {
 static inline void process_ring_buffers(void) {
     uint32_t first_index = synapse_row_get_first_ring_buffer_index(
             time, synapse_type_index_bits, synapse_delay_mask);
+    synapses_record_ring_buffer_maxima(time);
     neuron_transfer(&ring_buffers[first_index]);
 
     // Print the neuron inputs.
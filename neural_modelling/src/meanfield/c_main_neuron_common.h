@@ -32,6 +32,8 @@ struct neuron_provenance {
     uint32_t earliest_send;
     //! Latest send time within any time step
     uint32_t latest_send;
+    //! The integration steps taken by the meanfields
+    struct meanfield_step_provenance step_provenance;
 };
 
 //! The region IDs used by the neuron processing
@@ -58,6 +60,7 @@ static inline void store_neuron_provenance(struct neuron_provenance *prov) {
     prov->n_tdma_mises = tdma_processing_times_behind();
     prov->earliest_send = earliest_send_time;
     prov->latest_send = latest_send_time;
+    neuron_store_step_provenance(&prov->step_provenance);
 }
 
 //! \brief Read data to set up neuron processing
@@ -24,6 +24,7 @@
 
 #include <common/neuron-typedefs.h>
 #include <meanfield/send_spike.h>
+#include <meanfield/meanfield.h>
 
 //! \brief Initialise the particular implementation of the data
 //! \param[in] n_neurons: The number of neurons
@@ -59,6 +60,11 @@ static void neuron_impl_do_timestep_update(
 static void neuron_impl_store_neuron_parameters(
         address_t address, uint32_t next, uint32_t n_meanfields);
 
+//! \brief Store the provenance of the integration steps
+//! \param[out] prov: The structure to store the provenance in
+static void neuron_impl_store_step_provenance(
+        struct meanfield_step_provenance *prov);
+
 #if LOG_LEVEL >= LOG_DEBUG
 //! \brief Print the inputs to the neurons
 //! \param[in] n_neurons: The number of neurons
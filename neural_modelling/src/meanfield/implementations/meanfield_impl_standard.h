@@ -76,6 +76,9 @@ static ParamsFromNetwork_t *pNetwork_array;
 
 static mathsbox_t *mathsbox_array;
 
+//! The erfc configuration (and table) shared by all meanfields
+static erfc_config_t *erfc_config;
+
 static pFitPolynomial_t *Pfit_exc_array;
 static pFitPolynomial_t *Pfit_inh_array;
 
@@ -94,9 +97,16 @@ static global_neuron_params_t *global_parameters;
 //! The synapse shaping parameters
 static synapse_param_t *neuron_synapse_shaping_params;
 
-//! The number of steps to run per timestep
+//! \brief The number of steps to run per timestep; when stepping adaptively,
+//!     the most sub-steps a meanfield may take in a timestep
 static uint n_steps_per_timestep;
 
+//! The local error tolerance of adaptive stepping; 0 for fixed steps
+static REAL adaptive_tolerance;
+
+//! The integration steps taken so far
+static struct meanfield_step_provenance step_provenance;
+
 /*
 static inline void test(uint32_t time) {
     for (uint32_t i = N_RECORDED_VARS; i > 0; i--) {
@@ -263,6 +273,16 @@ static void neuron_impl_load_neuron_parameters(
         rt_error(RTE_SWERR);
     }
 
+    // Read the tolerance of adaptive stepping
+    adaptive_tolerance = kbits(address[next++]);
+    if (adaptive_tolerance > ZERO) {
+        log_debug("Stepping adaptively to a tolerance of %k, in at most %u"
+                " steps each timestep", adaptive_tolerance,
+                n_steps_per_timestep);
+    }
+    step_provenance.max_steps_per_timestep = n_steps_per_timestep;
+    step_provenance.tolerance = bitsk(adaptive_tolerance);
+
     if (sizeof(global_neuron_params_t)) {
         log_debug("writing neuron global parameters");
         spin1_memcpy(global_parameters, &address[next],
@@ -299,6 +319,23 @@ static void neuron_impl_load_neuron_parameters(
     }
     
     if (sizeof(mathsbox_t)) {
+        log_debug("reading erfc configuration");
+        const erfc_config_t *config = (const erfc_config_t *) &address[next];
+        uint32_t config_size = sizeof(erfc_config_t)
+                + config->n_entries * sizeof(REAL);
+        // The size can't change between runs, so only allocate once
+        if (erfc_config == NULL) {
+            erfc_config = spin1_malloc(config_size);
+            if (erfc_config == NULL) {
+                log_error("Unable to allocate erfc configuration"
+                        " - Out of DTCM");
+                rt_error(RTE_SWERR);
+            }
+        }
+        spin1_memcpy(erfc_config, config, config_size);
+        next += n_words_needed(config_size);
+        mathsbox_set_erfc_config(erfc_config);
+
         log_debug("reading mathsbox parameters");
         spin1_memcpy(mathsbox_array, &address[next],
                 n_meanfields * sizeof(mathsbox_t));
@@ -348,6 +385,12 @@ SOMETIMES_UNUSED // Marked unused as only used sometimes
 static void neuron_impl_do_timestep_update(
         uint32_t timer_count, uint32_t time, uint32_t n_neurons) {
 
+    // When stepping adaptively, the model does the sub-steps itself
+    uint32_t n_loops = n_steps_per_timestep;
+    if (adaptive_tolerance > ZERO) {
+        n_loops = 1;
+    }
+
     for (uint32_t meanfield_index = 0; meanfield_index < n_neurons; meanfield_index++) {
         // Get the neuron itself
         meanfield_t *this_meanfield = &meanfield_array[meanfield_index];
@@ -372,9 +415,12 @@ static void neuron_impl_do_timestep_update(
         // Store whether the neuron has spiked
         bool has_spiked = false;
 
+        // The number of integration steps taken this timestep
+        uint32_t steps_this_update = 0;
+
         // Loop however many times requested; do this in reverse for efficiency,
         // and because the index doesn't actually matter
-        for (uint32_t i_step = n_steps_per_timestep; i_step > 0; i_step--) {
+        for (uint32_t i_step = n_loops; i_step > 0; i_step--) {
             // Get the voltage->firing rate
             state_t firing_rate_Ve = meanfield_model_get_firing_rate_Ve(
                 this_meanfield);
@@ -409,7 +455,7 @@ static void neuron_impl_do_timestep_update(
             }
 
             // Do recording if on the first step 
-            if (i_step == n_steps_per_timestep) {
+            if (i_step == n_loops) {
                 neuron_recording_record_accum(
                         VE_RECORDING_INDEX, meanfield_index, firing_rate_Ve);
                 neuron_recording_record_accum(
@@ -433,11 +479,22 @@ static void neuron_impl_do_timestep_update(
 //                    additional_inputs, firing_rate);
 
             // update neuron parameters
-            state_t result = meanfield_model_state_update(this_meanfield,
-                                                          pNetwork_types,
-                                                          Pfit_exc_types,
-                                                          Pfit_inh_types,
-                                                          mathsbox_types);
+            uint32_t n_steps_taken = 1;
+            state_t result;
+            if (adaptive_tolerance > ZERO) {
+                n_steps_taken = meanfield_model_state_update_adaptive(
+                        this_meanfield, pNetwork_types, Pfit_exc_types,
+                        Pfit_inh_types, mathsbox_types, adaptive_tolerance,
+                        n_steps_per_timestep);
+                result = meanfield_model_get_firing_rate_Ve(this_meanfield);
+            } else {
+                result = meanfield_model_state_update(this_meanfield,
+                                                      pNetwork_types,
+                                                      Pfit_exc_types,
+                                                      Pfit_inh_types,
+                                                      mathsbox_types);
+            }
+            steps_this_update += n_steps_taken;
 
             // determine if a spike should occur
             bool spike_now =
@@ -470,6 +527,17 @@ static void neuron_impl_do_timestep_update(
             neuron_recording_record_bit(SPIKE_RECORDING_BITFIELD, meanfield_index);
         }
 
+        // Account for the steps taken by this meanfield this timestep
+        step_provenance.n_updates++;
+        step_provenance.total_steps += steps_this_update;
+        if (steps_this_update > step_provenance.max_steps_taken) {
+            step_provenance.max_steps_taken = steps_this_update;
+        }
+        if (adaptive_tolerance > ZERO &&
+                steps_this_update == n_steps_per_timestep) {
+            step_provenance.n_budget_reached++;
+        }
+
 #if LOG_LEVEL >= LOG_DEBUG
         meanfield_model_print_state_variables(this_meanfield);
 #endif // LOG_LEVEL >= LOG_DEBUG
@@ -485,8 +553,8 @@ static void neuron_impl_store_neuron_parameters(
         address_t address, uint32_t next, uint32_t n_meanfields) {
     log_debug("writing parameters");
 
-    // Skip over the steps per timestep
-    next += 1;
+    // Skip over the steps per timestep and the adaptive tolerance
+    next += 2;
 
     if (sizeof(global_neuron_params_t)) {
         log_debug("writing neuron global parameters");
@@ -513,6 +581,14 @@ static void neuron_impl_store_neuron_parameters(
 
 }
 
+SOMETIMES_UNUSED // Marked unused as only used sometimes
+//! \brief Store the provenance of the integration steps
+//! \param[out] prov: The structure to store the provenance in
+static void neuron_impl_store_step_provenance(
+        struct meanfield_step_provenance *prov) {
+    *prov = step_provenance;
+}
+
 /*
 #if LOG_LEVEL >= LOG_DEBUG
 //! \brief Print the inputs to the neurons
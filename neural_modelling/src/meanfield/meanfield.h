@@ -36,6 +36,22 @@
 #include <spin1_api.h>
 #include "../meanfield/synapse_row.h"
 
+//! The provenance of the integration steps taken by the meanfields
+struct meanfield_step_provenance {
+    //! The most sub-steps a meanfield may take in a timestep
+    uint32_t max_steps_per_timestep;
+    //! The local error tolerance of adaptive stepping (S16.15), 0 if fixed
+    uint32_t tolerance;
+    //! The number of meanfield updates (meanfields times timesteps)
+    uint32_t n_updates;
+    //! The total number of sub-steps taken by all updates
+    uint32_t total_steps;
+    //! The most sub-steps taken by any one update
+    uint32_t max_steps_taken;
+    //! The number of updates that took as many sub-steps as allowed
+    uint32_t n_budget_reached;
+};
+
 //! \brief translate the data stored in the NEURON_PARAMS data region in SDRAM
 //!        and convert it into c based objects for use.
 //! \param[in] address: the absolute address in SDRAM for the start of the
@@ -72,6 +88,10 @@ bool neuron_resume(void);
 //!                     in SDRAM
 void neuron_pause(void);
 
+//! \brief Store the provenance of the integration steps
+//! \param[out] prov: The structure to store the provenance in
+void neuron_store_step_provenance(struct meanfield_step_provenance *prov);
+
 //! \brief Add inputs to the neurons
 //! \param[in] syns The inputs to be added; this is an array of size
 //!                 n_synapse_types * 2^ceil(log_2(n_neurons)).
@@ -18,12 +18,37 @@ typedef struct mathsbox_t {
     REAL error_func_sample;
     
     REAL err_func;
-    
-    REAL var_sqrt;
 }mathsbox_t;
 
 //typedef struct mathsbox_params_t* mathsbox_pointer_t;
 
+//! The ways of evaluating the complementary error function
+typedef enum erfc_mode_t {
+    //! Midpoint integration with error_func_sample steps
+    ERFC_MODE_INTEGRAL = 0,
+    //! Linear interpolation in a table computed on the host
+    ERFC_MODE_TABLE = 1,
+    //! Fixed-point rational approximation (Abramowitz & Stegun 7.1.28)
+    ERFC_MODE_RATIONAL = 2
+} erfc_mode_t;
+
+//! \brief The erfc configuration shared by all the meanfields of a core,
+//!     written just before the mathsbox parameters
+typedef struct erfc_config_t {
+    //! How to evaluate erfc; an erfc_mode_t
+    uint32_t mode;
+    //! The number of entries in the table (0 unless in table mode)
+    uint32_t n_entries;
+    //! 1 / the step between the table arguments
+    REAL inv_step;
+    //! erfc(i * step) for i in [0, n_entries)
+    REAL table[];
+} erfc_config_t;
+
+//! \brief Set the erfc configuration to be used by error_function()
+//! \param[in] config: The configuration
+void mathsbox_set_erfc_config(const erfc_config_t *config);
+
 void error_function(REAL argument, mathsbox_t *restrict mathsbox);
 
 /****************************************************************************
@@ -88,6 +88,25 @@ state_t meanfield_model_state_update(
     pFitPolynomial_t *restrict Pfit_inh,
     mathsbox_t *restrict mathsbox);
 
+//! \brief Advance a meanfield by a whole timestep, splitting it into as many
+//!     sub-steps as needed to keep the estimated local error of the RK2
+//!     within a tolerance
+//! \param[in,out] meanfield: The meanfield to update
+//! \param[in] params_from_network: The network parameters of the meanfield
+//! \param[in] Pfit_exc: The excitatory threshold fit
+//! \param[in] Pfit_inh: The inhibitory threshold fit
+//! \param[in] mathsbox: The error function state
+//! \param[in] tolerance: The largest acceptable local error of the rates
+//! \param[in] max_steps: The most sub-steps that may be taken
+//! \return The number of sub-steps taken; 1 if the whole step was accepted
+uint32_t meanfield_model_state_update_adaptive(
+    meanfield_t *restrict meanfield,
+    ParamsFromNetwork_t *restrict params_from_network,
+    pFitPolynomial_t *restrict Pfit_exc,
+    pFitPolynomial_t *restrict Pfit_inh,
+    mathsbox_t *restrict mathsbox,
+    REAL tolerance, uint32_t max_steps);
+
 //! \brief Indicates that the neuron has spiked
 //! \param[in, out] neuron pointer to a neuron parameter struct which contains
 //!     all the parameters for a specific neuron
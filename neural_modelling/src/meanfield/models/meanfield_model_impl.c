@@ -41,6 +41,27 @@ static const global_neuron_params_t *global_params;
 //! Thanks to Mantas Mikaitis for this!
 //static const REAL MAGIC_MULTIPLIER = REAL_CONST(0.040008544921875);
 
+//! The erfc configuration shared by all the meanfields on this core
+static const erfc_config_t *erfc_config;
+
+//! Coefficients of the Abramowitz & Stegun 7.1.28 approximation of erf
+static const REAL ERFC_A1 = REAL_CONST(0.0705230784);
+static const REAL ERFC_A2 = REAL_CONST(0.0422820123);
+static const REAL ERFC_A3 = REAL_CONST(0.0092705272);
+static const REAL ERFC_A4 = REAL_CONST(0.0001520143);
+static const REAL ERFC_A5 = REAL_CONST(0.0002765672);
+static const REAL ERFC_A6 = REAL_CONST(0.0000430638);
+
+//! Beyond this erfc is below the resolution of an accum
+static const REAL ERFC_RATIONAL_MAX = REAL_CONST(4.0);
+
+//! The largest argument in the erfc table; as ERFC_TABLE_MAX in mathsbox.py
+static const REAL ERFC_TABLE_MAX = REAL_CONST(4.0);
+
+void mathsbox_set_erfc_config(const erfc_config_t *config) {
+    erfc_config = config;
+}
+
 /****************************************************************************
  *   Error function with integral computing by midpoint method OK
  *   Will do the Simpson if ITCM is ok
@@ -52,16 +73,14 @@ static const global_neuron_params_t *global_params;
       sqrtk take : ~1250 bytes
  *****************************************************************************/
 
-void error_function(REAL argument, mathsbox_t *restrict mathsbox){
+static inline REAL erfc_integral(REAL argument, const mathsbox_t *mathsbox){
 
-    mathsbox->err_func = 0.;
     REAL step = argument/mathsbox->error_func_sample;
     REAL x;
     REAL t;
     //REAL Pi = REAL_CONST(3.1415927);// here was a k
     REAL two_over_sqrt_Pi = REAL_CONST(1.128379167); //APPROXIMATION
     REAL Erf = ZERO;
-    REAL Erfc = ZERO;
     
     for(x=0; x<=argument; x+=step){
         
@@ -71,10 +90,67 @@ void error_function(REAL argument, mathsbox_t *restrict mathsbox){
         Erf +=  step*two_over_sqrt_Pi*(-(t*t));//TEST
         //Erf +=  step*(REAL_CONST(2.)/sqrtk(Pi))*expk(-(t*t)); // TEST sqrtk ONE
     }
-    Erfc = ONE-Erf;
+    return ONE-Erf;
+}
 
-    mathsbox->err_func = Erfc;
+//! \brief erfc of a non-negative argument by interpolation in the table
+static inline REAL erfc_table(REAL x) {
+    // Check before scaling, as a large x would overflow the position
+    if (x >= ERFC_TABLE_MAX) {
+        return ZERO;
+    }
+    REAL position = x * erfc_config->inv_step;
+    uint32_t index = (uint32_t) (bitsk(position) >> 15);
+    if (index >= erfc_config->n_entries - 1) {
+        return ZERO;
+    }
+    REAL fraction = kbits(bitsk(position) & 0x7FFF);
+    REAL low = erfc_config->table[index];
+    REAL high = erfc_config->table[index + 1];
+    return low + fraction * (high - low);
+}
+
+//! \brief erfc of a non-negative argument by rational approximation;
+//!     1 / (1 + a1 x + ... + a6 x^6)^16, without any exponential
+static inline REAL erfc_rational(REAL x) {
+    if (x >= ERFC_RATIONAL_MAX) {
+        return ZERO;
+    }
+    REAL poly = ERFC_A5 + x * ERFC_A6;
+    poly = ERFC_A4 + x * poly;
+    poly = ERFC_A3 + x * poly;
+    poly = ERFC_A2 + x * poly;
+    poly = ERFC_A1 + x * poly;
+    poly = ONE + x * poly;
+
+    // Invert first so that the powers stay within [0, 1]
+    REAL result = ONE / poly;
+    result = result * result;
+    result = result * result;
+    result = result * result;
+    return result * result;
+}
+
+void error_function(REAL argument, mathsbox_t *restrict mathsbox){
+
+    if (erfc_config->mode == ERFC_MODE_INTEGRAL) {
+        mathsbox->err_func = erfc_integral(argument, mathsbox);
+        return;
+    }
+
+    // erfc(-x) = 2 - erfc(x)
+    REAL x = (argument < ZERO) ? -argument : argument;
+    REAL Erfc;
+    if (erfc_config->mode == ERFC_MODE_TABLE) {
+        Erfc = erfc_table(x);
+    } else {
+        Erfc = erfc_rational(x);
+    }
+    if (argument < ZERO) {
+        Erfc = REAL_CONST(2.0) - Erfc;
+    }
 
+    mathsbox->err_func = Erfc;
 }
 
 static inline s1615 square_root_of(REAL number)
@@ -468,7 +544,10 @@ void TF(REAL Ve, REAL Vi, REAL W,
 }
 
 
-void RK2_midpoint_MF(REAL h, meanfield_t *meanfield,
+//! \brief Advance a meanfield by one RK2 midpoint step
+//! \return An estimate of the local error of the step: the largest
+//!     difference between the RK2 and Euler updates of the rates
+static REAL RK2_midpoint_MF(REAL h, meanfield_t *meanfield,
                      ParamsFromNetwork_t *restrict pNetwork,
                      pFitPolynomial_t *restrict Pfit_exc,
                      pFitPolynomial_t *restrict Pfit_inh,
@@ -537,7 +616,16 @@ void RK2_midpoint_MF(REAL h, meanfield_t *meanfield,
  
     meanfield->w += REAL_HALF(h*(k1_W+k2_W));
 
-
+    // The RK2 and Euler updates differ by h/2 (k2 - k1)
+    REAL error_exc = REAL_HALF(h*(k2_exc - k1_exc));
+    REAL error_inh = REAL_HALF(h*(k2_inh - k1_inh));
+    if (error_exc < ZERO) {
+        error_exc = -error_exc;
+    }
+    if (error_inh < ZERO) {
+        error_inh = -error_inh;
+    }
+    return (error_exc > error_inh) ? error_exc : error_inh;
 }
 
 void meanfield_model_set_global_neuron_params(
@@ -585,6 +673,45 @@ state_t meanfield_model_state_update(
     return meanfield->Ve;
 }
 
+uint32_t meanfield_model_state_update_adaptive(
+    meanfield_t *restrict meanfield,
+    ParamsFromNetwork_t *restrict pNetwork,
+    pFitPolynomial_t *restrict Pfit_exc,
+    pFitPolynomial_t *restrict Pfit_inh,
+    mathsbox_t *restrict mathsbox,
+    REAL tolerance, uint32_t max_steps){
+
+    REAL h = meanfield->this_h;
+    REAL lastVe = meanfield->Ve;
+    REAL lastVi = meanfield->Vi;
+    REAL lastW = meanfield->w;
+
+    // Try the whole step first; a quiescent meanfield stops here
+    REAL error = RK2_midpoint_MF(
+            h, meanfield, pNetwork, Pfit_exc, Pfit_inh, mathsbox);
+    uint32_t n_steps = 1;
+
+    if (error > tolerance && max_steps > 1) {
+        // The estimate goes as h^2, so n sub-steps divide it by n^2
+        do {
+            n_steps++;
+        } while (n_steps < max_steps &&
+                (error / (REAL) n_steps) / (REAL) n_steps > tolerance);
+
+        meanfield->Ve = lastVe;
+        meanfield->Vi = lastVi;
+        meanfield->w = lastW;
+        REAL sub_h = h / (REAL) n_steps;
+        for (uint32_t i = n_steps; i > 0; i--) {
+            RK2_midpoint_MF(
+                    sub_h, meanfield, pNetwork, Pfit_exc, Pfit_inh, mathsbox);
+        }
+    }
+    meanfield->this_h = global_params->machine_timestep_ms;
+
+    return n_steps;
+}
+
 
 
 void neuron_model_has_spiked(meanfield_t *restrict meanfield) {
@@ -60,6 +60,8 @@ struct synapse_provenance {
     uint32_t n_invalid_master_pop_table_hits;
     //! The number of spikes that a bit field filtered, stopping a DMA
     uint32_t n_filtered_by_bitfield;
+    //! The largest value seen in the ring buffers of each synapse type
+    uint32_t max_ring_buffer_values[SYNAPSES_N_TRACKED_TYPES];
 };
 
 //! \brief Callback to store synapse provenance data (format: synapse_provenance).
@@ -75,6 +77,9 @@ static inline void store_synapse_provenance(struct synapse_provenance *prov) {
     prov->n_failed_bitfield_reads = failed_bit_field_reads;
     prov->n_invalid_master_pop_table_hits = invalid_master_pop_hits;
     prov->n_filtered_by_bitfield = bit_field_filtered_packets;
+    for (uint32_t i = 0; i < SYNAPSES_N_TRACKED_TYPES; i++) {
+        prov->max_ring_buffer_values[i] = synapses_max_ring_buffer_values[i];
+    }
 }
 
 //! \brief Read data to set up synapse processing
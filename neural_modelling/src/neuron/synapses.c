@@ -80,6 +80,11 @@ uint32_t synapse_delay_mask;
 //! Count of the number of times the ring buffers have saturated
 uint32_t synapses_saturation_count = 0;
 
+weight_t synapses_max_ring_buffer_values[SYNAPSES_N_TRACKED_TYPES];
+
+//! Whether to note the largest values in the ring buffers each timestep
+static bool record_ring_buffer_maxima;
+
 static uint32_t n_neurons_peak;
 
 
@@ -248,6 +253,7 @@ struct synapse_params {
     uint32_t log_max_delay;
     uint32_t drop_late_packets;
     uint32_t incoming_spike_buffer_size;
+    uint32_t record_ring_buffer_maxima;
     uint32_t ring_buffer_shifts[];
 };
 
@@ -263,6 +269,7 @@ bool synapses_initialise(
     struct synapse_params *params = (struct synapse_params *) synapse_params_address;
     *clear_input_buffers_of_late_packets_init = params->drop_late_packets;
     *incoming_spike_buffer_size = params->incoming_spike_buffer_size;
+    record_ring_buffer_maxima = params->record_ring_buffer_maxima;
     n_neurons = params->n_neurons;
     *n_neurons_out = n_neurons;
     n_synapse_types = params->n_synapse_types;
@@ -324,7 +331,30 @@ bool synapses_initialise(
     return true;
 }
 
+void synapses_record_ring_buffer_maxima(timer_t time) {
+    if (!record_ring_buffer_maxima) {
+        return;
+    }
+    uint32_t ring_buffer_index = synapse_row_get_first_ring_buffer_index(
+            time, synapse_type_index_bits, synapse_delay_mask);
+    uint32_t n_types = n_synapse_types;
+    if (n_types > SYNAPSES_N_TRACKED_TYPES) {
+        n_types = SYNAPSES_N_TRACKED_TYPES;
+    }
+    for (uint32_t s_i = 0; s_i < n_types; s_i++) {
+        weight_t max_value = synapses_max_ring_buffer_values[s_i];
+        for (uint32_t n_i = n_neurons_peak; n_i > 0; n_i--) {
+            weight_t value = ring_buffers[ring_buffer_index++];
+            if (value > max_value) {
+                max_value = value;
+            }
+        }
+        synapses_max_ring_buffer_values[s_i] = max_value;
+    }
+}
+
 void synapses_flush_ring_buffers(timer_t time) {
+    synapses_record_ring_buffer_maxima(time);
     uint32_t synapse_index = 0;
     uint32_t ring_buffer_index = synapse_row_get_first_ring_buffer_index(
             time, synapse_type_index_bits, synapse_delay_mask);;
@@ -387,5 +417,8 @@ void synapses_resume(uint32_t time) {
         for (uint32_t i = 0; i < ring_buffer_size; i++) {
             ring_buffers[i] = 0;
         }
+        for (uint32_t i = 0; i < SYNAPSES_N_TRACKED_TYPES; i++) {
+            synapses_max_ring_buffer_values[i] = 0;
+        }
     }
 }
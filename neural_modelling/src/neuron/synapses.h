@@ -52,6 +52,13 @@ extern uint32_t synapse_delay_mask;
 //! Count of the number of times the synapses have saturated their weights.
 extern uint32_t synapses_saturation_count;
 
+//! \brief The number of synapse types for which the largest value seen in
+//!        the ring buffers is kept; any more synapse types are not tracked
+#define SYNAPSES_N_TRACKED_TYPES 4
+
+//! The largest value seen in the ring buffers of each synapse type
+extern weight_t synapses_max_ring_buffer_values[SYNAPSES_N_TRACKED_TYPES];
+
 
 //! \brief Print the weight of a synapse
 //! \param[in] weight: the weight to print in synapse-row form
@@ -109,4 +116,10 @@ void synapses_resume(timer_t time);
 //! \param[in] time: the simulated time to reset the buffers at
 void synapses_flush_ring_buffers(timer_t time);
 
+//! \brief Note the largest values in the ring buffers at the given time,
+//!        before they are passed on to the neurons, if asked to do so
+//!        in the synapse parameters
+//! \param[in] time: the simulated time of the buffers to look at
+void synapses_record_ring_buffer_maxima(timer_t time);
+
 #endif // _SYNAPSES_H_
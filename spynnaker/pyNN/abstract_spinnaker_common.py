@@ -28,6 +28,7 @@ from spinn_front_end_common.utilities.utility_objs import ExecutableFinder
 from spynnaker.pyNN import extra_algorithms, model_binaries
 from spynnaker.pyNN.config_setup import CONFIG_FILE_NAME, setup_configs
 from spynnaker.pyNN.utilities import constants
+from spynnaker.pyNN.utilities.bulk_memory_read import read_memory_in_bulk
 from spynnaker.pyNN.utilities.extracted_data import ExtractedData
 from spynnaker import __version__ as version
 
@@ -382,8 +383,9 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase):
             neuron_type.set_model_max_atoms_per_core()
 
     def get_projections_data(self, projection_to_attribute_map):
-        """ Common data extractor for projection data. Allows fully
-            exploitation of the ????
+        """ Common data extractor for projection data.  The synaptic data\
+            of all the projections is read from the machine in one pass\
+            before any of it is decoded.
 
         :param projection_to_attribute_map:
             the projection to attributes mapping
@@ -417,13 +419,18 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase):
             data_receiver.set_cores_for_data_streaming(
                 self._txrx, list(extra_monitor_cores), self._placements)
 
-        # acquire the data
+        # read the data of all the projections in one pass over the machine
+        reads = list()
+        for projection in projection_to_attribute_map:
+            reads.extend(projection._get_connection_reads())
+        read_memory_in_bulk(self._txrx, reads, self._machine)
+
+        # acquire the data, which is now decoded without further reads
         for projection in projection_to_attribute_map:
             for attribute in projection_to_attribute_map[projection]:
                 data = projection._get_synaptic_data(
                     as_list=True, data_to_get=attribute,
-                    fixed_values=None, notify=None,
-                    handle_time_out_configuration=False)
+                    fixed_values=None, notify=None)
                 mother_lode.set(projection, attribute, data)
 
         # reset time outs for the receivers
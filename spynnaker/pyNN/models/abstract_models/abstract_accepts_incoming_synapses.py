@@ -60,6 +60,51 @@ class AbstractAcceptsIncomingSynapses(object, metaclass=AbstractBase):
             The specific projection within the edge
         """
 
+    def get_connection_reads(
+            self, transceiver, placements, app_edge, synapse_info):
+        # pylint: disable=unused-argument
+        """ Get the reads of the connection data that have not already been\
+            done, so that the data of several projections can be read in\
+            one pass over the machine before\
+            :py:meth:`get_connections_from_machine` is called.  By default,\
+            there are none, and the data is read by\
+            :py:meth:`get_connections_from_machine` itself.
+
+        :param ~spinnman.transceiver.Transceiver transceiver:
+            How to find the connection data
+        :param ~pacman.model.placements.Placements placements:
+            Where the connection data is on the machine
+        :param ProjectionApplicationEdge app_edge:
+            The edge for which the data is being read
+        :param SynapseInformation synapse_info:
+            The specific projection within the edge
+        :rtype: list(~spynnaker.pyNN.utilities.bulk_memory_read.MemoryRead)
+        """
+        return []
+
+    def iter_connections_from_machine(
+            self, transceiver, placements, app_edge, synapse_info):
+        # pylint: disable=too-many-arguments
+        """ Get the connections from the machine post-run a block at a\
+            time (e.g. one per core), so that they can be used without all\
+            being held at once.  By default, there is just one block, from\
+            :py:meth:`get_connections_from_machine`.
+
+        :param ~spinnman.transceiver.Transceiver transceiver:
+            How to read the connection data
+        :param ~pacman.model.placements.Placements placements:
+            Where the connection data is on the machine
+        :param ProjectionApplicationEdge app_edge:
+            The edge for which the data is being read
+        :param SynapseInformation synapse_info:
+            The specific projection within the edge
+        :rtype: iterable(~numpy.ndarray)
+        """
+        connections = self.get_connections_from_machine(
+            transceiver, placements, app_edge, synapse_info)
+        if connections is not None:
+            yield connections
+
     @abstractmethod
     def clear_connection_cache(self):
         """ Clear the connection data stored in the vertex so far.
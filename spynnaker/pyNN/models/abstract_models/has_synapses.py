@@ -34,6 +34,36 @@ class HasSynapses(object):
             The specific projection within the edge
         """
 
+    @abstractmethod
+    def get_connection_reads(
+            self, transceiver, placement, app_edge, synapse_info):
+        """ Get the reads of the connection data of this vertex that have\
+            not already been done; once done, the data is used by\
+            :py:meth:`get_connections_from_machine`.
+
+        :param ~spinnman.transceiver.Transceiver transceiver:
+            How to find the connection data
+        :param ~pacman.model.placement.Placement placement:
+            Where the connection data is on the machine
+        :param ProjectionApplicationEdge app_edge:
+            The edge for which the data is being read
+        :param SynapseInformation synapse_info:
+            The specific projection within the edge
+        :rtype: list(~spynnaker.pyNN.utilities.bulk_memory_read.MemoryRead)
+        """
+
+    @abstractmethod
+    def mark_synapses_changed(self, synapse_infos):
+        """ Note that the synaptic data of some projections has changed on\
+            the machine, so that just that data can be written again.
+
+        :param set(SynapseInformation) synapse_infos:
+            The specific projections that have changed
+        :return: Whether the data can be written again in place; if not, it
+            must be generated again in full
+        :rtype: bool
+        """
+
     @abstractmethod
     def clear_connection_cache(self):
         """ Flush the cache of connection information; needed for a second run
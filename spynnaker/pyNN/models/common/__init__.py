@@ -16,6 +16,7 @@
 from .abstract_event_recordable import AbstractEventRecordable
 from .abstract_neuron_recordable import AbstractNeuronRecordable
 from .abstract_spike_recordable import AbstractSpikeRecordable
+from .abstract_streams_recording import AbstractStreamsRecording
 from .eieio_spike_recorder import EIEIOSpikeRecorder
 from .neuron_recorder import NeuronRecorder
 from .multi_spike_recorder import MultiSpikeRecorder
@@ -25,7 +26,8 @@ from .recording_utils import (
 from .simple_population_settable import SimplePopulationSettable
 
 __all__ = ["AbstractEventRecordable", "AbstractNeuronRecordable",
-           "AbstractSpikeRecordable", "EIEIOSpikeRecorder", "NeuronRecorder",
+           "AbstractSpikeRecordable", "AbstractStreamsRecording",
+           "EIEIOSpikeRecorder", "NeuronRecorder",
            "MultiSpikeRecorder", "SimplePopulationSettable",
            "get_buffer_sizes", "get_data", "needs_buffering",
            "get_recording_region_size_in_bytes", "pull_off_cached_lists", ]
@@ -0,0 +1,77 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+from spinn_utilities.require_subclass import require_subclass
+from pacman.model.graphs.application import ApplicationVertex
+
+
+@require_subclass(ApplicationVertex)
+class AbstractStreamsRecording(object, metaclass=AbstractBase):
+    """ Indicates that the recorded spikes, variables and events of this\
+        object can be read a chunk at a time, so that the whole recording\
+        is never held in memory at once.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def iter_spikes(self, placements, buffer_manager, max_rows):
+        """ Read the spikes one core and window of time steps at a time
+
+        :param ~pacman.model.placements.Placements placements:
+            the placements object
+        :param buffer_manager: the manager for buffered data
+        :type buffer_manager:
+            ~spinn_front_end_common.interface.buffer_management.BufferManager
+        :param int max_rows: the most recorded time steps to decode at once
+        :return: the ids and times of the spikes of each core and window
+        :rtype: iterable(tuple(~numpy.ndarray, ~numpy.ndarray))
+        """
+
+    @abstractmethod
+    def iter_data(
+            self, variable, n_machine_time_steps, placements, buffer_manager,
+            max_rows):
+        """ Read a recorded variable one core and window of time steps at a\
+            time
+
+        :param str variable: PyNN name for the variable
+        :param int n_machine_time_steps:
+        :param ~pacman.model.placements.Placements placements:
+            the placements object
+        :param buffer_manager: the manager for buffered data
+        :type buffer_manager:
+            ~spinn_front_end_common.interface.buffer_management.BufferManager
+        :param int max_rows: the most rows to decode at once
+        :return: for each core and window, the recording indexes, the first
+            row of the window and the data of the window
+        :rtype: iterable(tuple(list(int), int, ~numpy.ndarray))
+        """
+
+    @abstractmethod
+    def iter_events(self, variable, placements, buffer_manager, max_rows):
+        """ Read recorded events one core and window of events at a time
+
+        :param str variable: The variable to get the event data for
+        :param ~pacman.model.placements.Placements placements:
+            the placements object
+        :param buffer_manager: the manager for buffered data
+        :type buffer_manager:
+            ~spinn_front_end_common.interface.buffer_management.BufferManager
+        :param int max_rows: the most events to decode at once
+        :return: the events of each core and window, one row per event
+        :rtype: iterable(~numpy.ndarray)
+        """
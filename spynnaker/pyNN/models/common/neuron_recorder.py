@@ -13,10 +13,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import itertools
 import logging
 import math
 import numpy
+from spinn_utilities.config_holder import get_config_int
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.progress_bar import ProgressBar
 from pacman.model.resources.variable_sdram import VariableSDRAM
@@ -26,6 +28,7 @@ from spinn_front_end_common.utilities.constants import (
     BYTES_PER_WORD, BITS_PER_WORD)
 from spinn_front_end_common.utilities.globals_variables import (
     machine_time_step_ms)
+from spynnaker.pyNN.models.common.recording_utils import make_missing_string
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
@@ -54,6 +57,22 @@ def get_sampling_interval(sampling_rate):
     return sampling_rate * machine_time_step_ms()
 
 
+def _map_in_pool(decode, items):
+    """ Decode the data of several cores, using a pool of threads if the\
+        configuration asks for more than one
+
+    :param callable decode: called with the contents of each item
+    :param list(tuple) items: the arguments for each call
+    :return: the results of the calls, in the order of the items
+    :rtype: list
+    """
+    n_threads = get_config_int("Recording", "n_extraction_threads")
+    if n_threads is None or n_threads <= 1 or len(items) <= 1:
+        return [decode(*item) for item in items]
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        return list(executor.map(lambda item: decode(*item), items))
+
+
 class NeuronRecorder(object):
     __slots__ = [
         "__indexes",
@@ -223,61 +242,70 @@ class NeuronRecorder(object):
 
     @staticmethod
     def _process_missing_data(
-            missing_str, placement, expected_rows, n_neurons, times,
-            sampling_rate, label, placement_data):
-        missing_str += "({}, {}, {}); ".format(
-            placement.x, placement.y, placement.p)
-        # Start the fragment for this slice empty
-        fragment = numpy.empty((expected_rows, n_neurons))
-        for i in range(0, expected_rows):
-            time = i * sampling_rate
-            # Check if there is data for this time step
-            local_indexes = numpy.where(times == time)
-            if len(local_indexes[0]) == 1:
-                fragment[i] = placement_data[local_indexes[0]]
-            elif len(local_indexes[0]) > 1:
-                fragment[i] = placement_data[local_indexes[0], 1:]
-                logger.warning(
-                    "Population {} has multiple recorded data for time {}",
-                    label, time)
-            else:
-                # Set row to nan
-                fragment[i] = numpy.full(n_neurons, numpy.nan)
-        return fragment
+            expected_rows, times, sampling_rate, label, placement_data,
+            out=None):
+        """ Places the recorded rows of a core at the rows of the time steps\
+            they were recorded at, filling time steps without data with NaN
 
-    def _get_placement_matrix_data(
-            self, placements, vertex, region, buffer_manager, expected_rows,
-            missing_str, sampling_rate, label, data_type, n_per_timestep):
-        """ processes a placement for matrix data
-
-        :param ~pacman.model.placements.Placements placements:
-            the placements object
-        :param ~pacman.model.graphs.machine.MachineVertex vertex:
-            the vertex to read from
-        :param int region: the recording region id
-        :param ~.BufferManager buffer_manager: the buffer manager
         :param int expected_rows:
             how many rows the tools think should be recorded
-        :param str missing_str: string for reporting missing stuff
+        :param ~numpy.ndarray times: the time step of each recorded row
         :param int sampling_rate: the rate of sampling
         :param str label: the vertex label.
-        :return: placement data
+        :param ~numpy.ndarray placement_data: the recorded rows
+        :param out: where to write the rows; allocated if not given
+        :type out: ~numpy.ndarray or None
+        :return: the data with one row per expected time step
         :rtype: ~numpy.ndarray
         """
+        if out is None:
+            out = numpy.empty((expected_rows, placement_data.shape[1]))
+        out.fill(numpy.nan)
+
+        # Only rows recorded exactly on a sampled time step have a place
+        rows, offsets = numpy.divmod(
+            numpy.asarray(times, dtype="int64").reshape(-1), sampling_rate)
+        valid = (offsets == 0) & (rows >= 0) & (rows < expected_rows)
+        rows = rows[valid]
+        unique_rows, first, counts = numpy.unique(
+            rows, return_index=True, return_counts=True)
+        for row in unique_rows[counts > 1]:
+            logger.warning(
+                "Population {} has multiple recorded data for time {}",
+                label, row * sampling_rate)
 
-        placement = placements.get_placement_of_vertex(vertex)
-        if n_per_timestep == 0:
-            return None
+        # Where a time step was recorded more than once, keep the first
+        out[unique_rows] = placement_data[valid][first]
+        return out
 
-        # for buffering output info is taken form the buffer manager
-        record_raw, missing_data = buffer_manager.get_data_by_placement(
-            placement, region)
+    def _get_placement_matrix_data(
+            self, record_raw, missing_data, expected_rows, sampling_rate,
+            label, data_type, n_per_timestep, out):
+        """ processes a placement for matrix data
+
+        :param bytearray record_raw: the data recorded by the placement
+        :param bool missing_data:
+            whether the buffer manager reported data missing from the
+            placement
+        :param int expected_rows:
+            how many rows the tools think should be recorded
+        :param int sampling_rate: the rate of sampling
+        :param str label: the vertex label.
+        :param ~data_specification.enums.DataType data_type:
+            the type of the recorded values
+        :param int n_per_timestep: the number of values recorded per row
+        :param ~numpy.ndarray out:
+            the columns of the population data to write the placement into,
+            with expected_rows rows and n_per_timestep columns
+        :return: True if rows were missing from the data
+        :rtype: bool
+        """
         record_length = len(record_raw)
 
         # If there is no data, return empty for all timesteps
         if record_length == 0:
-            return numpy.zeros((expected_rows, n_per_timestep),
-                               dtype="float64")
+            out.fill(0)
+            return False
 
         # There is one column for time and one for each neuron recording
         data_row_length = n_per_timestep * data_type.size
@@ -288,75 +316,92 @@ class NeuronRecorder(object):
         placement_data = self._convert_placement_matrix_data(
             row_data, n_rows, data_row_length, n_per_timestep, data_type)
 
-        # If everything is there, return it
+        # If everything is there, copy it in
         if not missing_data and n_rows == expected_rows:
-            return placement_data
+            out[:] = placement_data
+            return False
 
         # Got data but its missing bits, so get times
-        time_bytes = (
-            row_data[:, 0: self._N_BYTES_FOR_TIMESTAMP].reshape(
-                n_rows * self._N_BYTES_FOR_TIMESTAMP))
-        times = time_bytes.view("<i4").reshape(n_rows, 1)
+        time_bytes = numpy.ascontiguousarray(
+            row_data[:, 0: self._N_BYTES_FOR_TIMESTAMP])
+        times = time_bytes.view("<i4").reshape(n_rows)
 
         # process data from core for missing data
-        placement_data = self._process_missing_data(
-            missing_str, placement, expected_rows, n_per_timestep, times,
-            sampling_rate, label, placement_data)
-        return placement_data
+        self._process_missing_data(
+            expected_rows, times, sampling_rate, label, placement_data, out)
+        return True
 
     def __read_data(
             self, label, buffer_manager, placements, application_vertex,
-            sampling_rate, data_type, variable, n_machine_time_steps):
-        vertices = (
+            sampling_rate, data_type, variable, n_machine_time_steps,
+            filename):
+        vertices = list(
             application_vertex.splitter.machine_vertices_for_recording(
                 variable))
         region = self.__region_ids[variable]
-        missing_str = ""
-        pop_level_data = None
         sampling_interval = get_sampling_interval(sampling_rate)
+        expected_rows = int(math.ceil(n_machine_time_steps / sampling_rate))
 
-        progress = ProgressBar(
-            vertices, "Getting {} for {}".format(variable, label))
-
+        # Work out where the columns of each core go before reading any, so
+        # that the data of each core can be written straight into place
         indexes = []
-        for i, vertex in enumerate(progress.over(vertices)):
-            expected_rows = int(
-                math.ceil(n_machine_time_steps / sampling_rate))
-
-            n_items_per_timestep = 1
+        offsets = []
+        for i, vertex in enumerate(vertices):
+            offsets.append(len(indexes))
             if variable in self.__sampling_rates:
-                neurons = self._neurons_recording(
-                    variable, vertex.vertex_slice)
-                n_items_per_timestep = len(neurons)
-                indexes.extend(neurons)
+                indexes.extend(self._neurons_recording(
+                    variable, vertex.vertex_slice))
             else:
                 indexes.append(i)
-            placement_data = self._get_placement_matrix_data(
-                placements, vertex, region, buffer_manager, expected_rows,
-                missing_str, sampling_rate, label, data_type,
-                n_items_per_timestep)
-
-            if placement_data is not None:
-                # append to the population data
-                if pop_level_data is None:
-                    pop_level_data = placement_data
-                else:
-                    # Add the slice fragment on axis 1
-                    # which is IDs/channel_index
-                    pop_level_data = numpy.append(
-                        pop_level_data, placement_data, axis=1)
+        offsets.append(len(indexes))
+        if not indexes:
+            return None, indexes, sampling_interval
+
+        if filename is None:
+            pop_level_data = numpy.empty(
+                (expected_rows, len(indexes)), dtype="float64")
+        else:
+            pop_level_data = numpy.lib.format.open_memmap(
+                filename, mode="w+", dtype="float64",
+                shape=(expected_rows, len(indexes)))
+
+        # Fetch the data of each core, then decode them all; each core
+        # writes to its own columns so the decoding can be done in parallel
+        progress = ProgressBar(
+            vertices, "Getting {} for {}".format(variable, label))
+        missing = []
+        placements_read = []
+        work = []
+        for i, vertex in enumerate(progress.over(vertices)):
+            start, end = offsets[i], offsets[i + 1]
+            if start == end:
+                continue
+            placement = placements.get_placement_of_vertex(vertex)
+            record_raw, missing_data = buffer_manager.get_data_by_placement(
+                placement, region)
+            placements_read.append((placement, missing_data))
+            work.append((
+                record_raw, missing_data, expected_rows, sampling_rate, label, data_type,
+                end - start, pop_level_data[:, start:end]))
+        rows_missing = _map_in_pool(self._get_placement_matrix_data, work)
+        for (placement, missing_data), missing_rows in zip(
+                placements_read, rows_missing):
+            if missing_data or missing_rows:
+                missing.append(placement)
 
         # warn user of missing data
-        if len(missing_str) > 0:
+        if missing:
             logger.warning(
                 "Population {} is missing recorded data in region {} from the"
-                " following cores: {}", label, region, missing_str)
+                " following cores: {}", label, region,
+                make_missing_string(missing))
 
         return pop_level_data, indexes, sampling_interval
 
     def get_matrix_data(
             self, label, buffer_manager, placements,
-            application_vertex, variable, n_machine_time_steps):
+            application_vertex, variable, n_machine_time_steps,
+            filename=None):
         """ Read a data mapped to time and neuron IDs from the SpiNNaker\
             machine and converts to required data types with scaling if needed.
 
@@ -371,9 +416,25 @@ class NeuronRecorder(object):
             ~pacman.model.graphs.application.ApplicationVertex
         :param str variable: PyNN name for the variable (`V`, `gsy_inh`, etc.)
         :param int n_machine_time_steps:
+        :param filename:
+            If given, the data is assembled in a memory-mapped ``.npy`` file
+            of this name rather than in memory
+        :type filename: str or None
         :return: (data, recording_indices, sampling_interval)
         :rtype: tuple(~numpy.ndarray, list(int), float)
         """
+        sampling_rate, data_type = self.__matrix_rate_and_type(variable)
+        return self.__read_data(
+            label, buffer_manager, placements, application_vertex,
+            sampling_rate, data_type, variable, n_machine_time_steps,
+            filename)
+
+    def __matrix_rate_and_type(self, variable):
+        """ Get how often a matrix variable is recorded and its data type
+
+        :param str variable: PyNN name for the variable
+        :rtype: tuple(int, ~data_specification.enums.DataType)
+        """
         if variable in self.__bitfield_variables:
             msg = ("Variable {} is not supported by get_matrix_data, use "
                    "get_spikes(...)").format(variable)
@@ -383,14 +444,93 @@ class NeuronRecorder(object):
                    "get_events(...)").format(variable)
             raise ConfigurationException(msg)
         if variable in self.__per_timestep_variables:
-            sampling_rate = 1
-            data_type = self.__per_timestep_datatypes[variable]
-        else:
-            sampling_rate = self.__sampling_rates[variable]
-            data_type = self.__data_types[variable]
-        return self.__read_data(
-            label, buffer_manager, placements, application_vertex,
-            sampling_rate, data_type, variable, n_machine_time_steps)
+            return 1, self.__per_timestep_datatypes[variable]
+        return (self.__sampling_rates[variable],
+                self.__data_types[variable])
+
+    def iter_matrix_data(
+            self, label, buffer_manager, placements, application_vertex,
+            variable, n_machine_time_steps, max_rows):
+        """ Read a data mapped to time and neuron IDs from the SpiNNaker\
+            machine one core and window of time steps at a time, so that\
+            only the recording of one core is held in memory at once.
+
+        :param str label: vertex label
+        :param buffer_manager: the manager for buffered data
+        :type buffer_manager:
+            ~spinn_front_end_common.interface.buffer_management.BufferManager
+        :param ~pacman.model.placements.Placements placements:
+            the placements object
+        :param application_vertex:
+        :type application_vertex:
+            ~pacman.model.graphs.application.ApplicationVertex
+        :param str variable: PyNN name for the variable (`V`, `gsy_inh`, etc.)
+        :param int n_machine_time_steps:
+        :param int max_rows: the most rows to decode at once
+        :return: for each core and window, the recording indexes, the first
+            row of the window and the data of the window
+        :rtype: iterable(tuple(list(int), int, ~numpy.ndarray))
+        """
+        sampling_rate, data_type = self.__matrix_rate_and_type(variable)
+        vertices = (
+            application_vertex.splitter.machine_vertices_for_recording(
+                variable))
+        region = self.__region_ids[variable]
+        expected_rows = int(math.ceil(n_machine_time_steps / sampling_rate))
+        missing = []
+        for i, vertex in enumerate(vertices):
+            if variable in self.__sampling_rates:
+                indexes = list(self._neurons_recording(
+                    variable, vertex.vertex_slice))
+            else:
+                indexes = [i]
+            n_items = len(indexes)
+            if n_items == 0:
+                continue
+            placement = placements.get_placement_of_vertex(vertex)
+            record_raw, missing_data = buffer_manager.get_data_by_placement(
+                placement, region)
+
+            data_row_length = n_items * data_type.size
+            full_row_length = data_row_length + self._N_BYTES_FOR_TIMESTAMP
+            n_rows = len(record_raw) // full_row_length
+            row_data = numpy.frombuffer(
+                record_raw, dtype="uint8", count=n_rows * full_row_length
+            ).reshape(n_rows, full_row_length)
+            times = numpy.ascontiguousarray(
+                row_data[:, 0: self._N_BYTES_FOR_TIMESTAMP]).view(
+                    "<i4").reshape(n_rows)
+            if missing_data or (n_rows and n_rows != expected_rows):
+                missing.append(placement)
+
+            for start in range(0, expected_rows, max_rows):
+                end = min(start + max_rows, expected_rows)
+                if n_rows == 0:
+                    # If there is no data, return empty for all timesteps
+                    block = numpy.zeros((end - start, n_items))
+                elif not missing_data and n_rows == expected_rows:
+                    block = self._convert_placement_matrix_data(
+                        row_data[start:end], end - start, data_row_length,
+                        n_items, data_type)
+                else:
+                    in_window = ((times >= start * sampling_rate) &
+                                 (times < end * sampling_rate))
+                    block = self._process_missing_data(
+                        end - start,
+                        times[in_window] - start * sampling_rate,
+                        sampling_rate, label,
+                        self._convert_placement_matrix_data(
+                            row_data[in_window],
+                            int(numpy.count_nonzero(in_window)),
+                            data_row_length, n_items, data_type))
+                yield indexes, start, block
+
+        # warn user of missing data
+        if missing:
+            logger.warning(
+                "Population {} is missing recorded data in region {} from the"
+                " following cores: {}", label, region,
+                make_missing_string(missing))
 
     def get_spikes(
             self, label, buffer_manager, placements, application_vertex,
@@ -416,69 +556,142 @@ class NeuronRecorder(object):
                 variable)
             raise ConfigurationException(msg)
 
-        spike_times = list()
-        spike_ids = list()
-
         vertices = (
             application_vertex.splitter.machine_vertices_for_recording(
                 variable))
-        missing_str = ""
+        region = self.__region_ids[variable]
+        missing = []
+        work = []
         progress = ProgressBar(vertices, "Getting spikes for {}".format(label))
         for vertex in progress.over(vertices):
             placement = placements.get_placement_of_vertex(vertex)
             vertex_slice = vertex.vertex_slice
 
-            neurons = list(self._neurons_recording(variable, vertex_slice))
-            neurons_recording = len(neurons)
-            if neurons_recording == 0:
+            neurons = numpy.fromiter(
+                self._neurons_recording(variable, vertex_slice),
+                dtype="int64")
+            if len(neurons) == 0:
                 continue
 
-            # Read the spikes
-            n_words = int(math.ceil(neurons_recording / BITS_PER_WORD))
-            n_bytes = n_words * BYTES_PER_WORD
-            n_words_with_timestamp = n_words + 1
-
             # for buffering output info is taken form the buffer manager
-            region = self.__region_ids[variable]
             record_raw, data_missing = buffer_manager.get_data_by_placement(
                     placement, region)
             if data_missing:
-                missing_str += "({}, {}, {}); ".format(
-                    placement.x, placement.y, placement.p)
+                missing.append(placement)
             if len(record_raw) > 0:
-                raw_data = (
-                    numpy.asarray(record_raw, dtype="uint8").view(
-                        dtype="<i4")).reshape([-1, n_words_with_timestamp])
-            else:
-                raw_data = record_raw
-            if len(raw_data) > 0:
-                record_time = raw_data[:, 0] * machine_time_step_ms()
-                spikes = raw_data[:, 1:].byteswap().view("uint8")
-                bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
-                    (-1, 32))).reshape((-1, n_bytes * 8))
-                time_indices, local_indices = numpy.where(bits == 1)
-                if self.__indexes[variable] is None:
-                    indices = local_indices + vertex_slice.lo_atom
-                    times = record_time[time_indices].reshape((-1))
-                    spike_ids.extend(indices)
-                    spike_times.extend(times)
-                else:
-                    for time_indice, local in zip(time_indices, local_indices):
-                        if local < neurons_recording:
-                            spike_ids.append(neurons[local])
-                            spike_times.append(record_time[time_indice])
+                work.append((record_raw, neurons))
 
-        if len(missing_str) > 0:
+        if missing:
             logger.warning(
                 "Population {} is missing spike data in region {} from the"
-                " following cores: {}", label, region, missing_str)
+                " following cores: {}", label, region,
+                make_missing_string(missing))
 
+        # Decode the cores, then merge them in slice order
+        decoded = _map_in_pool(self._decode_spikes, work)
+        if len(decoded) == 0:
+            return numpy.zeros((0, 2), dtype="float")
+        spike_ids = numpy.concatenate([ids for ids, _ in decoded])
+        spike_times = numpy.concatenate([times for _, times in decoded])
         if len(spike_ids) == 0:
             return numpy.zeros((0, 2), dtype="float")
 
         result = numpy.column_stack((spike_ids, spike_times))
         return result[numpy.lexsort((spike_times, spike_ids))]
 
+    @staticmethod
+    def _decode_spikes(record_raw, neurons):
+        """ Decode the spikes recorded by a single core
+
+        :param bytearray record_raw: the data recorded by the core
+        :param ~numpy.ndarray neurons:
+            the neurons recorded by the core, in the order of their bits
+        :return: the ids and times of the spikes
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        neurons_recording = len(neurons)
+        n_words = int(math.ceil(neurons_recording / BITS_PER_WORD))
+        n_words_with_timestamp = n_words + 1
+
+        raw_data = (
+            numpy.asarray(record_raw, dtype="uint8").view(
+                dtype="<i4")).reshape([-1, n_words_with_timestamp])
+
+        # Only unpack the time steps in which something spiked
+        rows = numpy.flatnonzero(raw_data[:, 1:].any(axis=1))
+        record_time = raw_data[rows, 0] * machine_time_step_ms()
+        spikes = raw_data[rows, 1:].byteswap().view("uint8")
+        time_indices, bit_indices = numpy.nonzero(
+            numpy.unpackbits(spikes, axis=1))
+
+        # The bytes are swapped so each word unpacks most significant bit
+        # first; flip the index within the word rather than the bits
+        local_indices = bit_indices ^ (BITS_PER_WORD - 1)
+
+        # Drop the padding bits of the last word, then map to the neurons
+        recorded = local_indices < neurons_recording
+        return (neurons[local_indices[recorded]],
+                record_time[time_indices[recorded]])
+
+    def iter_spikes(
+            self, label, buffer_manager, placements, application_vertex,
+            variable, max_rows):
+        """ Read spikes mapped to time and neuron IDs from the SpiNNaker\
+            machine one core and window of recorded time steps at a time, so\
+            that only the recording of one core is held in memory at once.
+
+        :param str label: vertex label
+        :param buffer_manager: the manager for buffered data
+        :type buffer_manager:
+            ~spinn_front_end_common.interface.buffer_management.BufferManager
+        :param ~pacman.model.placements.Placements placements:
+            the placements object
+        :param application_vertex:
+        :type application_vertex:
+            ~pacman.model.graphs.application.ApplicationVertex
+        :param str variable:
+        :param int max_rows: the most recorded time steps to decode at once
+        :return: for each core and window, the ids and times of the spikes,
+            ordered by time
+        :rtype: iterable(tuple(~numpy.ndarray, ~numpy.ndarray))
+        """
+        if variable not in self.__bitfield_variables:
+            msg = "Variable {} is not supported, use get_matrix_data".format(
+                variable)
+            raise ConfigurationException(msg)
+
+        vertices = (
+            application_vertex.splitter.machine_vertices_for_recording(
+                variable))
+        region = self.__region_ids[variable]
+        missing = []
+        for vertex in vertices:
+            neurons = numpy.fromiter(
+                self._neurons_recording(variable, vertex.vertex_slice),
+                dtype="int64")
+            if len(neurons) == 0:
+                continue
+            placement = placements.get_placement_of_vertex(vertex)
+            record_raw, data_missing = buffer_manager.get_data_by_placement(
+                placement, region)
+            if data_missing:
+                missing.append(placement)
+
+            n_words = int(math.ceil(len(neurons) / BITS_PER_WORD))
+            row_length = (n_words + 1) * BYTES_PER_WORD
+            window = max_rows * row_length
+            raw = memoryview(record_raw)
+            n_bytes = len(raw) - len(raw) % row_length
+            for start in range(0, n_bytes, window):
+                yield self._decode_spikes(
+                    raw[start:min(start + window, n_bytes)], neurons)
+
+        if missing:
+            logger.warning(
+                "Population {} is missing spike data in region {} from the"
+                " following cores: {}", label, region,
+                make_missing_string(missing))
+
     def get_events(
             self, label, buffer_manager, placements,
             application_vertex, variable):
@@ -509,6 +722,65 @@ class NeuronRecorder(object):
                 "{}".format(variable, self.get_event_recordable_variables()))
             raise ConfigurationException(msg)
 
+    def iter_events(
+            self, label, buffer_manager, placements, application_vertex,
+            variable, max_rows):
+        """ Read events mapped to time and neuron IDs from the SpiNNaker\
+            machine one core and window of events at a time, so that only\
+            the recording of one core is held in memory at once.
+
+        :param str label: vertex label
+        :param buffer_manager: the manager for buffered data
+        :type buffer_manager:
+            ~spinn_front_end_common.interface.buffer_management.BufferManager
+        :param ~pacman.model.placements.Placements placements:
+            the placements object
+        :param application_vertex:
+        :type application_vertex:
+            ~pacman.model.graphs.application.ApplicationVertex
+        :param str variable:
+        :param int max_rows: the most events to decode at once
+        :return: for each core and window, the events, one row per event
+            of the time, pre-id, post-id and value, ordered as by
+            :py:meth:`get_events`
+        :rtype: iterable(~numpy.ndarray)
+        """
+        if variable != self.REWIRING:
+            msg = (
+                "Variable {} is not supported. Supported event variables are: "
+                "{}".format(variable, self.get_event_recordable_variables()))
+            raise ConfigurationException(msg)
+
+        vertices = (
+            application_vertex.splitter.machine_vertices_for_recording(
+                variable))
+        region = self.__region_ids[variable]
+        missing = []
+        window = max_rows * self.REWIRING_N_WORDS * BYTES_PER_WORD
+        for vertex in vertices:
+            vertex_slice = vertex.vertex_slice
+            if vertex_slice.n_atoms == 0:
+                continue
+            placement = placements.get_placement_of_vertex(vertex)
+            record_raw, data_missing = buffer_manager.get_data_by_placement(
+                placement, region)
+            if data_missing:
+                missing.append(placement)
+
+            raw = memoryview(record_raw)
+            for start in range(0, len(raw), window):
+                times, pre_ids, post_ids, values = self._decode_rewires(
+                    raw[start:start + window], vertex_slice)
+                yield numpy.column_stack(
+                    (times, pre_ids, post_ids, values))[
+                        numpy.lexsort((values, post_ids, pre_ids, times))]
+
+        if missing:
+            logger.warning(
+                "Population {} is missing rewiring data in region {} from the"
+                " following cores: {}", label, region,
+                make_missing_string(missing))
+
     def _get_rewires(
             self, label, buffer_manager, placements, application_vertex,
             variable):
@@ -528,66 +800,40 @@ class NeuronRecorder(object):
         :return:
         :rtype: ~numpy.ndarray(tuple(int,int,int,int))
         """
-        rewire_times = list()
-        rewire_values = list()
-        rewire_postids = list()
-        rewire_preids = list()
-
         vertices = (
             application_vertex.splitter.machine_vertices_for_recording(
                 variable))
-        missing_str = ""
+        region = self.__region_ids[variable]
+        missing = []
+        work = []
         progress = ProgressBar(
             vertices, "Getting rewires for {}".format(label))
         for vertex in progress.over(vertices):
             placement = placements.get_placement_of_vertex(vertex)
             vertex_slice = vertex.vertex_slice
-
-            neurons = list(
-                range(vertex_slice.lo_atom, vertex_slice.hi_atom + 1))
-            neurons_recording = len(neurons)
-            if neurons_recording == 0:
+            if vertex_slice.n_atoms == 0:
                 continue
 
             # for buffering output info is taken form the buffer manager
-            region = self.__region_ids[variable]
             record_raw, data_missing = buffer_manager.get_data_by_placement(
                     placement, region)
             if data_missing:
-                missing_str += "({}, {}, {}); ".format(
-                    placement.x, placement.y, placement.p)
+                missing.append(placement)
             if len(record_raw) > 0:
-                raw_data = (
-                    numpy.asarray(record_raw, dtype="uint8").view(
-                        dtype="<i4")).reshape([-1, self.REWIRING_N_WORDS])
-            else:
-                raw_data = record_raw
-
-            if len(raw_data) > 0:
-                record_time = raw_data[:, 0] * machine_time_step_ms()
-                rewires_raw = raw_data[:, 1:]
-                rew_length = len(rewires_raw)
-                # rewires is 0 (elimination) or 1 (formation) in the first bit
-                rewires = [rewires_raw[i][0] & self._FIRST_BIT
-                           for i in range(rew_length)]
-                # the post-neuron ID is stored in the next 8 bytes
-                post_ids = [((int(rewires_raw[i]) >> self._POST_ID_SHIFT) %
-                            self._POST_ID_FACTOR) + vertex_slice.lo_atom
-                            for i in range(rew_length)]
-                # the pre-neuron ID is stored in the remaining 23 bytes
-                pre_ids = [int(rewires_raw[i]) >> self._PRE_ID_SHIFT
-                           for i in range(rew_length)]
-
-                rewire_values.extend(rewires)
-                rewire_postids.extend(post_ids)
-                rewire_preids.extend(pre_ids)
-                rewire_times.extend(record_time)
-
-        if len(missing_str) > 0:
+                work.append((record_raw, vertex_slice))
+
+        if missing:
             logger.warning(
                 "Population {} is missing rewiring data in region {} from the"
-                " following cores: {}", label, region, missing_str)
+                " following cores: {}", label, region,
+                make_missing_string(missing))
 
+        # Decode the cores, then merge them in slice order
+        decoded = _map_in_pool(self._decode_rewires, work)
+        if len(decoded) == 0:
+            return numpy.zeros((0, 4), dtype="float")
+        rewire_times, rewire_preids, rewire_postids, rewire_values = (
+            numpy.concatenate(column) for column in zip(*decoded))
         if len(rewire_values) == 0:
             return numpy.zeros((0, 4), dtype="float")
 
@@ -596,6 +842,30 @@ class NeuronRecorder(object):
         return result[numpy.lexsort(
             (rewire_values, rewire_postids, rewire_preids, rewire_times))]
 
+    def _decode_rewires(self, record_raw, vertex_slice):
+        """ Decode the rewires recorded by a single core
+
+        :param bytearray record_raw: the data recorded by the core
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            the slice of the core
+        :return: the times, pre-ids, post-ids and values of the rewires
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray,
+            ~numpy.ndarray)
+        """
+        raw_data = (
+            numpy.asarray(record_raw, dtype="uint8").view(
+                dtype="<i4")).reshape([-1, self.REWIRING_N_WORDS])
+        record_time = raw_data[:, 0] * machine_time_step_ms()
+        rewires_raw = raw_data[:, 1].astype("int64")
+        # rewires is 0 (elimination) or 1 (formation) in the first bit
+        rewires = rewires_raw & self._FIRST_BIT
+        # the post-neuron ID is stored in the next 8 bytes
+        post_ids = ((rewires_raw >> self._POST_ID_SHIFT) %
+                    self._POST_ID_FACTOR) + vertex_slice.lo_atom
+        # the pre-neuron ID is stored in the remaining 23 bytes
+        pre_ids = rewires_raw >> self._PRE_ID_SHIFT
+        return record_time, pre_ids, post_ids, rewires
+
     def get_recordable_variables(self):
         """
         :rtype: iterable(str)
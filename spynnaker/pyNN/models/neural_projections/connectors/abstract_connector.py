@@ -58,7 +58,8 @@ class AbstractConnector(object, metaclass=AbstractBase):
         "__verbose",
         "_weights",
         "__param_seeds",
-        "__synapse_info"]
+        "__synapse_info",
+        "__version"]
 
     def __init__(self, safe=True, callback=None, verbose=False, rng=None):
         """
@@ -83,6 +84,7 @@ class AbstractConnector(object, metaclass=AbstractBase):
         self.__min_delay = 0
         self.__param_seeds = dict()
         self.__synapse_info = None
+        self.__version = 0
 
     def set_space(self, space):
         """ Set the space object (allowed after instantiation).
@@ -90,6 +92,22 @@ class AbstractConnector(object, metaclass=AbstractBase):
         :param ~pyNN.space.Space space:
         """
         self.__space = space
+        self._changed()
+
+    def _changed(self):
+        """ Note that the connections made by the connector have changed,\
+            so that anything worked out from them must be worked out again
+        """
+        self.__version += 1
+
+    @property
+    def version(self):
+        """ The number of times the connector has been changed; anything\
+            worked out from the connector can be kept until this changes
+
+        :rtype: int
+        """
+        return self.__version
 
     def set_projection_information(self, synapse_info):
         """ sets a connectors projection info
@@ -624,6 +642,7 @@ class AbstractConnector(object, metaclass=AbstractBase):
         :param ~pyNN.space.Space new_value:
         """
         self.__space = new_value
+        self._changed()
 
     @property
     def synapse_info(self):
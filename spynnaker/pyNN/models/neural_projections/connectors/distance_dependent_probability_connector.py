@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
 import math
 import numpy
 from numpy import (
@@ -24,6 +25,7 @@ from spinn_utilities.safe_eval import SafeEval
 from spynnaker.pyNN.utilities.utility_calls import (
     get_probable_maximum_selected, get_probable_minimum_selected)
 from .abstract_connector import AbstractConnector
+from .tiled_probabilities import TiledProbabilities
 
 # support for arbitrary expression for the distance dependence
 _d_expr_context = SafeEval(math, numpy, arccos, arcsin, arctan, arctan2, ceil,
@@ -93,25 +95,41 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         """
         :param SynapseInformation synapse_info:
         """
-        # Set the probabilities up-front for now
-        # TODO: Work out how this can be done statistically
+        # The probabilities are worked out a block at a time when needed, as
+        # those of all the pairs of neurons might not fit in memory
+        self.__probs = TiledProbabilities(
+            functools.partial(self._get_probabilities, synapse_info),
+            synapse_info.n_pre_neurons, synapse_info.n_post_neurons)
+
+    def _get_probabilities(
+            self, synapse_info, pre_lo, pre_hi, post_lo, post_hi):
+        """ Get the probabilities of the connections between a range of\
+            pre-neurons and a range of post-neurons
+
+        :param SynapseInformation synapse_info:
+        :param int pre_lo: The first pre-neuron
+        :param int pre_hi: One more than the last pre-neuron
+        :param int post_lo: The first post-neuron
+        :param int post_hi: One more than the last post-neuron
+        :rtype: ~numpy.ndarray
+        """
         expand_distances = self._expand_distances(self.__d_expression)
         pre_positions = synapse_info.pre_population.positions
         post_positions = synapse_info.post_population.positions
 
         d1 = self.space.distances(
-            pre_positions, post_positions, expand_distances)
+            pre_positions[:, pre_lo:pre_hi],
+            post_positions[:, post_lo:post_hi], expand_distances)
 
         # PyNN 0.8 returns a flattened (C-style) array from space.distances,
         # so the easiest thing to do here is to reshape back to the "expected"
         # PyNN 0.7 shape; otherwise later code gets confusing and difficult
         if (len(d1.shape) == 1):
-            d = numpy.reshape(d1, (pre_positions.shape[0],
-                                   post_positions.shape[0]))
+            d = numpy.reshape(d1, (pre_hi - pre_lo, post_hi - post_lo))
         else:
             d = d1
 
-        self.__probs = _d_expr_context.eval(self.__d_expression, d=d)
+        return _d_expr_context.eval(self.__d_expression, d=d)
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, synapse_info):
@@ -120,7 +138,7 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             get_probable_maximum_selected(
                 synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
                 synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-                numpy.amax(self.__probs)),
+                self.__probs.max_probability()),
             synapse_info)
 
     @overrides(AbstractConnector.get_delay_minimum)
@@ -130,7 +148,7 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             get_probable_minimum_selected(
                 synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
                 synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-                numpy.amax(self.__probs)),
+                self.__probs.max_probability()),
             synapse_info)
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
@@ -138,9 +156,7 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             self, post_vertex_slice, synapse_info, min_delay=None,
             max_delay=None):
         # pylint: disable=too-many-arguments
-        max_prob = numpy.amax(
-            self.__probs[0:synapse_info.n_pre_neurons,
-                         post_vertex_slice.as_slice])
+        max_prob = self.__probs.max_probability(post_vertex_slice)
         n_connections = get_probable_maximum_selected(
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
             post_vertex_slice.n_atoms, max_prob)
@@ -159,7 +175,7 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         return get_probable_maximum_selected(
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
             synapse_info.n_post_neurons,
-            numpy.amax(self.__probs))
+            self.__probs.max_probability())
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self, synapse_info):
@@ -169,15 +185,15 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             get_probable_maximum_selected(
                 synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
                 synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-                numpy.amax(self.__probs)),
+                self.__probs.max_probability()),
             synapse_info)
 
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
             synapse_type, synapse_info):
-        probs = self.__probs[
-            pre_vertex_slice.as_slice, post_vertex_slice.as_slice].reshape(-1)
+        probs = self.__probs.get_block(
+            pre_vertex_slice, post_vertex_slice).reshape(-1)
         n_items = pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms
         items = self._rng.next(n_items)
 
@@ -219,6 +235,7 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
     @allow_self_connections.setter
     def allow_self_connections(self, new_value):
         self.__allow_self_connections = new_value
+        self._changed()
 
     @property
     def d_expression(self):
@@ -231,3 +248,4 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
     @d_expression.setter
     def d_expression(self, new_value):
         self.__d_expression = new_value
+        self._changed()
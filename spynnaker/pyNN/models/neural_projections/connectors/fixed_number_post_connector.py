@@ -289,6 +289,7 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
     @allow_self_connections.setter
     def allow_self_connections(self, new_value):
         self.__allow_self_connections = new_value
+        self._changed()
 
     @property
     @overrides(AbstractGenerateConnectorOnMachine.gen_connector_id)
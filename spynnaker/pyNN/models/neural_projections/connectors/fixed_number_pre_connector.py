@@ -26,6 +26,9 @@ from .abstract_connector_supports_views_on_machine import (
 
 N_GEN_PARAMS = 8
 
+# The most random numbers drawn at once when choosing the pre-neurons
+_MAX_BATCH_SIZE = 2 ** 22
+
 
 class FixedNumberPreConnector(AbstractGenerateConnectorOnMachine,
                               AbstractConnectorSupportsViewsOnMachine):
@@ -36,6 +39,9 @@ class FixedNumberPreConnector(AbstractGenerateConnectorOnMachine,
     __slots__ = [
         "__allow_self_connections",
         "__n_pre",
+        # The pre-neurons of each post-neuron, as post * n_pre_neurons + pre,
+        # sorted, so that those of a range of post-neurons that are in a
+        # range of pre-neurons can be found by searching
         "__pre_neurons",
         "__pre_neurons_set",
         "__with_replacement",
@@ -115,15 +121,36 @@ class FixedNumberPreConnector(AbstractGenerateConnectorOnMachine,
             synapse_info)
 
     def _get_pre_neurons(self, synapse_info):
-        """
+        """ Get the pre-neurons of all the post-neurons, choosing them if\
+            not already done
+
         :param SynapseInformation synapse_info:
-        :rtype: list(~numpy.ndarray)
+        :return: The pre-neurons of each post-neuron in turn, sorted, as
+            ``post * n_pre_neurons + pre``
+        :rtype: ~numpy.ndarray
         """
         # If we haven't set the array up yet, do it now
         if not self.__pre_neurons_set:
-            self.__pre_neurons = [None] * synapse_info.n_post_neurons
+            n_pre_neurons = synapse_info.n_pre_neurons
+            n_post_neurons = synapse_info.n_post_neurons
+            self.__pre_neurons = numpy.empty(
+                n_post_neurons * self.__n_pre, dtype="int64")
             self.__pre_neurons_set = True
 
+            # The posts are done in batches, with one draw of random numbers
+            # for each batch
+            n_posts = max(1, _MAX_BATCH_SIZE // max(
+                1, self.__n_pre, n_pre_neurons if self.__is_dense(
+                    synapse_info) else 0))
+            for lo in range(0, n_post_neurons, n_posts):
+                posts = numpy.arange(
+                    lo, min(lo + n_posts, n_post_neurons), dtype="int64")
+                pre_neurons = self.__choose_pre_neurons(posts, synapse_info)
+                pre_neurons += posts[:, None] * n_pre_neurons
+                self.__pre_neurons[
+                    lo * self.__n_pre:(lo + len(posts)) * self.__n_pre] = \
+                    pre_neurons.ravel()
+
             # if verbose open a file to output the connectivity
             if self.verbose:
                 filename = synapse_info.pre_population.label + \
@@ -131,80 +158,138 @@ class FixedNumberPreConnector(AbstractGenerateConnectorOnMachine,
                     '_fixednumberpre-conn.csv'
                 with open(filename, 'w') as file_handle:
                     numpy.savetxt(file_handle,
-                                  [(synapse_info.n_pre_neurons,
-                                    synapse_info.n_post_neurons,
+                                  [(n_pre_neurons, n_post_neurons,
                                     self.__n_pre)],
                                   fmt="%u,%u,%u")
 
-            # Loop over all the post neurons
-            for m in range(0, synapse_info.n_post_neurons):
-
-                # If the pre and post populations are the same
-                # then deal with allow_self_connections=False
-                if ((synapse_info.pre_population
-                        is synapse_info.post_population)
-                        and not self.__allow_self_connections):
-                    # Exclude the current pre-neuron from the post-neuron
-                    # list
-                    no_self_pre_neurons = [
-                        n for n in range(
-                            synapse_info.n_pre_neurons) if n != m]
-
-                    # Now use this list in the random choice
-                    self.__pre_neurons[m] = self._rng.choice(
-                        no_self_pre_neurons, self.__n_pre,
-                        self.__with_replacement)
-                else:
-                    self.__pre_neurons[m] = self._rng.choice(
-                        synapse_info.n_pre_neurons, self.__n_pre,
-                        self.__with_replacement)
-
-                # Sort the neurons now that we have them
-                self.__pre_neurons[m].sort()
-
-                # If verbose then output the list connected to this
-                # post-neuron
-                if self.verbose:
+                    # Output the list connected to each post-neuron
                     numpy.savetxt(
                         file_handle,
-                        self.__pre_neurons[m][None, :],
+                        (self.__pre_neurons % n_pre_neurons).reshape(
+                            n_post_neurons, self.__n_pre),
                         fmt=("%u," * (self.__n_pre - 1) + "%u"))
 
         return self.__pre_neurons
 
-    def _pre_neurons_in_slice(self, pre_vertex_slice, n, synapse_info):
+    def __excludes_self(self, synapse_info):
+        """ Whether a post-neuron can't connect to the pre-neuron with the\
+            same index
+
+        :param SynapseInformation synapse_info:
+        :rtype: bool
         """
-        :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
-        :param int n:
+        return (synapse_info.pre_population is synapse_info.post_population
+                and not self.__allow_self_connections)
+
+    def __n_choices(self, synapse_info):
+        """ The number of pre-neurons that each post-neuron can choose from
+
         :param SynapseInformation synapse_info:
-        :rtype: ~numpy.ndarray
+        :rtype: int
         """
-        pre_neurons = self._get_pre_neurons(synapse_info)
+        if self.__excludes_self(synapse_info):
+            return synapse_info.n_pre_neurons - 1
+        return synapse_info.n_pre_neurons
+
+    def __is_dense(self, synapse_info):
+        """ Whether so many of the pre-neurons are chosen without replacement\
+            that they are chosen by shuffling them all rather than by picking\
+            them one at a time
 
-        # Take the nth array and get the bits from it we need
-        # for this pre-vertex slice
-        this_pre_neuron_array = pre_neurons[n]
-        return this_pre_neuron_array[numpy.logical_and(
-            this_pre_neuron_array >= pre_vertex_slice.lo_atom,
-            this_pre_neuron_array <= pre_vertex_slice.hi_atom)]
+        :param SynapseInformation synapse_info:
+        :rtype: bool
+        """
+        return (not self.__with_replacement and
+                2 * self.__n_pre > self.__n_choices(synapse_info))
 
-    def _n_pre_neurons_in_slice(self, pre_vertex_slice, n, synapse_info):
-        """ Count the number of post neurons in the slice. \
-            Faster than ``len(_pre_neurons_in_slice(...))``.
+    def __draw(self, shape, n_choices):
+        """ Draw pre-neuron indices with replacement
+
+        :param tuple(int,int) shape: The number of each to draw
+        :param int n_choices: The number of indices to draw from
+        :rtype: ~numpy.ndarray
+        """
+        count = shape[0] * shape[1]
+        if not count:
+            return numpy.zeros(shape, dtype="int64")
+        values = numpy.floor(
+            numpy.atleast_1d(self._rng.next(count)) * n_choices)
+        return numpy.minimum(values, n_choices - 1).astype(
+            "int64").reshape(shape)
+
+    def __choose_pre_neurons(self, posts, synapse_info):
+        """ Choose the pre-neurons of some post-neurons
+
+        :param ~numpy.ndarray posts: The post-neurons
+        :param SynapseInformation synapse_info:
+        :return: The pre-neurons with a sorted row per post-neuron
+        :rtype: ~numpy.ndarray
+        """
+        n = self.__n_pre
+        n_choices = self.__n_choices(synapse_info)
+        shape = (len(posts), n)
+        if self.__with_replacement:
+            chosen = self.__draw(shape, n_choices)
+        elif not self.__is_dense(synapse_info):
+            # Draw with replacement, then draw again in place of any that
+            # are the same as another of the same post-neuron until there
+            # are none
+            chosen = self.__draw(shape, n_choices)
+            chosen.sort(axis=1)
+            repeated = numpy.zeros(shape, dtype="bool")
+            repeated[:, 1:] = chosen[:, 1:] == chosen[:, :-1]
+            while numpy.any(repeated):
+                chosen[repeated] = self.__draw(
+                    (1, numpy.count_nonzero(repeated)), n_choices)[0]
+                chosen.sort(axis=1)
+                repeated[:, 1:] = chosen[:, 1:] == chosen[:, :-1]
+        elif n == n_choices:
+            chosen = numpy.tile(numpy.arange(n_choices), (len(posts), 1))
+        else:
+            # Shuffle all the choices of each post-neuron, and take the
+            # first n of each
+            keys = numpy.atleast_1d(self._rng.next(
+                len(posts) * n_choices)).reshape(len(posts), n_choices)
+            chosen = numpy.argpartition(keys, n - 1, axis=1)[:, :n]
+
+        # Skip over the post-neuron itself if it is excluded; this keeps the
+        # order of the pre-neurons
+        if self.__excludes_self(synapse_info):
+            chosen += chosen >= posts[:, None]
+        chosen.sort(axis=1)
+        return chosen
+
+    def _pre_neurons_in_slice(
+            self, pre_vertex_slice, post_vertex_slice, synapse_info):
+        """ Get the connections from the pre-neurons of a slice to the\
+            post-neurons of a slice
 
         :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
-        :param int n:
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
         :param SynapseInformation synapse_info:
-        :rtype: int
+        :return: The pre-neuron and post-neuron of each connection, in order
+            of post-neuron and then pre-neuron
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
         """
         pre_neurons = self._get_pre_neurons(synapse_info)
-
-        # Take the nth array and get the bits from it we need
-        # for this pre-vertex slice
-        this_pre_neuron_array = pre_neurons[n]
-        return numpy.count_nonzero(numpy.logical_and(
-            this_pre_neuron_array >= pre_vertex_slice.lo_atom,
-            this_pre_neuron_array <= pre_vertex_slice.hi_atom))
+        n_pre_neurons = synapse_info.n_pre_neurons
+
+        # Find where the pre-neurons of the slice start and end for each
+        # post-neuron
+        post_keys = numpy.arange(
+            post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1,
+            dtype="int64") * n_pre_neurons
+        starts = numpy.searchsorted(
+            pre_neurons, post_keys + pre_vertex_slice.lo_atom, side="left")
+        ends = numpy.searchsorted(
+            pre_neurons, post_keys + pre_vertex_slice.hi_atom, side="right")
+
+        # Gather the ranges together
+        counts = ends - starts
+        index = numpy.arange(numpy.sum(counts)) + numpy.repeat(
+            starts - (numpy.cumsum(counts) - counts), counts)
+        connections = pre_neurons[index]
+        return connections % n_pre_neurons, connections // n_pre_neurons
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
@@ -249,31 +334,15 @@ class FixedNumberPreConnector(AbstractGenerateConnectorOnMachine,
             synapse_type, synapse_info):
         # pylint: disable=too-many-arguments
 
-        # Get lo and hi for the post vertex
-        lo = post_vertex_slice.lo_atom
-        hi = post_vertex_slice.hi_atom
-
-        # Get number of connections
-        n_connections = sum(
-            self._n_pre_neurons_in_slice(pre_vertex_slice, n, synapse_info)
-            for n in range(lo, hi + 1))
+        sources, targets = self._pre_neurons_in_slice(
+            pre_vertex_slice, post_vertex_slice, synapse_info)
+        n_connections = len(sources)
 
         # Set up the block
         block = numpy.zeros(
             n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
-
-        # Set up source and target
-        pre_neurons_in_slice = []
-        post_neurons_in_slice = []
-        post_vertex_array = numpy.arange(lo, hi + 1)
-        for n in range(lo, hi + 1):
-            for pn in self._pre_neurons_in_slice(
-                    pre_vertex_slice, n, synapse_info):
-                pre_neurons_in_slice.append(pn)
-                post_neurons_in_slice.append(post_vertex_array[n - lo])
-
-        block["source"] = pre_neurons_in_slice
-        block["target"] = post_neurons_in_slice
+        block["source"] = sources
+        block["target"] = targets
 
         block["weight"] = self._generate_weights(
             block["source"], block["target"], n_connections, None,
@@ -294,6 +363,7 @@ class FixedNumberPreConnector(AbstractGenerateConnectorOnMachine,
     @allow_self_connections.setter
     def allow_self_connections(self, new_value):
         self.__allow_self_connections = new_value
+        self._changed()
 
     @property
     @overrides(AbstractGenerateConnectorOnMachine.gen_connector_id)
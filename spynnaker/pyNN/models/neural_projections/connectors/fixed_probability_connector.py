@@ -199,3 +199,4 @@ class FixedProbabilityConnector(AbstractGenerateConnectorOnMachine,
             raise ConfigurationException(
                 "The probability must be between 0 and 1 (inclusive)")
         self._p_connect = new_value
+        self._changed()
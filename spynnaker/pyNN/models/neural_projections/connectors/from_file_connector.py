@@ -13,11 +13,17 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
 import os
 import numpy
 from pyNN.recording.files import StandardTextFile
+from spynnaker.pyNN.utilities.connection_file import (
+    is_connection_file, read_connection_file)
 from .from_list_connector import FromListConnector
 
+# The ending of the name of a file that holds a numpy array
+_NUMPY_SUFFIX = ".npy"
+
 
 class FromFileConnector(FromListConnector):
     """ Make connections according to a list read from a file.
@@ -27,7 +33,8 @@ class FromFileConnector(FromListConnector):
 
     def __init__(
             self, file,  # @ReservedAssignment
-            distributed=False, safe=True, callback=None, verbose=False):
+            distributed=False, safe=True, callback=None, verbose=False,
+            column_names=None, compact=False):
         """
         :param str file:
             Either an open file object or the filename of a file containing a
@@ -39,6 +46,12 @@ class FromFileConnector(FromListConnector):
                 # columns = ["i", "j", "weight", "delay", "U", "tau_rec"]
 
             Note that the header requires `#` at the beginning of the line.
+
+            A filename ending in ``.npy`` is read as a 2D numpy array instead,
+            which is memory-mapped rather than loaded.  A filename ending in
+            ``.spyconn`` is read as a binary connection file, as written by
+            :py:meth:`~spynnaker.pyNN.models.projection.Projection.save`,
+            which is also memory-mapped, and which holds its column names.
         :type file: str or ~io.FileIO
         :param bool distributed:
             Basic pyNN says:
@@ -61,8 +74,28 @@ class FromFileConnector(FromListConnector):
         :param bool verbose:
             Whether to output extra information about the connectivity to a
             CSV file
+        :param column_names:
+            The names of the columns after the first two, if not given in the
+            file; needed for a ``.npy`` file unless the columns are
+            ``weight, delay``
+        :type column_names: None or tuple(str) or list(str)
+        :param bool compact:
+            Whether to keep the connections compactly, as described in
+            :py:class:`FromListConnector`
         """
         self._file = file
+        reader = None
+        if is_connection_file(file):
+            reader = read_connection_file
+        elif isinstance(file, str) and file.endswith(_NUMPY_SUFFIX):
+            reader = functools.partial(numpy.load, mmap_mode="r")
+        if reader is not None:
+            conn_list = self._read_binary_conn_list(file, distributed, reader)
+            super().__init__(
+                conn_list, safe=safe, verbose=verbose,
+                column_names=column_names, callback=callback,
+                compact=compact)
+            return
         if isinstance(file, str):
             real_file = self.get_reader(file)
             try:
@@ -72,16 +105,37 @@ class FromFileConnector(FromListConnector):
         else:
             conn_list = self._read_conn_list(file, distributed)
 
-        column_names = self.get_reader(self._file).get_metadata().get(
+        file_column_names = self.get_reader(self._file).get_metadata().get(
             'columns')
-        if column_names is not None:
-            column_names = [column for column in column_names
+        if file_column_names is not None:
+            column_names = [column for column in file_column_names
                             if column not in ("i", "j")]
 
         # pylint: disable=too-many-arguments
         super().__init__(
             conn_list, safe=safe, verbose=verbose,
-            column_names=column_names, callback=callback)
+            column_names=column_names, callback=callback, compact=compact)
+
+    @staticmethod
+    def _read_binary_conn_list(filename, distributed, reader):
+        """ Memory-map a connection list saved in a binary file
+
+        :param str filename:
+        :param bool distributed:
+            Whether to read all the files named after the file, which are
+            joined, so are no longer memory-mapped
+        :param callable(str,~numpy.ndarray) reader:
+            How to memory-map a file
+        :rtype: ~numpy.ndarray
+        """
+        if not distributed:
+            return reader(filename)
+        prefix = "{}.".format(os.path.basename(filename))
+        directory = os.path.dirname(filename)
+        return numpy.concatenate([
+            reader(os.path.join(directory, found_file))
+            for found_file in sorted(os.listdir(directory))
+            if found_file.startswith(prefix)])
 
     def _read_conn_list(self, the_file, distributed):
         if not distributed:
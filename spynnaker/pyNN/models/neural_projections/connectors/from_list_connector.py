@@ -27,6 +27,9 @@ _SOURCE = 0
 _TARGET = 1
 _FIRST_PARAM = 2
 
+# The largest number of connections indexed with 32-bit indices
+_MAX_32_BIT_CONNECTIONS = 2 ** 32
+
 
 class FromListConnector(AbstractConnector):
     """ Make connections according to a list.
@@ -40,12 +43,15 @@ class FromListConnector(AbstractConnector):
         "__delays",
         "__extra_parameters",
         "__extra_parameter_names",
+        "__compact",
+        "__columns",
         "__split_conn_list",
+        "__split_order",
         "__split_pre_slices",
         "__split_post_slices"]
 
     def __init__(self, conn_list, safe=True, verbose=False, column_names=None,
-                 callback=None):
+                 callback=None, compact=False):
         """
         :param conn_list:
             A numpy array or a list of tuples, one tuple for each connection.
@@ -59,6 +65,10 @@ class FromListConnector(AbstractConnector):
             ``p1``, ``p2``, etc. are the synaptic parameters (e.g.,
             weight, delay, plasticity parameters).
             All tuples/rows must have the same number of items.
+            A numpy structured array can be given instead, with a field per
+            column, in which case the names of the fields after the first
+            two are the column names if these are not given; the array is
+            not copied, so it can be memory-mapped.
         :type conn_list: ~numpy.ndarray or list(tuple(int,int,...))
         :param bool safe:
             if ``True``, check that weights and delays have valid values.
@@ -75,11 +85,18 @@ class FromListConnector(AbstractConnector):
 
             .. note::
                 Not supported by sPyNNaker.
+        :param bool compact:
+            If ``True``, keep the sources and targets as 32-bit integers and
+            the weights and delays as 32-bit floats, rather than keeping the
+            list itself; this needs much less memory for big lists, and lets
+            a memory-mapped array be read without loading it all as floats.
         """
         super().__init__(safe, callback, verbose)
 
         self.__column_names = column_names
+        self.__compact = compact
         self.__split_conn_list = {}
+        self.__split_order = None
         self.__split_pre_slices = None
         self.__split_post_slices = None
 
@@ -145,29 +162,34 @@ class FromListConnector(AbstractConnector):
         n_bins = (len(pre_bins) + 1, len(post_bins) + 1)
         joined_indices = numpy.ravel_multi_index(
             (pre_indices, post_indices), n_bins)
+        del pre_indices, post_indices
 
         # Get a count of the indices in each bin
         index_count = numpy.bincount(
             joined_indices, minlength=numpy.prod(n_bins))
 
-        # Get a sort order on the connections
-        sort_indices = numpy.argsort(joined_indices)
-
-        # Split the sort order in to groups of connection indices
-        split_indices = numpy.array(numpy.split(
-            sort_indices, numpy.cumsum(index_count)))
-
-        # Ignore the outliers
-        split_indices = split_indices[:-1].reshape(n_bins)[1:-1, 1:-1]
-        split_indices = split_indices.reshape(-1)
-
-        # Get the results indexed by hi_atom in the slices
-        pre_post_bins = [(pre - 1, post - 1) for pre in pre_bins[1:]
-                         for post in post_bins[1:]]
+        # Get a sort order on the connections, which holds the connections
+        # of each bin one after the other, so the connections of a bin are a
+        # range of the order
+        sort_indices = numpy.argsort(joined_indices, kind="mergesort")
+        del joined_indices
+        if len(sort_indices) < _MAX_32_BIT_CONNECTIONS:
+            sort_indices = sort_indices.astype("uint32")
+        self.__split_order = sort_indices
+        ends = numpy.cumsum(index_count)
+        starts = ends - index_count
+
+        # Get the ranges indexed by hi_atom in the slices, ignoring the
+        # outliers
+        pre_post_bins = numpy.flatnonzero(index_count)
+        pre_bin_indices, post_bin_indices = numpy.unravel_index(
+            pre_post_bins, n_bins)
         self.__split_conn_list = {
-            pre_post: indices
-            for pre_post, indices in zip(pre_post_bins, split_indices)
-            if len(indices) > 0
+            (int(pre_bins[pre] - 1), int(post_bins[post] - 1)): (
+                int(starts[i]), int(ends[i]))
+            for i, pre, post in zip(
+                pre_post_bins, pre_bin_indices, post_bin_indices)
+            if 0 < pre < len(pre_bins) and 0 < post < len(post_bins)
         }
 
         return True
@@ -251,9 +273,8 @@ class FromListConnector(AbstractConnector):
         post_hi = post_vertex_slice.hi_atom
         if (pre_hi, post_hi) not in self.__split_conn_list:
             return numpy.zeros(0, dtype=self.NUMPY_SYNAPSES_DTYPE)
-        else:
-            indices = self.__split_conn_list[
-                pre_vertex_slice.hi_atom, post_vertex_slice.hi_atom]
+        start, end = self.__split_conn_list[pre_hi, post_hi]
+        indices = self.__split_order[start:end]
         block = numpy.zeros(len(indices), dtype=self.NUMPY_SYNAPSES_DTYPE)
         block["source"] = self.__sources[indices]
         block["target"] = self.__targets[indices]
@@ -288,9 +309,26 @@ class FromListConnector(AbstractConnector):
     def conn_list(self):
         """ The connection list.
 
+        .. note::
+            If the connector is compact, or was given a structured array,
+            this is made again from the values kept, so the delays are
+            rounded to time steps (and if compact, the weights and delays
+            are 32-bit floats).
+
         :rtype: ~numpy.ndarray
         """
-        return self.__conn_list
+        if self.__conn_list is not None:
+            return self.__conn_list
+        columns = [self.__sources, self.__targets]
+        for name in self.__columns:
+            if name == "weight":
+                columns.append(self.__weights)
+            elif name == "delay":
+                columns.append(self.__delays)
+            else:
+                columns.append(self.__extra_parameters[
+                    :, self.__extra_parameter_names.index(name)])
+        return numpy.column_stack(columns)
 
     def get_n_connections(self, pre_slices, post_slices, pre_hi, post_hi):
         """
@@ -306,20 +344,32 @@ class FromListConnector(AbstractConnector):
     @conn_list.setter
     def conn_list(self, conn_list):
         if conn_list is None or not len(conn_list):
-            self.__conn_list = numpy.zeros((0, 2), dtype="uint32")
+            conn_list = numpy.zeros((0, 2), dtype="uint32")
+        elif self.__compact or (isinstance(conn_list, numpy.ndarray) and
+                                conn_list.dtype.names is not None):
+            # Don't copy an array, as it might be memory-mapped
+            conn_list = numpy.asarray(conn_list)
         else:
-            self.__conn_list = numpy.array(conn_list)
+            conn_list = numpy.array(conn_list)
 
-        # If the shape of the conn_list is 2D, numpy has been able to create
-        # a 2D array which means every entry has the same number of values.
-        # If this was not possible, raise an exception!
-        if len(self.__conn_list.shape) != 2:
-            raise InvalidParameterType(
-                "Each tuple in the connection list for the"
-                " FromListConnector must have the same number of elements")
+        # A structured array has a field per column, which are kept rather
+        # than the array itself, as it might have fields of different types
+        structured = conn_list.dtype.names is not None
+        if structured:
+            columns = [conn_list[name] for name in conn_list.dtype.names]
+        else:
+            # If the shape of the conn_list is 2D, numpy has been able to
+            # create a 2D array which means every entry has the same number
+            # of values.  If this was not possible, raise an exception!
+            if len(conn_list.shape) != 2:
+                raise InvalidParameterType(
+                    "Each tuple in the connection list for the"
+                    " FromListConnector must have the same number of"
+                    " elements")
+            columns = [conn_list[:, i] for i in range(conn_list.shape[1])]
 
         # This tells us how many columns are in the list
-        n_columns = self.__conn_list.shape[1]
+        n_columns = len(columns)
         if n_columns < 2:
             raise InvalidParameterType(
                 "Each tuple in the connection list for the"
@@ -334,7 +384,9 @@ class FromListConnector(AbstractConnector):
         # Get the column names if not specified
         column_names = self.__column_names
         if self.__column_names is None:
-            if n_columns == 4:
+            if structured:
+                column_names = conn_list.dtype.names[_FIRST_PARAM:]
+            elif n_columns == 4:
                 column_names = ('weight', 'delay')
             elif n_columns == 2:
                 column_names = ()
@@ -343,15 +395,25 @@ class FromListConnector(AbstractConnector):
                     "Need to set 'column_names' for n_columns={}".format(
                         n_columns))
 
-        # Set the source and targets
-        self.__sources = self.__conn_list[:, _SOURCE]
-        self.__targets = self.__conn_list[:, _TARGET]
+        # Set the source and targets, keeping the list itself unless compact
+        # or structured
+        self.__columns = tuple(column_names)
+        if self.__compact:
+            self.__conn_list = None
+            self.__sources = columns[_SOURCE].astype("uint32")
+            self.__targets = columns[_TARGET].astype("uint32")
+        else:
+            self.__conn_list = None if structured else conn_list
+            self.__sources = columns[_SOURCE]
+            self.__targets = columns[_TARGET]
 
         # Find any weights
         self.__weights = None
         try:
             weight_column = column_names.index('weight') + _FIRST_PARAM
-            self.__weights = self.__conn_list[:, weight_column]
+            self.__weights = columns[weight_column]
+            if self.__compact:
+                self.__weights = self.__weights.astype("float32")
         except ValueError:
             pass
 
@@ -359,10 +421,7 @@ class FromListConnector(AbstractConnector):
         self.__delays = None
         try:
             delay_column = column_names.index('delay') + _FIRST_PARAM
-            self.__delays = (numpy.rint(
-                numpy.array(self.__conn_list[:, delay_column]) * (
-                    MICRO_TO_MILLISECOND_CONVERSION / machine_time_step())) *
-                    (machine_time_step() / MICRO_TO_MILLISECOND_CONVERSION))
+            self.__delays = self.__round_delays(columns[delay_column])
         except ValueError:
             pass
 
@@ -377,7 +436,7 @@ class FromListConnector(AbstractConnector):
         for i in extra_columns:
             # numpy.ptp gives the difference between the maximum and
             # minimum values of an array, so if 0, all values are equal
-            if numpy.ptp(self.__conn_list[:, i]):
+            if numpy.ptp(columns[i]):
                 raise ValueError(
                     "All values in column {} ({}) of a FromListConnector must"
                     " have the same value".format(
@@ -387,9 +446,28 @@ class FromListConnector(AbstractConnector):
         self.__extra_parameters = None
         self.__extra_parameter_names = None
         if extra_columns:
-            self.__extra_parameters = self.__conn_list[:, extra_columns]
+            self.__extra_parameters = numpy.column_stack(
+                [columns[i] for i in extra_columns])
             self.__extra_parameter_names = [
                 column_names[i - _FIRST_PARAM] for i in extra_columns]
+        self._changed()
+
+    def __round_delays(self, delays):
+        """ Round delays to whole time steps, without making more than one\
+            copy of a compact column
+
+        :param ~numpy.ndarray delays:
+        :rtype: ~numpy.ndarray
+        """
+        steps_per_ms = MICRO_TO_MILLISECOND_CONVERSION / machine_time_step()
+        ms_per_step = machine_time_step() / MICRO_TO_MILLISECOND_CONVERSION
+        if not self.__compact:
+            return numpy.rint(numpy.array(delays) * steps_per_ms) * ms_per_step
+        delays = delays.astype("float32")
+        delays *= steps_per_ms
+        numpy.rint(delays, out=delays)
+        delays *= ms_per_step
+        return delays
 
     @property
     def column_names(self):
@@ -404,6 +482,7 @@ class FromListConnector(AbstractConnector):
     @column_names.setter
     def column_names(self, column_names):
         self.__column_names = column_names
+        self._changed()
 
     def get_extra_parameters(self):
         """ Getter for the extra parameters. Excludes ``weight`` and\
@@ -23,6 +23,7 @@ from spinn_utilities.overrides import overrides
 from spinn_utilities.safe_eval import SafeEval
 from spynnaker.pyNN.utilities import utility_calls
 from .abstract_connector import AbstractConnector
+from .tiled_probabilities import TiledProbabilities
 
 # support for arbitrary expression for the indices
 _index_expr_context = SafeEval(math, numpy, arccos, arcsin, arctan, arctan2,
@@ -81,13 +82,31 @@ class IndexBasedProbabilityConnector(AbstractConnector):
         """
         :param SynapseInformation synapse_info:
         """
-        # note: this only needs to be done once
+        # note: this only needs to be done once; the probabilities are worked
+        # out a block at a time when needed, as those of all the pairs of
+        # neurons might not fit in memory
         if self.__probs is None:
-            # numpy array of probabilities using the index_expression
-            self.__probs = numpy.fromfunction(
-                lambda i, j: _index_expr_context.eval(
-                    self.__index_expression, i=i, j=j),
-                (synapse_info.n_pre_neurons, synapse_info.n_post_neurons))
+            self.__probs = TiledProbabilities(
+                self._get_probabilities, synapse_info.n_pre_neurons,
+                synapse_info.n_post_neurons)
+
+    def _get_probabilities(self, pre_lo, pre_hi, post_lo, post_hi):
+        """ Get the probabilities of the connections between a range of\
+            pre-neurons and a range of post-neurons using the\
+            index_expression
+
+        :param int pre_lo: The first pre-neuron
+        :param int pre_hi: One more than the last pre-neuron
+        :param int post_lo: The first post-neuron
+        :param int post_hi: One more than the last post-neuron
+        :rtype: ~numpy.ndarray
+        """
+        # The indices are given as floats, as numpy.fromfunction does
+        i, j = numpy.indices(
+            (pre_hi - pre_lo, post_hi - post_lo), dtype="float64")
+        i += pre_lo
+        j += post_lo
+        return _index_expr_context.eval(self.__index_expression, i=i, j=j)
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, synapse_info):
@@ -95,7 +114,7 @@ class IndexBasedProbabilityConnector(AbstractConnector):
         n_connections = utility_calls.get_probable_maximum_selected(
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-            numpy.amax(self.__probs))
+            self.__probs.max_probability())
         return self._get_delay_maximum(
             synapse_info.delays, n_connections, synapse_info)
 
@@ -105,7 +124,7 @@ class IndexBasedProbabilityConnector(AbstractConnector):
         n_connections = utility_calls.get_probable_minimum_selected(
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-            numpy.amax(self.__probs))
+            self.__probs.max_probability())
         return self._get_delay_minimum(
             synapse_info.delays, n_connections, synapse_info)
 
@@ -116,7 +135,7 @@ class IndexBasedProbabilityConnector(AbstractConnector):
         self._update_probs_from_index_expression(synapse_info)
         n_connections = utility_calls.get_probable_maximum_selected(
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-            post_vertex_slice.n_atoms, numpy.amax(self.__probs))
+            post_vertex_slice.n_atoms, self.__probs.max_probability())
 
         if min_delay is None or max_delay is None:
             return int(math.ceil(n_connections))
@@ -131,7 +150,7 @@ class IndexBasedProbabilityConnector(AbstractConnector):
         self._update_probs_from_index_expression(synapse_info)
         return utility_calls.get_probable_maximum_selected(
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-            synapse_info.n_pre_neurons, numpy.amax(self.__probs))
+            synapse_info.n_pre_neurons, self.__probs.max_probability())
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self, synapse_info):
@@ -139,7 +158,7 @@ class IndexBasedProbabilityConnector(AbstractConnector):
         n_connections = utility_calls.get_probable_maximum_selected(
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-            numpy.amax(self.__probs))
+            self.__probs.max_probability())
         return self._get_weight_maximum(
             synapse_info.weights, n_connections, synapse_info)
 
@@ -150,8 +169,8 @@ class IndexBasedProbabilityConnector(AbstractConnector):
         # setup probs here
         self._update_probs_from_index_expression(synapse_info)
 
-        probs = self.__probs[
-            pre_vertex_slice.as_slice, post_vertex_slice.as_slice].reshape(-1)
+        probs = self.__probs.get_block(
+            pre_vertex_slice, post_vertex_slice).reshape(-1)
 
         n_items = pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms
         items = self._rng.next(n_items)
@@ -197,6 +216,7 @@ class IndexBasedProbabilityConnector(AbstractConnector):
     @allow_self_connections.setter
     def allow_self_connections(self, new_value):
         self.__allow_self_connections = new_value
+        self._changed()
 
     @property
     def index_expression(self):
@@ -211,3 +231,4 @@ class IndexBasedProbabilityConnector(AbstractConnector):
     @index_expression.setter
     def index_expression(self, new_value):
         self.__index_expression = new_value
+        self._changed()
@@ -12,10 +12,12 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import functools
 import math
 import numpy
 from spinn_utilities.overrides import overrides
 from .abstract_connector import AbstractConnector
+from .tiled_probabilities import TiledProbabilities
 
 
 class SmallWorldConnector(AbstractConnector):
@@ -84,27 +86,44 @@ class SmallWorldConnector(AbstractConnector):
         """
         :param SynapseInformation synapse_info:
         """
-        # Get the probabilities up-front for now
-        # TODO: Work out how this can be done statistically
+        # The mask is worked out a block at a time when needed, as that of
+        # all the pairs of neurons might not fit in memory; the number of
+        # connections is found by going over it all a tile at a time
+        self.__mask = TiledProbabilities(
+            functools.partial(self._get_mask, synapse_info),
+            synapse_info.n_pre_neurons, synapse_info.n_post_neurons)
+
+        self.__n_connections = int(math.ceil(self.__mask.sum_probability()))
+
+    def _get_mask(self, synapse_info, pre_lo, pre_hi, post_lo, post_hi):
+        """ Get which pre-neurons of a range are connected to which\
+            post-neurons of a range, before rewiring
+
+        :param SynapseInformation synapse_info:
+        :param int pre_lo: The first pre-neuron
+        :param int pre_hi: One more than the last pre-neuron
+        :param int post_lo: The first post-neuron
+        :param int post_hi: One more than the last post-neuron
+        :return: 1 where there is a connection and 0 where not
+        :rtype: ~numpy.ndarray
+        """
         # space.distances(...) expects N,3 array in PyNN0.7, but 3,N in PyNN0.8
         pre_positions = synapse_info.pre_population.positions
         post_positions = synapse_info.post_population.positions
 
         distances = self.space.distances(
-            pre_positions, post_positions, False)
+            pre_positions[:, pre_lo:pre_hi],
+            post_positions[:, post_lo:post_hi], False)
 
         # PyNN 0.8 returns a flattened (C-style) array from space.distances,
         # so the easiest thing to do here is to reshape back to the "expected"
         # PyNN 0.7 shape; otherwise later code gets confusing and difficult
         if len(distances.shape) == 1:
-            d = numpy.reshape(distances, (pre_positions.shape[0],
-                                          post_positions.shape[0]))
+            d = numpy.reshape(distances, (pre_hi - pre_lo, post_hi - post_lo))
         else:
             d = distances
 
-        self.__mask = (d < self.__degree).astype(float)
-
-        self.__n_connections = int(math.ceil(numpy.sum(self.__mask)))
+        return (d < self.__degree).astype(float)
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, synapse_info):
@@ -121,9 +140,7 @@ class SmallWorldConnector(AbstractConnector):
             self, post_vertex_slice, synapse_info, min_delay=None,
             max_delay=None):
         # pylint: disable=too-many-arguments
-        n_connections = numpy.amax([
-            numpy.sum(self.__mask[i, post_vertex_slice.as_slice])
-            for i in range(synapse_info.n_pre_neurons)])
+        n_connections = self.__mask.max_pre_sum(post_vertex_slice)
 
         if min_delay is None or max_delay is None:
             return n_connections
@@ -135,9 +152,7 @@ class SmallWorldConnector(AbstractConnector):
     @overrides(AbstractConnector.get_n_connections_to_post_vertex_maximum)
     def get_n_connections_to_post_vertex_maximum(self, synapse_info):
         # pylint: disable=too-many-arguments
-        return numpy.amax([
-            numpy.sum(self.__mask[:, i]) for i in range(
-                synapse_info.n_post_neurons)])
+        return self.__mask.max_post_sum()
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self, synapse_info):
@@ -150,8 +165,8 @@ class SmallWorldConnector(AbstractConnector):
             self, pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
             synapse_type, synapse_info):
         # pylint: disable=too-many-arguments
-        ids = numpy.where(self.__mask[
-            pre_vertex_slice.as_slice, post_vertex_slice.as_slice])
+        ids = numpy.where(self.__mask.get_block(
+            pre_vertex_slice, post_vertex_slice))
         n_connections = len(ids[0])
 
         block = numpy.zeros(n_connections, dtype=self.NUMPY_SYNAPSES_DTYPE)
@@ -0,0 +1,184 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+
+# The most values worked out at once when going over all the values
+_MAX_TILE_SIZE = 2 ** 20
+
+
+class TiledProbabilities(object):
+    """ The probability of a connection between each pre- and post-neuron,\
+        worked out a block at a time when needed rather than all at once, so\
+        that the memory needed depends on the size of a core rather than the\
+        sizes of the populations.  The statistics of the probabilities over\
+        all the neurons are worked out in one pass over the whole, a tile at\
+        a time, and then kept.
+    """
+
+    __slots__ = [
+        # Gets the probabilities of a block, given the first and last+1 pre-
+        # and post-neurons
+        "__get_probabilities",
+
+        # The number of pre-neurons
+        "__n_pre",
+
+        # The number of post-neurons
+        "__n_post",
+
+        # The largest probability of a connection to each post-neuron
+        "__post_max",
+
+        # The sum of the probabilities of connection to each post-neuron
+        "__post_sum",
+
+        # The largest sum of the probabilities of connection from a pre-neuron
+        # to the neurons of a post-slice, by (lo_atom, hi_atom) of the slice
+        "__max_pre_sum"]
+
+    def __init__(self, get_probabilities, n_pre, n_post):
+        """
+        :param get_probabilities:
+            Gets the probabilities of the connections between a range of
+            pre-neurons and a range of post-neurons, given the first and
+            last+1 of each, as an array with a row per pre-neuron and a column
+            per post-neuron (or anything that can be broadcast to that)
+        :type get_probabilities:
+            callable(int, int, int, int, ~numpy.ndarray)
+        :param int n_pre: The number of pre-neurons
+        :param int n_post: The number of post-neurons
+        """
+        self.__get_probabilities = get_probabilities
+        self.__n_pre = n_pre
+        self.__n_post = n_post
+        self.__post_max = None
+        self.__post_sum = None
+        self.__max_pre_sum = dict()
+
+    def __get(self, pre_lo, pre_hi, post_lo, post_hi):
+        """ Get the probabilities of a block as a 2D array
+
+        :param int pre_lo: The first pre-neuron
+        :param int pre_hi: One more than the last pre-neuron
+        :param int post_lo: The first post-neuron
+        :param int post_hi: One more than the last post-neuron
+        :rtype: ~numpy.ndarray
+        """
+        probs = numpy.asarray(
+            self.__get_probabilities(pre_lo, pre_hi, post_lo, post_hi),
+            dtype="float64")
+        shape = (pre_hi - pre_lo, post_hi - post_lo)
+        if probs.shape == shape:
+            return probs
+        # A flat array holds the values in C order; anything else must be
+        # broadcast (e.g. a constant)
+        if probs.size == shape[0] * shape[1]:
+            return probs.reshape(shape)
+        return numpy.broadcast_to(probs, shape)
+
+    def __pre_tiles(self, n_columns):
+        """ Split the pre-neurons so that a tile with that many columns is\
+            not too big
+
+        :param int n_columns: The number of post-neurons in a tile
+        :return: The first and last+1 pre-neuron of each tile
+        :rtype: iterable(tuple(int, int))
+        """
+        n_rows = max(1, _MAX_TILE_SIZE // max(1, n_columns))
+        for pre_lo in range(0, self.__n_pre, n_rows):
+            yield pre_lo, min(pre_lo + n_rows, self.__n_pre)
+
+    def get_block(self, pre_vertex_slice, post_vertex_slice):
+        """ Get the probabilities of the connections between the neurons of\
+            a pre-slice and a post-slice
+
+        :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :return: The probabilities, with a row per pre-neuron
+        :rtype: ~numpy.ndarray
+        """
+        return self.__get(
+            pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom + 1,
+            post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1)
+
+    def __scan(self):
+        """ Work out the statistics per post-neuron in one pass over all the\
+            probabilities, if not already done
+        """
+        if self.__post_max is not None:
+            return
+        post_max = numpy.zeros(self.__n_post)
+        post_sum = numpy.zeros(self.__n_post)
+        n_columns = min(self.__n_post, _MAX_TILE_SIZE)
+        for post_lo in range(0, self.__n_post, n_columns):
+            post_hi = min(post_lo + n_columns, self.__n_post)
+            col_max = post_max[post_lo:post_hi]
+            col_sum = post_sum[post_lo:post_hi]
+            col_max.fill(-numpy.inf)
+            for pre_lo, pre_hi in self.__pre_tiles(post_hi - post_lo):
+                probs = self.__get(pre_lo, pre_hi, post_lo, post_hi)
+                numpy.maximum(col_max, probs.max(axis=0), out=col_max)
+                col_sum += probs.sum(axis=0)
+        self.__post_max = post_max
+        self.__post_sum = post_sum
+
+    def max_probability(self, post_vertex_slice=None):
+        """ Get the largest probability of a connection
+
+        :param post_vertex_slice:
+            If given, only connections to the neurons of this slice count
+        :type post_vertex_slice: ~pacman.model.graphs.common.Slice or None
+        :rtype: float
+        """
+        self.__scan()
+        if post_vertex_slice is None:
+            return numpy.amax(self.__post_max)
+        return numpy.amax(self.__post_max[post_vertex_slice.as_slice])
+
+    def sum_probability(self):
+        """ Get the sum of the probabilities of all the connections, i.e.\
+            the expected number of connections
+
+        :rtype: float
+        """
+        self.__scan()
+        return numpy.sum(self.__post_sum)
+
+    def max_post_sum(self):
+        """ Get the largest sum of the probabilities of the connections to a\
+            post-neuron
+
+        :rtype: float
+        """
+        self.__scan()
+        return numpy.amax(self.__post_sum)
+
+    def max_pre_sum(self, post_vertex_slice):
+        """ Get the largest sum of the probabilities of the connections from\
+            a pre-neuron to the neurons of a post-slice
+
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :rtype: float
+        """
+        key = (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        if key not in self.__max_pre_sum:
+            post_lo, post_hi = key[0], key[1] + 1
+            self.__max_pre_sum[key] = max((
+                numpy.amax(self.__get(
+                    pre_lo, pre_hi, post_lo, post_hi).sum(axis=1))
+                for pre_lo, pre_hi in self.__pre_tiles(post_hi - post_lo)),
+                default=0.0)
+        return self.__max_pre_sum[key]
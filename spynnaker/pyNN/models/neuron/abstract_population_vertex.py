@@ -13,6 +13,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import math
 import numpy
@@ -47,7 +49,7 @@ from spinn_front_end_common.utilities.globals_variables import (
 
 from spynnaker.pyNN.models.common import (
     AbstractSpikeRecordable, AbstractNeuronRecordable, AbstractEventRecordable,
-    NeuronRecorder)
+    AbstractStreamsRecording, NeuronRecorder)
 from spynnaker.pyNN.models.abstract_models import (
     AbstractPopulationInitializable, AbstractAcceptsIncomingSynapses,
     AbstractPopulationSettable, AbstractContainsUnits, AbstractMaxSpikes,
@@ -57,9 +59,12 @@ from spynnaker.pyNN.utilities.ranged import (
     SpynnakerRangeDictionary)
 from spynnaker.pyNN.utilities.constants import POSSION_SIGMA_SUMMATION_LIMIT
 from spynnaker.pyNN.utilities.running_stats import RunningStats
+from spynnaker.pyNN.utilities.utility_calls import get_n_bits
+from spynnaker.pyNN.utilities.bulk_memory_read import read_memory_in_bulk
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractSynapseDynamics, AbstractSynapseDynamicsStructural)
 from .synapse_io import get_max_row_info
+from .population_machine_synapses_provenance import N_TRACKED_SYNAPSE_TYPES
 from .master_pop_table import MasterPopTableAsBinarySearch
 from .generator_data import GeneratorData
 from .synaptic_matrices import SYNAPSES_BASE_GENERATOR_SDRAM_USAGE_IN_BYTES
@@ -78,13 +83,24 @@ _NEURON_BASE_N_CPU_CYCLES = 10
 # 1 for number of delay bits
 # 1 for drop late packets,
 # 1 for incoming spike buffer size
-_SYNAPSES_BASE_SDRAM_USAGE_IN_BYTES = 7 * BYTES_PER_WORD
+# 1 for whether to record the largest ring buffer values
+_SYNAPSES_BASE_SDRAM_USAGE_IN_BYTES = 8 * BYTES_PER_WORD
+
+# The value that a ring buffer saturates at
+_MAX_RING_BUFFER_VALUE = 0xFFFF
+
+# The statistics of the synapses of a projection that go into the ring buffer
+# shifts, before scaling by the global weight scale
+_SynapseStatistics = namedtuple("_SynapseStatistics", [
+    "weight_mean", "weight_variance", "delay_variance", "weight_max",
+    "n_connections", "weights_signed"])
 
 
 class AbstractPopulationVertex(
         TDMAAwareApplicationVertex, AbstractContainsUnits,
         AbstractSpikeRecordable, AbstractNeuronRecordable,
-        AbstractEventRecordable, AbstractProvidesOutgoingPartitionConstraints,
+        AbstractEventRecordable, AbstractStreamsRecording,
+        AbstractProvidesOutgoingPartitionConstraints,
         AbstractPopulationInitializable, AbstractPopulationSettable,
         AbstractChangableAfterRun, AbstractAcceptsIncomingSynapses,
         ProvidesKeyToAtomMappingImpl, AbstractCanReset):
@@ -114,7 +130,18 @@ class AbstractPopulationVertex(
         "__incoming_projections",
         "__synapse_dynamics",
         "__max_row_info",
-        "__self_projection"]
+        "__self_projection",
+        # The statistics of the synapses of each projection, with the
+        # version of the connector they were worked out from
+        "__synapse_statistics",
+        # The key and value of the last ring buffer maximum weights worked out
+        "__ring_buffer_max_weights",
+        # The ring buffer shifts written for each slice of the vertex
+        "__written_ring_buffer_shifts",
+        # The largest ring buffer values seen on the machine, as weights, and
+        # whether each synapse type was seen to saturate
+        "__observed_max_weights",
+        "__observed_saturation"]
 
     #: recording region IDs
     _SPIKE_RECORDING_REGION = 0
@@ -130,6 +157,7 @@ class AbstractPopulationVertex(
     _NEURON_BASE_N_CPU_CYCLES = 10
     _SYNAPSE_BASE_N_CPU_CYCLES_PER_NEURON = 22
     _SYNAPSE_BASE_N_CPU_CYCLES = 10
+    _RING_BUFFER_MAXIMA_N_CPU_CYCLES_PER_NEURON = 5
 
     # 5 elements before the start of global parameters
     # 1. has key, 2. key, 3. n atoms, 4. n_atoms_peak 5. n_synapse_types
@@ -232,6 +260,11 @@ class AbstractPopulationVertex(
         self.__incoming_projections = list()
         self.__max_row_info = dict()
         self.__self_projection = None
+        self.__synapse_statistics = dict()
+        self.__ring_buffer_max_weights = None
+        self.__written_ring_buffer_shifts = dict()
+        self.__observed_max_weights = None
+        self.__observed_saturation = None
 
         # Prepare for dealing with STDP - there can only be one (non-static)
         # synapse dynamics per vertex at present
@@ -432,12 +465,23 @@ class AbstractPopulationVertex(
             self.label, buffer_manager, placements, self,
             NeuronRecorder.SPIKES)
 
+    @overrides(AbstractStreamsRecording.iter_spikes)
+    def iter_spikes(self, placements, buffer_manager, max_rows):
+        return self.__neuron_recorder.iter_spikes(
+            self.label, buffer_manager, placements, self,
+            NeuronRecorder.SPIKES, max_rows)
+
     @overrides(AbstractEventRecordable.get_events)
     def get_events(
             self, variable, placements, buffer_manager):
         return self.__synapse_recorder.get_events(
             self.label, buffer_manager, placements, self, variable)
 
+    @overrides(AbstractStreamsRecording.iter_events)
+    def iter_events(self, variable, placements, buffer_manager, max_rows):
+        return self.__synapse_recorder.iter_events(
+            self.label, buffer_manager, placements, self, variable, max_rows)
+
     @overrides(AbstractNeuronRecordable.get_recordable_variables)
     def get_recordable_variables(self):
         variables = list()
@@ -489,6 +533,21 @@ class AbstractPopulationVertex(
                 n_machine_time_steps)
         self.__raise_var_not_supported(variable)
 
+    @overrides(AbstractStreamsRecording.iter_data)
+    def iter_data(
+            self, variable, n_machine_time_steps, placements, buffer_manager,
+            max_rows):
+        # pylint: disable=too-many-arguments
+        if self.__neuron_recorder.is_recordable(variable):
+            recorder = self.__neuron_recorder
+        elif self.__synapse_recorder.is_recordable(variable):
+            recorder = self.__synapse_recorder
+        else:
+            self.__raise_var_not_supported(variable)
+        return recorder.iter_matrix_data(
+            self.label, buffer_manager, placements, self, variable,
+            n_machine_time_steps, max_rows)
+
     @overrides(AbstractNeuronRecordable.get_neuron_sampling_interval)
     def get_neuron_sampling_interval(self, variable):
         if self.__neuron_recorder.is_recordable(variable):
@@ -747,14 +806,49 @@ class AbstractPopulationVertex(
             if isinstance(vertex, AbstractRewritesDataSpecification):
                 vertex.set_reload_required(True)
 
-        # If synapses change during the run,
+        # If synapses change during the run, write back the ones that have
+        # changed where possible, or generate them all again if not
         if (self.__synapse_dynamics is not None and
                 self.__synapse_dynamics.changes_during_run):
-            self.__change_requires_data_generation = True
+            if not self.__mark_synapses_changed():
+                self.__change_requires_data_generation = True
             for vertex in self.machine_vertices:
                 if isinstance(vertex, AbstractRewritesDataSpecification):
                     vertex.set_reload_required(True)
 
+        # If the ring buffer shifts now come out differently from those
+        # written to the machine, they are put in place by mapping again
+        if (self.__observed_max_weights is not None and
+                self.record_ring_buffer_maxima):
+            shifts = tuple(self.get_ring_buffer_shifts(
+                self.__incoming_projections))
+            if any(written != shifts for written in
+                   self.__written_ring_buffer_shifts.values()):
+                self.__change_requires_mapping = True
+                self.__written_ring_buffer_shifts.clear()
+
+    def __mark_synapses_changed(self):
+        """ Mark the synaptic matrices of the incoming projections that change\
+            during a run to be written back in place when the data is next\
+            reloaded
+
+        :return: Whether every core can write its matrices back in place
+        :rtype: bool
+        """
+        changed = set(
+            proj._synapse_information
+            for proj in self.__incoming_projections
+            if proj._synapse_information.synapse_dynamics.changes_during_run)
+        can_write_in_place = True
+        for vertex in self.machine_vertices:
+            if not isinstance(vertex, HasSynapses):
+                continue
+            if isinstance(vertex, AbstractRewritesDataSpecification):
+                can_write_in_place &= vertex.mark_synapses_changed(changed)
+            else:
+                can_write_in_place = False
+        return can_write_in_place
+
     @staticmethod
     def _ring_buffer_expected_upper_bound(
             weight_mean, weight_std_dev, spikes_per_second,
@@ -827,14 +921,166 @@ class AbstractPopulationVertex(
         return ((average_spikes_per_timestep * weight_mean) +
                 (sigma * math.sqrt(poisson_variance + weight_variance)))
 
+    def __get_synapse_statistics(self, synapse_info):
+        """ Get the statistics of the synapses of a projection, only working\
+            them out again if the connector has changed since they were last\
+            worked out
+
+        :param SynapseInformation synapse_info:
+        :rtype: _SynapseStatistics
+        """
+        connector = synapse_info.connector
+        version, stats = self.__synapse_statistics.get(
+            synapse_info, (None, None))
+        if stats is not None and version == connector.version:
+            return stats
+
+        synapse_dynamics = synapse_info.synapse_dynamics
+        stats = _SynapseStatistics(
+            weight_mean=synapse_dynamics.get_weight_mean(
+                connector, synapse_info),
+            weight_variance=synapse_dynamics.get_weight_variance(
+                connector, synapse_info.weights, synapse_info),
+            delay_variance=synapse_dynamics.get_delay_variance(
+                connector, synapse_info.delays, synapse_info),
+            weight_max=synapse_dynamics.get_weight_maximum(
+                connector, synapse_info),
+            n_connections=connector.get_n_connections_to_post_vertex_maximum(
+                synapse_info),
+            weights_signed=synapse_dynamics.are_weights_signed())
+        self.__synapse_statistics[synapse_info] = (connector.version, stats)
+        return stats
+
+    def __get_spike_rates(self, proj, steps_per_second):
+        """ Get the expected spikes per second and per tick of the source of\
+            a projection
+
+        :param ~spynnaker.pyNN.models.Projection proj:
+        :param float steps_per_second:
+        :rtype: tuple(float, float)
+        """
+        spikes_per_tick = max(
+            1.0, self.__spikes_per_second / steps_per_second)
+        spikes_per_second = self.__spikes_per_second
+        pre_vertex = proj._projection_edge.pre_vertex
+        if isinstance(pre_vertex, AbstractMaxSpikes):
+            rate = pre_vertex.max_spikes_per_second()
+            if rate != 0:
+                spikes_per_second = rate
+            spikes_per_tick = pre_vertex.max_spikes_per_ts()
+        return spikes_per_second, spikes_per_tick
+
     def get_ring_buffer_shifts(self, incoming_projections):
         """ Get the shift of the ring buffers for transfer of values into the
             input buffers for this model.
 
+        The statistics of each projection are kept until its connector\
+        changes, and the bounds are kept until any of their inputs change,\
+        so asking again for the same projections is cheap.
+
+        If ``ring_buffer_shifts_from_provenance`` is set, the largest values\
+        seen in the ring buffers in earlier runs are used in place of the\
+        bounds for the synapse types that had any input.
+
         :param list(~spynnaker.pyNN.models.Projection) incoming_projections:
             The projections to consider in the calculations
         :rtype: list(int)
         """
+        steps_per_second = MICRO_TO_SECOND_CONVERSION / machine_time_step()
+        rates = [self.__get_spike_rates(proj, steps_per_second)
+                 for proj in incoming_projections]
+        key = (
+            tuple((proj._synapse_information,
+                   proj._synapse_information.connector.version)
+                  for proj in incoming_projections),
+            tuple(rates), steps_per_second, self.__spikes_per_second,
+            self.__ring_buffer_sigma)
+        if (self.__ring_buffer_max_weights is None or
+                self.__ring_buffer_max_weights[0] != key):
+            self.__ring_buffer_max_weights = (
+                key, self.__compute_max_weights(incoming_projections, rates))
+        max_weights, weights_signed = self.__ring_buffer_max_weights[1]
+
+        if (self.__observed_max_weights is not None and
+                self.record_ring_buffer_maxima):
+            max_weights = self.__get_observed_max_weights(max_weights)
+
+        shifts = self.__get_ring_buffer_shifts(max_weights, weights_signed)
+        return list(shifts)
+
+    @property
+    def record_ring_buffer_maxima(self):
+        """ Whether the cores of this vertex note the largest values seen\
+            in their ring buffers, to set the ring buffer shifts of later runs
+
+        :rtype: bool
+        """
+        return get_config_bool(
+            "Simulation", "ring_buffer_shifts_from_provenance")
+
+    def set_written_ring_buffer_shifts(self, vertex_slice, ring_buffer_shifts):
+        """ Note the ring buffer shifts written for a slice of this vertex,\
+            against which the values seen in its ring buffers are read
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The slice of the vertex the shifts were written for
+        :param list(int) ring_buffer_shifts: The shifts written
+        """
+        self.__written_ring_buffer_shifts[vertex_slice] = tuple(
+            ring_buffer_shifts)
+
+    def __get_observed_max_weights(self, max_weights):
+        """ Get the maximum weights from what was seen in the ring buffers,\
+            with a margin; synapse types that had no input keep the bound,\
+            and those that saturated use at least twice what was seen
+
+        :param ~numpy.ndarray max_weights: The bounds on the weights
+        :rtype: ~numpy.ndarray
+        """
+        margin = get_config_float("Simulation", "ring_buffer_shift_margin")
+        observed = self.__observed_max_weights * margin
+        return numpy.where(
+            self.__observed_saturation,
+            numpy.maximum(max_weights, observed * 2),
+            numpy.where(observed > 0, observed, max_weights))
+
+    def add_ring_buffer_maxima(self, vertex_slice, max_values):
+        """ Note the largest values seen in the ring buffers of a core of\
+            this vertex during a run, as read from its provenance data
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The slice of the vertex on the core
+        :param list(int) max_values:
+            The largest value seen in the ring buffers of each synapse type;
+            any beyond the number of synapse types are ignored, and any
+            missing are taken as not seen
+        """
+        shifts = self.__written_ring_buffer_shifts.get(vertex_slice)
+        if shifts is None:
+            return
+        n_synapse_types = len(shifts)
+        values = numpy.zeros(n_synapse_types)
+        n_values = min(len(max_values), n_synapse_types)
+        values[:n_values] = max_values[:n_values]
+        weight_scales = numpy.array([
+            self.__get_weight_scale(shift) for shift in shifts])
+        if self.__observed_max_weights is None:
+            self.__observed_max_weights = numpy.zeros(n_synapse_types)
+            self.__observed_saturation = numpy.zeros(
+                n_synapse_types, dtype="bool")
+        self.__observed_max_weights = numpy.maximum(
+            self.__observed_max_weights, values / weight_scales)
+        self.__observed_saturation |= values >= _MAX_RING_BUFFER_VALUE
+
+    def __compute_max_weights(self, incoming_projections, rates):
+        """ Get the bounds on the values in the ring buffers of each\
+            synapse type, and whether any weights are signed
+
+        :param list(~spynnaker.pyNN.models.Projection) incoming_projections:
+        :param list(tuple(float, float)) rates:
+            The spikes per second and per tick of each projection
+        :rtype: tuple(~numpy.ndarray, bool)
+        """
         weight_scale = self.__neuron_impl.get_global_weight_scale()
         weight_scale_squared = weight_scale * weight_scale
         n_synapse_types = self.__neuron_impl.get_n_synapse_types()
@@ -844,51 +1090,30 @@ class AbstractPopulationVertex(
         biggest_weight = numpy.zeros(n_synapse_types)
         weights_signed = False
         rate_stats = [RunningStats() for _ in range(n_synapse_types)]
-        steps_per_second = MICRO_TO_SECOND_CONVERSION / machine_time_step()
 
-        for proj in incoming_projections:
+        for proj, (spikes_per_second, spikes_per_tick) in zip(
+                incoming_projections, rates):
             synapse_info = proj._synapse_information
             synapse_type = synapse_info.synapse_type
-            synapse_dynamics = synapse_info.synapse_dynamics
-            connector = synapse_info.connector
-
-            weight_mean = (
-                synapse_dynamics.get_weight_mean(
-                    connector, synapse_info) * weight_scale)
-            n_connections = \
-                connector.get_n_connections_to_post_vertex_maximum(
-                    synapse_info)
-            weight_variance = synapse_dynamics.get_weight_variance(
-                connector, synapse_info.weights,
-                synapse_info) * weight_scale_squared
-            running_totals[synapse_type].add_items(
-                weight_mean, weight_variance, n_connections)
+            stats = self.__get_synapse_statistics(synapse_info)
+            n_connections = stats.n_connections
 
-            delay_variance = synapse_dynamics.get_delay_variance(
-                connector, synapse_info.delays, synapse_info)
+            running_totals[synapse_type].add_items(
+                stats.weight_mean * weight_scale,
+                stats.weight_variance * weight_scale_squared, n_connections)
             delay_running_totals[synapse_type].add_items(
-                0.0, delay_variance, n_connections)
+                0.0, stats.delay_variance, n_connections)
 
-            weight_max = (synapse_dynamics.get_weight_maximum(
-                connector, synapse_info) * weight_scale)
+            weight_max = stats.weight_max * weight_scale
             biggest_weight[synapse_type] = max(
                 biggest_weight[synapse_type], weight_max)
 
-            spikes_per_tick = max(
-                1.0, self.__spikes_per_second / steps_per_second)
-            spikes_per_second = self.__spikes_per_second
-            pre_vertex = proj._projection_edge.pre_vertex
-            if isinstance(pre_vertex, AbstractMaxSpikes):
-                rate = pre_vertex.max_spikes_per_second()
-                if rate != 0:
-                    spikes_per_second = rate
-                spikes_per_tick = pre_vertex.max_spikes_per_ts()
             rate_stats[synapse_type].add_items(
                 spikes_per_second, 0, n_connections)
             total_weights[synapse_type] += spikes_per_tick * (
                 weight_max * n_connections)
 
-            if synapse_dynamics.are_weights_signed():
+            if stats.weights_signed:
                 weights_signed = True
 
         max_weights = numpy.zeros(n_synapse_types)
@@ -906,7 +1131,16 @@ class AbstractPopulationVertex(
                     total_weights[synapse_type])
                 max_weights[synapse_type] = max(
                     max_weights[synapse_type], biggest_weight[synapse_type])
+        return max_weights, weights_signed
+
+    @staticmethod
+    def __get_ring_buffer_shifts(max_weights, weights_signed):
+        """ Get the shifts that allow values up to the maximum weights
 
+        :param ~numpy.ndarray max_weights:
+        :param bool weights_signed:
+        :rtype: list(int)
+        """
         # Convert these to powers; we could use int.bit_length() for this if
         # they were integers, but they aren't...
         max_weight_powers = (
@@ -953,19 +1187,69 @@ class AbstractPopulationVertex(
     @overrides(AbstractAcceptsIncomingSynapses.get_connections_from_machine)
     def get_connections_from_machine(
             self, transceiver, placements, app_edge, synapse_info):
+        # Read anything not already read in one pass, so that the decoding
+        # below doesn't need to go to the machine
+        read_memory_in_bulk(transceiver, self.get_connection_reads(
+            transceiver, placements, app_edge, synapse_info))
+
+        post_vertices = [
+            post_vertex for post_vertex in self.machine_vertices
+            if isinstance(post_vertex, HasSynapses)]
+        progress = ProgressBar(
+            len(post_vertices),
+            "Getting synaptic data between {} and {}".format(
+                app_edge.pre_vertex.label, app_edge.post_vertex.label))
+
+        def decode(post_vertex):
+            placement = placements.get_placement_of_vertex(post_vertex)
+            return post_vertex.get_connections_from_machine(
+                transceiver, placement, app_edge, synapse_info)
+
         # Start with something in the list so that concatenate works
         connections = [numpy.zeros(
                 0, dtype=AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)]
+        n_threads = get_config_int("Simulation", "n_synaptic_read_threads")
+        if n_threads is None or n_threads <= 1 or len(post_vertices) <= 1:
+            for post_vertex in progress.over(post_vertices):
+                connections.extend(decode(post_vertex))
+        else:
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                for vertex_connections in progress.over(
+                        executor.map(decode, post_vertices)):
+                    connections.extend(vertex_connections)
+        return numpy.concatenate(connections)
+
+    @overrides(AbstractAcceptsIncomingSynapses.iter_connections_from_machine)
+    def iter_connections_from_machine(
+            self, transceiver, placements, app_edge, synapse_info):
+        # Read anything not already read in one pass, but decode a core at
+        # a time, so that only the connections of one core are held at once
+        read_memory_in_bulk(transceiver, self.get_connection_reads(
+            transceiver, placements, app_edge, synapse_info))
+        post_vertices = [
+            post_vertex for post_vertex in self.machine_vertices
+            if isinstance(post_vertex, HasSynapses)]
         progress = ProgressBar(
-            len(self.machine_vertices),
+            len(post_vertices),
             "Getting synaptic data between {} and {}".format(
                 app_edge.pre_vertex.label, app_edge.post_vertex.label))
-        for post_vertex in progress.over(self.machine_vertices):
+        for post_vertex in progress.over(post_vertices):
+            placement = placements.get_placement_of_vertex(post_vertex)
+            for connections in post_vertex.get_connections_from_machine(
+                    transceiver, placement, app_edge, synapse_info):
+                if len(connections):
+                    yield connections
+
+    @overrides(AbstractAcceptsIncomingSynapses.get_connection_reads)
+    def get_connection_reads(
+            self, transceiver, placements, app_edge, synapse_info):
+        reads = list()
+        for post_vertex in self.machine_vertices:
             if isinstance(post_vertex, HasSynapses):
                 placement = placements.get_placement_of_vertex(post_vertex)
-                connections.extend(post_vertex.get_connections_from_machine(
+                reads.extend(post_vertex.get_connection_reads(
                     transceiver, placement, app_edge, synapse_info))
-        return numpy.concatenate(connections)
+        return reads
 
     def get_synapse_params_size(self):
         """ Get the size of the synapse parameters in bytes
@@ -1276,11 +1560,21 @@ class AbstractPopulationVertex(
 
         :rtype: int
         """
-        return (
+        cycles = (
             self._SYNAPSE_BASE_N_CPU_CYCLES +
             (self._SYNAPSE_BASE_N_CPU_CYCLES_PER_NEURON *
              vertex_slice.n_atoms) +
             self.__synapse_recorder.get_n_cpu_cycles(vertex_slice.n_atoms))
+        if self.record_ring_buffer_maxima:
+            # Every ring buffer of the tracked synapse types is looked at
+            # each timestep, including those past the end of the slice
+            n_types = min(
+                self.__neuron_impl.get_n_synapse_types(),
+                N_TRACKED_SYNAPSE_TYPES)
+            cycles += (
+                self._RING_BUFFER_MAXIMA_N_CPU_CYCLES_PER_NEURON * n_types *
+                (1 << get_n_bits(vertex_slice.n_atoms)))
+        return cycles
 
     @property
     def incoming_projections(self):
@@ -20,6 +20,8 @@ from spinn_utilities.overrides import overrides
 _population_parameters = dict(
     AbstractPyNNNeuronModel.default_population_parameters)
 _population_parameters["n_steps_per_timestep"] = 1
+_population_parameters["erfc_mode"] = "integral"
+_population_parameters["adaptive_tolerance"] = 0.0
 
 
 class AbstractPyNNMeanfieldModelStandard(AbstractPyNNNeuronModel):
@@ -56,13 +58,17 @@ class AbstractPyNNMeanfieldModelStandard(AbstractPyNNNeuronModel):
             synapse_type, threshold_type, additional_input_type))
 
     @overrides(AbstractPyNNNeuronModel.create_vertex,
-               additional_arguments={"n_steps_per_timestep"})
+               additional_arguments={
+                   "n_steps_per_timestep", "erfc_mode", "adaptive_tolerance"})
     def create_vertex(
             self, n_neurons, label, constraints, spikes_per_second,
             ring_buffer_sigma, incoming_spike_buffer_size,
-            n_steps_per_timestep, drop_late_spikes, splitter):
+            n_steps_per_timestep, erfc_mode, adaptive_tolerance,
+            drop_late_spikes, splitter):
         # pylint: disable=arguments-differ
         self._model.n_steps_per_timestep = n_steps_per_timestep
+        self._model.erfc_mode = erfc_mode
+        self._model.adaptive_tolerance = adaptive_tolerance
         return super().create_vertex(
             n_neurons, label, constraints, spikes_per_second,
             ring_buffer_sigma, incoming_spike_buffer_size, drop_late_spikes,
@@ -14,7 +14,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy
-from numpy.lib.recfunctions import merge_arrays
+from scipy.sparse import csr_matrix
 
 
 class ConnectionHolder(object):
@@ -47,12 +47,20 @@ class ConnectionHolder(object):
         "__fixed_values",
 
         # A callback to call with the data when finished
-        "__notify"
+        "__notify",
+
+        # True if matrices should be returned as scipy.sparse matrices
+        # rather than dense arrays
+        "__sparse",
+
+        # True if a list should be sorted by source then target
+        "__sort"
     )
 
     def __init__(
             self, data_items_to_return, as_list, n_pre_atoms, n_post_atoms,
-            connections=None, fixed_values=None, notify=None):
+            connections=None, fixed_values=None, notify=None, sparse=False,
+            sort=True):
         """
         :param data_items_to_return: A list of data fields to be returned
         :type data_items_to_return: list(int) or tuple(int) or None
@@ -78,6 +86,13 @@ class ConnectionHolder(object):
             This should accept a single parameter, which will contain the
             data requested
         :type notify: callable(ConnectionHolder, None) or None
+        :param bool sparse:
+            True if matrices are to be returned as
+            :py:class:`scipy.sparse.csr_matrix` rather than dense arrays;
+            entries without a connection are then absent rather than NaN
+        :param bool sort:
+            True if a list is to be sorted by source then target; if False,
+            it is in the order that the connections were added
         """
         # pylint: disable=too-many-arguments
         self.__data_items_to_return = data_items_to_return
@@ -88,6 +103,8 @@ class ConnectionHolder(object):
         self.__data_items = None
         self.__notify = notify
         self.__fixed_values = fixed_values
+        self.__sparse = sparse
+        self.__sort = sort
 
     def add_connections(self, connections):
         """ Add connections to the holder to be returned
@@ -138,77 +155,138 @@ class ConnectionHolder(object):
                     "This may be because you are using a virtual machine. "
                     "This projection creates connections on machine.")
 
-        # Join all the connections that have been added (probably over multiple
-        # sub-vertices of a population)
-        connections = numpy.concatenate(self.__connections)
-
-        # If there are additional fixed values, merge them in
-        if self.__fixed_values is not None and self.__fixed_values:
-            # Generate a numpy type for the fixed values
-            fixed_dtypes = [
-                ('{}'.format(field[0]), None)
-                for field in self.__fixed_values]
-
-            # Get the actual data as a record array
-            fixed_data = numpy.asarray(
-                tuple([field[1] for field in self.__fixed_values]),
-                dtype=fixed_dtypes)
-
-            # Tile the array to be the correct size
-            fixed_values = numpy.tile(fixed_data, [len(connections), 1])
-
-            # Add the fixed values to the connections
-            connections = merge_arrays(
-                (connections, fixed_values), flatten=True)
+        # The connections have been added as blocks (probably one per
+        # sub-vertex of a population); these are read a column at a time so
+        # that all the fields of every connection are never copied at once
+        blocks = [
+            block for block in self.__connections
+            if len(block)] or self.__connections[:1]
+        dtype = numpy.dtype(self.__connections[0].dtype)
+        fixed = dict(self.__fixed_values or [])
 
-        # If we are returning a list...
         if self.__as_list:
-            # ...sort by source then target
-            order = numpy.lexsort(
-                (connections["target"], connections["source"]))
-
-            # There are no specific items to return, so just get
-            # all the data
-            if (self.__data_items_to_return is None or
-                    not self.__data_items_to_return):
-                self.__data_items = connections[order]
-            # There is more than one item to return, so let numpy do its magic
-            elif len(self.__data_items_to_return) > 1:
-                self.__data_items = \
-                    connections[order][self.__data_items_to_return]
-            # There is 1 item to return, so make sure only one item exists
-            else:
-                self.__data_items = \
-                    connections[order][self.__data_items_to_return[0]]
+            self.__data_items = self.__get_list(blocks, dtype, fixed)
+        elif self.__data_items_to_return is None:
+            return []
         else:
-            if self.__data_items_to_return is None:
-                return []
-
-            # Keep track of the matrices
-            merged_connections = list()
-            for item in self.__data_items_to_return:
-                # Build an empty matrix and fill it with NAN
-                matrix = numpy.empty((self.__n_pre_atoms, self.__n_post_atoms))
-                matrix.fill(numpy.nan)
-
-                # Fill in the values that have data
-                # TODO: Change this to sum the items with the same
-                #       (source, target) pairs
-                matrix[connections["source"], connections["target"]] = \
-                    connections[item]
-
-                # Store the matrix generated
-                merged_connections.append(matrix)
+            matrices = [
+                self.__get_matrix(blocks, item, fixed)
+                for item in self.__data_items_to_return]
 
             # If there is only one matrix, use it directly
-            if len(merged_connections) == 1:
-                self.__data_items = merged_connections[0]
+            if len(matrices) == 1:
+                self.__data_items = matrices[0]
             # Otherwise use a tuple of the matrices
             else:
-                self.__data_items = tuple(merged_connections)
+                self.__data_items = tuple(matrices)
 
         return self.__data_items
 
+    @staticmethod
+    def __column(blocks, name):
+        """ Get a field of all the connections
+
+        :param list(~numpy.ndarray) blocks: The connections
+        :param str name: The name of the field
+        :rtype: ~numpy.ndarray
+        """
+        if len(blocks) == 1:
+            return blocks[0][name]
+        return numpy.concatenate([block[name] for block in blocks])
+
+    def __get_order(self, blocks):
+        """ Get the order of the connections in a list, or None if they are\
+            already in that order
+
+        :param list(~numpy.ndarray) blocks: The connections
+        :rtype: ~numpy.ndarray or None
+        """
+        if not self.__sort:
+            return None
+        source = self.__column(blocks, "source").astype("int64")
+        target = self.__column(blocks, "target").astype("int64")
+        # The connections often arrive sorted, which is cheap to check
+        key = source * (int(target.max()) + 1 if len(target) else 1) + target
+        if numpy.all(key[1:] >= key[:-1]):
+            return None
+        return numpy.lexsort((target, source))
+
+    def __get_list(self, blocks, dtype, fixed):
+        """ Get the connections as a list, with the fixed values added
+
+        :param list(~numpy.ndarray) blocks: The connections
+        :param ~numpy.dtype dtype: The type of the connections
+        :param dict(str,float) fixed: The fixed values to add
+        :rtype: ~numpy.ndarray
+        """
+        # The fields to return, with the fixed values after the connections
+        # if all the fields are to be returned
+        items = self.__data_items_to_return
+        if not items:
+            items = list(dtype.names) + list(fixed)
+        order = self.__get_order(blocks)
+        n_connections = sum(len(block) for block in blocks)
+
+        def column(name):
+            if name in fixed:
+                return numpy.full(n_connections, fixed[name], dtype="float64")
+            values = self.__column(blocks, name)
+            if order is not None:
+                values = values[order]
+            return values
+
+        # There is 1 item to return, so make sure only one item exists
+        if len(items) == 1:
+            return column(items[0])
+
+        data = numpy.empty(n_connections, dtype=[
+            (name, "float64" if name in fixed else dtype.fields[name][0])
+            for name in items])
+        for name in items:
+            if name in fixed:
+                # Broadcast rather than making a column of the value
+                data[name] = fixed[name]
+            else:
+                data[name] = column(name)
+        return data
+
+    def __get_matrix(self, blocks, item, fixed):
+        """ Get a field of the connections as a matrix of pre- by post-atoms
+
+        :param list(~numpy.ndarray) blocks: The connections
+        :param str item: The field to get
+        :param dict(str,float) fixed: The fixed values
+        :rtype: ~numpy.ndarray or ~scipy.sparse.csr_matrix
+        """
+        shape = (self.__n_pre_atoms, self.__n_post_atoms)
+        if not self.__sparse:
+            # Build an empty matrix and fill it with NAN
+            matrix = numpy.full(shape, numpy.nan)
+
+            # Fill in the values that have data, a block at a time; where
+            # there are several with the same (source, target), the last wins
+            # TODO: Change this to sum the items with the same
+            #       (source, target) pairs
+            for block in blocks:
+                matrix[block["source"], block["target"]] = (
+                    fixed[item] if item in fixed else block[item])
+            return matrix
+
+        # A sparse matrix would sum any values with the same (source,
+        # target), so keep just the last of each, as the dense matrix does
+        source = self.__column(blocks, "source").astype("int64")
+        target = self.__column(blocks, "target").astype("int64")
+        if item in fixed:
+            values = numpy.full(len(source), fixed[item], dtype="float64")
+        else:
+            values = self.__column(blocks, item)
+        key = source * self.__n_post_atoms + target
+        _, last = numpy.unique(key[::-1], return_index=True)
+        if len(last) < len(key):
+            keep = len(key) - 1 - last
+            source, target, values = source[keep], target[keep], values[keep]
+        return csr_matrix((values, (source, target)), shape=shape)
+
     def __getitem__(self, s):
         data = self._get_data_items()
         return data[s]
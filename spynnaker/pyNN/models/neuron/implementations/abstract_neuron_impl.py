@@ -188,3 +188,26 @@ class AbstractNeuronImpl(object, metaclass=AbstractBase):
 
         :rtype: bool
         """
+
+    @property
+    def n_provenance_items(self):
+        """ The number of words of provenance the binary of the\
+            implementation writes after the neuron provenance
+
+        :rtype: int
+        """
+        return 0
+
+    def parse_provenance_items(self, label, names, provenance_data):
+        """ Get provenance items from the words written by the binary of\
+            the implementation
+
+        :param str label: The label of the node
+        :param list(str) names: The hierarchy of names for the provenance data
+        :param list(int) provenance_data:
+            The n_provenance_items words to interpret
+        :rtype: iterable(
+            ~spinn_front_end_common.utilities.utility_objs.ProvenanceDataItem)
+        """
+        # pylint: disable=unused-argument
+        return []
@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import ctypes
 import numpy
 
 from data_specification.enums import DataType
@@ -21,13 +22,39 @@ from spynnaker.pyNN.models.neuron.input_types import InputTypeConductance
 from .abstract_neuron_impl import AbstractNeuronImpl
 from spinn_front_end_common.utilities import globals_variables
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinn_front_end_common.utilities.utility_objs import ProvenanceDataItem
 
-# The size of the n_steps_per_timestep parameter
-_N_STEPS_PER_TIMESTEP_SIZE = 1 * BYTES_PER_WORD
+# The size of the n_steps_per_timestep and adaptive_tolerance parameters
+_N_STEPS_PER_TIMESTEP_SIZE = 2 * BYTES_PER_WORD
 
 # The default number of steps per timestep
 _DEFAULT_N_STEPS_PER_TIMESTEP = 1
 
+# The default tolerance of adaptive stepping; 0 is fixed stepping
+_DEFAULT_ADAPTIVE_TOLERANCE = 0.0
+
+
+class StepProvenance(ctypes.LittleEndianStructure):
+    """ Provenance items of the integration steps of the meanfields
+    """
+    _fields_ = [
+        # The most sub-steps a meanfield may take in a timestep
+        ("max_steps_per_timestep", ctypes.c_uint32),
+        # The local error tolerance of adaptive stepping, as S1615
+        ("tolerance", ctypes.c_int32),
+        # The number of meanfield updates (meanfields times timesteps)
+        ("n_updates", ctypes.c_uint32),
+        # The total number of sub-steps taken by all updates
+        ("total_steps", ctypes.c_uint32),
+        # The most sub-steps taken by any one update
+        ("max_steps_taken", ctypes.c_uint32),
+        # The number of updates that took as many sub-steps as allowed
+        ("n_budget_reached", ctypes.c_uint32)
+    ]
+
+    N_ITEMS = len(_fields_)
+
 
 class MeanfieldImplStandard(AbstractNeuronImpl):
     """ The standard componentised meanfield implementation.
@@ -46,7 +73,8 @@ class MeanfieldImplStandard(AbstractNeuronImpl):
         "__threshold_type",
         "__additional_input_type",
         "__components",
-        "__n_steps_per_timestep"
+        "__n_steps_per_timestep",
+        "__adaptive_tolerance"
     ]
 
     _RECORDABLES = ["Ve", "Vi", "w","gsyn_exc", "gsyn_inh"]
@@ -97,6 +125,7 @@ class MeanfieldImplStandard(AbstractNeuronImpl):
         self.__threshold_type = threshold_type
         self.__additional_input_type = additional_input_type
         self.__n_steps_per_timestep = _DEFAULT_N_STEPS_PER_TIMESTEP
+        self.__adaptive_tolerance = _DEFAULT_ADAPTIVE_TOLERANCE
 
         self.__components = [
             self.__neuron_model,
@@ -118,6 +147,48 @@ class MeanfieldImplStandard(AbstractNeuronImpl):
     def n_steps_per_timestep(self, n_steps_per_timestep):
         self.__n_steps_per_timestep = n_steps_per_timestep
 
+    @property
+    def adaptive_tolerance(self):
+        """ The largest local error of the rates accepted in one step when\
+            stepping adaptively, or 0 to always take n_steps_per_timestep\
+            steps.  When adaptive, n_steps_per_timestep is the most steps a\
+            unit may take in a timestep.
+
+        :rtype: float
+        """
+        return self.__adaptive_tolerance
+
+    @adaptive_tolerance.setter
+    def adaptive_tolerance(self, adaptive_tolerance):
+        if adaptive_tolerance is None:
+            adaptive_tolerance = _DEFAULT_ADAPTIVE_TOLERANCE
+        if adaptive_tolerance < 0:
+            raise ConfigurationException(
+                "adaptive_tolerance must not be negative, not {}".format(
+                    adaptive_tolerance))
+        self.__adaptive_tolerance = adaptive_tolerance
+
+    @property
+    def __is_adaptive(self):
+        return self.__adaptive_tolerance > 0
+
+    @property
+    def __max_steps_per_update(self):
+        """ The most RK2 steps a unit can take in a timestep; adaptive\
+            stepping tries a whole step before dividing it
+        """
+        if self.__is_adaptive:
+            return self.__n_steps_per_timestep + 1
+        return self.__n_steps_per_timestep
+
+    @property
+    def erfc_mode(self):
+        return self.__mathsbox.erfc_mode
+
+    @erfc_mode.setter
+    def erfc_mode(self, erfc_mode):
+        self.__mathsbox.erfc_mode = erfc_mode
+
     @property
     @overrides(AbstractNeuronImpl.model_name)
     def model_name(self):
@@ -130,13 +201,15 @@ class MeanfieldImplStandard(AbstractNeuronImpl):
 
     @overrides(AbstractNeuronImpl.get_n_cpu_cycles)
     def get_n_cpu_cycles(self, n_neurons):
+        # Budget for the worst case of every unit taking every step
         total = self.__neuron_model.get_n_cpu_cycles(n_neurons)
-        total += self.__synapse_type.get_n_cpu_cycles(n_neurons)
         total += self.__params_from_network.get_n_cpu_cycles(n_neurons)
         total += self.__p_fit_polynomial_exc.get_n_cpu_cycles(n_neurons)
         total += self.__p_fit_polynomial_inh.get_n_cpu_cycles(n_neurons)
-        total += self.__input_type.get_n_cpu_cycles(n_neurons)
         total += self.__mathsbox.get_n_cpu_cycles(n_neurons)
+        total *= self.__max_steps_per_update
+        total += self.__synapse_type.get_n_cpu_cycles(n_neurons)
+        total += self.__input_type.get_n_cpu_cycles(n_neurons)
         total += self.__threshold_type.get_n_cpu_cycles(n_neurons)
         if self.__additional_input_type is not None:
             total += self.__additional_input_type.get_n_cpu_cycles(n_neurons)
@@ -222,10 +295,15 @@ class MeanfieldImplStandard(AbstractNeuronImpl):
 
     @overrides(AbstractNeuronImpl.get_data)
     def get_data(self, parameters, state_variables, vertex_slice):
-        # Work out the time step per step
+        # Work out the time step per step; adaptive stepping divides the
+        # whole timestep on the machine
         ts = globals_variables.get_simulator().machine_time_step
-        ts /= self.__n_steps_per_timestep
-        items = [numpy.array([self.__n_steps_per_timestep], dtype="uint32")]
+        if not self.__is_adaptive:
+            ts /= self.__n_steps_per_timestep
+        items = [
+            numpy.array([self.__n_steps_per_timestep], dtype="uint32"),
+            DataType.S1615.encode_as_numpy_int_array(
+                [self.__adaptive_tolerance]).view("uint32")]
         items.extend(
             component.get_data(parameters, state_variables, vertex_slice, ts)
             for component in self.__components)
@@ -263,3 +341,33 @@ class MeanfieldImplStandard(AbstractNeuronImpl):
         # ... or fail
         raise AttributeError("'{}' object has no attribute {}".format(
             self.__class__.__name__, key))
+
+    @property
+    @overrides(AbstractNeuronImpl.n_provenance_items)
+    def n_provenance_items(self):
+        return StepProvenance.N_ITEMS
+
+    @overrides(AbstractNeuronImpl.parse_provenance_items)
+    def parse_provenance_items(self, label, names, provenance_data):
+        prov = StepProvenance(*provenance_data)
+        tolerance = prov.tolerance / float(DataType.S1615.scale)
+        mean_steps = prov.total_steps / max(prov.n_updates, 1)
+        yield ProvenanceDataItem(
+            names + ["Max_steps_per_timestep"], prov.max_steps_per_timestep)
+        yield ProvenanceDataItem(
+            names + ["Adaptive_step_tolerance"], tolerance)
+        yield ProvenanceDataItem(
+            names + ["Total_integration_steps"], prov.total_steps)
+        yield ProvenanceDataItem(
+            names + ["Mean_steps_per_timestep"], mean_steps)
+        yield ProvenanceDataItem(
+            names + ["Max_steps_taken_in_a_timestep"], prov.max_steps_taken)
+        yield ProvenanceDataItem(
+            names + ["Times_step_budget_reached"], prov.n_budget_reached,
+            prov.n_budget_reached > 0,
+            "The meanfields on {} took all of the {} steps allowed in a"
+            " timestep {} times, so their error may be above the tolerance"
+            " of {}.  Try increasing n_steps_per_timestep in the"
+            " additional_parameters of the Population.".format(
+                label, prov.max_steps_per_timestep, prov.n_budget_reached,
+                tolerance))
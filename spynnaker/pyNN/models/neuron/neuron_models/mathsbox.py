@@ -12,19 +12,49 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import numpy
+from scipy.special import erfc
+from spinn_utilities.helpful_functions import is_singleton
 from spinn_utilities.overrides import overrides
 from data_specification.enums import DataType
-from spinn_front_end_common.utilities.constants import (
-    MICRO_TO_MILLISECOND_CONVERSION)
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from .abstract_neuron_model import AbstractNeuronModel
 from .abstract_input_type import AbstractInputType
 from spynnaker.pyNN.models.neuron.implementations import (
     AbstractStandardNeuronComponent)
+from spynnaker.pyNN.utilities.struct import Struct
 
 ###--Meanfield Params--###
 SAMPLE = "sample"
 ERR_FUNC = "err_func"
 
+#: The ways the binary can evaluate erfc, mapped to the C erfc_mode_t values
+ERFC_MODES = {
+    # midpoint integration with "sample" steps per evaluation
+    "integral": 0,
+    # linear interpolation in a table computed here
+    "table": 1,
+    # fixed-point rational approximation (Abramowitz & Stegun 7.1.28)
+    "rational": 2
+}
+
+#: The number of entries in the erfc table
+ERFC_TABLE_SIZE = 256
+
+#: The largest argument in the erfc table; erfc is below S1615 precision after
+ERFC_TABLE_MAX = 4.0
+
+# The erfc configuration: mode, number of table entries, 1 / table step
+_ERFC_CONFIG = Struct([DataType.UINT32, DataType.UINT32, DataType.S1615])
+
+# CPU cycles per sample of the integral, and per evaluation of the fast modes
+_CYCLES_PER_SAMPLE = 20
+_CYCLES_PER_FAST_ERFC = 60
+
+# The number of integration steps assumed when it can't be determined
+_DEFAULT_SAMPLE = 1000
+
 UNITS = {
     ###--Meanfield--###
     SAMPLE: "",
@@ -35,28 +65,114 @@ UNITS = {
 class Mathsbox(AbstractInputType):
     """ Model of meanfield due to Destehexe et al
     """
-    __slots__ = ["_sample", "_err_func"]
+    __slots__ = ["_sample", "_err_func", "__erfc_mode"]
 
-    def __init__(self, sample, err_func):
+    def __init__(self, sample, err_func, erfc_mode="integral"):
         """
-        :param a: :math:`a`
-        :type a: float, iterable(float), ~pyNN.random.RandomDistribution or
-            (mapping) function
-        :param b: :math:`b`
-        :type b: float, iterable(float), ~pyNN.random.RandomDistribution or
-            (mapping) function
-        
+        :param sample: number of integration steps of the error function
+        :type sample: float, iterable(float),
+            ~pyNN.random.RandomDistribution or (mapping) function
+        :param err_func: initial value of the error function
+        :type err_func: float, iterable(float),
+            ~pyNN.random.RandomDistribution or (mapping) function
+        :param str erfc_mode: how erfc is evaluated; one of ERFC_MODES
         """
         super().__init__(
             [DataType.S1615, #sample
             DataType.S1615]) # error fonction
         self._sample = sample
         self._err_func = err_func
+        self.erfc_mode = erfc_mode
+
+    @property
+    def erfc_mode(self):
+        """ How erfc is evaluated on the machine; one of ERFC_MODES
+
+        :rtype: str
+        """
+        return self.__erfc_mode
+
+    @erfc_mode.setter
+    def erfc_mode(self, erfc_mode):
+        if erfc_mode not in ERFC_MODES:
+            raise ConfigurationException(
+                "erfc_mode must be one of {}, not {}".format(
+                    sorted(ERFC_MODES), erfc_mode))
+        self.__erfc_mode = erfc_mode
+
+    @property
+    def __n_erfc_entries(self):
+        if self.__erfc_mode == "table":
+            return ERFC_TABLE_SIZE
+        return 0
+
+    @property
+    def __erfc_size(self):
+        """ size of the erfc configuration and table, in bytes
+        """
+        return (_ERFC_CONFIG.get_size_in_whole_words() +
+                self.__n_erfc_entries) * BYTES_PER_WORD
+
+    def get_erfc_data(self):
+        """ Get the erfc configuration shared by all units, including the\
+            table of erfc values when in table mode
+
+        :rtype: ~numpy.ndarray(~numpy.uint32)
+        """
+        n_entries = self.__n_erfc_entries
+        inv_step = 0.0
+        table = numpy.zeros(0, dtype="uint32")
+        if n_entries:
+            step = ERFC_TABLE_MAX / (n_entries - 1)
+            inv_step = 1.0 / step
+            table = DataType.S1615.encode_as_numpy_int_array(
+                erfc(numpy.arange(n_entries) * step)).view("uint32")
+        config = _ERFC_CONFIG.get_data(
+            [ERFC_MODES[self.__erfc_mode], n_entries, inv_step])
+        return numpy.concatenate([config, table])
 
     @overrides(AbstractStandardNeuronComponent.get_n_cpu_cycles)
     def get_n_cpu_cycles(self, n_neurons):
-        # A bit of a guess
-        return 150 * n_neurons
+        # erfc is evaluated twice per unit per step
+        if self.__erfc_mode == "integral":
+            return 2 * _CYCLES_PER_SAMPLE * self.__max_sample * n_neurons
+        return 2 * _CYCLES_PER_FAST_ERFC * n_neurons
+
+    @property
+    def __max_sample(self):
+        """ the largest number of integration steps of any unit
+        """
+        if is_singleton(self._sample):
+            try:
+                return int(self._sample)
+            except TypeError:
+                # A random distribution; assume the default sampling
+                return _DEFAULT_SAMPLE
+        return int(numpy.max(self._sample))
+
+    @overrides(AbstractStandardNeuronComponent.get_dtcm_usage_in_bytes)
+    def get_dtcm_usage_in_bytes(self, n_neurons):
+        usage = super().get_dtcm_usage_in_bytes(n_neurons)
+        return usage + self.__erfc_size
+
+    @overrides(AbstractStandardNeuronComponent.get_sdram_usage_in_bytes)
+    def get_sdram_usage_in_bytes(self, n_neurons):
+        usage = super().get_sdram_usage_in_bytes(n_neurons)
+        return usage + self.__erfc_size
+
+    @overrides(AbstractStandardNeuronComponent.get_data)
+    def get_data(self, parameters, state_variables, vertex_slice, ts):
+        super_data = super().get_data(
+            parameters, state_variables, vertex_slice, ts)
+        return numpy.concatenate([self.get_erfc_data(), super_data])
+
+    @overrides(AbstractStandardNeuronComponent.read_data)
+    def read_data(
+            self, data, offset, vertex_slice, parameters, state_variables):
+        # The erfc configuration doesn't change
+        offset += self.__erfc_size
+        return super().read_data(
+            data, offset, vertex_slice, parameters, state_variables)
 
     @overrides(AbstractStandardNeuronComponent.add_parameters)
     def add_parameters(self, parameters):
@@ -96,7 +212,7 @@ class Mathsbox(AbstractInputType):
     def update_values(self, values, parameters, state_variables):
 
         # Decode the values
-        _sample = values
+        (_sample, err_func) = values
 
         # Copy the changed data only
         state_variables[ERR_FUNC] = err_func
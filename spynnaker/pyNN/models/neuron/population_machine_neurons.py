@@ -106,6 +106,16 @@ class PopulationMachineNeurons(
         :rtype: .NeuronRegions
         """
 
+    @property
+    def _n_neuron_provenance_items(self):
+        """ The number of words of neuron provenance, including those of the\
+            neuron implementation
+
+        :rtype: int
+        """
+        return (NeuronProvenance.N_ITEMS +
+                self._app_vertex.neuron_impl.n_provenance_items)
+
     def _parse_neuron_provenance(self, label, names, provenance_data):
         """ Extract and yield neuron provenance
 
@@ -115,7 +125,8 @@ class PopulationMachineNeurons(
         :return: a list of provenance data items
         :rtype: iterator of ProvenanceDataItem
         """
-        neuron_prov = NeuronProvenance(*provenance_data)
+        neuron_prov = NeuronProvenance(
+            *provenance_data[:NeuronProvenance.N_ITEMS])
 
         yield ProvenanceDataItem(
             names + ["Last_timer_tic_the_core_ran_to"],
@@ -126,8 +137,10 @@ class PopulationMachineNeurons(
             names + ["Earliest_send_time"], neuron_prov.earliest_send)
         yield ProvenanceDataItem(
             names + ["Latest_Send_time"], neuron_prov.latest_send)
+        yield from self._app_vertex.neuron_impl.parse_provenance_items(
+            label, names, provenance_data[NeuronProvenance.N_ITEMS:])
 
-        return NeuronProvenance.N_ITEMS
+        return self._n_neuron_provenance_items
 
     def _write_neuron_data_spec(self, spec, routing_info, ring_buffer_shifts):
         """ Write the data specification of the neuron data
@@ -261,8 +261,13 @@ class PopulationMachineSynapses(
         spec.write_value(get_n_bits(max_delay))
         spec.write_value(int(self._app_vertex.drop_late_spikes))
         spec.write_value(self._app_vertex.incoming_spike_buffer_size)
+        spec.write_value(int(self._app_vertex.record_ring_buffer_maxima))
         spec.write_array(ring_buffer_shifts)
 
+        # The values seen in the ring buffers are read against these shifts
+        self._app_vertex.set_written_ring_buffer_shifts(
+            self._vertex_slice, ring_buffer_shifts)
+
     @overrides(AbstractSynapseExpandable.gen_on_machine)
     def gen_on_machine(self):
         return self._synaptic_matrices.gen_on_machine
@@ -293,7 +298,47 @@ class PopulationMachineSynapses(
         return self._synaptic_matrices.get_connections_from_machine(
             transceiver, placement, app_edge, synapse_info)
 
+    def get_connection_reads(
+            self, transceiver, placement, app_edge, synapse_info):
+        """ Get the reads of the connection data of this vertex that have\
+            not already been done.
+
+        :param ~spinnman.transceiver.Transceiver transceiver:
+            How to find the connection data
+        :param ~pacman.model.placement.Placement placement:
+            Where the connection data is on the machine
+        :param ProjectionApplicationEdge app_edge:
+            The edge for which the data is being read
+        :param SynapseInformation synapse_info:
+            The specific projection within the edge
+        :rtype: list(~spynnaker.pyNN.utilities.bulk_memory_read.MemoryRead)
+        """
+        return self._synaptic_matrices.get_connection_reads(
+            transceiver, placement, app_edge, synapse_info)
+
     def clear_connection_cache(self):
         """ Flush the cache of connection information; needed for a second run
         """
         self._synaptic_matrices.clear_connection_cache()
+
+    def mark_synapses_changed(self, synapse_infos):
+        """ Note that the synaptic data of some projections has changed on\
+            the machine, so that just that data can be written again.
+
+        :param set(SynapseInformation) synapse_infos:
+            The specific projections that have changed
+        :return: Whether the data can be written again in place
+        :rtype: bool
+        """
+        return self._synaptic_matrices.mark_changed(synapse_infos)
+
+    def _write_changed_synaptic_data(self, transceiver, placement):
+        """ Write the synaptic matrices marked as changed back in place
+
+        :param ~spinnman.transceiver.Transceiver transceiver:
+            How to write the data to the machine
+        :param ~pacman.model.placements.Placement placement:
+            Where the data is on the machine
+        """
+        self._synaptic_matrices.write_changed_synaptic_data(
+            transceiver, placement)
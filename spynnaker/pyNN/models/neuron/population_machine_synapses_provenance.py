@@ -16,6 +16,10 @@ import ctypes
 from spinn_utilities.abstract_base import abstractproperty
 from spinn_front_end_common.utilities.utility_objs import ProvenanceDataItem
 
+#: The number of synapse types for which the largest value seen in the ring
+#: buffers is reported; must match SYNAPSES_N_TRACKED_TYPES in synapses.h
+N_TRACKED_SYNAPSE_TYPES = 4
+
 
 class SynapseProvenance(ctypes.LittleEndianStructure):
     """ Provenance items from synapse processing
@@ -35,10 +39,23 @@ class SynapseProvenance(ctypes.LittleEndianStructure):
         ("n_invalid_pop_table_hits", ctypes.c_uint32),
         # The number of spikes that didn't transfer empty rows
         ("n_filtered_by_bitfield", ctypes.c_uint32)
+    ] + [
+        # The largest value seen in the ring buffers of each synapse type
+        ("max_ring_buffer_value_{}".format(i), ctypes.c_uint32)
+        for i in range(N_TRACKED_SYNAPSE_TYPES)
     ]
 
     N_ITEMS = len(_fields_)
 
+    @property
+    def max_ring_buffer_values(self):
+        """ The largest value seen in the ring buffers of each synapse type
+
+        :rtype: list(int)
+        """
+        return [getattr(self, "max_ring_buffer_value_{}".format(i))
+                for i in range(N_TRACKED_SYNAPSE_TYPES)]
+
 
 class PopulationMachineSynapsesProvenance(object):
     """ Mix-in to add synapse provenance gathering without other synapse things
@@ -56,6 +73,7 @@ class PopulationMachineSynapsesProvenance(object):
     INVALID_MASTER_POP_HITS = "Invalid Master Pop hits"
     BIT_FIELD_FILTERED_PACKETS = \
         "How many packets were filtered by the bitfield filterer."
+    MAX_RING_BUFFER_VALUE_NAME = "Max_ring_buffer_value_of_synapse_type_{}"
 
     @abstractproperty
     def _app_vertex(self):
@@ -76,6 +94,9 @@ class PopulationMachineSynapsesProvenance(object):
         :rtype: iterator of ProvenanceDataItem
         """
         synapse_prov = SynapseProvenance(*provenance_data)
+        max_values = synapse_prov.max_ring_buffer_values
+        self._app_vertex.add_ring_buffer_maxima(
+            self.vertex_slice, max_values)
 
         yield ProvenanceDataItem(
             names + [self.TOTAL_PRE_SYNAPTIC_EVENT_NAME],
@@ -119,3 +140,10 @@ class PopulationMachineSynapsesProvenance(object):
         yield ProvenanceDataItem(
             names + [self.BIT_FIELD_FILTERED_PACKETS],
             synapse_prov.n_filtered_by_bitfield)
+        n_synapse_types = min(
+            self._app_vertex.neuron_impl.get_n_synapse_types(),
+            N_TRACKED_SYNAPSE_TYPES)
+        for synapse_type in range(n_synapse_types):
+            yield ProvenanceDataItem(
+                names + [self.MAX_RING_BUFFER_VALUE_NAME.format(synapse_type)],
+                max_values[synapse_type])
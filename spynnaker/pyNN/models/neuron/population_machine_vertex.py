@@ -20,6 +20,8 @@ from pacman.executor.injection_decorator import inject_items
 from spinn_utilities.overrides import overrides
 from spinn_front_end_common.abstract_models import (
     AbstractGeneratesDataSpecification, AbstractRewritesDataSpecification)
+from spinn_front_end_common.utilities.globals_variables import (
+    get_simulator)
 from spinn_front_end_common.utilities.utility_objs import ProvenanceDataItem
 from .population_machine_common import CommonRegions, PopulationMachineCommon
 from .population_machine_neurons import (
@@ -169,7 +171,9 @@ class PopulationMachineVertex(
         super(PopulationMachineVertex, self).__init__(
             label, constraints, app_vertex, vertex_slice, resources_required,
             self.COMMON_REGIONS,
-            NeuronProvenance.N_ITEMS + SynapseProvenance.N_ITEMS +
+            NeuronProvenance.N_ITEMS +
+            app_vertex.neuron_impl.n_provenance_items +
+            SynapseProvenance.N_ITEMS +
             SpikeProcessingProvenance.N_ITEMS + MainProvenance.N_ITEMS,
             self._PROFILE_TAG_LABELS, self.__get_binary_file_name(app_vertex))
         self.__key = None
@@ -227,11 +231,11 @@ class PopulationMachineVertex(
 
     @overrides(PopulationMachineCommon.parse_extra_provenance_items)
     def parse_extra_provenance_items(self, label, names, provenance_data):
-        syn_offset = NeuronProvenance.N_ITEMS
+        syn_offset = self._n_neuron_provenance_items
         proc_offset = syn_offset + SynapseProvenance.N_ITEMS
         end_proc_offset = proc_offset + SpikeProcessingProvenance.N_ITEMS
         yield from self._parse_neuron_provenance(
-            label, names, provenance_data[:NeuronProvenance.N_ITEMS])
+            label, names, provenance_data[:syn_offset])
         yield from self._parse_synapse_provenance(
             label, names, provenance_data[syn_offset:proc_offset])
         yield from self._parse_spike_processing_provenance(
@@ -304,6 +308,11 @@ class PopulationMachineVertex(
         # write the neuron params into the new DSG region
         self._write_neuron_parameters(spec, self.__ring_buffer_shifts)
 
+        # write back any synaptic matrices that changed during the last run;
+        # these go straight into their existing place in the synaptic region
+        self._write_changed_synaptic_data(
+            get_simulator().transceiver, placement)
+
         # close spec
         spec.end_specification()
 
@@ -114,7 +114,9 @@ class PopulationNeuronsMachineVertex(
         super(PopulationNeuronsMachineVertex, self).__init__(
             label, constraints, app_vertex, vertex_slice, resources_required,
             self.COMMON_REGIONS,
-            NeuronProvenance.N_ITEMS + NeuronMainProvenance.N_ITEMS,
+            NeuronProvenance.N_ITEMS +
+            app_vertex.neuron_impl.n_provenance_items +
+            NeuronMainProvenance.N_ITEMS,
             self._PROFILE_TAG_LABELS, self.__get_binary_file_name(app_vertex))
         self.__key = None
         self.__change_requires_neuron_parameters_reload = False
@@ -172,7 +174,7 @@ class PopulationNeuronsMachineVertex(
     @overrides(PopulationMachineCommon.parse_extra_provenance_items)
     def parse_extra_provenance_items(self, label, names, provenance_data):
         yield from self._parse_neuron_provenance(
-            label, names, provenance_data[:NeuronProvenance.N_ITEMS])
+            label, names, provenance_data[:self._n_neuron_provenance_items])
 
         neuron_prov = NeuronMainProvenance(
             *provenance_data[-NeuronMainProvenance.N_ITEMS:])
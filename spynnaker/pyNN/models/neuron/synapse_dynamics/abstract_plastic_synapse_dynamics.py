@@ -41,9 +41,12 @@ class AbstractPlasticSynapseDynamics(
             and lengths for the fixed_plastic and plastic-plastic parts of\
             each row.
 
-        Data is returned as an array made up of an array of 32-bit words for\
-        each row, for each of the fixed-plastic and plastic-plastic data\
-        regions.  The row into which connection should go is given by\
+        Data is returned as a single array of 32-bit words for each of the\
+        fixed-plastic and plastic-plastic data regions, holding the region of\
+        each row one after the other, with each row taking\
+        :py:meth:`get_n_fixed_plastic_words_per_row` and\
+        :py:meth:`get_n_plastic_plastic_words_per_row` words respectively.\
+        The row into which connection should go is given by\
         `connection_row_indices`, and the total number of rows is given by\
         `n_rows`.
 
@@ -97,9 +100,11 @@ class AbstractPlasticSynapseDynamics(
         :param ~pacman.model.graphs.common.Slice post_vertex_slice:
         :param int n_synapse_types:
         :param ~numpy.ndarray pp_size: 1D
-        :param ~numpy.ndarray pp_data: 2D
+        :param ~numpy.ndarray pp_data:
+            1D, the words of all the rows, one row after another
         :param ~numpy.ndarray fp_size: 1D
-        :param ~numpy.ndarray fp_data: 2D
+        :param ~numpy.ndarray fp_data:
+            1D, the words of all the rows, one row after another
         :return:
             array with columns ``source``, ``target``, ``weight``, ``delay``
         :rtype: ~numpy.ndarray
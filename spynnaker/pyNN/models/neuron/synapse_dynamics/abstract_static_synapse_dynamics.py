@@ -40,10 +40,11 @@ class AbstractStaticSynapseDynamics(
         """ Get the fixed-fixed data for each row, and lengths for the\
             fixed-fixed parts of each row.
 
-        Data is returned as an array made up of an array of 32-bit words for\
-        each row for the fixed-fixed region. The row into which connection\
-        should go is given by `connection_row_indices`, and the total number\
-        of rows is given by `n_rows`.
+        Data is returned as a single array of 32-bit words holding the\
+        fixed-fixed region of each row one after the other, with each row\
+        taking :py:meth:`get_n_static_words_per_row` words. The row into\
+        which connection should go is given by `connection_row_indices`, and\
+        the total number of rows is given by `n_rows`.
 
         Lengths are returned as an array made up of an integer for each row,\
         for the fixed-fixed region.
@@ -57,7 +58,7 @@ class AbstractStaticSynapseDynamics(
         :param int n_synapse_types: The number of synapse types
         :param int max_n_synapses: The maximum number of synapses to generate
         :return: (ff_data, ff_size)
-        :rtype: tuple(list(~numpy.ndarray), ~numpy.ndarray)
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
         """
 
     @abstractmethod
@@ -84,6 +85,7 @@ class AbstractStaticSynapseDynamics(
 
         :param ~pacman.model.graphs.common.Slice post_vertex_slice:
         :param int n_synapse_types:
-        :param ~numpy.ndarray ff_size:
-        :param list(~numpy.ndarray) ff_data:
+        :param ~numpy.ndarray ff_size: 1D
+        :param ~numpy.ndarray ff_data:
+            1D, the words of all the rows, one row after another
         """
@@ -13,10 +13,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import math
 import numpy
 from spinn_utilities.abstract_base import (
     AbstractBase, abstractmethod, abstractproperty)
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 
 
 class AbstractSynapseDynamics(object, metaclass=AbstractBase):
@@ -189,43 +189,57 @@ class AbstractSynapseDynamics(object, metaclass=AbstractBase):
         return connector.get_weight_variance(weights, synapse_info)
 
     def convert_per_connection_data_to_rows(
-            self, connection_row_indices, n_rows, data, max_n_synapses):
+            self, connection_row_indices, n_rows, data, max_n_synapses,
+            n_header_bytes=0, min_n_synapses=0):
         """ Converts per-connection data generated from connections into\
-            row-based data to be returned from get_synaptic_data
+            flat row-based data to be returned from get_synaptic_data.
+
+        The rows are packed one after another, each starting on a word
+        boundary, with a header of zero bytes before the data of each row.
+        Each row keeps its first `max_n_synapses` connections, in the order
+        that they appear in the data.
 
         :param ~numpy.ndarray connection_row_indices:
             The index of the row that each item should go into
         :param int n_rows:
             The number of rows
         :param ~numpy.ndarray data:
-            The non-row-based data
+            The non-row-based data, as a row of bytes for each connection
         :param int max_n_synapses:
             The maximum number of synapses to generate in each row
-        :rtype: list(~numpy.ndarray)
-        """
-        return [
-            data[connection_row_indices == i][:max_n_synapses].reshape(-1)
-            for i in range(n_rows)]
-
-    def get_n_items(self, rows, item_size):
-        """ Get the number of items in each row as 4-byte values, given the\
-            item size
-
-        :param ~numpy.ndarray rows:
-        :param int item_size:
-        :rtype: ~numpy.ndarray
-        """
-        return numpy.array([
-            int(math.ceil(float(row.size) / float(item_size)))
-            for row in rows], dtype="uint32").reshape((-1, 1))
-
-    def get_words(self, rows):
-        """ Convert the row data to words
-
-        :param ~numpy.ndarray rows:
-        :rtype: ~numpy.ndarray
-        """
-        words = [numpy.pad(
-            row, (0, (4 - (row.size % 4)) & 0x3), mode="constant",
-            constant_values=0).view("uint32") for row in rows]
-        return words
+        :param int n_header_bytes:
+            The number of bytes to leave blank at the start of each row
+        :param int min_n_synapses:
+            The number of synapses to leave space for in each row, even if
+            the row has fewer
+        :return: (words, n_synapses, n_words) where ``words`` are the rows
+            packed together, ``n_synapses`` is the number of synapses in each
+            row and ``n_words`` is the number of words of each row
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+        """
+        n_bytes_per_item = data.shape[1]
+
+        # Sort the connections by row, keeping their order within each row,
+        # and drop any beyond the maximum
+        order = numpy.argsort(connection_row_indices, kind="stable")
+        rows = connection_row_indices[order].astype("int64")
+        n_synapses = numpy.bincount(rows, minlength=n_rows)
+        rank = numpy.arange(len(rows)) - (
+            numpy.cumsum(n_synapses) - n_synapses)[rows]
+        keep = rank < max_n_synapses
+        order, rows, rank = order[keep], rows[keep], rank[keep]
+        n_synapses = numpy.minimum(n_synapses, max_n_synapses)
+
+        # Work out where each row starts, then scatter the bytes into place
+        n_words = (n_header_bytes + numpy.maximum(
+            n_synapses, min_n_synapses) * n_bytes_per_item +
+            (BYTES_PER_WORD - 1)) // BYTES_PER_WORD
+        row_starts = (numpy.cumsum(n_words) - n_words) * BYTES_PER_WORD
+        item_starts = (
+            row_starts[rows] + n_header_bytes + rank * n_bytes_per_item)
+        row_bytes = numpy.zeros(
+            int(numpy.sum(n_words)) * BYTES_PER_WORD, dtype="uint8")
+        row_bytes[item_starts[:, None] + numpy.arange(n_bytes_per_item)] = \
+            data[order]
+        return (row_bytes.view("uint32"), n_synapses.astype("uint32"),
+                n_words.astype("uint32"))
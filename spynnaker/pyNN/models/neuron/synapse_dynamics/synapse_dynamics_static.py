@@ -112,35 +112,14 @@ class SynapseDynamicsStatic(
                 "uint32") << n_neuron_id_bits) |
             ((connections["target"] - post_vertex_slice.lo_atom) &
              neuron_id_mask))
-        fixed_fixed_rows = self.convert_per_connection_data_to_rows(
+        # Any padding to the row length is left as zeros after the data
+        ff_data, ff_size, _ = self.convert_per_connection_data_to_rows(
             connection_row_indices, n_rows,
             fixed_fixed.view(dtype="uint8").reshape((-1, BYTES_PER_WORD)),
             max_n_synapses)
-        ff_size = self.get_n_items(fixed_fixed_rows, BYTES_PER_WORD)
-        if self.__pad_to_length is not None:
-            # Pad the data
-            fixed_fixed_rows = self._pad_row(fixed_fixed_rows, BYTES_PER_WORD)
-        ff_data = [fixed_row.view("uint32") for fixed_row in fixed_fixed_rows]
 
         return ff_data, ff_size
 
-    def _pad_row(self, rows, no_bytes_per_connection):
-        """
-        :param list(~numpy.ndarray) rows:
-        :param int no_bytes_per_connection:
-        :rtype: list(~numpy.ndarray)
-        """
-        padded_rows = []
-        for row in rows:  # Row elements are (individual) bytes
-            padded_rows.append(
-                numpy.concatenate((
-                    row, numpy.zeros(numpy.clip(
-                        no_bytes_per_connection * self.__pad_to_length -
-                        row.size, 0, None)).astype(
-                            dtype="uint8"))).view(dtype="uint8"))
-
-        return padded_rows
-
     @overrides(AbstractStaticSynapseDynamics.get_n_static_words_per_row)
     def get_n_static_words_per_row(self, ff_size):
 
@@ -161,10 +140,10 @@ class SynapseDynamicsStatic(
         n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
 
-        data = numpy.concatenate(ff_data)
+        data = ff_data
         connections = numpy.zeros(data.size, dtype=self.NUMPY_CONNECTORS_DTYPE)
-        connections["source"] = numpy.concatenate(
-            [numpy.repeat(i, ff_size[i]) for i in range(len(ff_size))])
+        connections["source"] = numpy.repeat(
+            numpy.arange(len(ff_size)), numpy.asarray(ff_size, dtype="int64"))
         connections["target"] = (
             (data & neuron_id_mask) + post_vertex_slice.lo_atom)
         connections["weight"] = (data >> 16) & 0xFFFF
@@ -332,16 +332,12 @@ class SynapseDynamicsSTDP(
              << n_neuron_id_bits) |
             ((connections["target"].astype("uint16") -
               post_vertex_slice.lo_atom) & neuron_id_mask))
-        fixed_plastic_rows = self.convert_per_connection_data_to_rows(
+        # Any padding of the fixed-plastic data is left as zeros after it,
+        # at the end of the row
+        fp_data, fp_size, _ = self.convert_per_connection_data_to_rows(
             connection_row_indices, n_rows,
-            fixed_plastic.view(dtype="uint8").reshape((-1, 2)),
+            fixed_plastic.view(dtype="uint8").reshape((-1, BYTES_PER_SHORT)),
             max_n_synapses)
-        fp_size = self.get_n_items(fixed_plastic_rows, BYTES_PER_SHORT)
-        if self.__pad_to_length is not None:
-            # Pad the data
-            fixed_plastic_rows = self._pad_row(
-                fixed_plastic_rows, BYTES_PER_SHORT)
-        fp_data = self.get_words(fixed_plastic_rows)
 
         # Get the plastic data by inserting the weight into the half-word
         # specified by the synapse structure
@@ -354,45 +350,16 @@ class SynapseDynamicsSTDP(
             numpy.rint(numpy.abs(connections["weight"])).astype("uint16")
 
         # Convert the plastic data into groups of bytes per connection and
-        # then into rows
+        # then into rows, each starting with a header and padded; the
+        # padding counts towards the size as it comes before the fixed data
         plastic_plastic = plastic_plastic.view(dtype="uint8").reshape(
             (-1, n_half_words * BYTES_PER_SHORT))
-        plastic_plastic_row_data = self.convert_per_connection_data_to_rows(
-            connection_row_indices, n_rows, plastic_plastic, max_n_synapses)
-
-        # pp_size = fp_size in words => fp_size * no_bytes / 4 (bytes)
-        if self.__pad_to_length is not None:
-            # Pad the data
-            plastic_plastic_row_data = self._pad_row(
-                plastic_plastic_row_data, n_half_words * BYTES_PER_SHORT)
-        plastic_headers = numpy.zeros(
-            (n_rows, self._n_header_bytes), dtype="uint8")
-        plastic_plastic_rows = [
-            numpy.concatenate((
-                plastic_headers[i], plastic_plastic_row_data[i]))
-            for i in range(n_rows)]
-        pp_size = self.get_n_items(plastic_plastic_rows, BYTES_PER_WORD)
-        pp_data = self.get_words(plastic_plastic_rows)
+        pp_data, _, pp_size = self.convert_per_connection_data_to_rows(
+            connection_row_indices, n_rows, plastic_plastic, max_n_synapses,
+            self._n_header_bytes, self.__pad_to_length or 0)
 
         return fp_data, pp_data, fp_size, pp_size
 
-    def _pad_row(self, rows, no_bytes_per_connection):
-        """
-        :param list(~numpy.ndarray) rows:
-        :param int no_bytes_per_connection:
-        :rtype: list(~numpy.ndarray)
-        """
-        # Row elements are (individual) bytes
-        return [
-            numpy.concatenate((
-                row, numpy.zeros(
-                    numpy.clip(
-                        (no_bytes_per_connection * self.__pad_to_length -
-                         row.size),
-                        0, None)).astype(dtype="uint8"))
-                ).view(dtype="uint8")
-            for row in rows]
-
     @overrides(
         AbstractPlasticSynapseDynamics.get_n_plastic_plastic_words_per_row)
     def get_n_plastic_plastic_words_per_row(self, pp_size):
@@ -416,29 +383,43 @@ class SynapseDynamicsSTDP(
             self, post_vertex_slice, n_synapse_types, pp_size, pp_data,
             fp_size, fp_data):
         # pylint: disable=too-many-arguments
-        n_rows = len(fp_size)
-
         n_synapse_type_bits = get_n_bits(n_synapse_types)
         n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
 
-        data_fixed = numpy.concatenate([
-            fp_data[i].view(dtype="uint16")[0:fp_size[i]]
-            for i in range(n_rows)])
-        pp_without_headers = [
-            row.view(dtype="uint8")[self._n_header_bytes:] for row in pp_data]
+        # The position of each synapse within its row, and the row of each
+        fp_size = numpy.asarray(fp_size, dtype="int64")
+        n_synapses = fp_size.sum()
+        rows = numpy.repeat(numpy.arange(len(fp_size)), fp_size)
+        index_in_row = numpy.arange(n_synapses) - numpy.repeat(
+            numpy.cumsum(fp_size) - fp_size, fp_size)
+
+        # The fixed half-words of each row start at the start of its words
+        fp_words = numpy.asarray(
+            self.get_n_fixed_plastic_words_per_row(fp_size), dtype="int64")
+        fp_row_start = (numpy.cumsum(fp_words) - fp_words) * 2
+        data_fixed = numpy.asarray(fp_data, dtype="uint32").view("uint16")[
+            fp_row_start[rows] + index_in_row]
+
+        # The weight of each synapse is a half-word within the plastic bytes
+        # after the header, which need not be aligned, so read it as bytes
         synapse_structure = self.__timing_dependence.synaptic_structure
         n_half_words = synapse_structure.get_n_half_words_per_connection()
         half_word = synapse_structure.get_weight_half_word()
-        pp_half_words = numpy.concatenate([
-            pp[:size * n_half_words * BYTES_PER_SHORT].view("uint16")[
-                half_word::n_half_words]
-            for pp, size in zip(pp_without_headers, fp_size)])
+        pp_words = numpy.asarray(
+            self.get_n_plastic_plastic_words_per_row(pp_size), dtype="int64")
+        pp_row_start = (numpy.cumsum(pp_words) - pp_words) * BYTES_PER_WORD
+        pp_bytes = numpy.asarray(pp_data, dtype="uint32").view("uint8")
+        weight_bytes = (
+            pp_row_start[rows] + self._n_header_bytes +
+            (index_in_row * n_half_words + half_word) * BYTES_PER_SHORT)
+        pp_half_words = (
+            pp_bytes[weight_bytes].astype("uint16") |
+            (pp_bytes[weight_bytes + 1].astype("uint16") << 8))
 
         connections = numpy.zeros(
             data_fixed.size, dtype=self.NUMPY_CONNECTORS_DTYPE)
-        connections["source"] = numpy.concatenate(
-            [numpy.repeat(i, fp_size[i]) for i in range(len(fp_size))])
+        connections["source"] = rows
         connections["target"] = (
             (data_fixed & neuron_id_mask) + post_vertex_slice.lo_atom)
         connections["weight"] = pp_half_words
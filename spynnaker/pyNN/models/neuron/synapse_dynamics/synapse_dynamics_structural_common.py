@@ -307,25 +307,15 @@ class SynapseDynamicsStructuralCommon(
         connections["source"] = connections["source"] - lo_atoms
         connections["target"] = connections["target"] - vertex_slice.lo_atom
 
-        # Make an array of all data required
-        conn_data = numpy.dstack(
-            (pop_indices, subpop_indices, connections["source"]))[0]
-
-        # Break data into rows based on target and strip target out
-        rows = [conn_data[connections["target"] == i]
-                for i in range(0, vertex_slice.n_atoms)]
-
-        if any(len(row) > self.s_max for row in rows):
-            raise Exception("Too many initial connections per incoming neuron")
-
-        # Make each row the required length through padding with 0xFFFF
-        padded_rows = [numpy.pad(row, [(self.s_max - len(row), 0), (0, 0)],
-                                 "constant", constant_values=0xFFFF)
-                       for row in rows]
-
-        # Finally make the table and write it out
-        post_to_pre = numpy.core.records.fromarrays(
-            numpy.concatenate(padded_rows).T, formats="u1, u1, u2").view("u4")
+        # Make an array of all data required, as a word per connection
+        conn_data = numpy.zeros(len(connections), dtype="u1, u1, u2")
+        conn_data["f0"] = pop_indices
+        conn_data["f1"] = subpop_indices
+        conn_data["f2"] = connections["source"]
+
+        post_to_pre = self._make_post_to_pre_table(
+            conn_data.view("u4"), connections["target"], vertex_slice.n_atoms,
+            self.s_max)
         if len(post_to_pre) != vertex_slice.n_atoms * self.s_max:
             raise Exception(
                 "Wrong size of pre-to-pop tables: {} Found, {} Expected"
@@ -334,6 +324,38 @@ class SynapseDynamicsStructuralCommon(
             vertex_slice.n_atoms * self.s_max))
         spec.write_array(post_to_pre)
 
+    @staticmethod
+    def _make_post_to_pre_table(conn_words, targets, n_atoms, s_max):
+        """ Make the post to pre table from the connections in one pass,\
+            by sorting them by target and scattering them into the rows.
+
+        :param ~numpy.ndarray conn_words:
+            The word to put in the table for each connection
+        :param ~numpy.ndarray targets:
+            The target of each connection, relative to the start of the slice
+        :param int n_atoms: The number of atoms in the target slice
+        :param int s_max: The length of each row
+        :return: The table, with each row padded at the start with 0xFFFFFFFF
+        :rtype: ~numpy.ndarray
+        """
+        # Break data into rows based on target; the sort is stable so each
+        # row is in the order of the connections
+        row_lengths = numpy.bincount(targets, minlength=n_atoms)
+        if numpy.any(row_lengths > s_max):
+            raise Exception("Too many initial connections per incoming neuron")
+        order = numpy.argsort(targets, kind="mergesort")
+        sorted_targets = targets[order].astype("int64")
+        index_in_row = numpy.arange(len(order)) - (
+            numpy.cumsum(row_lengths) - row_lengths)[sorted_targets]
+
+        # Make each row the required length through padding with 0xFFFF at
+        # the start, and scatter the connections in after the padding
+        post_to_pre = numpy.full(n_atoms * s_max, 0xFFFFFFFF, dtype="u4")
+        post_to_pre[
+            sorted_targets * s_max + (s_max - row_lengths[sorted_targets]) +
+            index_in_row] = conn_words[order]
+        return post_to_pre
+
     @overrides(AbstractSynapseDynamicsStructural.
                get_structural_parameters_sdram_usage_in_bytes)
     def get_structural_parameters_sdram_usage_in_bytes(
@@ -385,49 +385,70 @@ def _get_row_data(
     :rtype: tuple(int, ~numpy.ndarray)
     """
     # pylint: disable=too-many-arguments, too-many-locals
-    row_ids = range(n_rows)
-    ff_data, ff_size = None, None
-    fp_data, pp_data, fp_size, pp_size = None, None, None, None
+    no_data = numpy.zeros(0, dtype="uint32")
+    no_sizes = numpy.zeros(n_rows, dtype="uint32")
     if isinstance(synapse_dynamics, AbstractStaticSynapseDynamics):
 
         # Get the static data
         ff_data, ff_size = synapse_dynamics.get_static_synaptic_data(
             connections, row_indices, n_rows, post_vertex_slice,
             n_synapse_types, max_row_n_synapses)
+        ff_words = synapse_dynamics.get_n_static_words_per_row(ff_size)
 
         # Blank the plastic data
-        fp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
-        pp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
-        fp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
-        pp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
+        fp_data, pp_data = no_data, no_data
+        fp_size, pp_size, fp_words, pp_words = (
+            no_sizes, no_sizes, no_sizes, no_sizes)
     else:
 
         # Blank the static data
-        ff_data = [numpy.zeros(0, dtype="uint32") for _ in row_ids]
-        ff_size = [numpy.zeros(1, dtype="uint32") for _ in row_ids]
+        ff_data, ff_size, ff_words = no_data, no_sizes, no_sizes
 
         # Get the plastic data
         fp_data, pp_data, fp_size, pp_size = \
             synapse_dynamics.get_plastic_synaptic_data(
                 connections, row_indices, n_rows, post_vertex_slice,
                 n_synapse_types, max_row_n_synapses)
+        fp_words = synapse_dynamics.get_n_fixed_plastic_words_per_row(
+            fp_size)
+        pp_words = synapse_dynamics.get_n_plastic_plastic_words_per_row(
+            pp_size)
+
+    # Each row is pp_size, pp_data, ff_size, fp_size, ff_data, fp_data and
+    # then padding, so lay out the padded rows and scatter the parts in
+    row_data = numpy.zeros(
+        (n_rows, max_row_n_words + _N_HEADER_WORDS), dtype="uint32")
+    rows = numpy.arange(n_rows)
+    pp_words = numpy.asarray(pp_words, dtype="int64")
+    ff_words = numpy.asarray(ff_words, dtype="int64")
+    row_data[:, 0] = pp_size
+    _scatter_rows(row_data, 1, pp_data, pp_words)
+    row_data[rows, pp_words + 1] = ff_size
+    row_data[rows, pp_words + 2] = fp_size
+    _scatter_rows(row_data, pp_words + 3, ff_data, ff_words)
+    _scatter_rows(row_data, pp_words + ff_words + 3, fp_data, fp_words)
 
-    # Add some padding
-    row_lengths = [
-        pp_data[i].size + fp_data[i].size + ff_data[i].size
-        for i in row_ids]
-    padding = [
-        numpy.zeros(max_row_n_words - row_length, dtype="uint32")
-        for row_length in row_lengths]
+    # Return the data
+    return row_data.reshape(-1)
 
-    # Join the bits into rows
-    items_to_join = [
-        pp_size, pp_data, ff_size, fp_size, ff_data, fp_data, padding]
-    rows = [numpy.concatenate(items) for items in zip(*items_to_join)]
-    row_data = numpy.concatenate(rows)
 
-    # Return the data
-    return row_data
+def _scatter_rows(row_data, start_columns, words, n_words):
+    """ Put words packed one row after another into the columns of each\
+        row starting at the given columns
+
+    :param ~numpy.ndarray row_data: The rows to write into
+    :param start_columns: The column of each row to start writing at
+    :type start_columns: int or ~numpy.ndarray
+    :param ~numpy.ndarray words: The words of all rows packed together
+    :param ~numpy.ndarray n_words: The number of words of each row
+    """
+    if not len(words):
+        return
+    n_words = numpy.asarray(n_words, dtype="int64")
+    rows = numpy.repeat(numpy.arange(len(n_words)), n_words)
+    offsets = numpy.cumsum(n_words) - n_words - start_columns
+    columns = numpy.arange(len(words)) - numpy.repeat(offsets, n_words)
+    row_data[rows, columns] = words
 
 
 def convert_to_connections(
@@ -543,18 +564,30 @@ def _parse_static_data(row_data, dynamics):
     :param ~numpy.ndarray row_data: The raw row data
     :param AbstractStaticSynapseDynamics dynamics:
         The synapse dynamics that can decode the rows
-    :return: A tuple of the recorded length of each row and the row data
-        organised into rows
-    :rtype: tuple(~numpy.ndarray, list(~numpy.ndarray))
+    :return: A tuple of the recorded length of each row and the words of
+        the rows packed one after another
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
     """
-    n_rows = row_data.shape[0]
     ff_size = row_data[:, 1]
     ff_words = dynamics.get_n_static_words_per_row(ff_size)
-    ff_start = _N_HEADER_WORDS
-    ff_end = ff_start + ff_words
-    return (
-        ff_size,
-        [row_data[row, ff_start:ff_end[row]] for row in range(n_rows)])
+    return ff_size, _gather_rows(row_data, _N_HEADER_WORDS, ff_words)
+
+
+def _gather_rows(row_data, start_columns, n_words):
+    """ Get the words of each row starting at the given columns, packed one\
+        row after another
+
+    :param ~numpy.ndarray row_data: The rows to read from
+    :param start_columns: The column of each row to start reading at
+    :type start_columns: int or ~numpy.ndarray
+    :param ~numpy.ndarray n_words: The number of words to read from each row
+    :rtype: ~numpy.ndarray
+    """
+    n_words = numpy.asarray(n_words, dtype="int64")
+    rows = numpy.repeat(numpy.arange(len(n_words)), n_words)
+    offsets = numpy.cumsum(n_words) - n_words - start_columns
+    columns = numpy.arange(len(rows)) - numpy.repeat(offsets, n_words)
+    return row_data[rows, columns]
 
 
 def _read_static_data(
@@ -601,25 +634,21 @@ def _parse_plastic_data(row_data, dynamics):
     :param AbstractPlasticSynapseDynamics dynamics:
         The dynamics that generated the data
     :return: A tuple of the recorded length of the plastic-plastic data in
-        each row; the plastic-plastic data organised into rows; the
-        recorded length of the static-plastic data in each row; and the
-        static-plastic data organised into rows
-    :rtype: tuple(~numpy.ndarray, list(~numpy.ndarray), ~numpy.ndarray,
-        list(~numpy.ndarray))
+        each row; the plastic-plastic words of the rows packed one after
+        another; the recorded length of the static-plastic data in each row;
+        and the static-plastic words of the rows packed one after another
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray,
+        ~numpy.ndarray)
     """
     n_rows = row_data.shape[0]
     pp_size = row_data[:, 0]
-    pp_words = dynamics.get_n_plastic_plastic_words_per_row(pp_size)
+    pp_words = numpy.asarray(
+        dynamics.get_n_plastic_plastic_words_per_row(pp_size), dtype="int64")
     fp_size = row_data[numpy.arange(n_rows), pp_words + 2]
     fp_words = dynamics.get_n_fixed_plastic_words_per_row(fp_size)
-    fp_start = pp_size + _N_HEADER_WORDS
-    fp_end = fp_start + fp_words
-    row_ids = range(n_rows)
     return (
-        pp_size,
-        [row_data[row, 1:pp_words[row] + 1] for row in row_ids],
-        fp_size,
-        [row_data[row, fp_start[row]:fp_end[row]] for row in row_ids])
+        pp_size, _gather_rows(row_data, 1, pp_words),
+        fp_size, _gather_rows(row_data, pp_words + _N_HEADER_WORDS, fp_words))
 
 
 def _read_plastic_data(
@@ -695,26 +724,18 @@ def __convert_delayed_data(
     :rtype: ~numpy.ndarray
     """
     # Work out the delay stage of each row; rows are the all the rows
-    # from the first delay stage, then all from the second stage and so on
-    synapse_ids = range(len(n_synapses))
-    row_stage = numpy.array([
-        i // pre_vertex_slice.n_atoms
-        for i in synapse_ids], dtype="uint32")
-    # Work out the delay for each stage
-    row_min_delay = (row_stage + 1) * post_vertex_max_delay_ticks
-    # Repeat the delay for all connections in the same row
-    connection_min_delay = numpy.concatenate([
-        numpy.repeat(row_min_delay[i], n_synapses[i])
-        for i in synapse_ids])
-    # Repeat the "extra" source id for all connections in the same row;
-    # this converts the row id back to a source neuron id
-    connection_source_extra = numpy.concatenate([
-        numpy.repeat(
-            row_stage[i] * numpy.uint32(pre_vertex_slice.n_atoms),
-            n_synapses[i])
-        for i in synapse_ids])
-    # Do the conversions
-    delayed_connections["source"] -= connection_source_extra
+    # from the first delay stage, then all from the second stage and so on,
+    # and then the stage of the row of each connection
+    row_stage = (
+        numpy.arange(len(n_synapses), dtype="uint32") //
+        numpy.uint32(pre_vertex_slice.n_atoms))
+    connection_stage = numpy.repeat(
+        row_stage, numpy.asarray(n_synapses, dtype="int64"))
+    # The "extra" source id converts the row id back to a source neuron id,
+    # and each stage adds a maximum delay to the delay of the row
+    delayed_connections["source"] -= (
+        connection_stage * numpy.uint32(pre_vertex_slice.n_atoms))
     delayed_connections["source"] += pre_vertex_slice.lo_atom
-    delayed_connections["delay"] += connection_min_delay
+    delayed_connections["delay"] += (
+        (connection_stage + 1) * post_vertex_max_delay_ticks)
     return delayed_connections
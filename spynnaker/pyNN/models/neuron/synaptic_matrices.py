@@ -615,6 +615,54 @@ class SynapticMatrices(object):
         matrix = self.__app_matrix(app_edge, synapse_info)
         return matrix.get_connections(transceiver, placement)
 
+    def get_connection_reads(
+            self, transceiver, placement, app_edge, synapse_info):
+        """ Get the reads needed by :py:meth:`get_connections_from_machine`\
+            that have not already been done
+
+        :param ~spinnman.transceiver.Transceiver transceiver:
+            How to find the regions of the matrices on the machine
+        :param ~pacman.model.placements.Placement placement:
+            Where the vertices are on the machine
+        :param ProjectionApplicationEdge app_edge:
+            The application edge of the projection
+        :param SynapseInformation synapse_info:
+            The synapse information of the projection
+        :rtype: list(~spynnaker.pyNN.utilities.bulk_memory_read.MemoryRead)
+        """
+        matrix = self.__app_matrix(app_edge, synapse_info)
+        return matrix.get_reads(transceiver, placement)
+
+    def mark_changed(self, synapse_infos):
+        """ Note that the matrices of some projections have changed on the\
+            machine, so that just those are written back in place by\
+            :py:meth:`write_changed_synaptic_data`
+
+        :param set(SynapseInformation) synapse_infos:
+            The synapse information of the projections that have changed
+        :return: Whether all the matrices can be written back in place; if
+            not, the synaptic data must be generated again in full
+        :rtype: bool
+        """
+        can_write_in_place = True
+        for (_, synapse_info), matrix in self.__matrices.items():
+            if synapse_info in synapse_infos:
+                can_write_in_place &= matrix.mark_changed()
+        return can_write_in_place
+
+    def write_changed_synaptic_data(self, transceiver, placement):
+        """ Write the matrices marked as changed back in place, leaving the\
+            master population table and the other matrices untouched
+
+        :param ~spinnman.transceiver.Transceiver transceiver:
+            How to write the data to the machine
+        :param ~pacman.model.placements.Placement placement:
+            Where the matrices are on the machine
+        """
+        for matrix in self.__matrices.values():
+            if matrix.is_changed:
+                matrix.write_changed_data(transceiver, placement)
+
     def read_generated_connection_holders(self, transceiver, placement):
         """ Fill in any pre-run connection holders for data which is generated
             on the machine, after it has been generated
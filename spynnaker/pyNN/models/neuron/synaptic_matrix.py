@@ -18,6 +18,7 @@ import numpy
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractSynapseDynamicsStructural)
+from spynnaker.pyNN.utilities.bulk_memory_read import MemoryRead
 
 from .generator_data import GeneratorData, SYN_REGION_UNUSED
 from .synapse_io import get_synapses, convert_to_connections
@@ -482,6 +483,39 @@ class SynapticMatrix(object):
 
         return connections
 
+    def get_reads(self, placement, synapses_address, single_address):
+        """ Get the reads of the blocks needed by :py:meth:`read_connections`\
+            that have not already been read
+
+        :param ~pacman.model.placements.Placement placement:
+            Where the matrix is on the machine
+        :param int synapses_address:
+            The base address of the synaptic matrix region
+        :param int single_address:
+            The base address of the "direct" or "single" matrix region
+        :rtype: list(MemoryRead)
+        """
+        reads = list()
+        if (self.__syn_mat_offset is not None and
+                self.__received_block is None):
+            if self.__is_single:
+                reads.append(MemoryRead(
+                    placement.x, placement.y,
+                    self.__syn_mat_offset + single_address,
+                    self.__single_matrix_size, self.__receive_single_block))
+            else:
+                reads.append(MemoryRead(
+                    placement.x, placement.y,
+                    self.__syn_mat_offset + synapses_address,
+                    self.__matrix_size, self.__receive_block))
+        if (self.__delay_syn_mat_offset is not None and
+                self.__delay_received_block is None):
+            reads.append(MemoryRead(
+                placement.x, placement.y,
+                self.__delay_syn_mat_offset + synapses_address,
+                self.__delay_matrix_size, self.__receive_delayed_block))
+        return reads
+
     def clear_connection_cache(self):
         """ Clear the saved connections
         """
@@ -502,10 +536,16 @@ class SynapticMatrix(object):
         if self.__received_block is not None:
             return self.__received_block
         address = self.__syn_mat_offset + synapses_address
-        block = transceiver.read_memory(
-            placement.x, placement.y, address, self.__matrix_size)
+        self.__receive_block(transceiver.read_memory(
+            placement.x, placement.y, address, self.__matrix_size))
+        return self.__received_block
+
+    def __receive_block(self, block):
+        """ Store a block of data for undelayed synapses that has been read
+
+        :param bytearray block: The data read
+        """
         self.__received_block = block
-        return block
 
     def __get_delayed_block(self, transceiver, placement, synapses_address):
         """ Get a block of data for delayed synapses
@@ -519,10 +559,16 @@ class SynapticMatrix(object):
         if self.__delay_received_block is not None:
             return self.__delay_received_block
         address = self.__delay_syn_mat_offset + synapses_address
-        block = transceiver.read_memory(
-            placement.x, placement.y, address, self.__delay_matrix_size)
+        self.__receive_delayed_block(transceiver.read_memory(
+            placement.x, placement.y, address, self.__delay_matrix_size))
+        return self.__delay_received_block
+
+    def __receive_delayed_block(self, block):
+        """ Store a block of data for delayed synapses that has been read
+
+        :param bytearray block: The data read
+        """
         self.__delay_received_block = block
-        return block
 
     def __get_single_block(self, transceiver, placement, single_address):
         """ Get a block of data for "direct" or "single" synapses
@@ -536,12 +582,19 @@ class SynapticMatrix(object):
         if self.__received_block is not None:
             return self.__received_block
         address = self.__syn_mat_offset + single_address
-        block = transceiver.read_memory(
-            placement.x, placement.y, address, self.__single_matrix_size)
+        self.__receive_single_block(transceiver.read_memory(
+            placement.x, placement.y, address, self.__single_matrix_size))
+        return self.__received_block
+
+    def __receive_single_block(self, block):
+        """ Store a block of data for "direct" or "single" synapses that has\
+            been read, as rows of one synapse each
+
+        :param bytearray block: The data read
+        """
         numpy_data = numpy.asarray(block, dtype="uint8").view("uint32")
         n_rows = len(numpy_data)
         numpy_block = numpy.zeros((n_rows, BYTES_PER_WORD), dtype="uint32")
         numpy_block[:, 3] = numpy_data
         numpy_block[:, 1] = 1
-        self.__received_block = numpy_block
-        return numpy_block.tobytes()
+        self.__received_block = numpy_block.tobytes()
@@ -18,6 +18,9 @@ from pacman.model.graphs.common.slice import Slice
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.utilities.helpful_functions import (
     locate_memory_region_for_placement)
+from spynnaker.pyNN.utilities.bulk_memory_read import MemoryRead
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    AbstractSynapseDynamicsStructural)
 from .synaptic_matrix import SynapticMatrix
 from .generator_data import GeneratorData, SYN_REGION_UNUSED
 from .synapse_io import read_all_synapses, convert_to_connections
@@ -82,7 +85,17 @@ class SynapticMatrixApp(object):
         # A cache of the received synaptic matrix
         "__received_block",
         # A cache of the received delayed synaptic matrix
-        "__delay_received_block"
+        "__delay_received_block",
+        # A cache of the addresses of the synaptic and "direct" or "single"
+        # matrix regions on the machine
+        "__region_addresses",
+        # The data written from host, as a list of (offset in the synaptic
+        # matrix region, data), kept if the data changes during a run so
+        # that it can be written back in place; None if not kept
+        "__host_written_data",
+        # True if the matrix on the machine has changed and is to be
+        # written back in place from the data written from host
+        "__changed"
     ]
 
     def __init__(
@@ -149,6 +162,11 @@ class SynapticMatrixApp(object):
         # These are stored when blocks are read
         self.__received_block = None
         self.__delay_received_block = None
+        self.__region_addresses = None
+
+        # These are stored when data is written from host
+        self.__host_written_data = None
+        self.__changed = False
 
     def __get_matrix(self, machine_edge):
         """ Get or create a matrix object
@@ -280,6 +298,7 @@ class SynapticMatrixApp(object):
         """
         undelayed_matrix_data = list()
         delayed_matrix_data = list()
+        written_data = list()
         for m_edge in self.__m_edges:
 
             # Get a synaptic matrix for each machine edge
@@ -292,19 +311,46 @@ class SynapticMatrixApp(object):
                 undelayed_matrix_data.append((m_edge, row_data))
                 delayed_matrix_data.append((m_edge, delay_row_data))
             else:
-                # If no app keys, write the data as normal
-                block_addr, single_addr = matrix.write_machine_matrix(
+                # If no app keys, write the data as normal, noting where
+                # anything written to the block went
+                next_addr, next_single_addr = matrix.write_machine_matrix(
                     spec, block_addr, single_synapses, single_addr,
                     row_data)
-                block_addr = matrix.write_delayed_machine_matrix(
+                if next_single_addr != single_addr:
+                    written_data = None
+                elif next_addr != block_addr and written_data is not None:
+                    written_data.append((
+                        next_addr - len(row_data) * BYTES_PER_WORD, row_data))
+                block_addr, single_addr = next_addr, next_single_addr
+                next_addr = matrix.write_delayed_machine_matrix(
                     spec, block_addr, delay_row_data)
+                if next_addr != block_addr and written_data is not None:
+                    written_data.append((
+                        next_addr - len(delay_row_data) * BYTES_PER_WORD,
+                        delay_row_data))
+                block_addr = next_addr
 
         # If there is an app key, add a single matrix
         if self.__use_app_keys:
-            block_addr = self.__write_app_matrix(
+            next_addr = self.__write_app_matrix(
                 spec, block_addr, undelayed_matrix_data)
-            block_addr = self.__write_delay_app_matrix(
+            if next_addr != block_addr:
+                written_data.append((self.__syn_mat_offset, numpy.concatenate(
+                    [row_data for _, row_data in undelayed_matrix_data])))
+            block_addr = next_addr
+            next_addr = self.__write_delay_app_matrix(
                 spec, block_addr, delayed_matrix_data)
+            if next_addr != block_addr:
+                written_data.append((
+                    self.__delay_syn_mat_offset, numpy.concatenate(
+                        [row_data for _, row_data in delayed_matrix_data])))
+            block_addr = next_addr
+
+        # Only keep the data if it might need to be written back
+        self.__host_written_data = None
+        if self.__synapse_info.synapse_dynamics.changes_during_run:
+            self.__host_written_data = written_data
+        self.__changed = False
 
         return block_addr, single_addr
 
@@ -423,6 +469,9 @@ class SynapticMatrixApp(object):
         :return: The updated block address
         :rtype: int
         """
+        # Data generated on the machine can only be made again there
+        self.__host_written_data = None
+        self.__changed = False
 
         if self.__use_app_keys:
             # Reserve the space in the matrix for an application-level key,
@@ -706,6 +755,50 @@ class SynapticMatrixApp(object):
                 .format(next_addr, max_addr))
         return next_addr
 
+    def mark_changed(self):
+        """ Note that the matrix on the machine has changed, so that it is\
+            written back in place by :py:meth:`write_changed_data`
+
+        :return: Whether the matrix can be written back in place; if not,
+            the synaptic data must be generated again in full
+        :rtype: bool
+        """
+        if (self.__host_written_data is None or isinstance(
+                self.__synapse_info.synapse_dynamics,
+                AbstractSynapseDynamicsStructural)):
+            return False
+        self.__changed = True
+        return True
+
+    @property
+    def is_changed(self):
+        """ Whether the matrix has been marked as changed and not yet\
+            written back
+
+        :rtype: bool
+        """
+        return self.__changed
+
+    def write_changed_data(self, transceiver, placement):
+        """ Write the data written from host back over the matrix on the\
+            machine, leaving the rest of the synaptic data where it is
+
+        :param ~spinnman.transceiver.Transceiver transceiver:
+            How to write the data to the machine
+        :param ~pacman.model.placements.Placement placement:
+            Where the matrix is on the machine
+        """
+        if not self.__changed:
+            return
+        synapses_address, _ = self.__get_region_addresses(
+            transceiver, placement)
+        for offset, data in self.__host_written_data:
+            transceiver.write_memory(
+                placement.x, placement.y, synapses_address + offset,
+                data.tobytes())
+        self.__changed = False
+        self.clear_connection_cache()
+
     def get_connections(self, transceiver, placement):
         """ Get the connections for this matrix from the machine
 
@@ -720,11 +813,8 @@ class SynapticMatrixApp(object):
         # This might happen if the matrix is never actually generated
         if self.__m_edges is None:
             return []
-        synapses_address = locate_memory_region_for_placement(
-            placement, self.__synaptic_matrix_region, transceiver)
-        single_address = (locate_memory_region_for_placement(
-            placement, self.__direct_matrix_region, transceiver) +
-            BYTES_PER_WORD)
+        synapses_address, single_address = self.__get_region_addresses(
+            transceiver, placement)
         if self.__use_app_keys:
             return self.__read_connections(
                 transceiver, placement, synapses_address)
@@ -736,11 +826,66 @@ class SynapticMatrixApp(object):
                 transceiver, placement, synapses_address, single_address))
         return connections
 
+    def get_reads(self, transceiver, placement):
+        """ Get the reads of the blocks needed by :py:meth:`get_connections`\
+            that have not already been read, so that they can be read\
+            together with those of other matrices
+
+        :param ~spinnman.transceiver.Transceiver transceiver:
+            How to find the regions of the matrix on the machine
+        :param ~pacman.model.placements.Placement placement:
+            Where the matrix is on the machine
+        :rtype: list(MemoryRead)
+        """
+        if self.__m_edges is None:
+            return []
+        synapses_address, single_address = self.__get_region_addresses(
+            transceiver, placement)
+        if not self.__use_app_keys:
+            reads = list()
+            for m_edge in self.__m_edges:
+                reads.extend(self.__get_matrix(m_edge).get_reads(
+                    placement, synapses_address, single_address))
+            return reads
+
+        reads = list()
+        if (self.__syn_mat_offset is not None and
+                self.__received_block is None):
+            reads.append(MemoryRead(
+                placement.x, placement.y,
+                self.__syn_mat_offset + synapses_address,
+                self.__matrix_size, self.__receive_block))
+        if (self.__delay_syn_mat_offset is not None and
+                self.__delay_received_block is None):
+            reads.append(MemoryRead(
+                placement.x, placement.y,
+                self.__delay_syn_mat_offset + synapses_address,
+                self.__delay_matrix_size, self.__receive_delayed_block))
+        return reads
+
+    def __get_region_addresses(self, transceiver, placement):
+        """ Get the addresses of the synaptic matrix region and the "direct"\
+            or "single" matrix data on the machine, reading them only once
+
+        :param Transceiver transceiver: How to read the data from the machine
+        :param Placement placement: Where the matrix is on the machine
+        :rtype: tuple(int, int)
+        """
+        if self.__region_addresses is None:
+            synapses_address = locate_memory_region_for_placement(
+                placement, self.__synaptic_matrix_region, transceiver)
+            single_address = (locate_memory_region_for_placement(
+                placement, self.__direct_matrix_region, transceiver) +
+                BYTES_PER_WORD)
+            self.__region_addresses = (synapses_address, single_address)
+        return self.__region_addresses
+
     def clear_connection_cache(self):
         """ Clear saved connections
         """
         self.__received_block = None
         self.__delay_received_block = None
+        self.__region_addresses = None
         for matrix in self.__matrices.values():
             matrix.clear_connection_cache()
 
@@ -807,10 +952,16 @@ class SynapticMatrixApp(object):
         if self.__received_block is not None:
             return self.__received_block
         address = self.__syn_mat_offset + synapses_address
-        block = transceiver.read_memory(
-            placement.x, placement.y, address, self.__matrix_size)
+        self.__receive_block(transceiver.read_memory(
+            placement.x, placement.y, address, self.__matrix_size))
+        return self.__received_block
+
+    def __receive_block(self, block):
+        """ Store a block of data for undelayed synapses that has been read
+
+        :param bytearray block: The data read
+        """
         self.__received_block = block
-        return block
 
     def __get_delayed_block(self, transceiver, placement, synapses_address):
         """ Get a block of data for delayed synapses
@@ -824,10 +975,16 @@ class SynapticMatrixApp(object):
         if self.__delay_received_block is not None:
             return self.__delay_received_block
         address = self.__delay_syn_mat_offset + synapses_address
-        block = transceiver.read_memory(
-            placement.x, placement.y, address, self.__delay_matrix_size)
+        self.__receive_delayed_block(transceiver.read_memory(
+            placement.x, placement.y, address, self.__delay_matrix_size))
+        return self.__delay_received_block
+
+    def __receive_delayed_block(self, block):
+        """ Store a block of data for delayed synapses that has been read
+
+        :param bytearray block: The data read
+        """
         self.__delay_received_block = block
-        return block
 
     def get_index(self, machine_edge):
         """ Get the index in the master population table of the matrix for a
@@ -427,6 +427,32 @@ class Population(PopulationBase):
             return self._recorder.get_spikes()
         return self._recorder.get_recorded_pynn7(variable)
 
+    def spinnaker_export_data(
+            self, directory, variables='all', max_rows=10000):
+        """ Write recorded data to a directory a chunk at a time, without\
+            holding the whole recording in memory, as ``.npz`` files which\
+            can be read back with\
+            :py:mod:`spynnaker.pyNN.utilities.recording_export`.
+
+        :param str directory: where to write the data
+        :param variables:
+            either a single variable name or a list of variable names.
+            Variables must have been previously recorded, otherwise an
+            Exception will be raised.
+        :type variables: str or list(str)
+        :param int max_rows:
+            the most time steps (or rewiring events) to write in one chunk
+        :return: the chunks, bytes and time taken for each variable
+        :rtype: dict(str,
+            ~spynnaker.pyNN.utilities.recording_export.ExportStatistics)
+        """
+        warn_once(
+            logger, "spinnaker_export_data is non-standard PyNN and therefore "
+            "may not be portable to other simulators.")
+        if max_rows < 1:
+            raise ConfigurationException("max_rows must be at least 1")
+        return self._recorder.export_data(directory, variables, max_rows)
+
     @overrides(PopulationBase.get_spike_counts, extend_doc=False)
     def get_spike_counts(self, gather=True):
         """ Return the number of spikes for each neuron.
@@ -25,7 +25,11 @@ from spinn_utilities.logger_utils import warn_once
 from spinn_front_end_common.utilities.globals_variables import (
     get_simulator, machine_time_step_ms, machine_time_step_per_ms)
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
-from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
+from spynnaker.pyNN.utilities.constants import REWIRING, SPIKE_PARTITION_ID
+from spynnaker.pyNN.utilities.connection_file import (
+    ConnectionFileWriter, is_connection_file)
+from spynnaker.pyNN.utilities.rewiring_log import (
+    DEFAULT_CHECKPOINT_INTERVAL, RewiringLog)
 from spynnaker.pyNN.models.abstract_models import (
     AbstractAcceptsIncomingSynapses)
 from spynnaker.pyNN.models.neural_projections import (
@@ -34,7 +38,7 @@ from spynnaker.pyNN.models.neural_projections.connectors import (
     AbstractConnectorSupportsViewsOnMachine, FromListConnector)
 from spynnaker.pyNN.models.neuron import ConnectionHolder
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
-    SynapseDynamicsStatic)
+    AbstractSynapseDynamicsStructural, SynapseDynamicsStatic)
 from spynnaker._version import __version__
 from spynnaker.pyNN.models.populations import Population, PopulationView
 from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
@@ -242,7 +246,10 @@ class Projection(object):
 
         :param attribute_names: list of attributes to gather
         :type attribute_names: str or iterable(str)
-        :param str format: ``"list"`` or ``"array"``
+        :param str format:
+            ``"list"``, ``"array"`` or ``"sparse"``; ``"sparse"`` is like
+            ``"array"`` but gives a :py:class:`scipy.sparse.csr_matrix`, so
+            that large projections need not be held as dense matrices
         :param bool gather: gather over all nodes
         :param bool with_address:
             True if the source and target are to be included
@@ -274,6 +281,14 @@ class Projection(object):
         .. note::
             SpiNNaker always gathers.
 
+        .. note::
+            If the filename ends in ``.spyconn``, the connections are
+            written to a binary connection file, which can be read back by
+            :py:class:`~.FromFileConnector` without parsing it.  The
+            connections are then written a core at a time in the list
+            format, whatever the format requested, with the sources and
+            targets as 32-bit integers and the rest as 64-bit floats.
+
         :param attribute_names:
         :type attribute_names: str or list(str)
         :param file: filename or open handle (which will be closed)
@@ -293,6 +308,9 @@ class Projection(object):
             attribute_names = \
                 self._projection_edge.post_vertex.synapse_dynamics.\
                 get_parameter_names()
+        if is_connection_file(file):
+            self.__save_binary(file, attribute_names, with_address)
+            return
         metadata = {"columns": attribute_names}
         if with_address:
             metadata["columns"] = ["i", "j"] + list(metadata["columns"])
@@ -300,6 +318,70 @@ class Projection(object):
             attribute_names, format, with_address,
             notify=functools.partial(self.__save_callback, file, metadata))
 
+    def get_rewiring_log(
+            self, checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL):
+        """ Get the connections made and broken by structural plasticity,\
+            from the connections this projection started with and the\
+            rewiring events recorded by the post-population.  This can give\
+            the connections at any time, and how long they lasted, without\
+            reading the synaptic matrix back from the machine.
+
+        .. note::
+            The post-population must be recording ``rewiring``, and this must
+            be the only projection to it with structural plasticity, as the
+            events recorded do not say which projection they are of.
+
+        :param int checkpoint_interval:
+            The number of events between snapshots of the connections
+        :rtype: ~spynnaker.pyNN.utilities.rewiring_log.RewiringLog
+        :raises ConfigurationException:
+            If the rewiring events of this projection are not known
+        """
+        synapse_dynamics = self.__synapse_information.synapse_dynamics
+        if not isinstance(synapse_dynamics, AbstractSynapseDynamicsStructural):
+            raise ConfigurationException(
+                "{} does not have structural plasticity".format(self))
+        post_vertex = self.__projection_edge.post_vertex
+        if not post_vertex.is_recording(REWIRING):
+            raise ConfigurationException(
+                "The post-population of {} has not been set to record"
+                " rewires".format(self))
+        if any(proj is not self and isinstance(
+                proj._synapse_information.synapse_dynamics,
+                AbstractSynapseDynamicsStructural)
+               for proj in post_vertex.incoming_projections):
+            raise ConfigurationException(
+                "The rewires of {} cannot be told apart from those of other"
+                " projections with structural plasticity to the same"
+                " population".format(self))
+
+        initial = [
+            conns
+            for (vertex, _), slice_conns in (
+                synapse_dynamics.connections.items())
+            if vertex == post_vertex
+            for conns, _, _, synapse_info in slice_conns
+            if synapse_info == self.__synapse_information]
+        sources = numpy.concatenate(
+            [conns["source"] for conns in initial] + [[]])
+        targets = numpy.concatenate(
+            [conns["target"] for conns in initial] + [[]])
+
+        sim = get_simulator()
+        events = numpy.zeros((0, 4))
+        if not sim.has_ran:
+            logger.warning(
+                "The simulation has not yet run, therefore rewires cannot "
+                "be retrieved, hence only the initial connections are known")
+        elif sim.use_virtual_board:
+            logger.warning(
+                "The simulation is using a virtual machine and so has not "
+                "truly ran, hence only the initial connections are known")
+        else:
+            events = post_vertex.get_events(
+                REWIRING, sim.placements, sim.buffer_manager)
+        return RewiringLog(sources, targets, events, checkpoint_interval)
+
     def __get_data(
             self, attribute_names, format,  # @ReservedAssignment
             with_address, notify):
@@ -307,7 +389,7 @@ class Projection(object):
 
         :param attribute_names: list of attributes to gather
         :type attribute_names: str or iterable(str)
-        :param str format: ``"list"`` or ``"array"``
+        :param str format: ``"list"``, ``"array"`` or ``"sparse"``
         :param bool with_address:
         :param callable(ConnectionHolder,None) notify:
         :return: values selected
@@ -342,7 +424,67 @@ class Projection(object):
 
         # Return the connection data
         return self._get_synaptic_data(
-            format == "list", data_items, fixed_values, notify=notify)
+            format == "list", data_items, fixed_values, notify=notify,
+            sparse=format == "sparse")
+
+    def __save_binary(self, filename, attribute_names, with_address):
+        """ Save connections to a binary connection file, a block at a time
+
+        :param str filename: The name of the file to write
+        :param list(str) attribute_names: The attributes to save
+        :param bool with_address:
+            Whether to save the source and target of each connection first
+        """
+        fields = list()
+        if with_address:
+            fields = [("i", "uint32"), ("j", "uint32")]
+            attribute_names = [
+                name for name in attribute_names
+                if name not in ("source", "target")]
+        fixed_values = dict()
+        for attribute in attribute_names:
+            if attribute in ("source", "target"):
+                fields.append((attribute, "uint32"))
+                continue
+            fields.append((attribute, "float64"))
+            if attribute not in ("weight", "delay"):
+                fixed_values[attribute] = \
+                    self._synapse_information.synapse_dynamics.get_value(
+                        attribute)
+
+        def write(blocks):
+            with ConnectionFileWriter(filename, fields) as writer:
+                for block in blocks:
+                    data = numpy.empty(len(block), dtype=writer.dtype)
+                    if with_address:
+                        data["i"] = block["source"]
+                        data["j"] = block["target"]
+                    for name in attribute_names:
+                        data[name] = (
+                            fixed_values[name] if name in fixed_values
+                            else block[name])
+                    writer.write(data)
+
+        def notify(holder):
+            write(holder.connections or [])
+
+        # Once run, stream the connections from the machine a core at a
+        # time; otherwise write them once they are known
+        post_vertex = self.__projection_edge.post_vertex
+        if not get_simulator().has_ran:
+            # Even on a virtual board, the connections are only known once
+            # they have been generated
+            self.__synapse_information.add_pre_run_connection_holder(
+                ConnectionHolder(
+                    None, True, self.__projection_edge.pre_vertex.n_atoms,
+                    post_vertex.n_atoms, notify=notify))
+        elif (self.__virtual_connection_list is None and
+                isinstance(post_vertex, AbstractAcceptsIncomingSynapses)):
+            write(post_vertex.iter_connections_from_machine(
+                get_simulator().transceiver, get_simulator().placements,
+                self.__projection_edge, self.__synapse_information))
+        else:
+            self._get_synaptic_data(True, None, notify=notify)
 
     @staticmethod
     def __save_callback(save_file, metadata, data):
@@ -446,12 +588,14 @@ class Projection(object):
         return None
 
     def _get_synaptic_data(
-            self, as_list, data_to_get, fixed_values=None, notify=None):
+            self, as_list, data_to_get, fixed_values=None, notify=None,
+            sparse=False):
         """
         :param bool as_list:
         :param list(int) data_to_get:
         :param list(tuple(str,int)) fixed_values:
         :param callable(ConnectionHolder,None) notify:
+        :param bool sparse: whether matrices are to be sparse
         :rtype: ConnectionHolder
         """
         # pylint: disable=too-many-arguments
@@ -463,7 +607,7 @@ class Projection(object):
             connection_holder = ConnectionHolder(
                 data_to_get, as_list, pre_vertex.n_atoms, post_vertex.n_atoms,
                 self.__virtual_connection_list, fixed_values=fixed_values,
-                notify=notify)
+                notify=notify, sparse=sparse)
             connection_holder.finish()
             return connection_holder
 
@@ -471,7 +615,7 @@ class Projection(object):
         # possible later date
         connection_holder = ConnectionHolder(
             data_to_get, as_list, pre_vertex.n_atoms, post_vertex.n_atoms,
-            fixed_values=fixed_values, notify=notify)
+            fixed_values=fixed_values, notify=notify, sparse=sparse)
 
         # If we haven't run, add the holder to get connections, and return it
         # and set up a callback for after run to fill in this connection holder
@@ -490,6 +634,22 @@ class Projection(object):
             connection_holder.finish()
         return connection_holder
 
+    def _get_connection_reads(self):
+        """ Get the reads of the synaptic data of this projection that have\
+            not already been done, so that they can be done together with\
+            those of other projections
+
+        :rtype: list(~spynnaker.pyNN.utilities.bulk_memory_read.MemoryRead)
+        """
+        post_vertex = self.__projection_edge.post_vertex
+        if (self.__virtual_connection_list is not None or
+                not get_simulator().has_ran or
+                not isinstance(post_vertex, AbstractAcceptsIncomingSynapses)):
+            return []
+        return post_vertex.get_connection_reads(
+            get_simulator().transceiver, get_simulator().placements,
+            self.__projection_edge, self.__synapse_information)
+
     def _clear_cache(self):
         post_vertex = self.__projection_edge.post_vertex
         if isinstance(post_vertex, AbstractAcceptsIncomingSynapses):
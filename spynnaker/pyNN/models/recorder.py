@@ -14,6 +14,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from datetime import datetime
 import logging
+import os
 import numpy
 import neo
 import quantities
@@ -23,11 +24,14 @@ from spinn_utilities.ordered_set import OrderedSet
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.globals_variables import get_simulator
 from spynnaker.pyNN.models.common import (
-    AbstractSpikeRecordable, AbstractNeuronRecordable, AbstractEventRecordable)
+    AbstractSpikeRecordable, AbstractNeuronRecordable, AbstractEventRecordable,
+    AbstractStreamsRecording)
 from spynnaker.pyNN.utilities.constants import (
     SPIKES, FIRING_RATE_EXC, FIRING_RATE_INH, ADAPTATION, GSYN_EXCIT, GSYN_INHIB, REWIRING)
 from spynnaker.pyNN.exceptions import InvalidParameterType
 from spynnaker.pyNN.utilities.data_cache import DataCache
+from spynnaker.pyNN.utilities.recording_export import (
+    write_event_chunks, write_signal_chunks, write_spike_chunks)
 
 logger = FormatAdapter(logging.getLogger(__name__))
 _DEFAULT_UNITS = {
@@ -40,6 +44,36 @@ _DEFAULT_UNITS = {
     REWIRING: "ms"}
 
 
+def _split_spikes(spikes, indexes):
+    """ Split spikes into the times of each of the given neurons, in one pass\
+        over the spikes rather than one per neuron.
+
+    :param ~numpy.ndarray spikes:
+        Spike data in raw sPyNNaker format; (neuron id, time) pairs, which
+        are usually already sorted by neuron id
+    :param iterable(int) indexes: The neurons to get the times of
+    :return: The times of each neuron in turn, in the order they appear in
+        the spikes; these are views on a single array
+    :rtype: list(~numpy.ndarray)
+    """
+    indexes = numpy.fromiter(indexes, dtype="int64")
+    if len(spikes) == 0:
+        return [numpy.empty(0) for _ in indexes]
+    spikes = numpy.asarray(spikes)
+    ids = spikes[:, 0]
+    times = spikes[:, 1]
+    if numpy.any(ids[1:] < ids[:-1]):
+        # A stable sort keeps the order of the times of each neuron
+        order = numpy.argsort(ids, kind="stable")
+        ids = ids[order]
+        times = times[order]
+    else:
+        times = numpy.ascontiguousarray(times)
+    starts = numpy.searchsorted(ids, indexes, side="left")
+    ends = numpy.searchsorted(ids, indexes, side="right")
+    return [times[start:end] for start, end in zip(starts, ends)]
+
+
 class Recorder(object):
     """ Object to hold recording behaviour, used by populations.
     """
@@ -223,14 +257,7 @@ class Recorder(object):
         sim.verify_not_running()
 
         # check that we're in a state to get voltages
-        if not isinstance(self.__vertex, AbstractNeuronRecordable):
-            raise ConfigurationException(
-                "This population has not got the capability to record {}"
-                .format(variable))
-        if not self.__vertex.is_recording(variable):
-            raise ConfigurationException(
-                "This population has not been set to record {}".format(
-                    variable))
+        self.__check_recording(variable)
 
         if not sim.has_ran:
             logger.warning(
@@ -259,14 +286,26 @@ class Recorder(object):
 
         return (data, indexes, sampling_interval)
 
-    def get_spikes(self):
-        """ How to get spikes (of a population's neurons) from the recorder.
+    def __check_recording(self, variable):
+        """ Checks that the vertex is recording a variable other than spikes
 
-        :return: the spikes (event times) from the underlying vertex
-        :rtype: ~numpy.ndarray
+        :param str variable:
+        :raises ConfigurationException: if it is not
         """
+        if not isinstance(self.__vertex, AbstractNeuronRecordable):
+            raise ConfigurationException(
+                "This population has not got the capability to record {}"
+                .format(variable))
+        if not self.__vertex.is_recording(variable):
+            raise ConfigurationException(
+                "This population has not been set to record {}".format(
+                    variable))
 
-        # check we're in a state where we can get spikes
+    def __check_recording_spikes(self):
+        """ Checks that the vertex is recording spikes
+
+        :raises ConfigurationException: if it is not
+        """
         if not isinstance(self.__vertex, AbstractSpikeRecordable):
             raise ConfigurationException(
                 "This population has not got the capability to record spikes")
@@ -274,6 +313,28 @@ class Recorder(object):
             raise ConfigurationException(
                 "This population has not been set to record spikes")
 
+    def __check_recording_events(self):
+        """ Checks that the vertex is recording rewires
+
+        :raises ConfigurationException: if it is not
+        """
+        if not isinstance(self.__vertex, AbstractEventRecordable):
+            raise ConfigurationException(
+                "This population has not got the capability to record rewires")
+        if not self.__vertex.is_recording(REWIRING):
+            raise ConfigurationException(
+                "This population has not been set to record rewires")
+
+    def get_spikes(self):
+        """ How to get spikes (of a population's neurons) from the recorder.
+
+        :return: the spikes (event times) from the underlying vertex
+        :rtype: ~numpy.ndarray
+        """
+
+        # check we're in a state where we can get spikes
+        self.__check_recording_spikes()
+
         sim = get_simulator()
         if not sim.has_ran:
             logger.warning(
@@ -298,12 +359,7 @@ class Recorder(object):
         """
 
         # check we're in a state where we can get rewires
-        if not isinstance(self.__vertex, AbstractEventRecordable):
-            raise ConfigurationException(
-                "This population has not got the capability to record rewires")
-        if not self.__vertex.is_recording(REWIRING):
-            raise ConfigurationException(
-                "This population has not been set to record rewires")
+        self.__check_recording_events()
 
         sim = get_simulator()
         if not sim.has_ran:
@@ -368,6 +424,74 @@ class Recorder(object):
             block.annotate(**annotations)
         return block
 
+    def export_data(self, directory, variables, max_rows):
+        """ Writes the recorded data of the current segment to a directory\
+            a chunk at a time, so that the whole recording is never held in\
+            memory at once.
+
+        :param str directory: where to write the chunks
+        :param list(str) variables: the variables to export
+        :param int max_rows:
+            the most time steps (or events) to decode into one chunk
+        :return: what was written for each variable
+        :rtype: dict(str,
+            ~spynnaker.pyNN.utilities.recording_export.ExportStatistics)
+        """
+        sim = get_simulator()
+        sim.verify_not_running()
+        variables = self._clean_variables(variables)
+        if not sim.has_ran:
+            logger.warning(
+                "The simulation has not yet run, therefore no data can be "
+                "exported")
+            return {}
+        if sim.use_virtual_board:
+            logger.warning(
+                "The simulation is using a virtual machine and so has not "
+                "truly ran, hence no data can be exported")
+            return {}
+        os.makedirs(directory, exist_ok=True)
+
+        # Vertices that cannot stream their data have it read in one go
+        streams = isinstance(self.__vertex, AbstractStreamsRecording)
+        statistics = dict()
+        for variable in variables:
+            if variable == SPIKES:
+                if streams:
+                    self.__check_recording_spikes()
+                    chunks = self.__vertex.iter_spikes(
+                        sim.placements, sim.buffer_manager, max_rows)
+                else:
+                    spikes = self.get_spikes()
+                    chunks = [(spikes[:, 0], spikes[:, 1])]
+                statistics[variable] = write_spike_chunks(
+                    directory, variable, chunks)
+            elif variable == REWIRING:
+                if streams:
+                    self.__check_recording_events()
+                    chunks = self.__vertex.iter_events(
+                        variable, sim.placements, sim.buffer_manager,
+                        max_rows)
+                else:
+                    chunks = [self.get_events(variable)]
+                statistics[variable] = write_event_chunks(
+                    directory, variable, chunks)
+            else:
+                if streams:
+                    self.__check_recording(variable)
+                    chunks = self.__vertex.iter_data(
+                        variable, sim.no_machine_time_steps, sim.placements,
+                        sim.buffer_manager, max_rows)
+                    sampling_interval = (
+                        self.__vertex.get_neuron_sampling_interval(variable))
+                else:
+                    data, indexes, sampling_interval = (
+                        self.get_recorded_matrix(variable))
+                    chunks = [(indexes, 0, data)]
+                statistics[variable] = write_signal_chunks(
+                    directory, variable, chunks, sampling_interval)
+        return statistics
+
     def _get_units(self, variable):
         """ Get units with some safety code if the population has trouble
 
@@ -636,24 +760,21 @@ class Recorder(object):
         :param str label: recording elements label
         """
         # pylint: disable=too-many-arguments
-        # Safety check in case spikes are an empty list
-        if len(spikes) == 0:
-            spikes = numpy.empty(shape=(0, 2))
-
         t_stop = t * quantities.ms
 
         if indexes is None:
             indexes = range(n_neurons)
-        for index in indexes:
+        for index, times in zip(indexes, _split_spikes(spikes, indexes)):
             spiketrain = neo.SpikeTrain(
-                times=spikes[spikes[:, 0] == index][:, 1],
+                times=times,
                 t_start=recording_start_time,
                 t_stop=t_stop,
                 units='ms',
                 sampling_interval=sampling_interval,
                 source_population=label,
                 source_id=self.__population.index_to_id(index),
-                source_index=index)
+                source_index=index,
+                copy=False)
             # get times per atom
             segment.spiketrains.append(spiketrain)
 
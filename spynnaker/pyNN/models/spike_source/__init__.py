@@ -15,6 +15,7 @@
 
 from .spike_source_array import SpikeSourceArray
 from .spike_source_array_vertex import SpikeSourceArrayVertex
+from .spike_schedule import SpikeSchedule
 from .spike_source_from_file import SpikeSourceFromFile
 from .spike_source_poisson import SpikeSourcePoisson
 from .spike_source_poisson_variable import SpikeSourcePoissonVariable
@@ -22,7 +23,7 @@ from .spike_source_poisson_machine_vertex import (
     SpikeSourcePoissonMachineVertex)
 from .spike_source_poisson_vertex import SpikeSourcePoissonVertex
 
-__all__ = ["SpikeSourceArray", "SpikeSourceArrayVertex",
+__all__ = ["SpikeSchedule", "SpikeSourceArray", "SpikeSourceArrayVertex",
            "SpikeSourceFromFile", "SpikeSourcePoisson",
            "SpikeSourcePoissonMachineVertex", "SpikeSourcePoissonVariable",
            "SpikeSourcePoissonVertex"]
@@ -0,0 +1,154 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+
+class SpikeSchedule(object):
+    """ The spike times of a number of neurons, held as the times of all the\
+        spikes in one array, ordered by neuron, with the offset of the first\
+        spike of each neuron in another (as the rows of a compressed sparse\
+        row matrix are held).  This can be given as the ``spike_times`` of\
+        a :py:class:`SpikeSourceArray` in place of a list of lists, and\
+        needs much less memory and time for big recorded data sets.
+
+    It can also be used as a list of the spike times of each neuron.
+    """
+
+    __slots__ = [
+        # The index in the times of the first spike of each neuron, followed
+        # by the number of spikes
+        "__offsets",
+
+        # The spike times of all the neurons, in neuron order
+        "__times"]
+
+    def __init__(self, offsets, times):
+        """
+        :param offsets:
+            The index in ``times`` of the first spike of each neuron, and
+            then the number of spikes, so the spikes of neuron ``i`` are
+            ``times[offsets[i]:offsets[i + 1]]``
+        :type offsets: ~numpy.ndarray or list(int)
+        :param times: The times of the spikes, in milliseconds
+        :type times: ~numpy.ndarray or list(float)
+        :raises ConfigurationException: If the offsets don't fit the times
+        """
+        self.__offsets = numpy.asarray(offsets, dtype="int64")
+        self.__times = numpy.asarray(times, dtype="float64")
+        if (len(self.__offsets.shape) != 1 or len(self.__times.shape) != 1 or
+                not len(self.__offsets)):
+            raise ConfigurationException(
+                "The offsets and times of a SpikeSchedule must be 1D, with at"
+                " least one offset")
+        if (self.__offsets[0] != 0 or
+                self.__offsets[-1] != len(self.__times) or
+                numpy.any(numpy.diff(self.__offsets) < 0)):
+            raise ConfigurationException(
+                "The offsets of a SpikeSchedule must go up from 0 to the"
+                " number of spikes")
+
+    @classmethod
+    def from_neuron_ids(cls, n_neurons, neuron_ids, times):
+        """ Make a schedule from the neuron and time of each spike, in any\
+            order, such as is recorded
+
+        :param int n_neurons: The number of neurons
+        :param neuron_ids: The neuron of each spike
+        :type neuron_ids: ~numpy.ndarray or list(int)
+        :param times: The time of each spike, in milliseconds
+        :type times: ~numpy.ndarray or list(float)
+        :rtype: SpikeSchedule
+        :raises ConfigurationException:
+            If a neuron is out of range, or there are not as many neurons as
+            times
+        """
+        neuron_ids = numpy.asarray(neuron_ids, dtype="int64")
+        times = numpy.asarray(times, dtype="float64")
+        if neuron_ids.shape != times.shape or len(times.shape) != 1:
+            raise ConfigurationException(
+                "There must be one neuron for each spike time")
+        if len(neuron_ids) and (
+                neuron_ids.min() < 0 or neuron_ids.max() >= n_neurons):
+            raise ConfigurationException(
+                "The neurons of the spikes must be between 0 and {}".format(
+                    n_neurons - 1))
+        order = numpy.lexsort((times, neuron_ids))
+        offsets = numpy.zeros(n_neurons + 1, dtype="int64")
+        numpy.cumsum(
+            numpy.bincount(neuron_ids, minlength=n_neurons),
+            out=offsets[1:])
+        return cls(offsets, times[order])
+
+    @property
+    def n_neurons(self):
+        """ The number of neurons
+
+        :rtype: int
+        """
+        return len(self.__offsets) - 1
+
+    @property
+    def n_spikes(self):
+        """ The number of spikes of all the neurons
+
+        :rtype: int
+        """
+        return len(self.__times)
+
+    @property
+    def offsets(self):
+        """ The index of the first spike of each neuron, and then the\
+            number of spikes
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__offsets
+
+    @property
+    def times(self):
+        """ The times of the spikes, in neuron order
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__times
+
+    def split(self, values):
+        """ Split values with one per spike into one array per neuron
+
+        :param ~numpy.ndarray values: The values, one per spike
+        :return: views of the values of each neuron
+        :rtype: list(~numpy.ndarray)
+        """
+        return numpy.split(values, self.__offsets[1:-1])
+
+    def __len__(self):
+        return self.n_neurons
+
+    def __getitem__(self, neuron_id):
+        if neuron_id < 0:
+            neuron_id += self.n_neurons
+        if not 0 <= neuron_id < self.n_neurons:
+            raise IndexError("No neuron {} in {}".format(neuron_id, self))
+        return self.__times[
+            self.__offsets[neuron_id]:self.__offsets[neuron_id + 1]]
+
+    def __iter__(self):
+        return iter(self.split(self.__times))
+
+    def __repr__(self):
+        return "SpikeSchedule({} neurons, {} spikes)".format(
+            self.n_neurons, self.n_spikes)
@@ -22,11 +22,13 @@ from spinn_front_end_common.utility_models import ReverseIpTagMultiCastSource
 from spinn_front_end_common.abstract_models import AbstractChangableAfterRun
 from spinn_front_end_common.abstract_models.impl import (
     ProvidesKeyToAtomMappingImpl)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.globals_variables import (
     get_simulator, machine_time_step)
 from spynnaker.pyNN.models.common import (
     AbstractSpikeRecordable, EIEIOSpikeRecorder, SimplePopulationSettable)
 from spynnaker.pyNN.utilities import constants
+from .spike_schedule import SpikeSchedule
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
@@ -37,7 +39,10 @@ def _as_numpy_ticks(times, time_step):
 
 
 def _send_buffer_times(spike_times, time_step):
-    # Convert to ticks
+    # Convert to ticks; a schedule is converted all at once, and then split
+    # into views of the ticks of each neuron
+    if isinstance(spike_times, SpikeSchedule):
+        return spike_times.split(_as_numpy_ticks(spike_times.times, time_step))
     if len(spike_times) and hasattr(spike_times[0], "__len__"):
         data = []
         for times in spike_times:
@@ -64,6 +69,7 @@ class SpikeSourceArrayVertex(
         self.__model = model
         if spike_times is None:
             spike_times = []
+        self.__check_schedule(spike_times, n_neurons)
         self._spike_times = spike_times
         time_step = self.get_spikes_sampling_interval()
 
@@ -95,43 +101,57 @@ class SpikeSourceArrayVertex(
         """
         return list(self._spike_times)
 
+    @staticmethod
+    def __check_schedule(spike_times, n_neurons):
+        """ Check that a schedule has the spikes of the right number of\
+            neurons
+
+        :param spike_times:
+        :type spike_times: SpikeSchedule or list
+        :raises ConfigurationException: If it doesn't
+        """
+        if (isinstance(spike_times, SpikeSchedule) and
+                spike_times.n_neurons != n_neurons):
+            raise ConfigurationException(
+                "The SpikeSchedule has the spikes of {} neurons, but there"
+                " are {} neurons".format(spike_times.n_neurons, n_neurons))
+
     def _to_early_spikes_single_list(self, spike_times):
         """
         Checks if there is one or more spike_times before the current time
 
-        Logs a warning for the first oen found
+        Logs a warning for the first one found
 
-        :param iterable(int spike_times:
+        :param iterable(int) spike_times:
         """
         current_time = get_simulator().get_current_time()
-        for i in range(len(spike_times)):
-            if spike_times[i] > current_time:
-                logger.warning(
-                    "SpikeSourceArray {} has spike_times that are lower than "
-                    "the current time {} For example {} - "
-                    "these will be ignored.".format(
-                        self, current_time, float(spike_times[i])))
-                return
+        spike_times = numpy.asarray(spike_times, dtype="float64")
+        early = spike_times < current_time
+        if numpy.any(early):
+            logger.warning(
+                "SpikeSourceArray {} has spike_times that are lower than "
+                "the current time {} For example {} - "
+                "these will be ignored.".format(
+                    self, current_time,
+                    float(spike_times[numpy.argmax(early)])))
 
     def _check_spikes_double_list(self, spike_times):
         """
         Checks if there is one or more spike_times before the current time
 
-        Logs a warning for the first oen found
+        Logs a warning for the first one found
 
-        :param iterable(iterable(int) spike_times:
+        :param spike_times:
+        :type spike_times: SpikeSchedule or iterable(iterable(int))
         """
-        current_time = get_simulator().get_current_time()
-        for neuron_id in range(0, self.n_atoms):
-            id_times = spike_times[neuron_id]
-            for i in range(len(id_times)):
-                if id_times[i] > current_time:
-                    logger.warning(
-                       "SpikeSourceArray {} has spike_times that are lower "
-                       "than the current time {} For example {} - "
-                       "these will be ignored.".format(
-                            self, current_time, float(id_times[i])))
-                    return
+        if isinstance(spike_times, SpikeSchedule):
+            times = spike_times.times
+        else:
+            times = [
+                numpy.asarray(spike_times[neuron_id], dtype="float64").ravel()
+                for neuron_id in range(self.n_atoms)]
+            times = numpy.concatenate(times) if times else []
+        self._to_early_spikes_single_list(times)
 
     @spike_times.setter
     def spike_times(self, spike_times):
@@ -139,10 +159,12 @@ class SpikeSourceArrayVertex(
             actual change
 
         """
+        self.__check_schedule(spike_times, self.n_atoms)
         time_step = self.get_spikes_sampling_interval()
         # warn the user if they are asking for a spike time out of range
-        if spike_times:  # in case of empty list do not check
-            if hasattr(spike_times[0], '__iter__'):
+        if len(spike_times):  # in case of empty list do not check
+            if isinstance(spike_times, SpikeSchedule) or hasattr(
+                    spike_times[0], '__iter__'):
                 self._check_spikes_double_list(spike_times)
             else:
                 self._to_early_spikes_single_list(spike_times)
@@ -55,22 +55,13 @@ from spynnaker.pyNN.models.abstract_models import (
 from spynnaker.pyNN.exceptions import SynapticConfigurationException
 
 
-def _flatten(alist):
-    for item in alist:
-        if hasattr(item, "__iter__"):
-            yield from _flatten(item)
-        else:
-            yield item
-
-
-def get_rates_bytes(vertex_slice, rate_data):
+def get_rates_bytes(vertex_slice, n_rates):
     """ Gets the size of the Poisson rates in bytes
 
     :param ~pacman.model.graphs.common.Slice vertex_slice:
+    :param int n_rates: The number of rates of all the neurons of the slice
     :rtype: int
     """
-    n_rates = sum(len(rate_data[i]) for i in range(
-        vertex_slice.lo_atom, vertex_slice.hi_atom + 1))
     return ((vertex_slice.n_atoms * PARAMS_WORDS_PER_NEURON) +
             (n_rates * PARAMS_WORDS_PER_RATE)) * BYTES_PER_WORD
 
@@ -99,7 +90,6 @@ SDRAM_EDGE_PARAMS_BYTES_PER_WEIGHT = BYTES_PER_SHORT
 # 3. offset to start writing, 4. VLA of weights (not counted here)
 SDRAM_EDGE_PARAMS_BASE_BYTES = 3 * BYTES_PER_WORD
 
-_ONE_WORD = struct.Struct("<I")
 _FOUR_WORDS = struct.Struct("<4I")
 
 
@@ -423,20 +413,13 @@ class SpikeSourcePoissonMachineVertex(
             self.POISSON_SPIKE_SOURCE_REGIONS.RATES_REGION.value)
 
         # Extract the data on which to work and convert to appropriate form
-        starts = numpy.array(list(_flatten(
-            self._app_vertex.start[self.vertex_slice.as_slice]))).astype(
-                "float")
-        durations = numpy.array(list(_flatten(
-            self._app_vertex.duration[self.vertex_slice.as_slice]))).astype(
-                "float")
-        local_rates = self._app_vertex.rates[self.vertex_slice.as_slice]
-        n_rates = numpy.array([len(r) for r in local_rates])
-        splits = numpy.cumsum(n_rates)
-        rates = numpy.array(list(_flatten(local_rates)))
-        time_to_spike = numpy.array(list(_flatten(
-            self._app_vertex.time_to_spike[
-                self.vertex_slice.as_slice]))).astype("u4")
+        offsets, rates, starts, durations, time_to_spike = \
+            self._app_vertex.get_rate_data(self.vertex_slice)
+        n_rates = numpy.diff(offsets)
+        neuron_ids = numpy.repeat(
+            numpy.arange(self.vertex_slice.n_atoms), n_rates)
         rate_change = self._app_vertex.rate_change[self.vertex_slice.as_slice]
+        has_rates = n_rates > 0
 
         # Convert start times to start time steps
         starts_scaled = self._convert_ms_to_n_timesteps(starts)
@@ -452,10 +435,9 @@ class SpikeSourcePoissonMachineVertex(
 
         # Work out the timestep at which the next rate activates, using
         # the maximum value at the end (meaning there is no "next")
-        starts_split = numpy.array_split(starts_scaled, splits)
-        next_scaled = numpy.concatenate(
-            [numpy.append(s[1:], self._MAX_TIMESTEP)
-             for s in starts_split[:-1]])
+        next_scaled = numpy.empty_like(starts_scaled)
+        next_scaled[:-1] = starts_scaled[1:]
+        next_scaled[offsets[1:][has_rates] - 1] = self._MAX_TIMESTEP
 
         # Compute the spikes per tick for each rate for each atom
         spikes_per_tick = rates * (
@@ -467,54 +449,82 @@ class SpikeSourcePoissonMachineVertex(
         # pylint: disable=assignment-from-no-return
         is_slow_source = numpy.logical_not(is_fast_source)
 
+        # The rate data for the core, one struct per rate
+        core_data = numpy.zeros(
+            len(rates), dtype=self._PoissonStruct.numpy_dtype)
+        core_data["f0"] = starts_scaled
+        core_data["f1"] = ends_scaled
+        core_data["f2"] = next_scaled
+        core_data["f3"] = is_fast_source
+
         # Compute the e^-(spikes_per_tick) for fast sources to allow fast
         # computation of the Poisson distribution to get the number of
         # spikes per timestep
-        exp_minus_lambda = DataType.U032.encode_as_numpy_int_array(
+        core_data["f4"] = DataType.U032.encode_as_numpy_int_array(
             numpy.where(is_fast_source, numpy.exp(-1.0 * spikes_per_tick), 0))
 
         # Compute sqrt(lambda) for "faster" sources to allow Gaussian
         # approximation of the Poisson distribution to get the number of
         # spikes per timestep
-        sqrt_lambda = DataType.S1615.encode_as_numpy_int_array(
+        core_data["f5"] = DataType.S1615.encode_as_numpy_int_array(
             numpy.where(is_faster_source, numpy.sqrt(spikes_per_tick), 0))
 
         # Compute the inter-spike-interval for slow sources to get the
         # average number of timesteps between spikes
-        isi_val = numpy.where(
+        core_data["f6"] = numpy.where(
             not_zero & is_slow_source,
-            (1.0 / spikes_per_tick).astype(int), 0).astype("uint32")
+            (1.0 / spikes_per_tick).astype(int), 0)
 
         # Reuse the time-to-spike read from the machine (if has been run)
         # or don't if the rate has since been changed
-        time_to_spike_split = numpy.array_split(time_to_spike, splits)
-        time_to_spike = numpy.concatenate(
-            [t if rate_change[i] else numpy.repeat(0, len(t))
-             for i, t in enumerate(time_to_spike_split[:-1])])
-
-        # Turn the fast source booleans into uint32
-        is_fast_source = is_fast_source.astype("uint32")
-
-        # Group together the rate data for the core by rate
-        core_data = numpy.dstack((
-            starts_scaled, ends_scaled, next_scaled, is_fast_source,
-            exp_minus_lambda, sqrt_lambda, isi_val, time_to_spike))[0]
-
-        # Group data by neuron id
-        core_data_split = numpy.array_split(core_data, splits)
-
-        # Work out the index where the core should start based on the given
-        # first timestep
-        ends_scaled_split = numpy.array_split(ends_scaled, splits)
-        indices = [numpy.argmax(e > first_machine_time_step)
-                   for e in ends_scaled_split[:-1]]
-
-        # Build the final data for this core, and write it
-        final_data = numpy.concatenate([
-            numpy.concatenate(([len(d), indices[i]], numpy.concatenate(d)))
-            for i, d in enumerate(core_data_split[:-1])])
+        core_data["f7"] = numpy.where(
+            numpy.repeat(rate_change != 0, n_rates), time_to_spike, 0)
+
+        # Work out the index where each neuron should start based on the
+        # given first timestep, which is the first rate that ends after it,
+        # or the first rate if there is none
+        after_first = numpy.where(
+            ends_scaled > first_machine_time_step,
+            numpy.arange(len(rates)), len(rates))
+        indices = numpy.zeros(self.vertex_slice.n_atoms, dtype="int64")
+        if len(rates):
+            first_after = numpy.minimum.reduceat(
+                after_first, offsets[:-1][has_rates])
+            indices[has_rates] = numpy.where(
+                first_after < offsets[1:][has_rates],
+                first_after - offsets[:-1][has_rates], 0)
+
+        # Build the final data for this core, with the number of rates and
+        # the index of each neuron before the rate data of that neuron, and
+        # write it
+        header_words = numpy.arange(self.vertex_slice.n_atoms) * (
+            PARAMS_WORDS_PER_NEURON) + offsets[:-1] * PARAMS_WORDS_PER_RATE
+        final_data = numpy.zeros(
+            self.vertex_slice.n_atoms * PARAMS_WORDS_PER_NEURON +
+            len(rates) * PARAMS_WORDS_PER_RATE, dtype="uint32")
+        final_data[header_words] = n_rates
+        final_data[header_words + 1] = indices
+        final_data[self.__rate_words(neuron_ids, len(rates))] = \
+            core_data.view("uint32").reshape(-1, PARAMS_WORDS_PER_RATE)
         spec.write_array(final_data)
 
+    @staticmethod
+    def __rate_words(neuron_ids, n_rates):
+        """ Get the index of each word of the data of each rate in the rates\
+            region, in which each neuron has its number of rates and index\
+            before the data of its rates
+
+        :param ~numpy.ndarray neuron_ids:
+            The index in the slice of the neuron of each rate
+        :param int n_rates: The number of rates
+        :return: The index of each word, with a row per rate
+        :rtype: ~numpy.ndarray
+        """
+        first_words = (
+            (neuron_ids + 1) * PARAMS_WORDS_PER_NEURON +
+            numpy.arange(n_rates) * PARAMS_WORDS_PER_RATE)
+        return first_words[:, None] + numpy.arange(PARAMS_WORDS_PER_RATE)
+
     def _write_poisson_parameters(self, spec, graph, placement, routing_info):
         """ Generate Parameter data for Poisson spike sources
 
@@ -644,7 +654,8 @@ class SpikeSourcePoissonMachineVertex(
         spec.reserve_memory_region(
             region=self.POISSON_SPIKE_SOURCE_REGIONS.RATES_REGION.value,
             size=get_rates_bytes(
-                placement.vertex.vertex_slice, self._app_vertex.rates),
+                placement.vertex.vertex_slice,
+                self._app_vertex.n_rates(placement.vertex.vertex_slice)),
             label='PoissonRates')
 
     @staticmethod
@@ -683,53 +694,56 @@ class SpikeSourcePoissonMachineVertex(
             self.poisson_rate_region_address(placement, transceiver))
 
         # get size of poisson params
-        size_of_region = get_rates_bytes(vertex_slice, self._app_vertex.rates)
+        offsets = self._app_vertex.get_rate_data(vertex_slice)[0]
+        n_rates = numpy.diff(offsets)
+        size_of_region = get_rates_bytes(vertex_slice, int(offsets[-1]))
 
         # get data from the machine
         byte_array = transceiver.read_memory(
             placement.x, placement.y,
             poisson_rate_region_sdram_address, size_of_region)
+        words = numpy.frombuffer(byte_array, dtype="<u4")
 
-        # For each atom, read the number of rates and the rate parameters
-        offset = 0
-        for i in range(vertex_slice.lo_atom, vertex_slice.hi_atom + 1):
-            n_values, = _ONE_WORD.unpack_from(byte_array, offset)
-            offset += 4
-
-            # Skip reading the index, as it will be recalculated on data write
-            offset += 4
-
-            (_start, _end, _next, is_fast_source, exp_minus_lambda,
-             sqrt_lambda, isi, time_to_next_spike) = (
-                 self._PoissonStruct.read_data(byte_array, offset, n_values))
-            offset += (
-                self._PoissonStruct.get_size_in_whole_words(
-                    n_values) * BYTES_PER_WORD)
-
-            # Work out the spikes per tick depending on if the source is
-            # slow (isi), fast (exp) or faster (sqrt)
-            is_fast_source = is_fast_source == 1.0
-            spikes_per_tick = numpy.zeros(len(is_fast_source), dtype="float")
-            spikes_per_tick[is_fast_source] = numpy.log(
-                exp_minus_lambda[is_fast_source]) * -1.0
-            is_faster_source = sqrt_lambda > 0
-            # pylint: disable=assignment-from-no-return
-            spikes_per_tick[is_faster_source] = numpy.square(
-                sqrt_lambda[is_faster_source])
-            slow_elements = isi > 0
-            spikes_per_tick[slow_elements] = 1.0 / isi[slow_elements]
-
-            # Convert spikes per tick to rates
-            self._app_vertex.rates.set_value_by_id(
-                i,
-                spikes_per_tick *
-                (MICRO_TO_SECOND_CONVERSION /
-                 machine_time_step()))
-
-            # Store the updated time until next spike so that it can be
-            # rewritten when the parameters are loaded
-            self._app_vertex.time_to_spike.set_value_by_id(
-                i, time_to_next_spike)
+        # Check that each atom has the number of rates expected; the index
+        # is skipped, as it will be recalculated on data write
+        header_words = numpy.arange(vertex_slice.n_atoms) * (
+            PARAMS_WORDS_PER_NEURON) + offsets[:-1] * PARAMS_WORDS_PER_RATE
+        if not numpy.array_equal(words[header_words], n_rates):
+            raise ConfigurationException(
+                "The Poisson rates read from {} do not have the number of"
+                " rates expected".format(placement))
+
+        # Read the rate parameters of all the atoms in one go
+        neuron_ids = numpy.repeat(numpy.arange(vertex_slice.n_atoms), n_rates)
+        rate_data = numpy.ascontiguousarray(
+            words[self.__rate_words(neuron_ids, int(offsets[-1]))]).view(
+                self._PoissonStruct.numpy_dtype).reshape(-1)
+        is_fast_source = rate_data["f3"] == 1
+        exp_minus_lambda = (
+            rate_data["f4"] / float(DataType.U032.scale))
+        sqrt_lambda = rate_data["f5"] / float(DataType.S1615.scale)
+        isi = rate_data["f6"]
+
+        # Work out the spikes per tick depending on if the source is
+        # slow (isi), fast (exp) or faster (sqrt)
+        spikes_per_tick = numpy.zeros(len(rate_data), dtype="float")
+        spikes_per_tick[is_fast_source] = numpy.log(
+            exp_minus_lambda[is_fast_source]) * -1.0
+        is_faster_source = sqrt_lambda > 0
+        # pylint: disable=assignment-from-no-return
+        spikes_per_tick[is_faster_source] = numpy.square(
+            sqrt_lambda[is_faster_source])
+        slow_elements = isi > 0
+        spikes_per_tick[slow_elements] = 1.0 / isi[slow_elements]
+
+        # Convert spikes per tick to rates, and store the updated time until
+        # next spike so that it can be rewritten when the parameters are
+        # loaded
+        self._app_vertex.update_rate_data(
+            vertex_slice,
+            spikes_per_tick *
+            (MICRO_TO_SECOND_CONVERSION / machine_time_step()),
+            rate_data["f7"])
 
     @overrides(SendsSynapticInputsOverSDRAM.sdram_requirement)
     def sdram_requirement(self, sdram_machine_edge):
@@ -40,13 +40,9 @@ from spinn_front_end_common.utilities.globals_variables import (
 from spynnaker.pyNN.models.common import (
     AbstractSpikeRecordable, MultiSpikeRecorder, SimplePopulationSettable)
 from .spike_source_poisson_machine_vertex import (
-    SpikeSourcePoissonMachineVertex, _flatten, get_rates_bytes,
+    SpikeSourcePoissonMachineVertex, get_rates_bytes,
     get_sdram_edge_params_bytes)
 from spynnaker.pyNN.utilities.utility_calls import create_mars_kiss_seeds
-from spynnaker.pyNN.utilities.ranged.spynnaker_ranged_dict \
-    import SpynnakerRangeDictionary
-from spynnaker.pyNN.utilities.ranged.spynnaker_ranged_list \
-    import SpynnakerRangedList
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
@@ -92,7 +88,10 @@ class SpikeSourcePoissonVertex(
         "__max_rate",
         "__rate_change",
         "__n_profile_samples",
-        "__data",
+        "__offsets",
+        "__rates",
+        "__starts",
+        "__durations",
         "__is_variable_rate",
         "__max_spikes",
         "__outgoing_projections"]
@@ -232,26 +231,19 @@ class SpikeSourcePoissonVertex(
                 if len(duration_set) != len(rate_set):
                     raise Exception("Each rate must have its own duration")
 
+        # Keep the values of all the neurons as compressed sparse rows, with
+        # the values of neuron i at offsets[i]:offsets[i + 1]
         if hasattr(rates[0], "__len__"):
-            time_to_spike = [
-                numpy.array([0 for _ in range(len(rates[i]))])
-                for i in range(len(rates))]
+            n_rates = [len(r) for r in rates]
         else:
-            time_to_spike = numpy.array([0 for _ in range(len(rates))])
-
-        self.__data = SpynnakerRangeDictionary(n_neurons)
-        self.__data["rates"] = SpynnakerRangedList(
-            n_neurons, rates,
-            use_list_as_value=not hasattr(rates[0], "__len__"))
-        self.__data["starts"] = SpynnakerRangedList(
-            n_neurons, starts,
-            use_list_as_value=not hasattr(starts[0], "__len__"))
-        self.__data["durations"] = SpynnakerRangedList(
-            n_neurons, durations,
-            use_list_as_value=not hasattr(durations[0], "__len__"))
-        self.__data["time_to_spike"] = SpynnakerRangedList(
-            n_neurons, time_to_spike,
-            use_list_as_value=not hasattr(time_to_spike[0], "__len__"))
+            n_rates = numpy.repeat(len(rates), n_neurons)
+        self.__offsets = numpy.zeros(n_neurons + 1, dtype="int64")
+        numpy.cumsum(n_rates, out=self.__offsets[1:])
+        self.__rates = self.__to_rows(rates, n_neurons)
+        self.__starts = self.__to_rows(
+            starts if starts is not None else numpy.zeros(1), n_neurons)
+        self.__durations = self.__to_rows(durations, n_neurons)
+        self.__time_to_spike = numpy.zeros(len(self.__rates), dtype="uint32")
         self.__rng = numpy.random.RandomState(seed)
         self.__rate_change = numpy.zeros(n_neurons)
 
@@ -261,25 +253,62 @@ class SpikeSourcePoissonVertex(
         # Prepare for recording, and to get spikes
         self.__spike_recorder = MultiSpikeRecorder()
 
-        all_rates = list(_flatten(self.__data["rates"]))
         self.__max_rate = max_rate
-        if max_rate is None and len(all_rates):
-            self.__max_rate = numpy.amax(all_rates)
+        if max_rate is None and len(self.__rates):
+            self.__max_rate = numpy.amax(self.__rates)
         elif max_rate is None:
             self.__max_rate = 0
 
-        total_rate = numpy.sum(all_rates)
+        total_rate = numpy.sum(self.__rates)
         self.__max_spikes = 0
         if total_rate > 0:
-            # Note we have to do this per rate, as the whole array is not numpy
-            max_rates = numpy.array(
-                [numpy.max(r) for r in self.__data["rates"]])
+            max_rates = numpy.maximum.reduceat(
+                self.__rates, self.__offsets[:-1])
             self.__max_spikes = numpy.sum(scipy.stats.poisson.ppf(
                 1.0 - (1.0 / max_rates), max_rates))
 
         # Keep track of how many outgoing projections exist
         self.__outgoing_projections = list()
 
+    @staticmethod
+    def __to_rows(values, n_neurons):
+        """ Join the values of each neuron together into one array
+
+        :param values:
+            The values of each neuron, or the values shared by all neurons;
+            a value of None becomes NaN
+        :type values: list(~numpy.ndarray) or ~numpy.ndarray
+        :param int n_neurons: The number of neurons
+        :rtype: ~numpy.ndarray
+        """
+        if hasattr(values[0], "__len__"):
+            return numpy.concatenate(
+                [numpy.asarray(v, dtype="float64") for v in values] +
+                [numpy.zeros(0)])
+        return numpy.tile(numpy.asarray(values, dtype="float64"), n_neurons)
+
+    def __split(self, values):
+        """ Split values held as compressed sparse rows into one array per\
+            neuron
+
+        :param ~numpy.ndarray values:
+        :rtype: list(~numpy.ndarray)
+        """
+        return numpy.split(values, self.__offsets[1:-1])
+
+    def __one_per_neuron(self, value):
+        """ Make a value given for all neurons or for each neuron into one\
+            value per neuron, for when each neuron has a single rate
+
+        :param value:
+        :type value: float or list(float) or None
+        :rtype: ~numpy.ndarray
+        """
+        if hasattr(value, "__len__"):
+            return numpy.array(value, dtype="float64")
+        return numpy.repeat(
+            numpy.array([value], dtype="float64"), self.__n_atoms)
+
     def add_outgoing_projection(self, projection):
         """ Add an outgoing projection from this vertex
 
@@ -303,26 +332,18 @@ class SpikeSourcePoissonVertex(
     def rate(self):
         if self.__is_variable_rate:
             raise Exception("Get variable rate poisson rates with .rates")
-        return list(_flatten(self.__data["rates"]))
+        return list(self.__rates)
 
     @rate.setter
     def rate(self, rate):
         if self.__is_variable_rate:
             raise Exception("Cannot set rate of a variable rate poisson")
-        self.__rate_change = rate - numpy.array(
-            list(_flatten(self.__data["rates"])))
-        # Normalise parameter
-        if hasattr(rate, "__len__"):
-            # Single rate per neuron for whole simulation
-            self.__data["rates"].set_value([numpy.array([r]) for r in rate])
-        else:
-            # Single rate for all neurons for whole simulation
-            self.__data["rates"].set_value(
-                numpy.array([rate]), use_list_as_value=True)
-        all_rates = list(_flatten(self.__data["rates"]))
+        self.__rate_change = rate - self.__rates
+        # Single rate per neuron, or for all neurons, for whole simulation
+        self.__rates = self.__one_per_neuron(rate)
         new_max = 0
-        if len(all_rates):
-            new_max = numpy.amax(all_rates)
+        if len(self.__rates):
+            new_max = numpy.amax(self.__rates)
         if self.__max_rate is None:
             self.__max_rate = new_max
         # Setting record forces reset so OK to go over if not recording
@@ -335,42 +356,30 @@ class SpikeSourcePoissonVertex(
 
     @property
     def start(self):
-        return self.__data["starts"]
+        return self.__split(self.__starts)
 
     @start.setter
     def start(self, start):
         if self.__is_variable_rate:
             raise Exception("Cannot set start of a variable rate poisson")
-        # Normalise parameter
-        if hasattr(start, "__len__"):
-            # Single start per neuron for whole simulation
-            self.__data["starts"].set_value([numpy.array([s]) for s in start])
-        else:
-            # Single start for all neurons for whole simulation
-            self.__data["starts"].set_value(
-                numpy.array([start]), use_list_as_value=True)
+        # Single start per neuron, or for all neurons, for whole simulation
+        self.__starts = self.__one_per_neuron(start)
 
     @property
     def duration(self):
-        return self.__data["durations"]
+        return self.__split(self.__durations)
 
     @duration.setter
     def duration(self, duration):
         if self.__is_variable_rate:
             raise Exception("Cannot set duration of a variable rate poisson")
-        # Normalise parameter
-        if hasattr(duration, "__len__"):
-            # Single duration per neuron for whole simulation
-            self.__data["durations"].set_value(
-                [numpy.array([d]) for d in duration])
-        else:
-            # Single duration for all neurons for whole simulation
-            self.__data["durations"].set_value(
-                numpy.array([duration]), use_list_as_value=True)
+        # Single duration per neuron, or for all neurons, for whole
+        # simulation
+        self.__durations = self.__one_per_neuron(duration)
 
     @property
     def rates(self):
-        return self.__data["rates"]
+        return self.__split(self.__rates)
 
     @rates.setter
     def rates(self, _rates):
@@ -380,7 +389,7 @@ class SpikeSourcePoissonVertex(
 
     @property
     def starts(self):
-        return self.__data["starts"]
+        return self.__split(self.__starts)
 
     @starts.setter
     def starts(self, _starts):
@@ -390,7 +399,7 @@ class SpikeSourcePoissonVertex(
 
     @property
     def durations(self):
-        return self.__data["durations"]
+        return self.__split(self.__durations)
 
     @durations.setter
     def durations(self, _durations):
@@ -400,12 +409,53 @@ class SpikeSourcePoissonVertex(
 
     @property
     def time_to_spike(self):
-        return self.__data["time_to_spike"]
+        return self.__split(self.__time_to_spike)
 
     @property
     def rate_change(self):
         return self.__rate_change
 
+    def n_rates(self, vertex_slice):
+        """ Get the number of rates of all the neurons of a slice
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+        :rtype: int
+        """
+        return int(self.__offsets[vertex_slice.hi_atom + 1] -
+                   self.__offsets[vertex_slice.lo_atom])
+
+    def get_rate_data(self, vertex_slice):
+        """ Get the rates of the neurons of a slice, as compressed sparse\
+            rows
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+        :return: The index of the first rate of each neuron of the slice
+            followed by the number of rates, and then the rate, start,
+            duration (NaN for none) and time to the next spike of each rate
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray,
+            ~numpy.ndarray, ~numpy.ndarray)
+        """
+        offsets = self.__offsets[
+            vertex_slice.lo_atom:vertex_slice.hi_atom + 2]
+        rows = slice(offsets[0], offsets[-1])
+        return (offsets - offsets[0], self.__rates[rows], self.__starts[rows],
+                self.__durations[rows], self.__time_to_spike[rows])
+
+    def update_rate_data(self, vertex_slice, rates, time_to_spike):
+        """ updates the rates and times to the next spike of the neurons of\
+            a slice from the machine
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            the vertex slice to update the rates of
+        :param ~numpy.ndarray rates: the rates, as from get_rate_data
+        :param ~numpy.ndarray time_to_spike: the times to the next spike
+        :rtype: None
+        """
+        rows = slice(self.__offsets[vertex_slice.lo_atom],
+                     self.__offsets[vertex_slice.hi_atom + 1])
+        self.__rates[rows] = rates
+        self.__time_to_spike[rows] = time_to_spike
+
     @property
     @overrides(AbstractChangableAfterRun.requires_mapping)
     def requires_mapping(self):
@@ -452,7 +502,8 @@ class SpikeSourcePoissonVertex(
         :param ~pacman.model.graphs.common.Slice vertex_slice:
         """
         # pylint: disable=arguments-differ
-        poisson_params_sz = get_rates_bytes(vertex_slice, self.__data["rates"])
+        poisson_params_sz = get_rates_bytes(
+            vertex_slice, self.n_rates(vertex_slice))
         sdram_sz = get_sdram_edge_params_bytes(vertex_slice)
         other = ConstantSDRAM(
             SYSTEM_BYTES_REQUIREMENT +
@@ -0,0 +1,101 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Reading many blocks of memory from the machine in one pass.
+
+The reads are planned first as :py:class:`MemoryRead` items.  Reads of the
+same chip that touch or overlap are then merged into a single read, and the
+reads of each board are done in a thread of their own, so that the boards
+are read from at the same time.  The data of each planned read is handed to
+its ``receive`` callback once it has been read.
+"""
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from spinn_utilities.config_holder import get_config_int
+
+
+class MemoryRead(namedtuple(
+        "MemoryRead", ["x", "y", "address", "size", "receive"])):
+    """ A block of memory to be read from a chip, and what to do with it
+
+    The ``receive`` callable is called with a bytearray holding the data
+    of the block once it has been read.
+    """
+    __slots__ = ()
+
+
+def coalesce_reads(reads):
+    """ Merge the reads of each chip that touch or overlap
+
+    :param iterable(MemoryRead) reads: the reads to merge
+    :return: the merged reads as (x, y, address, size) and the reads that
+        are satisfied by each of them
+    :rtype: list(tuple(tuple(int, int, int, int), list(MemoryRead)))
+    """
+    merged = list()
+    for read in sorted(reads, key=lambda r: (r.x, r.y, r.address)):
+        if read.size <= 0:
+            continue
+        if merged:
+            (x, y, address, size), parts = merged[-1]
+            if (x, y) == (read.x, read.y) and read.address <= address + size:
+                end = max(address + size, read.address + read.size)
+                merged[-1] = ((x, y, address, end - address), parts)
+                parts.append(read)
+                continue
+        merged.append(((read.x, read.y, read.address, read.size), [read]))
+    return merged
+
+
+def read_memory_in_bulk(transceiver, reads, machine=None):
+    """ Do all the reads, merging those that can be merged and reading the\
+        boards of the machine at the same time
+
+    :param ~spinnman.transceiver.Transceiver transceiver:
+        How to read the data from the machine
+    :param iterable(MemoryRead) reads: the reads to do
+    :param ~spinn_machine.Machine machine:
+        The machine, used to work out which board each chip is on; if not
+        given, the reads are all done in one thread
+    :return: the number of reads actually done after merging
+    :rtype: int
+    """
+    # Group the merged reads by the board they are on
+    by_board = defaultdict(list)
+    merged = coalesce_reads(reads)
+    for (x, y, address, size), parts in merged:
+        board = None
+        if machine is not None:
+            chip = machine.get_chip_at(x, y)
+            if chip is not None:
+                board = (chip.nearest_ethernet_x, chip.nearest_ethernet_y)
+        by_board[board].append(((x, y, address, size), parts))
+
+    def read_board(board_reads):
+        for (x, y, address, size), parts in board_reads:
+            data = transceiver.read_memory(x, y, address, size)
+            for part in parts:
+                offset = part.address - address
+                part.receive(data[offset:offset + part.size])
+
+    n_threads = get_config_int("Simulation", "n_synaptic_read_threads")
+    if n_threads is None or n_threads <= 1 or len(by_board) <= 1:
+        for board_reads in by_board.values():
+            read_board(board_reads)
+    else:
+        with ThreadPoolExecutor(
+                max_workers=min(n_threads, len(by_board))) as executor:
+            # Consume the results so that any error is raised here
+            list(executor.map(read_board, by_board.values()))
+    return len(merged)
@@ -0,0 +1,173 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" A binary file of connections, which can be memory-mapped.
+
+The file starts with :py:data:`MAGIC`, then the version of the format and
+the length of the header text as two little-endian 32-bit integers, then
+the header text itself, which is JSON giving the name and numpy type of
+each field of a connection.  The header is padded so that the connections
+start at a multiple of :py:data:`_ALIGNMENT` bytes.  The connections follow
+as packed records, one per connection, in the order that they were written;
+their number is worked out from the size of the file, so that connections
+can be added a block at a time without going back to the header.
+"""
+import json
+import os
+import struct
+import numpy
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+#: The bytes at the start of a connection file
+MAGIC = b"SPYNCONN"
+
+#: The ending of the name of a connection file
+CONNECTION_FILE_SUFFIX = ".spyconn"
+
+# The version of the format written
+_VERSION = 1
+
+# The version and the length of the header text
+_HEADER_INFO = struct.Struct("<II")
+
+# The connections start at a multiple of this many bytes
+_ALIGNMENT = 64
+
+
+def is_connection_file(filename):
+    """ Determine if a file name is that of a connection file
+
+    :param str filename:
+    :rtype: bool
+    """
+    return isinstance(filename, str) and filename.endswith(
+        CONNECTION_FILE_SUFFIX)
+
+
+class ConnectionFileWriter(object):
+    """ Writes connections to a connection file a block at a time
+    """
+
+    __slots__ = [
+        # The open file being written
+        "__file",
+
+        # The numpy type of a connection in the file
+        "__dtype",
+
+        # The number of connections written so far
+        "__n_connections"]
+
+    def __init__(self, filename, fields):
+        """
+        :param str filename: The name of the file to write
+        :param fields: The name and numpy type of each field of a connection
+        :type fields: list(tuple(str, str))
+        """
+        self.__dtype = numpy.dtype(
+            [(name, numpy.dtype(dtype).newbyteorder("<"))
+             for name, dtype in fields])
+        header = json.dumps({"fields": [
+            [name, self.__dtype.fields[name][0].str]
+            for name in self.__dtype.names]}).encode("ascii")
+        size = len(MAGIC) + _HEADER_INFO.size + len(header)
+        header += b" " * (-size % _ALIGNMENT)
+        self.__file = open(filename, "wb")
+        self.__file.write(MAGIC)
+        self.__file.write(_HEADER_INFO.pack(_VERSION, len(header)))
+        self.__file.write(header)
+        self.__n_connections = 0
+
+    @property
+    def dtype(self):
+        """ The numpy type of a connection in the file
+
+        :rtype: ~numpy.dtype
+        """
+        return self.__dtype
+
+    @property
+    def n_connections(self):
+        """ The number of connections written so far
+
+        :rtype: int
+        """
+        return self.__n_connections
+
+    def write(self, connections):
+        """ Add connections to the end of the file
+
+        :param ~numpy.ndarray connections:
+            The connections, as a numpy structured array with (at least)
+            the fields of the file, which are converted to the type in the
+            file if needed
+        """
+        if connections.dtype != self.__dtype:
+            block = numpy.empty(len(connections), dtype=self.__dtype)
+            for name in self.__dtype.names:
+                block[name] = connections[name]
+            connections = block
+        self.__file.write(numpy.ascontiguousarray(connections).tobytes())
+        self.__n_connections += len(connections)
+
+    def close(self):
+        """ Finish writing the file
+        """
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def read_connection_file(filename):
+    """ Memory-map the connections in a connection file
+
+    :param str filename: The name of the file to read
+    :return: The connections as a numpy structured array, with a field for
+        each of the fields in the file
+    :rtype: ~numpy.ndarray
+    :raises ConfigurationException: If the file is not a connection file
+    """
+    with open(filename, "rb") as f:
+        magic = f.read(len(MAGIC))
+        info = f.read(_HEADER_INFO.size)
+        if magic != MAGIC or len(info) != _HEADER_INFO.size:
+            raise ConfigurationException(
+                "{} is not a connection file".format(filename))
+        version, header_length = _HEADER_INFO.unpack(info)
+        if version != _VERSION:
+            raise ConfigurationException(
+                "{} has version {} of the connection file format; only"
+                " version {} is supported".format(
+                    filename, version, _VERSION))
+        header = json.loads(f.read(header_length).decode("ascii"))
+    dtype = numpy.dtype([(str(name), str(dtype))
+                         for name, dtype in header["fields"]])
+    offset = len(MAGIC) + _HEADER_INFO.size + header_length
+    n_bytes = os.path.getsize(filename) - offset
+    if n_bytes % dtype.itemsize:
+        raise ConfigurationException(
+            "{} ends part way through a connection".format(filename))
+    n_connections = n_bytes // dtype.itemsize
+
+    # An empty file can't be memory-mapped
+    if not n_connections:
+        return numpy.zeros(0, dtype=dtype)
+    return numpy.memmap(
+        filename, dtype=dtype, mode="r", offset=offset,
+        shape=(n_connections, ))
@@ -0,0 +1,532 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import math
+import time
+from collections import namedtuple
+import numpy
+from data_specification.enums import DataType
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinn_front_end_common.utilities.globals_variables import (
+    machine_time_step_ms)
+from spynnaker.pyNN.models.neuron.neuron_models.mathsbox import (
+    ERFC_TABLE_MAX, SAMPLE, Mathsbox)
+from .reference_integrator import (
+    MeanfieldReferenceIntegrator, PARAMETERS, STATE_VARIABLES, expand_values)
+
+# The layout of an S16.15 accum
+_FRACTION_BITS = 15
+_INT32_MIN = -(1 << 31)
+_INT32_MAX = (1 << 31) - 1
+
+#: The arithmetic events counted by the emulation
+EVENTS = (
+    # a result that doesn't fit in an accum
+    "overflow",
+    # a product of two non-zero values that is zero in an accum
+    "underflow",
+    # a division by zero, which has no defined result on the machine
+    "divide_by_zero",
+    # an erfc integral that would never finish on the machine
+    "erfc_stall")
+
+#: The parameters of the threshold polynomial fits
+FIT_PARAMETERS = tuple(
+    "p{}_{}".format(i, kind) for kind in ("exc", "inh") for i in range(11))
+
+#: The results of comparing the fixed-point emulation with the reference
+FidelityReport = namedtuple("FidelityReport", [
+    "label", "max_error", "rms_error", "events", "fixed_point_rate",
+    "reference_rate"])
+
+
+def _const(value):
+    """ REAL_CONST; a compile-time constant rounded to the nearest accum
+
+    :rtype: int
+    """
+    return int(round(value * (1 << _FRACTION_BITS)))
+
+
+# Constants as written in the C code; note that ACS_DBL_TINY is 0 as an accum
+_ONE = _const(1.0)
+_TWO = _const(2.0)
+_HALF = _const(0.5)
+_TINY = _const(1.0e-6)
+_TWO_OVER_SQRT_PI = _const(1.128379167)
+_SQRT_2 = _const(1.4142137)
+_ERFC_A = tuple(_const(a) for a in (
+    0.0705230784, 0.0422820123, 0.0092705272, 0.0001520143, 0.0002765672,
+    0.0000430638))
+_ERFC_RATIONAL_MAX = _const(4.0)
+_ERFC_TABLE_MAX = _const(ERFC_TABLE_MAX)
+
+
+class FixedPointMeanfield(object):
+    """ An emulation of the S16.15 arithmetic of meanfield_model_impl.c,\
+        over all the units of a population at once.
+
+    Every accum operation of the C code is done on integers in the same
+    order, so that the results should match those of the machine bit for
+    bit.  Products are shifted down (rounding to minus infinity) and
+    quotients are truncated, as by the GCC fixed-point support; results
+    wrap on overflow, as the C code does not use saturating types, unless
+    saturation is asked for to see what it would change.  The events that
+    make the fixed-point results wrong are counted in :py:attr:`events`.
+
+    The parameters are encoded with the types the host writes them as and
+    then used as accums, as the C structures declare them; by default the
+    polynomial fits are written as S0.31, which the machine then reads as
+    S16.15.
+    """
+
+    __slots__ = [
+        "__n_units", "__params", "__state", "__timestep_ms", "__h",
+        "__n_steps_per_timestep", "__erfc_mode", "__n_erfc_entries",
+        "__erfc_inv_step", "__erfc_table", "__max_iterations",
+        "__saturate", "__events"]
+
+    def __init__(
+            self, parameters, state_variables, n_units, timestep_ms=None,
+            n_steps_per_timestep=1, erfc_mode="integral",
+            fit_data_type=DataType.S031, saturate=False):
+        """
+        :param parameters:
+            The parameters of the units, as held by the population vertex
+        :type parameters: ~spinn_utilities.ranged.RangeDictionary or
+            dict(str, float or list(float))
+        :param state_variables: The initial state of the units
+        :type state_variables: ~spinn_utilities.ranged.RangeDictionary or
+            dict(str, float or list(float))
+        :param int n_units: The number of units
+        :param timestep_ms:
+            The simulation time step; by default the machine time step
+        :type timestep_ms: float or None
+        :param int n_steps_per_timestep: The number of updates per time step
+        :param str erfc_mode: How erfc is evaluated; one of ERFC_MODES
+        :param ~data_specification.enums.DataType fit_data_type:
+            The type the polynomial fits are written as by the host
+        :param bool saturate: Whether to saturate instead of wrapping
+        :raises ConfigurationException:
+            If a value can't be written with the type the host uses for it
+        """
+        if timestep_ms is None:
+            timestep_ms = machine_time_step_ms()
+        self.__n_units = n_units
+        self.__saturate = saturate
+        self.__events = {event: 0 for event in EVENTS}
+        self.__params = {
+            name: self.__encode(
+                name, expand_values(parameters[name], n_units),
+                fit_data_type if name in FIT_PARAMETERS else DataType.S1615)
+            for name in PARAMETERS}
+        self.__state = {
+            name: self.__encode(
+                name, expand_values(state_variables[name], n_units),
+                DataType.S1615)
+            for name in STATE_VARIABLES}
+        self.__timestep_ms = float(timestep_ms)
+        self.__h = self.__encode(
+            "h", numpy.array([self.__timestep_ms / n_steps_per_timestep]),
+            DataType.S1615)[0]
+        self.__n_steps_per_timestep = n_steps_per_timestep
+
+        # Use the erfc configuration exactly as it is written for the machine
+        # (this also checks the mode)
+        config = Mathsbox(0, 0, erfc_mode).get_erfc_data().view("int32")
+        self.__erfc_mode = erfc_mode
+        self.__n_erfc_entries = int(config[1])
+        self.__erfc_inv_step = int(config[2])
+        self.__erfc_table = config[3:].astype("int64")
+
+        # The C loop takes at most about twice sample steps, as the step is
+        # truncated; any more and x has wrapped and the loop never ends
+        max_sample = int(self.__params[SAMPLE].max()) >> _FRACTION_BITS
+        self.__max_iterations = 2 * max_sample + 2
+
+    @staticmethod
+    def __encode(name, values, data_type):
+        if values.size and (values.min() < float(data_type.min) or
+                            values.max() > float(data_type.max)):
+            raise ConfigurationException(
+                "{} can't be written as {}; values are between {} and "
+                "{}".format(name, data_type.name, values.min(), values.max()))
+        return numpy.round(values * float(data_type.scale)).astype("int64")
+
+    @property
+    def n_units(self):
+        """ The number of units being integrated
+
+        :rtype: int
+        """
+        return self.__n_units
+
+    @property
+    def state(self):
+        """ The current state of the units, by variable name
+
+        :rtype: dict(str, ~numpy.ndarray)
+        """
+        return {name: self.__decode(values)
+                for name, values in self.__state.items()}
+
+    @property
+    def events(self):
+        """ The number of each of the EVENTS seen so far, over all units
+
+        :rtype: dict(str, int)
+        """
+        return dict(self.__events)
+
+    @staticmethod
+    def __decode(values):
+        return values / float(1 << _FRACTION_BITS)
+
+    def _fit(self, values):
+        """ Bring results back into 32 bits, as the machine would
+
+        :param ~numpy.ndarray values: The results, as int64
+        :rtype: ~numpy.ndarray
+        """
+        out_of_range = (values < _INT32_MIN) | (values > _INT32_MAX)
+        n_out_of_range = numpy.count_nonzero(out_of_range)
+        if not n_out_of_range:
+            return values
+        self.__events["overflow"] += int(n_out_of_range)
+        if self.__saturate:
+            return numpy.clip(values, _INT32_MIN, _INT32_MAX)
+        return ((values - _INT32_MIN) & 0xFFFFFFFF) + _INT32_MIN
+
+    def _add(self, a, b):
+        return self._fit(numpy.add(a, b))
+
+    def _sub(self, a, b):
+        return self._fit(numpy.subtract(a, b))
+
+    def _neg(self, a):
+        return self._fit(numpy.negative(a))
+
+    def _mul(self, a, b):
+        result = self._fit(numpy.multiply(a, b) >> _FRACTION_BITS)
+        self.__events["underflow"] += int(numpy.count_nonzero(
+            (result == 0) & numpy.not_equal(a, 0) & numpy.not_equal(b, 0)))
+        return result
+
+    def _div(self, a, b):
+        a, b = numpy.broadcast_arrays(a, b)
+        zero = b == 0
+        divisor = numpy.where(zero, 1, b)
+        dividend = a << _FRACTION_BITS
+        result = numpy.abs(dividend) // numpy.abs(divisor)
+        result = numpy.where((dividend < 0) != (divisor < 0), -result, result)
+        n_zero = numpy.count_nonzero(zero)
+        if n_zero:
+            self.__events["divide_by_zero"] += int(n_zero)
+            result = numpy.where(
+                zero, numpy.where(a < 0, _INT32_MIN, _INT32_MAX), result)
+        return self._fit(result)
+
+    def _erfc_integral(self, argument):
+        step = self._div(argument, self.__params[SAMPLE])
+        erf = numpy.zeros_like(argument)
+        x = numpy.zeros_like(argument)
+
+        # for(x=0; x<=argument; x+=step); a step of 0 never gets there
+        active = numpy.flatnonzero(argument >= 0)
+        stalled = step[active] <= 0
+        self.__events["erfc_stall"] += int(numpy.count_nonzero(stalled))
+        active = active[~stalled]
+        n_iterations = 0
+        while active.size:
+            if n_iterations == self.__max_iterations:
+                self.__events["erfc_stall"] += int(active.size)
+                break
+            n_iterations += 1
+            step_active = step[active]
+            x_active = x[active]
+            t = self._add(x_active, self._mul(step_active, _HALF))
+            erf[active] = self._add(erf[active], self._mul(
+                self._mul(step_active, _TWO_OVER_SQRT_PI),
+                self._neg(self._mul(t, t))))
+            x_active = self._add(x_active, step_active)
+            x[active] = x_active
+            active = active[x_active <= argument[active]]
+        return self._sub(_ONE, erf)
+
+    def _erfc_table(self, x):
+        # Checked before scaling, as a large x would overflow the position
+        in_range = numpy.flatnonzero(x < _ERFC_TABLE_MAX)
+        position = self._mul(x[in_range], self.__erfc_inv_step)
+        index = position >> _FRACTION_BITS
+        # The index is unsigned, so negative ones are beyond the table too
+        valid = (index >= 0) & (index < self.__n_erfc_entries - 1)
+        inside = in_range[valid]
+        position = position[valid]
+        index = index[valid]
+        result = numpy.zeros_like(x)
+        fraction = position & ((1 << _FRACTION_BITS) - 1)
+        low = self.__erfc_table[index]
+        high = self.__erfc_table[index + 1]
+        result[inside] = self._add(
+            low, self._mul(fraction, self._sub(high, low)))
+        return result
+
+    def _erfc_rational(self, x):
+        inside = numpy.flatnonzero(x < _ERFC_RATIONAL_MAX)
+        x_inside = x[inside]
+        poly = self._add(_ERFC_A[4], self._mul(x_inside, _ERFC_A[5]))
+        for a in _ERFC_A[3::-1]:
+            poly = self._add(a, self._mul(x_inside, poly))
+        poly = self._add(_ONE, self._mul(x_inside, poly))
+        erfc = self._div(_ONE, poly)
+        for _ in range(4):
+            erfc = self._mul(erfc, erfc)
+        result = numpy.zeros_like(x)
+        result[inside] = erfc
+        return result
+
+    def _error_function(self, argument):
+        """ error_function
+        """
+        if self.__erfc_mode == "integral":
+            return self._erfc_integral(argument)
+        negative = argument < 0
+        x = numpy.where(negative, self._neg(argument), argument)
+        if self.__erfc_mode == "table":
+            result = self._erfc_table(x)
+        else:
+            result = self._erfc_rational(x)
+        return numpy.where(negative, self._sub(_TWO, result), result)
+
+    def _fluct_regime(self, Ve, Vi):
+        """ get_fluct_regime_varsup; the same for both fits
+
+        :return: muV, sV, TvN
+        """
+        # pylint: disable=too-many-locals
+        p = self.__params
+        gei = p["gei"]
+        pconnec = p["pconnec"]
+        Ntot = p["Ntot"]
+        Gl = p["Gl"]
+        Cm = p["Cm"]
+        Te = p["Tsyn_exc"]
+        Ti = p["Tsyn_inh"]
+        Ee = p["Erev_exc"]
+        Ei = p["Erev_inh"]
+        mul = self._mul
+        add = self._add
+
+        Fe = mul(mul(mul(Ve, self._sub(_ONE, gei)), pconnec), Ntot)
+        Fi = mul(mul(mul(Vi, gei), pconnec), Ntot)
+        muGe = mul(mul(p["q_exc"], Te), Fe)
+        muGi = mul(mul(p["q_inh"], Ti), Fi)
+        muG = add(add(Gl, muGe), muGi)
+        muV = self._div(
+            add(add(mul(muGe, Ee), mul(muGi, Ei)), mul(Gl, p["El"])), muG)
+        Tm = self._div(Cm, muG)
+        Ue = mul(mul(p["q_exc"], self._sub(Ee, muV)), muG)
+        Ui = mul(mul(p["q_inh"], self._sub(Ei, muV)), muG)
+        UeTe = mul(Ue, Te)
+        TiUi = mul(Ti, Ui)
+        exc_term = mul(mul(Fe, UeTe), UeTe)
+        inh_term = mul(mul(Fi, TiUi), TiUi)
+        Tv_num = add(exc_term, inh_term)
+        Tv_denom = add(
+            self._div(exc_term, add(Te, Tm)), self._div(inh_term, add(Ti, Tm)))
+        Tv = self._div(Tv_num, Tv_denom)
+        TvN = self._div(mul(Tv, Gl), Cm)
+        sV = mul(_HALF, Tv_denom)
+        return muV, sV, TvN
+
+    def _transfer_function(self, muV, sV, TvN, kind):
+        """ threshold_func and the rest of TF for one of the fits
+
+        :param str kind: "exc" or "inh"
+        :return: Fout_th
+        """
+        p = self.__params
+        P = [p["p{}_{}".format(i, kind)] for i in range(11)]
+        mul = self._mul
+        sub = self._sub
+        muV_diff = sub(muV, p["muV0"])
+        sV_diff = sub(sV, p["sV0"])
+        TvN_diff = sub(TvN, p["TvN0"])
+        mu = mul(muV_diff, p["one_over_DmuV0"])
+        s = mul(sV_diff, p["one_over_DsV0"])
+        t = mul(TvN_diff, p["one_over_DTvN0"])
+        terms = [
+            mul(mul(P[1], muV_diff), p["one_over_DmuV0"]),
+            mul(mul(P[2], sV_diff), p["one_over_DsV0"]),
+            mul(mul(P[3], TvN_diff), p["one_over_DTvN0"]),
+            mul(mul(P[5], mu), mu), mul(mul(P[6], s), s),
+            mul(mul(P[7], t), t), mul(mul(P[8], mu), s),
+            mul(mul(P[9], mu), t), mul(mul(P[10], s), t)]
+        Vthre = P[0]
+        for term in terms:
+            Vthre = self._add(Vthre, term)
+
+        sV = numpy.where(sV < _TINY, self._add(sV, _TINY), sV)
+        argument = self._div(sub(Vthre, muV), self._add(_SQRT_2, sV))
+        Fout_th = self._div(
+            mul(mul(_HALF, p["Gl"]), self._error_function(argument)),
+            mul(p["Cm"], TvN))
+        return numpy.where(
+            Fout_th < _TINY, self._add(Fout_th, _TINY), Fout_th)
+
+    def _step(self):
+        """ RK2_midpoint_MF for all the units
+        """
+        p = self.__params
+        mul = self._mul
+        add = self._add
+        sub = self._sub
+        h = self.__h
+        Ve = self.__state["Ve"]
+        Vi = self.__state["Vi"]
+        W = self.__state["w"]
+        muV, sV, TvN = self._fluct_regime(
+            numpy.where(Ve < _TINY, add(Ve, _TINY), Ve),
+            numpy.where(Vi < _TINY, add(Vi, _TINY), Vi))
+        TF_exc = self._transfer_function(muV, sV, TvN, "exc")
+        TF_inh = self._transfer_function(muV, sV, TvN, "inh")
+
+        T_inv = p["Timescale_inv"]
+        k1_exc = mul(sub(TF_exc, Ve), T_inv)
+        k2_exc = mul(sub(TF_exc, add(Ve, mul(h, k1_exc))), T_inv)
+        k1_inh = mul(sub(TF_inh, Vi), T_inv)
+        k2_inh = mul(sub(TF_inh, add(Vi, mul(h, k1_inh))), T_inv)
+        b_Ve = mul(p["b"], Ve)
+        k1_W = add(self._div(self._neg(W), p["tauw"]), b_Ve)
+        k2_W = add(
+            self._div(self._neg(add(W, mul(h, k1_W))), p["tauw"]), b_Ve)
+
+        self.__state["Ve"] = add(Ve, mul(mul(h, add(k1_exc, k2_exc)), _HALF))
+        self.__state["Vi"] = add(Vi, mul(mul(h, add(k1_inh, k2_inh)), _HALF))
+        self.__state["w"] = add(W, mul(mul(h, add(k1_W, k2_W)), _HALF))
+
+    def run(self, n_timesteps, variables=STATE_VARIABLES, sampling_rate=1,
+            indexes=None, dtype="float64"):
+        """ Advance all the units, recording as the machine would.
+
+        The state is kept, so further calls continue where this one stopped.
+
+        :param int n_timesteps: The number of time steps to run for
+        :param iterable(str) variables: The state variables to record
+        :param int sampling_rate: Record every this many time steps
+        :param indexes: The units to record, or None for all of them
+        :type indexes: list(int) or None
+        :param dtype: The type of the recorded data
+        :return: for each variable, (data, recording_indices,
+            sampling_interval) as from NeuronRecorder.get_matrix_data
+        :rtype: dict(str, tuple(~numpy.ndarray, list(int), float))
+        """
+        for variable in variables:
+            if variable not in STATE_VARIABLES:
+                raise ConfigurationException(
+                    "Variable {} can't be recorded; use one of {}".format(
+                        variable, STATE_VARIABLES))
+        if indexes is None:
+            indexes = range(self.__n_units)
+        indexes = list(indexes)
+        columns = numpy.array(indexes, dtype="int64")
+        n_rows = int(math.ceil(n_timesteps / sampling_rate))
+        data = {variable: numpy.empty((n_rows, len(indexes)), dtype=dtype)
+                for variable in variables}
+
+        for timestep in range(n_timesteps):
+            # As on the machine, record before the update
+            if timestep % sampling_rate == 0:
+                row = timestep // sampling_rate
+                for variable in variables:
+                    data[variable][row] = self.__decode(
+                        self.__state[variable][columns])
+            for _ in range(self.__n_steps_per_timestep):
+                self._step()
+
+        sampling_interval = sampling_rate * self.__timestep_ms
+        return {variable: (data[variable], indexes, sampling_interval)
+                for variable in variables}
+
+
+def benchmark_fixed_point(
+        parameters, state_variables, n_units, n_timesteps, configurations,
+        timestep_ms=None, variables=STATE_VARIABLES):
+    """ Compare the fixed-point emulation with the floating-point reference\
+        over some units for each of a number of configurations.
+
+    Each configuration is a dict of the keyword arguments of
+    :py:class:`FixedPointMeanfield` (n_steps_per_timestep, erfc_mode,
+    fit_data_type and saturate); the reference uses the same number of
+    steps and erfc mode, so the errors are those of the fixed-point
+    arithmetic alone.  The units can be a
+    :py:class:`~spynnaker.pyNN.utilities.meanfield.MeanfieldParameterSweep`
+    to cover an envelope of parameters.
+
+    :param parameters: The parameters of the units
+    :type parameters: ~spinn_utilities.ranged.RangeDictionary or
+        dict(str, float or list(float))
+    :param state_variables: The initial state of the units
+    :type state_variables: ~spinn_utilities.ranged.RangeDictionary or
+        dict(str, float or list(float))
+    :param int n_units: The number of units
+    :param int n_timesteps: The number of time steps to run each for
+    :param configurations: The configurations to try, by label
+    :type configurations: dict(str, dict)
+    :param timestep_ms:
+        The simulation time step; by default the machine time step
+    :type timestep_ms: float or None
+    :param iterable(str) variables: The state variables to compare
+    :return: A report for each configuration, in the order given.  Errors
+        are by variable over all units and samples, ignoring samples where
+        the reference is not finite; rates are in unit-steps per second.
+    :rtype: list(FidelityReport)
+    """
+    reports = list()
+    for label, options in configurations.items():
+        options = dict(options)
+        n_steps = options.pop("n_steps_per_timestep", 1)
+        erfc_mode = options.get("erfc_mode", "integral")
+        fixed = FixedPointMeanfield(
+            parameters, state_variables, n_units, timestep_ms,
+            n_steps_per_timestep=n_steps, **options)
+        reference = MeanfieldReferenceIntegrator(
+            parameters, state_variables, n_units, timestep_ms,
+            n_steps_per_timestep=n_steps, erfc_mode=erfc_mode)
+        unit_steps = float(n_units * n_timesteps * n_steps)
+
+        start = time.perf_counter()
+        fixed_data = fixed.run(n_timesteps, variables)
+        fixed_time = time.perf_counter() - start
+        start = time.perf_counter()
+        reference_data = reference.run(n_timesteps, variables)
+        reference_time = time.perf_counter() - start
+
+        max_error = dict()
+        rms_error = dict()
+        for variable in variables:
+            expected = reference_data[variable][0]
+            finite = numpy.isfinite(expected)
+            error = numpy.abs(fixed_data[variable][0][finite] -
+                              expected[finite])
+            max_error[variable] = float(error.max()) if error.size else 0.0
+            rms_error[variable] = (
+                float(numpy.sqrt(numpy.mean(error * error)))
+                if error.size else 0.0)
+        reports.append(FidelityReport(
+            label, max_error, rms_error, fixed.events,
+            unit_steps / max(fixed_time, 1e-9),
+            unit_steps / max(reference_time, 1e-9)))
+    return reports
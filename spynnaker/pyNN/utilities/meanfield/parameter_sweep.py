@@ -0,0 +1,193 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict, namedtuple
+import numpy
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.models.neuron.builds import MeanfieldBase
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangeDictionary
+from .reference_integrator import MeanfieldReferenceIntegrator
+
+#: The results of a sweep for one variable; data is indexed by the position
+#: on each axis of the grid, then by recorded sample
+SweepResult = namedtuple(
+    "SweepResult", ["data", "axes", "sampling_interval"])
+
+
+class MeanfieldParameterSweep(object):
+    """ Lays out a grid of meanfield parameter values as the units of a\
+        single population, so that the whole grid is mapped, loaded and run\
+        once rather than once per point.
+
+    Each axis of the grid gives the values of one parameter (or initial
+    value); the points of the grid are all the combinations of these,
+    ordered as numpy.meshgrid with ``indexing="ij"`` would order them, and
+    unit *i* of the population simulates point *i*.
+    """
+
+    __slots__ = ["__axes", "__fixed", "__model_class", "__points"]
+
+    def __init__(self, grid, model_class=MeanfieldBase, **fixed):
+        """
+        :param grid: The values to sweep, by parameter name, in axis order
+        :type grid: dict(str, iterable(float))
+        :param type model_class: The meanfield model to sweep
+        :param fixed: Values of other parameters, common to all points
+        """
+        known = set(model_class.default_parameters)
+        known.update(model_class.default_initial_values)
+        for name in list(grid) + list(fixed):
+            if name not in known:
+                raise ConfigurationException(
+                    "{} has no parameter {}".format(
+                        model_class.__name__, name))
+        both = set(grid).intersection(fixed)
+        if both:
+            raise ConfigurationException(
+                "Parameters {} are both swept and fixed".format(sorted(both)))
+        self.__axes = OrderedDict(
+            (name, numpy.asarray(values, dtype="float64"))
+            for name, values in grid.items())
+        for name, values in self.__axes.items():
+            if values.ndim != 1 or not len(values):
+                raise ConfigurationException(
+                    "The values of {} must be a non-empty list".format(name))
+        self.__fixed = fixed
+        self.__model_class = model_class
+        mesh = numpy.meshgrid(*self.__axes.values(), indexing="ij")
+        self.__points = OrderedDict(
+            (name, values.ravel())
+            for name, values in zip(self.__axes, mesh))
+
+    @property
+    def axes(self):
+        """ The values on each axis of the grid, by parameter name
+
+        :rtype: dict(str, ~numpy.ndarray)
+        """
+        return OrderedDict(
+            (name, values.copy()) for name, values in self.__axes.items())
+
+    @property
+    def shape(self):
+        """ The shape of the grid
+
+        :rtype: tuple(int)
+        """
+        return tuple(len(values) for values in self.__axes.values())
+
+    @property
+    def n_points(self):
+        """ The number of points in the grid, and so units in the population
+
+        :rtype: int
+        """
+        return int(numpy.prod(self.shape))
+
+    @property
+    def points(self):
+        """ The parameter values of each point, in unit order
+
+        :rtype: dict(str, ~numpy.ndarray)
+        """
+        return OrderedDict(
+            (name, values.copy()) for name, values in self.__points.items())
+
+    def create_model(self):
+        """ Make a model with one unit per point of the grid
+
+        :rtype: AbstractPyNNMeanfieldModelStandard
+        """
+        params = dict(self.__fixed)
+        params.update(self.__points)
+        return self.__model_class(**params)
+
+    def create_population(
+            self, sim, label=None, record=("Ve", "Vi", "w"),
+            sampling_interval=None, additional_parameters=None):
+        """ Make a population with one unit per point of the grid
+
+        :param sim: The simulator, on which setup must already be called
+        :param str label: The label of the population
+        :param iterable(str) record: The variables to record
+        :param sampling_interval: The sampling interval of the recording
+        :type sampling_interval: int or None
+        :param additional_parameters:
+            Population parameters (e.g. ``n_steps_per_timestep``)
+        :type additional_parameters: dict(str, ...) or None
+        :rtype: ~spynnaker.pyNN.models.populations.Population
+        """
+        population = sim.Population(
+            self.n_points, self.create_model(), label=label,
+            additional_parameters=additional_parameters)
+        if record:
+            population.record(
+                list(record), sampling_interval=sampling_interval)
+        return population
+
+    def get_parameters_and_state(self):
+        """ Get the parameters and initial values of all the points of the\
+            grid, as a population vertex would hold them
+
+        :return: parameters, state_variables
+        :rtype: tuple(SpynnakerRangeDictionary, SpynnakerRangeDictionary)
+        """
+        # pylint: disable=protected-access
+        model = self.create_model()._model
+        parameters = SpynnakerRangeDictionary(self.n_points)
+        state_variables = SpynnakerRangeDictionary(self.n_points)
+        model.add_parameters(parameters)
+        model.add_state_variables(state_variables)
+        return parameters, state_variables
+
+    def create_reference_integrator(self, **kwargs):
+        """ Make a host-side integrator of all the points of the grid
+
+        :param kwargs: Passed on to MeanfieldReferenceIntegrator
+        :rtype: MeanfieldReferenceIntegrator
+        """
+        parameters, state_variables = self.get_parameters_and_state()
+        return MeanfieldReferenceIntegrator(
+            parameters, state_variables, self.n_points, **kwargs)
+
+    def to_grid(self, data, indexes, sampling_interval):
+        """ Arrange recorded data by point of the grid
+
+        :param ~numpy.ndarray data: The data, one row per sample
+        :param list(int) indexes: The unit of each column of the data
+        :param float sampling_interval: The time between samples
+        :return: the data with one axis per parameter, then one of samples;
+            points that were not recorded are NaN
+        :rtype: SweepResult
+        """
+        n_samples = len(data)
+        by_point = numpy.full((self.n_points, n_samples), numpy.nan)
+        if len(indexes):
+            by_point[numpy.asarray(indexes)] = numpy.transpose(data)
+        return SweepResult(
+            by_point.reshape(self.shape + (n_samples, )), self.axes,
+            sampling_interval)
+
+    def get_results(self, population, variable):
+        """ Get the recorded data of a population made by\
+            :py:meth:`create_population`, arranged by point of the grid
+
+        :param ~spynnaker.pyNN.models.populations.Population population:
+        :param str variable: The recorded variable to get
+        :rtype: SweepResult
+        """
+        # pylint: disable=protected-access
+        return self.to_grid(
+            *population._recorder.get_recorded_matrix(variable))
@@ -0,0 +1,392 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import math
+import numpy
+from pyNN.random import RandomDistribution
+from scipy.special import erfc
+from spinn_utilities.helpful_functions import is_singleton
+from spinn_utilities.ranged.abstract_list import AbstractList
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinn_front_end_common.utilities.globals_variables import (
+    machine_time_step_ms)
+from spynnaker.pyNN.models.neuron.neuron_models.mathsbox import (
+    ERFC_MODES, ERFC_TABLE_MAX, ERFC_TABLE_SIZE, SAMPLE)
+
+#: The parameters used by the meanfield update, by their ranged dict names
+PARAMETERS = (
+    "b", "tauw", "Timescale_inv",
+    "pconnec", "q_exc", "q_inh", "Tsyn_exc", "Tsyn_inh", "Erev_exc",
+    "Erev_inh", "Ntot", "gei", "Gl", "Cm", "El",
+    "muV0", "one_over_DmuV0", "sV0", "one_over_DsV0", "TvN0",
+    "one_over_DTvN0", SAMPLE) + tuple(
+        "p{}_{}".format(i, kind) for kind in ("exc", "inh")
+        for i in range(11))
+
+#: The state variables that are integrated, and can be recorded
+STATE_VARIABLES = ("Ve", "Vi", "w")
+
+#: The value the C code uses to keep things away from zero
+_TINY = 1.0e-6
+
+# Constants as written in the C code
+_TWO_OVER_SQRT_PI = 1.128379167
+_SQRT_2 = 1.4142137
+
+# Coefficients of the Abramowitz & Stegun 7.1.28 approximation of erf
+_ERFC_A = (0.0705230784, 0.0422820123, 0.0092705272, 0.0001520143,
+           0.0002765672, 0.0000430638)
+
+# Beyond this the rational approximation is treated as 0
+_ERFC_RATIONAL_MAX = 4.0
+
+
+def expand_values(values, n_units):
+    """ Get one float per unit from a ranged list, list or single value
+
+    :rtype: ~numpy.ndarray
+    """
+    if isinstance(values, AbstractList):
+        data = numpy.empty(n_units)
+        for start, stop, value in values.iter_ranges():
+            data[start:stop] = expand_values(value, stop - start)
+        return data
+    if isinstance(values, RandomDistribution):
+        return numpy.asarray(values.next(n_units), dtype="float64")
+    if is_singleton(values):
+        return numpy.full(n_units, values, dtype="float64")
+    return numpy.asarray(values, dtype="float64")
+
+
+class MeanfieldReferenceIntegrator(object):
+    """ A host-side, vectorised version of the meanfield update performed by\
+        meanfield_model_impl.c, over all the units of a population at once.
+
+    Each step follows the C code: get_fluct_regime_varsup, threshold_func
+    and TF for each of the excitatory and inhibitory polynomial fits, then
+    RK2_midpoint_MF, including the quirks of that code (the \"integral\"
+    erfc mode sums the same integrand as the C loop).  It is computed in
+    floating point, so it is a reference for what the fixed-point code is
+    trying to do rather than a bit-exact copy of it.
+
+    Random distributions in the parameters are drawn again here, so only
+    populations with deterministic parameters can be compared unit by unit
+    with the machine.
+    """
+
+    __slots__ = [
+        "__n_units", "__params", "__state", "__timestep_ms", "__h",
+        "__n_steps_per_timestep", "__tolerance", "__n_steps_taken",
+        "__erfc", "__erfc_table", "__exc_rate", "__inh_rate",
+        "__exc_factor", "__inh_factor", "__leak"]
+
+    def __init__(
+            self, parameters, state_variables, n_units, timestep_ms=None,
+            n_steps_per_timestep=1, erfc_mode="integral",
+            adaptive_tolerance=0.0):
+        """
+        :param parameters:
+            The parameters of the units, as held by the population vertex
+        :type parameters: ~spinn_utilities.ranged.RangeDictionary or
+            dict(str, float or list(float))
+        :param state_variables: The initial state of the units
+        :type state_variables: ~spinn_utilities.ranged.RangeDictionary or
+            dict(str, float or list(float))
+        :param int n_units: The number of units
+        :param timestep_ms:
+            The simulation time step; by default the machine time step
+        :type timestep_ms: float or None
+        :param int n_steps_per_timestep: The number of updates per time step
+        :param str erfc_mode:
+            How erfc is evaluated; one of those of the machine, or
+            \"exact\" to use a true erfc
+        :param float adaptive_tolerance:
+            The local error tolerance of adaptive stepping, in which case
+            n_steps_per_timestep is the most steps per timestep, or 0 for
+            fixed steps
+        """
+        if erfc_mode != "exact" and erfc_mode not in ERFC_MODES:
+            raise ConfigurationException(
+                "erfc_mode must be \"exact\" or one of {}, not {}".format(
+                    sorted(ERFC_MODES), erfc_mode))
+        if timestep_ms is None:
+            timestep_ms = machine_time_step_ms()
+        self.__n_units = n_units
+        self.__params = {
+            name: expand_values(parameters[name], n_units)
+            for name in PARAMETERS}
+        self.__state = {
+            name: expand_values(state_variables[name], n_units)
+            for name in STATE_VARIABLES}
+        self.__timestep_ms = float(timestep_ms)
+        self.__tolerance = float(adaptive_tolerance or 0.0)
+        self.__h = self.__timestep_ms
+        if not self.__tolerance:
+            self.__h /= n_steps_per_timestep
+        self.__n_steps_per_timestep = n_steps_per_timestep
+        self.__n_steps_taken = numpy.zeros(n_units, dtype="int64")
+        self.__erfc = getattr(self, "_erfc_" + erfc_mode)
+        self.__erfc_table = None
+        if erfc_mode == "table":
+            step = ERFC_TABLE_MAX / (ERFC_TABLE_SIZE - 1)
+            self.__erfc_table = erfc(numpy.arange(ERFC_TABLE_SIZE) * step)
+
+        # Things that don't change between steps
+        p = self.__params
+        self.__exc_rate = (1 - p["gei"]) * p["pconnec"] * p["Ntot"]
+        self.__inh_rate = p["gei"] * p["pconnec"] * p["Ntot"]
+        self.__exc_factor = p["q_exc"] * p["Tsyn_exc"]
+        self.__inh_factor = p["q_inh"] * p["Tsyn_inh"]
+        self.__leak = p["Gl"] * p["El"]
+
+    @classmethod
+    def from_population(cls, population, erfc_mode=None):
+        """ Make an integrator with the current parameters and initial\
+            values of a population of a meanfield model
+
+        :param ~spynnaker.pyNN.models.populations.Population population:
+        :param erfc_mode:
+            How erfc is evaluated; by default as on the machine
+        :type erfc_mode: str or None
+        :rtype: MeanfieldReferenceIntegrator
+        """
+        # pylint: disable=protected-access
+        vertex = population._vertex
+        neuron_impl = vertex.neuron_impl
+        if erfc_mode is None:
+            erfc_mode = neuron_impl.erfc_mode
+        return cls(
+            vertex.parameters, vertex.state_variables, vertex.n_atoms,
+            n_steps_per_timestep=neuron_impl.n_steps_per_timestep,
+            erfc_mode=erfc_mode,
+            adaptive_tolerance=neuron_impl.adaptive_tolerance)
+
+    @property
+    def n_units(self):
+        """ The number of units being integrated
+
+        :rtype: int
+        """
+        return self.__n_units
+
+    @property
+    def state(self):
+        """ The current state of the units, by variable name
+
+        :rtype: dict(str, ~numpy.ndarray)
+        """
+        return {name: values.copy() for name, values in self.__state.items()}
+
+    @property
+    def n_steps_taken(self):
+        """ The number of steps taken so far by each unit, as counted in\
+            the step provenance of the machine
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__n_steps_taken.copy()
+
+    def _erfc_exact(self, argument):
+        return erfc(argument)
+
+    def _erfc_integral(self, argument):
+        # The C loop sums the integrand at sample + 1 midpoints when the
+        # argument is positive, and doesn't run otherwise
+        step = argument / self.__params[SAMPLE]
+        n = numpy.floor(self.__params[SAMPLE]) + 1
+        sum_t_squared = (step * step * step) * (n * n * n / 3.0 - n / 12.0)
+        erf = numpy.where(
+            argument > 0, -_TWO_OVER_SQRT_PI * sum_t_squared, 0.0)
+        return 1.0 - erf
+
+    def _erfc_table(self, argument):
+        x = numpy.abs(argument)
+        result = numpy.interp(
+            x, numpy.linspace(0, ERFC_TABLE_MAX, ERFC_TABLE_SIZE),
+            self.__erfc_table, right=0.0)
+        return numpy.where(argument < 0, 2.0 - result, result)
+
+    def _erfc_rational(self, argument):
+        x = numpy.abs(argument)
+        poly = numpy.full_like(x, _ERFC_A[-1])
+        for a in _ERFC_A[-2::-1]:
+            poly = a + x * poly
+        poly = 1.0 + x * poly
+        result = 1.0 / poly
+        for _ in range(4):
+            result *= result
+        result[x >= _ERFC_RATIONAL_MAX] = 0.0
+        return numpy.where(argument < 0, 2.0 - result, result)
+
+    def _fluct_regime(self, Ve, Vi):
+        """ get_fluct_regime_varsup; the same for both fits
+
+        :return: muV, sV, TvN
+        """
+        p = self.__params
+        Fe = Ve * self.__exc_rate
+        Fi = Vi * self.__inh_rate
+        muGe = self.__exc_factor * Fe
+        muGi = self.__inh_factor * Fi
+        muG = p["Gl"] + muGe + muGi
+        muV = (muGe * p["Erev_exc"] + muGi * p["Erev_inh"] + self.__leak) / muG
+        Tm = p["Cm"] / muG
+        Ue = p["q_exc"] * (p["Erev_exc"] - muV) * muG
+        Ui = p["q_inh"] * (p["Erev_inh"] - muV) * muG
+        exc_term = Ue * p["Tsyn_exc"]
+        exc_term *= exc_term * Fe
+        inh_term = p["Tsyn_inh"] * Ui
+        inh_term *= inh_term * Fi
+        Tv_num = exc_term + inh_term
+        Tv_denom = (exc_term / (p["Tsyn_exc"] + Tm) +
+                    inh_term / (p["Tsyn_inh"] + Tm))
+        TvN = (Tv_num / Tv_denom) * p["Gl"] / p["Cm"]
+        sV = 0.5 * Tv_denom
+        return muV, sV, TvN
+
+    def _transfer_function(self, muV, sV, TvN, kind):
+        """ threshold_func and the rest of TF for one of the fits
+
+        :param str kind: "exc" or "inh"
+        :return: Fout_th
+        """
+        p = self.__params
+        fit = [p["p{}_{}".format(i, kind)] for i in range(11)]
+        mu = (muV - p["muV0"]) * p["one_over_DmuV0"]
+        s = (sV - p["sV0"]) * p["one_over_DsV0"]
+        t = (TvN - p["TvN0"]) * p["one_over_DTvN0"]
+        Vthre = (fit[0] + fit[1] * mu + fit[2] * s + fit[3] * t +
+                 fit[5] * mu * mu + fit[6] * s * s + fit[7] * t * t +
+                 fit[8] * mu * s + fit[9] * mu * t + fit[10] * s * t)
+        sV = numpy.where(sV < _TINY, sV + _TINY, sV)
+        argument = (Vthre - muV) / (_SQRT_2 + sV)
+        Fout_th = (0.5 * p["Gl"]) * self.__erfc(argument) / (p["Cm"] * TvN)
+        return numpy.where(Fout_th < _TINY, Fout_th + _TINY, Fout_th)
+
+    def _step(self, h, active=None):
+        """ RK2_midpoint_MF for all the units
+
+        :param h: The step, overall or by unit
+        :type h: float or ~numpy.ndarray
+        :param active: Which units to update, or None for all of them
+        :type active: ~numpy.ndarray or None
+        :return: The local error estimate of the step of each unit
+        :rtype: ~numpy.ndarray
+        """
+        p = self.__params
+        Ve = self.__state["Ve"]
+        Vi = self.__state["Vi"]
+        W = self.__state["w"]
+        muV, sV, TvN = self._fluct_regime(
+            numpy.where(Ve < _TINY, Ve + _TINY, Ve),
+            numpy.where(Vi < _TINY, Vi + _TINY, Vi))
+        TF_exc = self._transfer_function(muV, sV, TvN, "exc")
+        TF_inh = self._transfer_function(muV, sV, TvN, "inh")
+
+        T_inv = p["Timescale_inv"]
+        k1_exc = (TF_exc - Ve) * T_inv
+        k2_exc = (TF_exc - (Ve + h * k1_exc)) * T_inv
+        k1_inh = (TF_inh - Vi) * T_inv
+        k2_inh = (TF_inh - (Vi + h * k1_inh)) * T_inv
+        k1_W = -W / p["tauw"] + p["b"] * Ve
+        k2_W = -(W + h * k1_W) / p["tauw"] + p["b"] * Ve
+
+        new_state = {
+            "Ve": Ve + 0.5 * h * (k1_exc + k2_exc),
+            "Vi": Vi + 0.5 * h * (k1_inh + k2_inh),
+            "w": W + 0.5 * h * (k1_W + k2_W)}
+        for name, values in new_state.items():
+            if active is not None:
+                values = numpy.where(active, values, self.__state[name])
+            self.__state[name] = values
+
+        # The RK2 and Euler updates differ by h/2 (k2 - k1)
+        return numpy.maximum(
+            numpy.abs(0.5 * h * (k2_exc - k1_exc)),
+            numpy.abs(0.5 * h * (k2_inh - k1_inh)))
+
+    def _adaptive_step(self):
+        """ meanfield_model_state_update_adaptive for all the units
+
+        :return: The number of steps taken by each unit, not counting the\
+            whole step tried first when that is rejected
+        :rtype: ~numpy.ndarray
+        """
+        max_steps = self.__n_steps_per_timestep
+        last_state = self.state
+        error = self._step(self.__h)
+        n_steps = numpy.ones(self.__n_units, dtype="int64")
+        redo = error > self.__tolerance
+        if max_steps == 1 or not numpy.any(redo):
+            return n_steps
+
+        # The estimate goes as h^2, so n sub-steps divide it by n^2
+        n_steps[redo] = numpy.clip(numpy.ceil(numpy.sqrt(
+            error[redo] / self.__tolerance)), 2, max_steps)
+        for name, values in last_state.items():
+            self.__state[name] = numpy.where(
+                redo, values, self.__state[name])
+        sub_h = self.__h / n_steps
+        for i in range(int(n_steps[redo].max())):
+            self._step(sub_h, redo & (i < n_steps))
+        return n_steps
+
+    def run(self, n_timesteps, variables=STATE_VARIABLES, sampling_rate=1,
+            indexes=None, dtype="float64"):
+        """ Advance all the units, recording as the machine would.
+
+        The state is kept, so further calls continue where this one stopped.
+
+        :param int n_timesteps: The number of time steps to run for
+        :param iterable(str) variables: The state variables to record
+        :param int sampling_rate: Record every this many time steps
+        :param indexes: The units to record, or None for all of them
+        :type indexes: list(int) or None
+        :param dtype: The type of the recorded data
+        :return: for each variable, (data, recording_indices,
+            sampling_interval) as from NeuronRecorder.get_matrix_data
+        :rtype: dict(str, tuple(~numpy.ndarray, list(int), float))
+        """
+        for variable in variables:
+            if variable not in STATE_VARIABLES:
+                raise ConfigurationException(
+                    "Variable {} can't be recorded; use one of {}".format(
+                        variable, STATE_VARIABLES))
+        if indexes is None:
+            indexes = range(self.__n_units)
+        indexes = list(indexes)
+        columns = numpy.array(indexes, dtype="int64")
+        n_rows = int(math.ceil(n_timesteps / sampling_rate))
+        data = {variable: numpy.empty((n_rows, len(indexes)), dtype=dtype)
+                for variable in variables}
+
+        with numpy.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            for timestep in range(n_timesteps):
+                # As on the machine, record before the update
+                if timestep % sampling_rate == 0:
+                    row = timestep // sampling_rate
+                    for variable in variables:
+                        data[variable][row] = \
+                            self.__state[variable][columns]
+                if self.__tolerance:
+                    self.__n_steps_taken += self._adaptive_step()
+                    continue
+                for _ in range(self.__n_steps_per_timestep):
+                    self._step(self.__h)
+                self.__n_steps_taken += self.__n_steps_per_timestep
+
+        sampling_interval = sampling_rate * self.__timestep_ms
+        return {variable: (data[variable], indexes, sampling_interval)
+                for variable in variables}
@@ -0,0 +1,208 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Writing recorded data to disk a chunk at a time, and reading it back.
+
+Each chunk is a separate ``.npz`` file in the export directory, named after
+the variable and the position of the chunk, so a recording is never held in
+memory as a whole while it is written.  A spike chunk holds the ``ids`` and
+``times`` of its spikes; a signal chunk holds the recording ``indexes`` of
+its columns, the ``times`` of its rows and the ``data`` itself; an event
+chunk holds the ``events`` as rows.
+"""
+from collections import namedtuple
+import glob
+import logging
+import os
+import time
+import numpy
+from spinn_utilities.log import FormatAdapter
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+
+class ExportStatistics(namedtuple(
+        "ExportStatistics", ["n_chunks", "n_bytes", "seconds"])):
+    """ How much was written by an export and how long it took
+    """
+    __slots__ = ()
+
+    @property
+    def bytes_per_second(self):
+        """ The throughput of the export
+
+        :rtype: float
+        """
+        if self.seconds <= 0:
+            return float("inf") if self.n_bytes else 0.0
+        return self.n_bytes / self.seconds
+
+
+def _chunk_filename(directory, variable, index):
+    return os.path.join(directory, "{}_{:06d}.npz".format(variable, index))
+
+
+def _chunk_filenames(directory, variable):
+    return sorted(glob.glob(os.path.join(
+        glob.escape(directory), "{}_[0-9]*.npz".format(
+            glob.escape(variable)))))
+
+
+def _write_chunks(directory, variable, chunks):
+    """
+    :param str directory:
+    :param str variable:
+    :param iterable(dict(str,~numpy.ndarray)) chunks:
+    :rtype: ExportStatistics
+    """
+    # Remove chunks of an earlier export that this one might not overwrite
+    for filename in _chunk_filenames(directory, variable):
+        os.remove(filename)
+
+    start = time.perf_counter()
+    n_chunks = 0
+    n_bytes = 0
+    for arrays in chunks:
+        filename = _chunk_filename(directory, variable, n_chunks)
+        numpy.savez(filename, **arrays)
+        n_bytes += os.path.getsize(filename)
+        n_chunks += 1
+    stats = ExportStatistics(n_chunks, n_bytes, time.perf_counter() - start)
+    logger.info(
+        "Exported {} bytes of {} in {} chunks in {:.3f}s ({:.0f} bytes/s)",
+        stats.n_bytes, variable, stats.n_chunks, stats.seconds,
+        stats.bytes_per_second)
+    return stats
+
+
+def write_spike_chunks(directory, variable, chunks):
+    """ Write spikes to disk one chunk at a time
+
+    :param str directory: where to write the chunks
+    :param str variable: the name of the recorded variable
+    :param chunks: the ids and times of the spikes of each chunk
+    :type chunks: iterable(tuple(~numpy.ndarray, ~numpy.ndarray))
+    :rtype: ExportStatistics
+    """
+    return _write_chunks(directory, variable, (
+        {"ids": ids, "times": times} for ids, times in chunks))
+
+
+def write_signal_chunks(directory, variable, chunks, sampling_interval):
+    """ Write a recorded signal to disk one chunk at a time
+
+    :param str directory: where to write the chunks
+    :param str variable: the name of the recorded variable
+    :param chunks:
+        the recording indexes, first row and data of each chunk
+    :type chunks: iterable(tuple(list(int), int, ~numpy.ndarray))
+    :param float sampling_interval: the time between rows
+    :rtype: ExportStatistics
+    """
+    return _write_chunks(directory, variable, (
+        {"indexes": numpy.asarray(indexes),
+         "times": numpy.arange(
+             first_row, first_row + len(data)) * sampling_interval,
+         "data": data}
+        for indexes, first_row, data in chunks))
+
+
+def write_event_chunks(directory, variable, chunks):
+    """ Write recorded events to disk one chunk at a time
+
+    :param str directory: where to write the chunks
+    :param str variable: the name of the recorded variable
+    :param chunks: the events of each chunk, one row per event
+    :type chunks: iterable(~numpy.ndarray)
+    :rtype: ExportStatistics
+    """
+    return _write_chunks(directory, variable, (
+        {"events": events} for events in chunks))
+
+
+def read_spike_chunks(directory, variable="spikes"):
+    """ Read back spikes written by :py:func:`write_spike_chunks`
+
+    :param str directory: where the chunks were written
+    :param str variable: the name of the recorded variable
+    :return: the spikes as (id, time) rows, in the same order as\
+        :py:meth:`~spynnaker.pyNN.models.common.NeuronRecorder.get_spikes`
+    :rtype: ~numpy.ndarray
+    """
+    ids = []
+    times = []
+    for filename in _chunk_filenames(directory, variable):
+        with numpy.load(filename) as chunk:
+            ids.append(chunk["ids"])
+            times.append(chunk["times"])
+    if not ids:
+        return numpy.zeros((0, 2), dtype="float")
+    ids = numpy.concatenate(ids)
+    times = numpy.concatenate(times)
+    result = numpy.column_stack((ids, times))
+    return result[numpy.lexsort((times, ids))]
+
+
+def read_signal_chunks(directory, variable):
+    """ Read back a signal written by :py:func:`write_signal_chunks`
+
+    :param str directory: where the chunks were written
+    :param str variable: the name of the recorded variable
+    :return: the data with a row per time and a column per index, the
+        indexes and the times
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+    """
+    chunks = []
+    for filename in _chunk_filenames(directory, variable):
+        with numpy.load(filename) as chunk:
+            chunks.append(
+                (chunk["indexes"], chunk["times"], chunk["data"]))
+    if not chunks:
+        return numpy.zeros((0, 0)), numpy.zeros(0, dtype="int"), \
+            numpy.zeros(0)
+
+    # Columns are kept in the order they were first written
+    indexes = []
+    columns = dict()
+    for chunk_indexes, _, _ in chunks:
+        for index in chunk_indexes:
+            if index not in columns:
+                columns[index] = len(indexes)
+                indexes.append(index)
+    times = numpy.unique(numpy.concatenate([t for _, t, _ in chunks]))
+    data = numpy.full((len(times), len(indexes)), numpy.nan)
+    for chunk_indexes, chunk_times, chunk_data in chunks:
+        rows = numpy.searchsorted(times, chunk_times)
+        cols = [columns[index] for index in chunk_indexes]
+        data[numpy.ix_(rows, cols)] = chunk_data
+    return data, numpy.asarray(indexes), times
+
+
+def read_event_chunks(directory, variable):
+    """ Read back events written by :py:func:`write_event_chunks`
+
+    :param str directory: where the chunks were written
+    :param str variable: the name of the recorded variable
+    :return: the events, one row per event, in the same order as\
+        :py:meth:`~spynnaker.pyNN.models.common.NeuronRecorder.get_events`
+    :rtype: ~numpy.ndarray
+    """
+    events = []
+    for filename in _chunk_filenames(directory, variable):
+        with numpy.load(filename) as chunk:
+            events.append(chunk["events"])
+    if not events:
+        return numpy.zeros((0, 0), dtype="float")
+    events = numpy.concatenate(events)
+    return events[numpy.lexsort(events.T[::-1])]
@@ -0,0 +1,320 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+
+#: The default number of rewiring events between snapshots of the connections
+DEFAULT_CHECKPOINT_INTERVAL = 10000
+
+# A connection is kept as a single key of source * _KEY_FACTOR + target
+_KEY_FACTOR = 2 ** 32
+
+# The columns of the recorded rewiring events
+_TIME, _PRE, _POST, _FORMATION = range(4)
+
+
+class RewiringLog(object):
+    """ The connections made and broken by structural plasticity, indexed by\
+        time, so that the connections at any time can be found without\
+        reading the synaptic matrix back from the machine.
+
+    A snapshot of the connections is kept every so many events, so that
+    finding the connections at a time only replays the events since the
+    snapshot before it.  A connection between the same neurons can be made
+    more than once, so a count of each connection is kept.  An elimination
+    of a connection that is not there (as where recorded events were lost)
+    is ignored, so the count never goes below 0.
+    """
+
+    __slots__ = [
+        # The time of each event, in order
+        "__times",
+
+        # The connection key of each event
+        "__keys",
+
+        # Whether each event is a formation (rather than an elimination)
+        "__formations",
+
+        # The number of events between snapshots
+        "__checkpoint_interval",
+
+        # The keys and counts of the connections before each block of events
+        "__snapshots",
+
+        # The keys of the connections at the start, one per synapse
+        "__initial_keys"]
+
+    def __init__(
+            self, sources, targets, events,
+            checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL):
+        """
+        :param ~numpy.ndarray sources: The source of each initial connection
+        :param ~numpy.ndarray targets: The target of each initial connection
+        :param ~numpy.ndarray events:
+            The rewiring events as recorded, with a row per event of the time
+            in milliseconds, the pre-neuron, the post-neuron and 1 for a
+            formation or 0 for an elimination
+        :param int checkpoint_interval:
+            The number of events between snapshots of the connections
+        """
+        events = numpy.asarray(events).reshape(-1, 4)
+        order = numpy.argsort(events[:, _TIME], kind="mergesort")
+        events = events[order]
+        self.__times = events[:, _TIME].astype("float64")
+        self.__keys = self.__make_keys(events[:, _PRE], events[:, _POST])
+        self.__formations = events[:, _FORMATION] != 0
+        self.__checkpoint_interval = max(1, int(checkpoint_interval))
+        self.__initial_keys = self.__make_keys(sources, targets)
+
+        # Make a snapshot at the start and after each block of events
+        keys, counts = numpy.unique(self.__initial_keys, return_counts=True)
+        self.__snapshots = [(keys, counts)]
+        for first in range(
+                self.__checkpoint_interval, len(self.__times) + 1,
+                self.__checkpoint_interval):
+            keys, counts = self.__replay(
+                keys, counts, first - self.__checkpoint_interval, first)
+            self.__snapshots.append((keys, counts))
+
+    @staticmethod
+    def __make_keys(sources, targets):
+        """ Make a single key for each connection
+
+        :param ~numpy.ndarray sources:
+        :param ~numpy.ndarray targets:
+        :rtype: ~numpy.ndarray
+        """
+        return (numpy.asarray(sources).astype("int64") * _KEY_FACTOR +
+                numpy.asarray(targets).astype("int64"))
+
+    def __replay(self, keys, counts, first, last):
+        """ Apply a range of events to the connections
+
+        :param ~numpy.ndarray keys: The keys of the connections, in order
+        :param ~numpy.ndarray counts: The number of each connection
+        :param int first: The first event to apply
+        :param int last: One more than the last event to apply
+        :return: The keys and counts of the connections after the events
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        if first == last:
+            return keys, counts
+        all_keys, all_counts, ids = self.__index_events(
+            keys, counts, self.__keys[first:last])
+        _, after = self.__running_counts(
+            ids, numpy.where(self.__formations[first:last], 1, -1),
+            all_counts)
+
+        # The count of each connection is that after its last event
+        connections, last = numpy.unique(ids[::-1], return_index=True)
+        all_counts[connections] = after[len(ids) - 1 - last]
+        exists = all_counts > 0
+        return all_keys[exists], all_counts[exists]
+
+    @staticmethod
+    def __index_events(keys, counts, event_keys):
+        """ Number the connections known before and those of a range of\
+            events
+
+        :param ~numpy.ndarray keys: The keys of the connections, in order
+        :param ~numpy.ndarray counts: The number of each connection
+        :param ~numpy.ndarray event_keys: The connection key of each event
+        :return: The keys of all the connections, the count of each before
+            the events, and the number of the connection of each event
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+        """
+        all_keys, index = numpy.unique(
+            numpy.concatenate((keys, event_keys)), return_inverse=True)
+        index = index.ravel()
+        all_counts = numpy.zeros(len(all_keys), dtype="int64")
+        all_counts[index[:len(keys)]] = counts
+        return all_keys, all_counts, index[len(keys):]
+
+    @staticmethod
+    def __running_counts(ids, changes, initial):
+        """ Count the connection of each event before and after it, one\
+            event at a time, where an elimination of a connection that is\
+            not there is ignored
+
+        :param ~numpy.ndarray ids: The connection of each event, in order
+        :param ~numpy.ndarray changes:
+            1 for each formation and -1 for each elimination
+        :param ~numpy.ndarray initial:
+            The count of each connection before the events
+        :return: The count of the connection of each event before it and
+            after it
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        # Group the events by connection, keeping them in order
+        order = numpy.argsort(ids, kind="stable")
+        ids = ids[order]
+        changes = changes[order]
+        positions = numpy.arange(len(ids))
+        starts = numpy.searchsorted(ids, ids, side="left")
+        is_start = starts == positions
+
+        # The count if nothing were ignored; each ignored elimination lifts
+        # the count by one from then on, which is the count's lowest point
+        # below 0 so far in the group
+        sums = numpy.cumsum(changes)
+        unclamped = initial[ids] + sums - sums[starts] + changes[starts]
+        # Shift each group below the ones before, so that the lowest point
+        # so far does not carry from one group to the next
+        shift = (numpy.cumsum(is_start) - 1) * (len(ids) + 1)
+        lowest = numpy.minimum.accumulate(
+            numpy.minimum(unclamped, 0) - shift) + shift
+        after = unclamped - lowest
+
+        before = numpy.empty_like(after)
+        before[is_start] = initial[ids[is_start]]
+        before[~is_start] = after[positions[~is_start] - 1]
+        result_before = numpy.empty_like(before)
+        result_after = numpy.empty_like(after)
+        result_before[order] = before
+        result_after[order] = after
+        return result_before, result_after
+
+    @property
+    def n_events(self):
+        """ The number of rewiring events
+
+        :rtype: int
+        """
+        return len(self.__times)
+
+    @property
+    def times(self):
+        """ The time of each rewiring event, in order
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__times
+
+    def connections_at(self, time):
+        """ Get the connections there were at a given time, after the events\
+            at that time
+
+        :param float time: The time in milliseconds
+        :return: The source and target of each connection, in order of
+            source and then target, with a connection made more than once
+            repeated
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        n_events = numpy.searchsorted(self.__times, time, side="right")
+        snapshot = n_events // self.__checkpoint_interval
+        keys, counts = self.__snapshots[snapshot]
+        keys, counts = self.__replay(
+            keys, counts, snapshot * self.__checkpoint_interval, n_events)
+        keys = numpy.repeat(keys, counts)
+        return keys // _KEY_FACTOR, keys % _KEY_FACTOR
+
+    def n_connections_at(self, time):
+        """ Get the number of connections there were at a given time, after\
+            the events at that time
+
+        :param float time: The time in milliseconds
+        :rtype: int
+        """
+        return len(self.connections_at(time)[0])
+
+    def lifetimes(self, end_time=None):
+        """ Get how long each connection lasted, from when it was made (or\
+            the start) until it was broken.  Where a connection was made more\
+            than once, the first made is taken to be the first broken.
+
+        :param end_time:
+            If given, only events up to this time count, and connections
+            still there at this time are given the time they lasted until it;
+            otherwise only connections that were broken are included
+        :type end_time: float or None
+        :return: The lifetime of each connection in milliseconds
+        :rtype: ~numpy.ndarray
+        """
+        n_events = len(self.__times)
+        if end_time is not None:
+            n_events = numpy.searchsorted(self.__times, end_time, side="right")
+        times = self.__times[:n_events]
+        keys = self.__keys[:n_events]
+        formations = self.__formations[:n_events]
+
+        # An elimination only breaks a connection that is there
+        initial_keys, initial_counts = numpy.unique(
+            self.__initial_keys, return_counts=True)
+        _, all_counts, ids = self.__index_events(
+            initial_keys, initial_counts, keys)
+        before, _ = self.__running_counts(
+            ids, numpy.where(formations, 1, -1), all_counts)
+        broken = ~formations & (before > 0)
+
+        # The initial connections are taken to have been made at the start
+        birth_keys = numpy.concatenate((self.__initial_keys, keys[formations]))
+        birth_times = numpy.concatenate((
+            numpy.zeros(len(self.__initial_keys)), times[formations]))
+        death_keys = keys[broken]
+        death_times = times[broken]
+
+        # Match the nth death of each connection to its nth birth
+        _, ids = numpy.unique(
+            numpy.concatenate((birth_keys, death_keys)), return_inverse=True)
+        ids = ids.ravel()
+        n_ranks = max(len(birth_keys), len(death_keys)) + 1
+        birth_order, birth_ranks = self.__rank(
+            ids[:len(birth_keys)], birth_times)
+        death_order, death_ranks = self.__rank(
+            ids[len(birth_keys):], death_times)
+        births = ids[:len(birth_keys)][birth_order] * n_ranks + birth_ranks
+        deaths = ids[len(birth_keys):][death_order] * n_ranks + death_ranks
+        birth_times = birth_times[birth_order]
+        death_times = death_times[death_order]
+        match = numpy.searchsorted(births, deaths)
+        matched = match < len(births)
+        matched[matched] = births[match[matched]] == deaths[matched]
+        lifetimes = death_times[matched] - birth_times[match[matched]]
+        if end_time is None:
+            return lifetimes
+
+        alive = numpy.ones(len(births), dtype=bool)
+        alive[match[matched]] = False
+        return numpy.concatenate((lifetimes, end_time - birth_times[alive]))
+
+    @staticmethod
+    def __rank(ids, times):
+        """ Sort events by connection and then time, and number the events\
+            of each connection in order from 0
+
+        :param ~numpy.ndarray ids: The connection of each event
+        :param ~numpy.ndarray times: The time of each event
+        :return: The order of the events, and the number of each in order
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        order = numpy.lexsort((times, ids))
+        sorted_ids = ids[order]
+        ranks = numpy.arange(len(order)) - numpy.searchsorted(
+            sorted_ids, sorted_ids, side="left")
+        return order, ranks
+
+    def lifetime_histogram(self, bins=10, end_time=None):
+        """ Get a histogram of how long connections lasted
+
+        :param bins: The number of bins, or the edges of the bins
+        :type bins: int or list(float)
+        :param end_time: As for :py:meth:`lifetimes`
+        :type end_time: float or None
+        :return: The number of connections in each bin, and the edges of
+            the bins
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        return numpy.histogram(self.lifetimes(end_time), bins=bins)
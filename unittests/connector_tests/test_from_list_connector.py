@@ -195,3 +195,44 @@ def test_could_connect():
             else:
                 assert(not connector.could_connect(
                     None, pre_vertex, post_vertex))
+
+
+def test_compact_connector():
+    unittest_setup()
+    n_sources = 100
+    n_targets = 100
+    n_connections = 1000
+    sources = numpy.random.randint(0, n_sources, n_connections)
+    targets = numpy.random.randint(0, n_targets, n_connections)
+    weights = numpy.random.rand(n_connections)
+    delays = numpy.random.randint(1, 16, n_connections)
+    connection_list = numpy.column_stack((sources, targets, weights, delays))
+    connector = FromListConnector(connection_list, compact=True)
+    assert numpy.allclose(connector.conn_list, connection_list)
+
+    pre_slices = [Slice(0, 49), Slice(50, 99)]
+    post_slices = [Slice(0, 32), Slice(33, 65), Slice(66, 99)]
+    synapse_info = SynapseInformation(
+        connector=None, pre_population=MockPopulation(n_sources, "Pre"),
+        post_population=MockPopulation(n_targets, "Post"),
+        prepop_is_view=False, postpop_is_view=False, rng=None,
+        synapse_dynamics=None, synapse_type=None, is_virtual_machine=False,
+        weights=1.0, delays=1.0)
+    n_found = 0
+    for pre_slice in pre_slices:
+        for post_slice in post_slices:
+            block = connector.create_synaptic_block(
+                pre_slices, post_slices, pre_slice, post_slice, 1,
+                synapse_info)
+
+            # The connections of the block are those of the list, in order
+            mask = ((sources >= pre_slice.lo_atom) &
+                    (sources <= pre_slice.hi_atom) &
+                    (targets >= post_slice.lo_atom) &
+                    (targets <= post_slice.hi_atom))
+            assert numpy.array_equal(block["source"], sources[mask])
+            assert numpy.array_equal(block["target"], targets[mask])
+            assert numpy.allclose(block["weight"], weights[mask])
+            assert numpy.array_equal(block["delay"], delays[mask])
+            n_found += len(block)
+    assert n_found == n_connections
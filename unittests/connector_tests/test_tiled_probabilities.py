@@ -0,0 +1,62 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    tiled_probabilities)
+
+
+def test_tiled_probabilities(monkeypatch):
+    unittest_setup()
+    # Small tiles, so that the statistics are made from many of them
+    monkeypatch.setattr(tiled_probabilities, "_MAX_TILE_SIZE", 7)
+    n_pre, n_post = 23, 17
+    i, j = numpy.indices((n_pre, n_post))
+    probs = numpy.sin(i * 0.3 + j * 0.7) ** 2
+    blocks = list()
+
+    def get_probabilities(pre_lo, pre_hi, post_lo, post_hi):
+        blocks.append((pre_hi - pre_lo) * (post_hi - post_lo))
+        return probs[pre_lo:pre_hi, post_lo:post_hi]
+
+    tiled = tiled_probabilities.TiledProbabilities(
+        get_probabilities, n_pre, n_post)
+    pre_slice = Slice(5, 9)
+    post_slice = Slice(10, 16)
+    assert numpy.array_equal(
+        tiled.get_block(pre_slice, post_slice), probs[5:10, 10:17])
+    assert tiled.max_probability() == numpy.amax(probs)
+    assert tiled.max_probability(post_slice) == numpy.amax(probs[:, 10:17])
+    assert numpy.isclose(tiled.sum_probability(), numpy.sum(probs))
+    assert numpy.isclose(tiled.max_post_sum(), numpy.amax(probs.sum(axis=0)))
+    assert numpy.isclose(
+        tiled.max_pre_sum(post_slice),
+        numpy.amax(probs[:, 10:17].sum(axis=1)))
+
+    # A row is bigger than a tile can be, so each tile is a single row; the
+    # statistics over the whole are only worked out once
+    assert max(blocks[1:]) <= n_post
+    n_blocks = len(blocks)
+    tiled.max_probability(Slice(0, 4))
+    tiled.max_pre_sum(post_slice)
+    assert len(blocks) == n_blocks
+
+    # A constant probability is spread over the block
+    constant = tiled_probabilities.TiledProbabilities(
+        lambda *_: 0.5, n_pre, n_post)
+    assert constant.get_block(pre_slice, post_slice).shape == (5, 7)
+    assert constant.sum_probability() == 0.5 * n_pre * n_post
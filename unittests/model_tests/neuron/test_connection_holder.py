@@ -164,3 +164,40 @@ def test_connection_holder_matrix_multiple_items():
         [(0, 0, 1, 10), (0, 0, 2, 20), (0, 1, 3, 30)],
         AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
     connection_holder.add_connections(connections)
+
+
+def test_connection_holder_sparse():
+    unittest_setup()
+    connection_holder = ConnectionHolder(
+        data_items_to_return=["weight", "test"], as_list=False,
+        n_pre_atoms=2, n_post_atoms=3, fixed_values=[("test", 100)],
+        sparse=True)
+    connection_holder.add_connections(numpy.array(
+        [(0, 0, 1, 10), (0, 2, 2, 20)],
+        AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE))
+    connection_holder.add_connections(numpy.array(
+        [(0, 0, 3, 30), (1, 1, 4, 40)],
+        AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE))
+    weights, test = connection_holder
+    assert weights.shape == (2, 3)
+
+    # The last of several connections between the same pair wins
+    assert numpy.array_equal(weights.toarray(), [[3, 0, 2], [0, 4, 0]])
+    assert weights.nnz == 3
+    assert numpy.array_equal(test.toarray(), [[100, 0, 100], [0, 100, 0]])
+
+
+def test_connection_holder_unsorted_blocks():
+    unittest_setup()
+    blocks = [
+        numpy.array([(1, 0, 1, 10), (1, 1, 2, 20)],
+                    AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE),
+        numpy.array([(0, 1, 3, 30)],
+                    AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)]
+    for sort, expected in [(True, [3, 1, 2]), (False, [1, 2, 3])]:
+        connection_holder = ConnectionHolder(
+            data_items_to_return=["source", "target", "weight"],
+            as_list=True, n_pre_atoms=2, n_post_atoms=2, sort=sort)
+        for block in blocks:
+            connection_holder.add_connections(block)
+        assert list(connection_holder["weight"]) == expected
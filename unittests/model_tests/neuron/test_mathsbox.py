@@ -0,0 +1,55 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from scipy.special import erfc
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neuron.neuron_models import Mathsbox
+from spynnaker.pyNN.models.neuron.neuron_models.mathsbox import (
+    ERFC_MODES, ERFC_TABLE_MAX, ERFC_TABLE_SIZE)
+
+
+def test_erfc_table():
+    unittest_setup()
+    mathsbox = Mathsbox(1000, 0.0, erfc_mode="table")
+    data = mathsbox.get_erfc_data()
+    assert data[0] == ERFC_MODES["table"]
+    assert data[1] == ERFC_TABLE_SIZE
+    assert len(data) == 3 + ERFC_TABLE_SIZE
+    table = data[3:].view("int32") / 32768.0
+    x = numpy.linspace(0, ERFC_TABLE_MAX, ERFC_TABLE_SIZE)
+    assert numpy.allclose(table, erfc(x), atol=1.0 / 32768.0)
+
+
+def test_erfc_fast_mode_cost():
+    unittest_setup()
+    mathsbox = Mathsbox(1000, 0.0)
+    integral_cycles = mathsbox.get_n_cpu_cycles(100)
+    integral_sdram = mathsbox.get_sdram_usage_in_bytes(100)
+    mathsbox.erfc_mode = "rational"
+    assert mathsbox.get_n_cpu_cycles(100) < integral_cycles
+    assert mathsbox.get_sdram_usage_in_bytes(100) == integral_sdram
+    assert len(mathsbox.get_erfc_data()) == 3
+    mathsbox.erfc_mode = "table"
+    assert mathsbox.get_sdram_usage_in_bytes(100) == (
+        integral_sdram + ERFC_TABLE_SIZE * 4)
+
+
+def test_erfc_bad_mode():
+    unittest_setup()
+    with pytest.raises(ConfigurationException):
+        Mathsbox(1000, 0.0, erfc_mode="simpson")
@@ -0,0 +1,58 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neuron.builds import MeanfieldBase
+from spynnaker.pyNN.models.neuron.implementations.meanfield_impl_standard \
+    import StepProvenance
+
+
+def _impl():
+    # pylint: disable=protected-access
+    return MeanfieldBase()._model
+
+
+def test_adaptive_budget():
+    unittest_setup()
+    impl = _impl()
+    impl.n_steps_per_timestep = 4
+    fixed_cycles = impl.get_n_cpu_cycles(10)
+    impl.adaptive_tolerance = 0.01
+    # The whole step is tried before it is divided
+    assert impl.get_n_cpu_cycles(10) > fixed_cycles
+    impl.adaptive_tolerance = None
+    assert impl.adaptive_tolerance == 0.0
+    assert impl.get_n_cpu_cycles(10) == fixed_cycles
+    with pytest.raises(ConfigurationException):
+        impl.adaptive_tolerance = -1.0
+
+
+def test_step_provenance():
+    unittest_setup()
+    impl = _impl()
+    assert impl.n_provenance_items == StepProvenance.N_ITEMS
+    items = list(impl.parse_provenance_items(
+        "pop", ["pop"], [4, 328, 100, 250, 4, 7]))
+    values = {item.names[-1]: item.value for item in items}
+    assert values["Max_steps_per_timestep"] == 4
+    assert values["Adaptive_step_tolerance"] == pytest.approx(0.01, abs=1e-4)
+    assert values["Total_integration_steps"] == 250
+    assert values["Mean_steps_per_timestep"] == 2.5
+    assert values["Max_steps_taken_in_a_timestep"] == 4
+    reported = [item for item in items if item.report]
+    assert [item.names[-1] for item in reported] == [
+        "Times_step_budget_reached"]
@@ -12,6 +12,10 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import struct
+import numpy
+from spinn_utilities.config_holder import set_config
+from pacman.model.graphs.common import Slice
 from data_specification.enums import DataType
 from spynnaker.pyNN.config_setup import unittest_setup
 from spynnaker.pyNN.models.common import NeuronRecorder
@@ -51,3 +55,231 @@ def test_recording_variables():
     nr.set_recording("gsyn_inh", True)
     assert(["v", "gsyn_inh"] == nr.recording_variables)
     assert([0, 2] == nr.recorded_region_ids)
+
+
+def test_process_missing_data():
+    unittest_setup()
+    placement_data = numpy.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0],
+                                  [7.0, 8.0]])
+    # Time 2 is missing, time 4 is recorded twice and time 5 is not sampled
+    times = numpy.array([0, 4, 4, 5])
+    data = NeuronRecorder._process_missing_data(
+        4, times, 2, "test", placement_data)
+    assert data.shape == (4, 2)
+    assert numpy.array_equal(data[0], [1.0, 2.0])
+    assert numpy.all(numpy.isnan(data[1]))
+    assert numpy.array_equal(data[2], [3.0, 4.0])
+    assert numpy.all(numpy.isnan(data[3]))
+
+
+class _Vertex(object):
+    # Also acts as its own placement
+    def __init__(self, vertex_slice, p):
+        self.vertex_slice = vertex_slice
+        self.x = 0
+        self.y = 0
+        self.p = p
+
+
+class _Splitter(object):
+    def __init__(self, vertices):
+        self.vertices = vertices
+
+    def machine_vertices_for_recording(self, variable):
+        return self.vertices
+
+
+class _AppVertex(object):
+    def __init__(self, vertices):
+        self.splitter = _Splitter(vertices)
+
+
+class _Placements(object):
+    def get_placement_of_vertex(self, vertex):
+        return vertex
+
+
+class _BufferManager(object):
+    def __init__(self, data, missing=()):
+        self.data = data
+        self.missing = missing
+
+    def get_data_by_placement(self, placement, region):
+        return self.data[placement], placement in self.missing
+
+
+def _record(times, values):
+    return bytearray(b"".join(
+        struct.pack("<i", time) + b"".join(
+            struct.pack("<i", DataType.S1615.encode_as_int(value))
+            for value in row)
+        for time, row in zip(times, values)))
+
+
+def test_get_matrix_data():
+    unittest_setup()
+    data_types = {"v": DataType.S1615}
+    nr = NeuronRecorder(["v"], data_types, [], 5, [], [], [], [])
+    nr.set_recording("v", True, indexes=[0, 2, 3, 4])
+    vertices = [_Vertex(Slice(0, 1), 1), _Vertex(Slice(2, 4), 2)]
+    buffer_manager = _BufferManager({
+        vertices[0]: _record(range(3), [[1], [2], [3]]),
+        # The second core is missing the second time step
+        vertices[1]: _record([0, 2], [[4, 5, 6], [7, 8, 9]])})
+    data, indexes, _ = nr.get_matrix_data(
+        "test", buffer_manager, _Placements(), _AppVertex(vertices), "v", 3)
+    assert indexes == [0, 2, 3, 4]
+    assert numpy.array_equal(data[:, 0], [1, 2, 3])
+    assert numpy.array_equal(data[0, 1:], [4, 5, 6])
+    assert numpy.all(numpy.isnan(data[1, 1:]))
+    assert numpy.array_equal(data[2, 1:], [7, 8, 9])
+
+
+def test_get_matrix_data_reported_missing():
+    unittest_setup()
+    data_types = {"v": DataType.S1615}
+    nr = NeuronRecorder(["v"], data_types, [], 2, [], [], [], [])
+    nr.set_recording("v", True)
+    vertices = [_Vertex(Slice(0, 1), 1)]
+    # The right number of rows, but the first time step was lost and the
+    # last was read twice
+    buffer_manager = _BufferManager(
+        {vertices[0]: _record([1, 2, 2], [[1, 2], [3, 4], [5, 6]])},
+        missing=vertices)
+    data, _, _ = nr.get_matrix_data(
+        "test", buffer_manager, _Placements(), _AppVertex(vertices), "v", 3)
+    assert numpy.all(numpy.isnan(data[0]))
+    assert numpy.array_equal(data[1:], [[1, 2], [3, 4]])
+    chunks = list(nr.iter_matrix_data(
+        "test", buffer_manager, _Placements(), _AppVertex(vertices), "v",
+        3, 2))
+    streamed = numpy.concatenate([chunk for _, _, chunk in chunks])
+    assert numpy.array_equal(streamed, data, equal_nan=True)
+
+
+def _spike_record(times, spikes):
+    # One word of spike bits per time step, least significant bit first
+    return bytearray(b"".join(
+        struct.pack("<iI", time, sum(1 << i for i in ids))
+        for time, ids in zip(times, spikes)))
+
+
+def test_get_spikes_in_threads():
+    unittest_setup()
+    nr = NeuronRecorder([], {}, ["spikes"], 30, [], [], [], [])
+    nr.set_recording("spikes", True)
+    vertices = [_Vertex(Slice(i * 10, i * 10 + 9), i) for i in range(3)]
+    buffer_manager = _BufferManager({
+        vertices[0]: _spike_record([0, 1], [[0, 3], [9]]),
+        vertices[1]: _spike_record([0, 2], [[], [1, 2]]),
+        vertices[2]: bytearray()})
+    results = []
+    for n_threads in (1, 4):
+        set_config("Recording", "n_extraction_threads", n_threads)
+        results.append(nr.get_spikes(
+            "test", buffer_manager, _Placements(), _AppVertex(vertices),
+            "spikes"))
+    assert numpy.array_equal(results[0], results[1])
+    assert numpy.array_equal(results[0][:, 0], [0, 3, 9, 11, 12])
+
+
+def test_get_spikes_selective():
+    unittest_setup()
+    nr = NeuronRecorder([], {}, ["spikes"], 40, [], [], [], [])
+    nr.set_recording("spikes", True, indexes=[1, 5, 34, 36, 39])
+    vertices = [_Vertex(Slice(0, 33), 0), _Vertex(Slice(34, 39), 1)]
+    # Bits are only present for the recorded neurons of each core
+    buffer_manager = _BufferManager({
+        vertices[0]: _spike_record([0, 1, 2], [[0, 1], [], [1]]),
+        vertices[1]: _spike_record([1, 2], [[1, 2], [0]])})
+    spikes = nr.get_spikes(
+        "test", buffer_manager, _Placements(), _AppVertex(vertices), "spikes")
+    assert numpy.array_equal(spikes[:, 0], [1, 5, 5, 34, 36, 39])
+    assert numpy.array_equal(spikes[:, 1], [0, 0, 2, 2, 1, 1])
+
+
+def test_iter_matrix_data():
+    unittest_setup()
+    data_types = {"v": DataType.S1615}
+    nr = NeuronRecorder(["v"], data_types, [], 5, [], [], [], [])
+    nr.set_recording("v", True)
+    vertices = [_Vertex(Slice(0, 1), 1), _Vertex(Slice(2, 4), 2)]
+    buffer_manager = _BufferManager({
+        vertices[0]: _record(range(5), [[i, -i] for i in range(5)]),
+        # The second core is missing some time steps
+        vertices[1]: _record([0, 3, 4], [[1, 2, 3], [4, 5, 6], [7, 8, 9]])})
+    data, indexes, _ = nr.get_matrix_data(
+        "test", buffer_manager, _Placements(), _AppVertex(vertices), "v", 5)
+    streamed = numpy.full(data.shape, -1.0)
+    for chunk_indexes, first_row, chunk in nr.iter_matrix_data(
+            "test", buffer_manager, _Placements(), _AppVertex(vertices), "v",
+            5, 2):
+        assert len(chunk) <= 2
+        columns = [indexes.index(i) for i in chunk_indexes]
+        streamed[first_row:first_row + len(chunk), columns] = chunk
+    assert numpy.array_equal(streamed, data, equal_nan=True)
+
+
+def test_iter_spikes():
+    unittest_setup()
+    nr = NeuronRecorder([], {}, ["spikes"], 20, [], [], [], [])
+    nr.set_recording("spikes", True)
+    vertices = [_Vertex(Slice(0, 9), 0), _Vertex(Slice(10, 19), 1)]
+    buffer_manager = _BufferManager({
+        vertices[0]: _spike_record(range(5), [[0], [1, 2], [], [3], [9]]),
+        vertices[1]: _spike_record([1, 2], [[0, 9], [5]])})
+    spikes = nr.get_spikes(
+        "test", buffer_manager, _Placements(), _AppVertex(vertices), "spikes")
+    chunks = list(nr.iter_spikes(
+        "test", buffer_manager, _Placements(), _AppVertex(vertices), "spikes",
+        2))
+    assert len(chunks) == 4
+    ids = numpy.concatenate([ids for ids, _ in chunks])
+    times = numpy.concatenate([times for _, times in chunks])
+    streamed = numpy.column_stack((ids, times))
+    assert numpy.array_equal(
+        streamed[numpy.lexsort((times, ids))], spikes)
+
+
+def test_decode_rewires():
+    unittest_setup()
+    nr = NeuronRecorder([], {}, [], 300, [], [], [], [])
+    # Each rewire is a time and a word of pre-id, post-id and formation bit
+    rewires = [(0, 5, 3, 1), (2, 0, 255, 0), (7, 2 ** 22 - 1, 0, 1)]
+    raw = bytearray(b"".join(
+        struct.pack("<iI", time, (pre << 9) | (post << 1) | value)
+        for time, pre, post, value in rewires))
+    times, pre_ids, post_ids, values = nr._decode_rewires(
+        raw, Slice(20, 275))
+    assert numpy.array_equal(times, [0, 2, 7])
+    assert numpy.array_equal(pre_ids, [5, 0, 2 ** 22 - 1])
+    assert numpy.array_equal(post_ids, [23, 275, 20])
+    assert numpy.array_equal(values, [1, 0, 1])
+
+
+def _rewire_record(rewires):
+    return bytearray(b"".join(
+        struct.pack("<iI", time, (pre << 9) | (post << 1) | value)
+        for time, pre, post, value in rewires))
+
+
+def test_iter_events():
+    unittest_setup()
+    nr = NeuronRecorder(
+        [], {}, [], 20, [], [], [NeuronRecorder.REWIRING],
+        {NeuronRecorder.REWIRING: NeuronRecorder.REWIRING_TYPE})
+    vertices = [_Vertex(Slice(0, 9), 0), _Vertex(Slice(10, 19), 1)]
+    buffer_manager = _BufferManager({
+        vertices[0]: _rewire_record(
+            [(0, 5, 3, 1), (0, 2, 4, 1), (2, 7, 0, 0), (4, 1, 9, 1)]),
+        vertices[1]: _rewire_record([(1, 3, 2, 1), (3, 0, 5, 0)])})
+    events = nr.get_events(
+        "test", buffer_manager, _Placements(), _AppVertex(vertices),
+        NeuronRecorder.REWIRING)
+    chunks = list(nr.iter_events(
+        "test", buffer_manager, _Placements(), _AppVertex(vertices),
+        NeuronRecorder.REWIRING, 3))
+    assert [len(chunk) for chunk in chunks] == [3, 1, 2]
+    streamed = numpy.concatenate(chunks)
+    assert numpy.array_equal(
+        streamed[numpy.lexsort(streamed.T[::-1])], events)
@@ -0,0 +1,140 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_utilities.config_holder import set_config
+from pacman.model.graphs.common import Slice
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    FromListConnector)
+import spynnaker8 as p
+
+
+def test_ring_buffer_shifts_cached(monkeypatch):
+    unittest_setup()
+    p.setup(1.0)
+    n_calls = list()
+    get_weight_mean = FromListConnector.get_weight_mean
+
+    def counting_get_weight_mean(self, weights, synapse_info):
+        n_calls.append(self)
+        return get_weight_mean(self, weights, synapse_info)
+
+    monkeypatch.setattr(
+        FromListConnector, "get_weight_mean", counting_get_weight_mean)
+
+    pre_pop = p.Population(10, p.IF_curr_exp(), label="Pre")
+    post_pop = p.Population(10, p.IF_curr_exp(), label="Post")
+    connector = p.FromListConnector([(i, i, 1.0, 1.0) for i in range(10)])
+    p.Projection(pre_pop, post_pop, connector, p.StaticSynapse())
+    vertex = post_pop._vertex
+
+    shifts = vertex.get_ring_buffer_shifts(vertex.incoming_projections)
+    assert len(n_calls) == 1
+
+    # Asking again, as another splitter might, doesn't work them out again
+    assert vertex.get_ring_buffer_shifts(
+        vertex.incoming_projections) == shifts
+    assert len(n_calls) == 1
+
+    # Changing the connector does
+    connector.conn_list = [(i, i, 100.0, 1.0) for i in range(10)]
+    bigger_shifts = vertex.get_ring_buffer_shifts(
+        vertex.incoming_projections)
+    assert len(n_calls) == 2
+    assert bigger_shifts[0] > shifts[0]
+
+
+def test_ring_buffer_shifts_from_provenance():
+    unittest_setup()
+    set_config("Simulation", "ring_buffer_shifts_from_provenance", True)
+    p.setup(1.0)
+    pre_pop = p.Population(10, p.IF_curr_exp(), label="Pre")
+    post_pop = p.Population(10, p.IF_curr_exp(), label="Post")
+    p.Projection(
+        pre_pop, post_pop,
+        p.FromListConnector([(i, i, 1.0, 1.0) for i in range(10)]),
+        p.StaticSynapse(), receptor_type="excitatory")
+    vertex = post_pop._vertex
+    shifts = vertex.get_ring_buffer_shifts(vertex.incoming_projections)
+
+    # Values from a core that has had no shifts written are not used
+    vertex_slice = Slice(0, 9)
+    vertex.add_ring_buffer_maxima(vertex_slice, [0x1000, 0, 0, 0])
+    assert vertex.get_ring_buffer_shifts(
+        vertex.incoming_projections) == shifts
+    vertex.set_written_ring_buffer_shifts(vertex_slice, shifts)
+
+    # Small values seen give smaller shifts; types with no input keep theirs
+    vertex.add_ring_buffer_maxima(vertex_slice, [0x1000, 0, 0, 0])
+    tight_shifts = vertex.get_ring_buffer_shifts(vertex.incoming_projections)
+    assert tight_shifts[0] < shifts[0]
+    assert tight_shifts[1] == shifts[1]
+
+    # Saturation gives bigger shifts than the bound
+    vertex.add_ring_buffer_maxima(vertex_slice, [0xFFFF, 0, 0, 0])
+    safe_shifts = vertex.get_ring_buffer_shifts(vertex.incoming_projections)
+    assert safe_shifts[0] > shifts[0]
+    assert safe_shifts[1] == shifts[1]
+
+
+def test_ring_buffer_maxima_use_written_shifts():
+    unittest_setup()
+    set_config("Simulation", "ring_buffer_shifts_from_provenance", True)
+    p.setup(1.0)
+    pre_pop = p.Population(10, p.IF_curr_exp(), label="Pre")
+    post_pop = p.Population(10, p.IF_curr_exp(), label="Post")
+    connector = p.FromListConnector([(i, i, 1.0, 1.0) for i in range(10)])
+    p.Projection(
+        pre_pop, post_pop, connector, p.StaticSynapse(),
+        receptor_type="excitatory")
+    vertex = post_pop._vertex
+    shifts = vertex.get_ring_buffer_shifts(vertex.incoming_projections)
+    vertex.set_written_ring_buffer_shifts(Slice(0, 9), shifts)
+
+    # Asking for the shifts of other weights doesn't change how the values
+    # of the core are read
+    connector.conn_list = [(i, i, 100.0, 1.0) for i in range(10)]
+    vertex.get_ring_buffer_shifts(vertex.incoming_projections)
+    connector.conn_list = [(i, i, 1.0, 1.0) for i in range(10)]
+    vertex.add_ring_buffer_maxima(Slice(0, 9), [0x1000, 0, 0, 0])
+    tight_shifts = vertex.get_ring_buffer_shifts(vertex.incoming_projections)
+    assert tight_shifts[0] < shifts[0]
+
+    # The same value from a core written with a bigger shift is a bigger
+    # weight
+    bigger_shifts = list(shifts)
+    bigger_shifts[0] += 4
+    vertex.set_written_ring_buffer_shifts(Slice(10, 19), bigger_shifts)
+    vertex.add_ring_buffer_maxima(Slice(10, 19), [0x1000, 0, 0, 0])
+    assert vertex.get_ring_buffer_shifts(
+        vertex.incoming_projections)[0] > tight_shifts[0]
+
+
+def test_record_ring_buffer_maxima_costs():
+    unittest_setup()
+    p.setup(1.0)
+    vertex = p.Population(10, p.IF_curr_exp(), label="Pop")._vertex
+    vertex_slice = Slice(0, 9)
+    assert not vertex.record_ring_buffer_maxima
+    cpu = vertex.get_synapse_cpu(vertex_slice)
+
+    # 8 words, including whether to record, then a shift for each of the
+    # 2 synapse types
+    assert vertex.get_synapse_params_size() == 10 * BYTES_PER_WORD
+
+    set_config("Simulation", "ring_buffer_shifts_from_provenance", True)
+    assert vertex.record_ring_buffer_maxima
+    assert vertex.get_synapse_cpu(vertex_slice) > cpu
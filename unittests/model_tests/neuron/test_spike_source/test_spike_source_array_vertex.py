@@ -14,7 +14,9 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import unittest
-from spynnaker.pyNN.models.spike_source import SpikeSourceArrayVertex
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.models.spike_source import (
+    SpikeSchedule, SpikeSourceArrayVertex)
 import spynnaker8
 
 
@@ -42,3 +44,23 @@ class TestSpikeSourceArrayVertex(unittest.TestCase):
         SpikeSourceArrayVertex(
             n_neurons=3, spike_times=[[1], [11], [22]], constraints=None,
             label="test", max_atoms_per_core=None, model=None, splitter=None)
+
+    def test_schedule(self):
+        schedule = SpikeSchedule.from_neuron_ids(
+            3, [2, 0, 2, 0], [5.0, 3.0, 1.0, 4.0])
+        self.assertListEqual([0, 2, 2, 4], list(schedule.offsets))
+        self.assertListEqual([3.0, 4.0, 1.0, 5.0], list(schedule.times))
+        v = SpikeSourceArrayVertex(
+            n_neurons=3, spike_times=schedule, constraints=None,
+            label="test", max_atoms_per_core=None, model=None, splitter=None)
+        self.assertListEqual(
+            [[3, 4], [], [1, 5]],
+            [list(times) for times in v.send_buffer_times])
+        self.assertListEqual([1.0, 5.0], list(v.spike_times[2]))
+        v.spike_times = SpikeSchedule([0, 1, 1, 1], [7.0])
+        self.assertListEqual(
+            [[7], [], []], [list(times) for times in v.send_buffer_times])
+        with self.assertRaises(ConfigurationException):
+            v.spike_times = SpikeSchedule([0, 1], [7.0])
+        with self.assertRaises(ConfigurationException):
+            SpikeSchedule([0, 2, 1], [1.0])
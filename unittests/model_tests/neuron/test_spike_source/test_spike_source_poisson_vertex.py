@@ -0,0 +1,60 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import numpy
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.spike_source import SpikeSourcePoissonVertex
+import spynnaker8
+
+
+class TestSpikeSourcePoissonVertex(unittest.TestCase):
+
+    def setUp(cls):
+        spynnaker8.setup()
+
+    def test_rate_data(self):
+        v = SpikeSourcePoissonVertex(
+            n_neurons=3, constraints=None, label="test", seed=None,
+            max_atoms_per_core=None, model=None,
+            rates=[[1, 2], [3], [4, 5, 6]], starts=[[0, 10], [5], [0, 1, 2]],
+            durations=[[10, None], [20], [1, 1, None]])
+        offsets, rates, starts, durations, time_to_spike = \
+            v.get_rate_data(Slice(1, 2))
+        self.assertListEqual([0, 1, 4], list(offsets))
+        self.assertListEqual([3, 4, 5, 6], list(rates))
+        self.assertListEqual([5, 0, 1, 2], list(starts))
+        self.assertListEqual([20, 1, 1], list(durations[:3]))
+        self.assertTrue(numpy.isnan(durations[3]))
+        self.assertListEqual([0, 0, 0, 0], list(time_to_spike))
+        self.assertEqual(6, v.n_rates(Slice(0, 2)))
+        self.assertListEqual([[1, 2], [3], [4, 5, 6]],
+                             [list(r) for r in v.rates])
+
+        v.update_rate_data(Slice(0, 1), [7, 8, 9], [1, 2, 3])
+        self.assertListEqual([[7, 8], [9], [4, 5, 6]],
+                             [list(r) for r in v.rates])
+        self.assertListEqual([[1, 2], [3], [0, 0, 0]],
+                             [list(t) for t in v.time_to_spike])
+
+    def test_set_rate(self):
+        v = SpikeSourcePoissonVertex(
+            n_neurons=3, constraints=None, label="test", seed=None,
+            max_atoms_per_core=None, model=None, rate=[1, 2, 3], start=0)
+        v.rate = 5
+        self.assertListEqual([5, 5, 5], v.rate)
+        self.assertListEqual([4, 3, 2], list(v.rate_change))
+        v.start = [1, 2, 3]
+        self.assertListEqual([[1], [2], [3]], [list(s) for s in v.start])
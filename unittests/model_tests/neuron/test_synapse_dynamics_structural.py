@@ -0,0 +1,39 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsStructuralCommon)
+
+_EMPTY = 0xFFFFFFFF
+
+
+def test_post_to_pre_table():
+    unittest_setup()
+    words = numpy.array([10, 11, 12, 13, 14], dtype="u4")
+    targets = numpy.array([2, 0, 2, 3, 2], dtype="uint32")
+    table = SynapseDynamicsStructuralCommon._make_post_to_pre_table(
+        words, targets, 4, 3)
+    # Each row is padded at the start, and keeps the order of connections
+    assert numpy.array_equal(table.reshape(4, 3), [
+        [_EMPTY, _EMPTY, 11],
+        [_EMPTY, _EMPTY, _EMPTY],
+        [10, 12, 14],
+        [_EMPTY, _EMPTY, 13]])
+    with pytest.raises(Exception):
+        SynapseDynamicsStructuralCommon._make_post_to_pre_table(
+            words, targets, 4, 2)
@@ -13,13 +13,19 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
 import pytest
+from pacman.model.graphs.common import Slice
 from spynnaker.pyNN.exceptions import SynapseRowTooBigException
 from spynnaker.pyNN.models.neural_projections import (
     ProjectionApplicationEdge, SynapseInformation)
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     SynapseDynamicsStatic, SynapseDynamicsSTDP)
-from spynnaker.pyNN.models.neuron.synapse_io import _get_allowed_row_length
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
+from spynnaker.pyNN.models.neuron.synapse_io import (
+    _get_allowed_row_length, _get_row_data, _read_plastic_data,
+    _read_static_data)
 from spynnaker.pyNN.models.neuron.plasticity.stdp.weight_dependence import (
     WeightDependenceAdditive)
 from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence import (
@@ -65,3 +71,102 @@ def test_get_allowed_row_length(
     else:
         actual_size = _get_allowed_row_length(size, dynamics, in_edge, size)
         assert actual_size == max_size
+
+
+def test_get_row_data_static():
+    spynnaker8.setup()
+    connections = numpy.array(
+        [(0, 3, 2.0, 1, 0), (2, 1, 1.0, 2, 1), (0, 4, 3.0, 1, 0),
+         (0, 5, 4.0, 1, 0)],
+        dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    # 4 bits of neuron id and 1 of synapse type; the third synapse of row 0
+    # is beyond the maximum of 2 so is dropped
+    row_data = _get_row_data(
+        connections, connections["source"], 3, Slice(0, 9), 2,
+        SynapseDynamicsStatic(), 2, 3)
+    assert numpy.array_equal(row_data.reshape(3, 6), [
+        [0, 2, 0, (2 << 16) | (1 << 5) | 3, (3 << 16) | (1 << 5) | 4, 0],
+        [0, 0, 0, 0, 0, 0],
+        [0, 1, 0, (1 << 16) | (2 << 5) | (1 << 4) | 1, 0, 0]])
+
+
+def _random_connections(n_rows, n_per_row, post_slice, seed=0):
+    rng = numpy.random.default_rng(seed)
+    n_connections = n_rows * n_per_row
+    connections = numpy.zeros(
+        n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = rng.permutation(
+        numpy.repeat(numpy.arange(n_rows), n_per_row))
+    connections["target"] = rng.integers(
+        post_slice.lo_atom, post_slice.hi_atom + 1, n_connections)
+    connections["weight"] = rng.integers(0, 1 << 16, n_connections)
+    connections["delay"] = rng.integers(1, 16, n_connections)
+    return connections
+
+
+def _read_static_data_per_row(
+        pre_slice, post_slice, n_synapse_types, row_data, delayed,
+        post_vertex_max_delay_ticks):
+    """ Decode static rows one at a time, for comparison with the\
+        vectorised decode
+    """
+    n_synapse_type_bits = 1 if n_synapse_types > 1 else 0
+    n_neuron_id_bits = int(numpy.ceil(numpy.log2(post_slice.n_atoms)))
+    connections = []
+    for row_index, row in enumerate(row_data):
+        stage, source = divmod(row_index, pre_slice.n_atoms)
+        extra_delay = (stage + 1) * post_vertex_max_delay_ticks
+        for word in row[3:3 + row[1]]:
+            connections.append((
+                source + pre_slice.lo_atom,
+                (word & ((1 << n_neuron_id_bits) - 1)) + post_slice.lo_atom,
+                word >> 16,
+                ((word & 0xFFFF) >> (n_neuron_id_bits + n_synapse_type_bits)) +
+                (extra_delay if delayed else 0)))
+    return numpy.array(connections, dtype=[
+        ("source", "uint32"), ("target", "uint32"), ("weight", "float64"),
+        ("delay", "float64")]).reshape(-1)
+
+
+@pytest.mark.parametrize("n_rows", [1, 10, 100, 1000])
+@pytest.mark.parametrize("delayed", [False, True])
+def test_read_static_data(n_rows, delayed):
+    spynnaker8.setup()
+    pre_slice = Slice(10, 10 + n_rows - 1)
+    post_slice = Slice(32, 63)
+    dynamics = SynapseDynamicsStatic()
+    n_row_rows = n_rows * 2 if delayed else n_rows
+    connections = _random_connections(n_row_rows, 4, post_slice)
+    row_data = _get_row_data(
+        connections, connections["source"], n_row_rows, post_slice, 2,
+        dynamics, 8, 8).reshape(n_row_rows, -1)
+    read = _read_static_data(
+        dynamics, pre_slice, post_slice, 2, row_data, delayed, 16)
+    expected = _read_static_data_per_row(
+        pre_slice, post_slice, 2, row_data, delayed, 16)
+    for name in ["source", "target", "weight", "delay"]:
+        assert numpy.array_equal(read[name], expected[name])
+
+    # Connections come back in the order of their rows
+    order = numpy.argsort(connections["source"], kind="stable")
+    assert numpy.array_equal(read["weight"], connections["weight"][order])
+
+
+@pytest.mark.parametrize("n_rows", [1, 10, 100, 1000])
+def test_read_plastic_data(n_rows):
+    spynnaker8.setup()
+    pre_slice = Slice(0, n_rows - 1)
+    post_slice = Slice(32, 63)
+    dynamics = SynapseDynamicsSTDP(
+        TimingDependenceSpikePair(), WeightDependenceAdditive())
+    connections = _random_connections(n_rows, 3, post_slice)
+    row_data = _get_row_data(
+        connections, connections["source"], n_rows, post_slice, 2,
+        dynamics, 8, 16).reshape(n_rows, -1)
+    read = _read_plastic_data(
+        dynamics, pre_slice, post_slice, 2, row_data, False, 16)
+    order = numpy.argsort(connections["source"], kind="stable")
+    expected = connections[order]
+    for name in ["source", "target", "weight", "delay"]:
+        assert numpy.array_equal(read[name], expected[name])
+
@@ -79,6 +79,11 @@ class MockTransceiverRawData(object):
         datum, = struct.unpack("<I", self.read_memory(x, y, base_address, 4))
         return datum
 
+    @overrides(Transceiver.write_memory)
+    def write_memory(self, x, y, base_address, data, n_bytes=None, offset=0,
+                     cpu=0, is_filename=False):
+        self._data_to_read[base_address:base_address + len(data)] = data
+
 
 def say_false(self, weights, delays):
     return False
@@ -263,6 +268,101 @@ def test_write_data_spec():
         shutil.rmtree(report_folder, ignore_errors=True)
 
 
+def test_write_changed_synaptic_data():
+    unittest_setup()
+    # UGLY but the mock transceiver NEED generate_on_machine to be False
+    AbstractGenerateConnectorOnMachine.generate_on_machine = say_false
+    machine = virtual_machine(2, 2)
+
+    p.setup(1.0)
+    load_config()
+    p.set_number_of_neurons_per_core(p.IF_curr_exp, 100)
+    pre_pop = p.Population(
+        10, p.IF_curr_exp(), label="Pre",
+        additional_parameters={
+            "splitter": SplitterAbstractPopulationVertexSlice()})
+    post_pop = p.Population(
+        10, p.IF_curr_exp(), label="Post",
+        additional_parameters={
+            "splitter": SplitterAbstractPopulationVertexSlice()})
+    stdp = p.STDPMechanism(
+        timing_dependence=p.SpikePairRule(),
+        weight_dependence=p.AdditiveWeightDependence(w_min=0.0, w_max=5.0),
+        weight=1.5, delay=1.0)
+    proj_changed = p.Projection(
+        pre_pop, post_pop, p.AllToAllConnector(), stdp)
+    proj_unchanged = p.Projection(
+        pre_pop, post_pop, p.OneToOneConnector(), stdp)
+
+    app_graph = globals_variables.get_simulator().original_application_graph
+    context = {
+        "ApplicationGraph": app_graph
+    }
+    with (injection_context(context)):
+        delay_adder = DelaySupportAdder()
+        delay_adder.__call__(app_graph)
+        partitioner = SpynnakerSplitterPartitioner()
+        machine_graph, _ = partitioner.__call__(app_graph, machine, 100)
+        allocator = ZonedRoutingInfoAllocator()
+        n_keys_mapper = EdgeToNKeysMapper()
+        n_keys_map = n_keys_mapper.__call__(machine_graph)
+        routing_info = allocator.__call__(
+            machine_graph, n_keys_map, flexible=False)
+
+    post_vertex = next(iter(post_pop._vertex.machine_vertices))
+    post_vertex_placement = Placement(post_vertex, 0, 0, 3)
+
+    temp_spec = tempfile.mktemp()
+    spec = DataSpecificationGenerator(io.FileIO(temp_spec, "wb"), None)
+
+    synaptic_matrices = SynapticMatrices(
+        post_vertex.vertex_slice, n_synapse_types=2, all_single_syn_sz=10000,
+        synaptic_matrix_region=1, direct_matrix_region=2, poptable_region=3,
+        connection_builder_region=4)
+    synaptic_matrices.write_synaptic_data(
+        spec, post_pop._vertex.incoming_projections, all_syn_block_sz=10000,
+        weight_scales=[32, 32], routing_info=routing_info)
+    spec.end_specification()
+
+    with io.FileIO(temp_spec, "rb") as spec_reader:
+        executor = DataSpecificationExecutor(spec_reader, 20000)
+        executor.execute()
+
+    all_data = bytearray()
+    all_data.extend(bytearray(executor.get_header()))
+    all_data.extend(bytearray(executor.get_pointer_table(0)))
+    region_start = None
+    for r in range(MAX_MEM_REGIONS):
+        region = executor.get_region(r)
+        if region is not None:
+            if r == 1:
+                region_start = len(all_data)
+            all_data.extend(region.region_data)
+    transceiver = MockTransceiverRawData(all_data)
+
+    def get_connections(proj):
+        return numpy.concatenate(
+            synaptic_matrices.get_connections_from_machine(
+                transceiver, post_vertex_placement, proj._projection_edge,
+                proj._synapse_information))
+
+    # Pretend the run changed the whole synaptic matrix region
+    region_size = len(executor.get_region(1).region_data)
+    all_data[region_start:region_start + region_size] = bytes(region_size)
+    assert len(get_connections(proj_changed)) == 0
+
+    # Only the changed projection is written back
+    assert synaptic_matrices.mark_changed(
+        {proj_changed._synapse_information})
+    synaptic_matrices.write_changed_synaptic_data(
+        transceiver, post_vertex_placement)
+    connections = get_connections(proj_changed)
+    assert len(connections) == 100
+    assert all(connections["weight"] == 1.5)
+    assert all(connections["delay"] == 1.0)
+    assert len(get_connections(proj_unchanged)) == 0
+
+
 def test_set_synapse_dynamics():
     unittest_setup()
     p.setup(1.0)
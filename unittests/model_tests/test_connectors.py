@@ -17,6 +17,7 @@ import functools
 import numpy
 import pytest
 import random
+from pyNN.random import NumpyRNG
 from pacman.model.graphs.common import Slice
 from spynnaker.pyNN.config_setup import unittest_setup
 from spynnaker.pyNN.models.neural_projections.connectors import (
@@ -176,3 +177,43 @@ def test_connectors(
             print(max_delay, matrix_max_delay, synaptic_block["delay"])
     print(connector, n_pre, n_post, n_in_slice, max_row_length,
           max_source, max_col_length, max_target)
+
+
+@pytest.mark.parametrize("n, with_replacement", [
+    (3, False), (45, False), (49, False), (10, True)])
+def test_fixed_number_pre_without_self(n, with_replacement):
+    unittest_setup()
+    n_neurons = 50
+    population = MockPopulation(n_neurons, "Pop")
+    synapse_info = SynapseInformation(
+        connector=None, pre_population=population,
+        post_population=population, prepop_is_view=False,
+        postpop_is_view=False, rng=None, synapse_dynamics=None,
+        synapse_type=None, is_virtual_machine=False, weights=5, delays=1)
+    blocks = list()
+    for seed in (1, 1, 2):
+        connector = FixedNumberPreConnector(
+            n, allow_self_connections=False,
+            with_replacement=with_replacement, rng=NumpyRNG(seed))
+        connector.set_projection_information(synapse_info)
+        slices = [Slice(0, 19), Slice(20, 39), Slice(40, 49)]
+        block = numpy.concatenate([
+            connector.create_synaptic_block(
+                slices, slices, pre_slice, post_slice, 0, synapse_info)
+            for post_slice in slices for pre_slice in slices])
+        blocks.append(block)
+
+        # Each post-neuron has n pre-neurons, never itself, and different
+        # ones unless with replacement
+        assert numpy.array_equal(
+            numpy.bincount(block["target"], minlength=n_neurons),
+            numpy.full(n_neurons, n))
+        assert not numpy.any(block["source"] == block["target"])
+        if not with_replacement:
+            assert len(numpy.unique(
+                block["target"] * n_neurons + block["source"])) == len(block)
+
+    # The same seed gives the same connections; when all the other neurons
+    # are chosen, every seed does
+    assert numpy.array_equal(blocks[0], blocks[1])
+    assert numpy.array_equal(blocks[0], blocks[2]) == (n == n_neurons - 1)
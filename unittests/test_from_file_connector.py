@@ -21,6 +21,7 @@ from spynnaker.pyNN.models.neural_projections.connectors import (
     FromFileConnector)
 from unittests.mocks import MockPopulation
 from spynnaker.pyNN.models.neural_projections import SynapseInformation
+from spynnaker.pyNN.utilities.connection_file import ConnectionFileWriter
 import spynnaker8
 
 # NO unittest_setup() as sim.setup is called
@@ -99,3 +100,63 @@ def test_connector(
         [pre_slice], [post_slice], pre_slice, post_slice, 1, synapse_info)
     assert(numpy.array_equal(block["weight"], numpy.array(expected_weights)))
     assert(numpy.array_equal(block["delay"], numpy.array(expected_delays)))
+
+
+def test_numpy_file():
+    spynnaker8.setup()
+    clist = numpy.array([(0, 0, 0.5, 1), (1, 1, 1.5, 2), (2, 2, 2.5, 3)])
+    temp = tempfile.NamedTemporaryFile(suffix=".npy", delete=False)
+    with temp as f:
+        numpy.save(f, clist)
+
+    connector = FromFileConnector(temp.name, compact=True)
+    assert numpy.array_equal(connector.conn_list, clist)
+
+    pre_slice = Slice(0, 10)
+    post_slice = Slice(0, 10)
+    synapse_info = SynapseInformation(
+        connector=None, pre_population=MockPopulation(10, "Pre"),
+        post_population=MockPopulation(10, "Post"), prepop_is_view=False,
+        postpop_is_view=False, rng=None, synapse_dynamics=None,
+        synapse_type=None, is_virtual_machine=False, weights=5, delays=1)
+    block = connector.create_synaptic_block(
+        [pre_slice], [post_slice], pre_slice, post_slice, 1, synapse_info)
+    assert numpy.array_equal(block["weight"], [0.5, 1.5, 2.5])
+    assert numpy.array_equal(block["delay"], [1, 2, 3])
+
+
+def test_connection_file():
+    spynnaker8.setup()
+    temp = tempfile.NamedTemporaryFile(suffix=".spyconn", delete=False)
+    temp.close()
+    with ConnectionFileWriter(
+            temp.name, [("i", "uint32"), ("j", "uint32"),
+                        ("weight", "float64"), ("delay", "float64")]) as w:
+        # Written in blocks, as when saved a core at a time
+        block = numpy.zeros(2, dtype=w.dtype)
+        block["i"] = [0, 1]
+        block["j"] = [0, 1]
+        block["weight"] = [0.5, 1.5]
+        block["delay"] = [1, 2]
+        w.write(block)
+        w.write(numpy.array(
+            [(2, 2, 2.5, 3)], dtype=[("i", "uint32"), ("j", "uint32"),
+                                     ("weight", "float32"),
+                                     ("delay", "float32")]))
+
+    connector = FromFileConnector(temp.name)
+    assert connector.column_names is None
+    assert numpy.array_equal(
+        connector.conn_list, [(0, 0, 0.5, 1), (1, 1, 1.5, 2), (2, 2, 2.5, 3)])
+
+    pre_slice = Slice(0, 10)
+    post_slice = Slice(0, 10)
+    synapse_info = SynapseInformation(
+        connector=None, pre_population=MockPopulation(10, "Pre"),
+        post_population=MockPopulation(10, "Post"), prepop_is_view=False,
+        postpop_is_view=False, rng=None, synapse_dynamics=None,
+        synapse_type=None, is_virtual_machine=False, weights=5, delays=1)
+    block = connector.create_synaptic_block(
+        [pre_slice], [post_slice], pre_slice, post_slice, 1, synapse_info)
+    assert numpy.array_equal(block["weight"], [0.5, 1.5, 2.5])
+    assert numpy.array_equal(block["delay"], [1, 2, 3])
@@ -31,6 +31,12 @@ def mock_spikes(_self):
          [2, 45], [2, 76]])
 
 
+def mock_spikes_unsorted(_self):
+    return numpy.array(
+        [[2, 45], [0, 7], [1, 8], [0, 20], [1, 20], [0, 24], [0, 34],
+         [0, 53], [1, 53], [0, 67], [2, 76], [0, 77]])
+
+
 def mock_v_all(_self, _variable):
     indexes = [0, 1, 2, 3]
     data = numpy.empty((100, 4))
@@ -121,6 +127,23 @@ class TestGetting(BaseTestCase):
 
         sim.end()
 
+    def test_get_spikes_unsorted(self):
+        sim.setup(timestep=1.0)
+        pop = sim.Population(4, sim.IF_curr_exp(), label="a label")
+        pop.record("spikes")
+
+        Recorder.get_spikes = mock_spikes_unsorted
+        get_simulator().get_current_time = mock_time
+
+        neo = pop.get_data("spikes")
+        spikes = neo_convertor.convert_spikes(neo)
+        assert numpy.array_equal(spikes, mock_spikes(None))
+        spiketrains = neo.segments[0].spiketrains
+        assert 4 == len(spiketrains)
+        assert 0 == len(spiketrains[3])
+
+        sim.end()
+
     def test_get_spikes_by_view(self):
         sim.setup(timestep=1.0)
         pop = sim.Population(4, sim.IF_curr_exp(), label="a label")
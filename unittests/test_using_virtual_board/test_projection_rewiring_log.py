@@ -0,0 +1,104 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from pacman.model.graphs.common import Slice
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+import spynnaker8 as p
+from spinnaker_testbase import BaseTestCase
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
+
+
+def _structural():
+    return p.StructuralMechanismStatic(
+        partner_selection=p.RandomSelection(),
+        formation=p.DistanceDependentFormation([1, 1], 1.0),
+        elimination=p.RandomByWeightElimination(2.0, 0, 0),
+        f_rew=1000, initial_weight=2.0, initial_delay=1.0,
+        s_max=4, seed=0, weight=0.0, delay=1.0)
+
+
+def _connections(sources, targets):
+    conns = numpy.zeros(
+        len(sources), dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    conns["source"] = sources
+    conns["target"] = targets
+    return conns
+
+
+class _SynapseInfo(object):
+    # Another projection with the same synapse dynamics
+    def __init__(self, synapse_dynamics):
+        self.synapse_dynamics = synapse_dynamics
+
+
+class _Edge(object):
+    def __init__(self, post_vertex):
+        self.post_vertex = post_vertex
+
+
+class TestProjectionRewiringLog(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def test_get_rewiring_log(self):
+        p.setup(timestep=1.0, min_delay=1.0)
+        stim = p.Population(10, p.SpikeSourceArray(spike_times=[]))
+        pop = p.Population(10, p.IF_curr_exp())
+        proj = p.Projection(
+            stim, pop, p.FromListConnector([]), _structural())
+        static_proj = p.Projection(
+            stim, pop, p.OneToOneConnector(), p.StaticSynapse())
+
+        # Not recording rewires
+        with self.assertRaises(ConfigurationException):
+            proj.get_rewiring_log()
+        pop.record("rewiring")
+
+        # Not structural, even though another projection is
+        with self.assertRaises(ConfigurationException):
+            static_proj.get_rewiring_log()
+
+        # No initial connections
+        log = proj.get_rewiring_log()
+        self.assertEqual(log.n_connections_at(0), 0)
+        self.assertEqual(log.n_events, 0)
+
+        # Only the connections of this projection to this population count
+        synapse_info = proj._synapse_information
+        dynamics = synapse_info.synapse_dynamics
+        edge = proj._projection_edge
+        dynamics.set_connections(
+            _connections([3, 1], [2, 0]), Slice(0, 4), edge, synapse_info,
+            None)
+        dynamics.set_connections(
+            _connections([0], [7]), Slice(5, 9), edge, synapse_info, None)
+        dynamics.set_connections(
+            _connections([5], [5]), Slice(5, 9), edge,
+            _SynapseInfo(dynamics), None)
+        dynamics.set_connections(
+            _connections([6], [6]), Slice(0, 4),
+            _Edge(stim._vertex), synapse_info, None)
+        sources, targets = proj.get_rewiring_log().connections_at(0)
+        self.assertEqual(
+            list(zip(sources.tolist(), targets.tolist())),
+            [(0, 7), (1, 0), (3, 2)])
+
+        # The rewires of two structural projections cannot be told apart
+        p.Projection(stim, pop, p.FromListConnector([]), _structural())
+        with self.assertRaises(ConfigurationException):
+            proj.get_rewiring_log()
+        p.end()
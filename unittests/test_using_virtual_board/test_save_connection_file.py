@@ -0,0 +1,76 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import numpy
+import spynnaker8 as sim
+from spinnaker_testbase import BaseTestCase
+from spynnaker.pyNN.utilities.connection_file import read_connection_file
+
+CONNECTIONS = [
+    (0, 1, 1.5, 2.0), (0, 3, 0.5, 1.0), (2, 0, 2.0, 4.0), (3, 3, 1.0, 3.0)]
+
+
+class TestSaveConnectionFile(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def check_file(self, filename, names):
+        connections = read_connection_file(filename)
+        self.assertEqual(connections.dtype.names, ("i", "j") + names)
+        self.assertEqual(connections.dtype["i"], numpy.dtype("<u4"))
+        self.assertEqual(connections.dtype["j"], numpy.dtype("<u4"))
+        for name in names:
+            self.assertEqual(connections.dtype[name], numpy.dtype("<f8"))
+        order = numpy.lexsort((connections["j"], connections["i"]))
+        expected = numpy.array(CONNECTIONS)
+        self.assertTrue(numpy.array_equal(
+            connections["i"][order], expected[:, 0]))
+        self.assertTrue(numpy.array_equal(
+            connections["j"][order], expected[:, 1]))
+        for name, column in (("weight", 2), ("delay", 3)):
+            if name in names:
+                self.assertTrue(numpy.allclose(
+                    connections[name][order], expected[:, column],
+                    atol=0.01))
+
+    def test_save_and_load(self):
+        directory = tempfile.mkdtemp()
+        before = os.path.join(directory, "before.spyconn")
+        after = os.path.join(directory, "after.spyconn")
+
+        sim.setup(1.0)
+        pre = sim.Population(4, sim.IF_curr_exp(), label="pre")
+        post = sim.Population(4, sim.IF_curr_exp(), label="post")
+        proj = sim.Projection(
+            pre, post, sim.FromListConnector(
+                CONNECTIONS, column_names=["weight", "delay"]))
+
+        # Saved before the run, so written once the connections are made
+        proj.save(["weight", "delay"], before)
+        sim.run(0)
+        self.check_file(before, ("weight", "delay"))
+        proj.save("weight", after)
+        self.check_file(after, ("weight", ))
+
+        # The file can be used to make the same connections again
+        connector = sim.FromFileConnector(before)
+        conn_list = numpy.asarray(connector.conn_list)
+        self.assertEqual(conn_list.shape, (len(CONNECTIONS), 4))
+        order = numpy.lexsort((conn_list[:, 1], conn_list[:, 0]))
+        self.assertTrue(numpy.allclose(
+            conn_list[order], CONNECTIONS, atol=0.01))
+        sim.end()
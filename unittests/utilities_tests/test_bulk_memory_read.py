@@ -0,0 +1,84 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import threading
+from spinn_utilities.config_holder import set_config
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.utilities.bulk_memory_read import (
+    MemoryRead, coalesce_reads, read_memory_in_bulk)
+
+
+class _Transceiver(object):
+    """ Memory where each byte is its address plus x and y, modulo 256
+    """
+
+    def __init__(self):
+        self.reads = list()
+        self.__lock = threading.Lock()
+
+    def read_memory(self, x, y, address, size):
+        with self.__lock:
+            self.reads.append((x, y, address, size))
+        return bytearray((a + x + y) % 256 for a in range(
+            address, address + size))
+
+
+class _Chip(object):
+    def __init__(self, x, y):
+        # Boards of 8 x 8 chips
+        self.nearest_ethernet_x = x - x % 8
+        self.nearest_ethernet_y = y - y % 8
+
+
+class _Machine(object):
+    def get_chip_at(self, x, y):
+        return _Chip(x, y)
+
+
+def _read(x, y, address, size, received):
+    return MemoryRead(
+        x, y, address, size,
+        lambda data: received.append(((x, y, address), bytes(data))))
+
+
+def test_coalesce_reads():
+    unittest_setup()
+    received = list()
+    reads = [_read(0, 0, 100, 10, received), _read(0, 0, 0, 10, received),
+             _read(0, 0, 10, 5, received), _read(0, 0, 12, 2, received),
+             _read(0, 1, 15, 5, received), _read(0, 0, 50, 0, received)]
+    merged = [block for block, _ in coalesce_reads(reads)]
+    # Adjacent and overlapping reads of a chip merge; empty reads go
+    assert merged == [(0, 0, 0, 15), (0, 0, 100, 10), (0, 1, 15, 5)]
+
+
+def test_read_memory_in_bulk():
+    unittest_setup()
+    set_config("Simulation", "n_synaptic_read_threads", 4)
+    transceiver = _Transceiver()
+    received = list()
+    reads = [_read(0, 0, 0, 8, received), _read(0, 0, 8, 8, received),
+             _read(0, 0, 4, 4, received), _read(8, 0, 0, 8, received),
+             _read(0, 8, 32, 4, received)]
+    n_reads = read_memory_in_bulk(transceiver, reads, _Machine())
+    assert n_reads == 3
+    assert sorted(transceiver.reads) == [
+        (0, 0, 0, 16), (0, 8, 32, 4), (8, 0, 0, 8)]
+
+    # Each read gets just its own part of the data
+    assert len(received) == len(reads)
+    for (x, y, address), data in received:
+        assert data[0] == (address + x + y) % 256
+    assert sorted(len(data) for _, data in received) == [4, 4, 8, 8, 8]
@@ -0,0 +1,65 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+from tempfile import mkdtemp
+import numpy
+import pytest
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.utilities.connection_file import (
+    ConnectionFileWriter, is_connection_file, read_connection_file)
+
+
+def test_round_trip():
+    unittest_setup()
+    filename = os.path.join(mkdtemp(), "test.spyconn")
+    assert is_connection_file(filename)
+    fields = [("i", "uint32"), ("j", "uint32"), ("weight", "float64")]
+    with ConnectionFileWriter(filename, fields) as writer:
+        for start in range(0, 100, 30):
+            block = numpy.zeros(min(30, 100 - start), dtype=writer.dtype)
+            block["i"] = numpy.arange(start, start + len(block))
+            block["j"] = block["i"] % 7
+            block["weight"] = block["i"] * 0.25
+            writer.write(block)
+        assert writer.n_connections == 100
+    connections = read_connection_file(filename)
+    assert isinstance(connections, numpy.memmap)
+    assert connections.dtype.names == ("i", "j", "weight")
+    assert numpy.array_equal(connections["i"], numpy.arange(100))
+    assert numpy.array_equal(connections["j"], numpy.arange(100) % 7)
+    assert numpy.array_equal(connections["weight"], numpy.arange(100) * 0.25)
+
+
+def test_empty_and_bad_files():
+    unittest_setup()
+    directory = mkdtemp()
+    filename = os.path.join(directory, "empty.spyconn")
+    with ConnectionFileWriter(filename, [("i", "uint32"), ("j", "uint32")]):
+        pass
+    assert len(read_connection_file(filename)) == 0
+
+    # A file cut short part way through a connection is not read
+    with open(filename, "ab") as f:
+        f.write(b"\0" * 5)
+    with pytest.raises(ConfigurationException):
+        read_connection_file(filename)
+
+    filename = os.path.join(directory, "text.spyconn")
+    with open(filename, "w") as f:
+        f.write("0 0 1.0 1.0\n")
+    with pytest.raises(ConfigurationException):
+        read_connection_file(filename)
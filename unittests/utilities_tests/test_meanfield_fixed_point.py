@@ -0,0 +1,118 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from data_specification.enums import DataType
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.utilities.meanfield import (
+    FixedPointMeanfield, MeanfieldParameterSweep, benchmark_fixed_point)
+from spynnaker.pyNN.utilities.meanfield.fixed_point import EVENTS
+
+
+def _sweep():
+    return MeanfieldParameterSweep(
+        {"b": [0.0, 20.0], "Ve": [4.0, 9.0]}, Timescale_inv=2.0)
+
+
+def test_accum_arithmetic():
+    unittest_setup()
+    parameters, state = _sweep().get_parameters_and_state()
+    fixed = FixedPointMeanfield(parameters, state, 4, timestep_ms=0.1)
+    # pylint: disable=protected-access
+    one = 1 << 15
+    big = numpy.array([60000 * one], dtype="int64")
+    assert fixed._mul(numpy.array([3]), numpy.array([one // 2]))[0] == 1
+    assert fixed._div(numpy.array([-one]), numpy.array([3 * one]))[0] == \
+        -(one // 3)
+    # wraps rather than saturates
+    assert fixed._add(big, big)[0] < 0
+    assert fixed._div(numpy.array([one]), numpy.array([0]))[0] == 2 ** 31 - 1
+    events = fixed.events
+    assert events["overflow"] == 1
+    assert events["underflow"] == 0
+    assert events["divide_by_zero"] == 1
+
+
+def test_saturate():
+    unittest_setup()
+    parameters, state = _sweep().get_parameters_and_state()
+    fixed = FixedPointMeanfield(
+        parameters, state, 4, timestep_ms=0.1, saturate=True)
+    # pylint: disable=protected-access
+    big = numpy.array([2 ** 30], dtype="int64")
+    assert fixed._add(big, big)[0] == 2 ** 31 - 1
+
+
+def test_erfc_table_large_argument():
+    unittest_setup()
+    parameters, state = _sweep().get_parameters_and_state()
+    fixed = FixedPointMeanfield(
+        parameters, state, 4, timestep_ms=0.1, erfc_mode="table")
+    # pylint: disable=protected-access
+    one = 1 << 15
+    # Beyond about 1028, x * 1 / step would wrap to a small position
+    x = numpy.array([0, 2 * one, 4 * one, 1100 * one, 60000 * one])
+    erfc = fixed._erfc_table(x)
+    assert erfc[0] == one
+    assert 0 < erfc[1] < one
+    assert numpy.array_equal(erfc[2:], [0, 0, 0])
+    assert fixed.events["overflow"] == 0
+
+
+def test_run_format():
+    unittest_setup()
+    parameters, state = _sweep().get_parameters_and_state()
+    fixed = FixedPointMeanfield(
+        parameters, state, 4, timestep_ms=0.1, erfc_mode="rational")
+    results = fixed.run(5, sampling_rate=2, indexes=[0, 3])
+    data, indexes, sampling_interval = results["Ve"]
+    assert data.shape == (3, 2)
+    assert indexes == [0, 3]
+    assert sampling_interval == pytest.approx(0.2)
+    assert list(data[0]) == [4.0, 9.0]
+
+
+def test_fit_data_type_range():
+    unittest_setup()
+    sweep = MeanfieldParameterSweep({"b": [0.0, 20.0]}, p0_exc=2.0)
+    parameters, state = sweep.get_parameters_and_state()
+    with pytest.raises(ConfigurationException):
+        FixedPointMeanfield(parameters, state, 2, timestep_ms=0.1)
+    FixedPointMeanfield(
+        parameters, state, 2, timestep_ms=0.1, fit_data_type=DataType.S1615)
+
+
+def test_benchmark():
+    unittest_setup()
+    sweep = _sweep()
+    parameters, state = sweep.get_parameters_and_state()
+    reports = benchmark_fixed_point(
+        parameters, state, sweep.n_points, 5, {
+            "table": {"erfc_mode": "table"},
+            "rational_s1615": {
+                "erfc_mode": "rational", "fit_data_type": DataType.S1615,
+                "n_steps_per_timestep": 2}},
+        timestep_ms=0.1)
+    assert [report.label for report in reports] == [
+        "table", "rational_s1615"]
+    for report in reports:
+        assert set(report.events) == set(EVENTS)
+        assert set(report.max_error) == {"Ve", "Vi", "w"}
+        for variable, error in report.rms_error.items():
+            assert error <= report.max_error[variable]
+        assert report.fixed_point_rate > 0
+        assert report.reference_rate > 0
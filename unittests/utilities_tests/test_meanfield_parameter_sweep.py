@@ -0,0 +1,63 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.utilities.meanfield import MeanfieldParameterSweep
+
+
+def test_grid_layout():
+    unittest_setup()
+    sweep = MeanfieldParameterSweep(
+        {"b": [0.0, 10.0, 20.0], "tauw": [1.0, 2.0]}, Timescale_inv=2.0)
+    assert sweep.shape == (3, 2)
+    assert sweep.n_points == 6
+    points = sweep.points
+    assert list(points["b"]) == [0.0, 0.0, 10.0, 10.0, 20.0, 20.0]
+    assert list(points["tauw"]) == [1.0, 2.0, 1.0, 2.0, 1.0, 2.0]
+
+
+def test_to_grid():
+    unittest_setup()
+    sweep = MeanfieldParameterSweep({"b": [0.0, 10.0], "tauw": [1.0, 2.0]})
+    # Two samples of units 0, 1 and 3 only
+    data = numpy.array([[0.0, 1.0, 3.0], [10.0, 11.0, 13.0]])
+    result = sweep.to_grid(data, [0, 1, 3], 0.5)
+    assert result.data.shape == (2, 2, 2)
+    assert list(result.data[1, 1]) == [3.0, 13.0]
+    assert numpy.all(numpy.isnan(result.data[1, 0]))
+    assert list(result.axes) == ["b", "tauw"]
+    assert result.sampling_interval == 0.5
+
+
+def test_reference_sweep():
+    unittest_setup()
+    sweep = MeanfieldParameterSweep(
+        {"b": [0.0, 10.0, 20.0]}, Timescale_inv=2.0)
+    integrator = sweep.create_reference_integrator(
+        timestep_ms=0.1, erfc_mode="exact")
+    result = sweep.to_grid(*integrator.run(10)["w"])
+    assert result.data.shape == (3, 10)
+    assert numpy.all(numpy.diff(result.data[:, -1]) > 0)
+
+
+def test_bad_parameters():
+    unittest_setup()
+    with pytest.raises(ConfigurationException):
+        MeanfieldParameterSweep({"not_a_parameter": [1.0]})
+    with pytest.raises(ConfigurationException):
+        MeanfieldParameterSweep({"b": [1.0]}, b=2.0)
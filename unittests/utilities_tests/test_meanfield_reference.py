@@ -0,0 +1,88 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neuron.builds import MeanfieldBase
+from spynnaker.pyNN.utilities.meanfield import MeanfieldReferenceIntegrator
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangeDictionary
+
+
+def _meanfield_values(n_units, **changes):
+    defaults = dict(MeanfieldBase.default_parameters)
+    defaults.update(MeanfieldBase.default_initial_values)
+    values = SpynnakerRangeDictionary(n_units)
+    for name, value in defaults.items():
+        values[name] = value
+    values["one_over_DmuV0"] = 1.0 / defaults["DmuV0"]
+    values["one_over_DsV0"] = 1.0 / defaults["DsV0"]
+    values["one_over_DTvN0"] = 1.0 / defaults["DTvN0"]
+    # Keep h * Timescale_inv small enough for the RK2 to be stable
+    values["Timescale_inv"] = 2.0
+    for name, value in changes.items():
+        values[name] = value
+    return values
+
+
+def test_recording_format():
+    unittest_setup()
+    values = _meanfield_values(10)
+    integrator = MeanfieldReferenceIntegrator(
+        values, values, 10, timestep_ms=0.1, erfc_mode="exact")
+    results = integrator.run(25, sampling_rate=10, indexes=[1, 3])
+    data, indexes, sampling_interval = results["Ve"]
+    assert data.shape == (3, 2)
+    assert indexes == [1, 3]
+    assert sampling_interval == 1.0
+    # Recorded before the update, as on the machine
+    assert numpy.all(data[0] == 9.0)
+    assert numpy.all(numpy.isfinite(data))
+
+
+def test_per_unit_parameters():
+    unittest_setup()
+    values = _meanfield_values(4)
+    values["b"] = [0.0, 10.0, 20.0, 40.0]
+    integrator = MeanfieldReferenceIntegrator(
+        values, values, 4, timestep_ms=0.1, erfc_mode="exact")
+    integrator.run(10)
+    w = integrator.state["w"]
+    # w is driven by b * Ve, so it should be ordered by b
+    assert numpy.all(numpy.diff(w) > 0)
+
+
+def test_fast_erfc_modes_match():
+    unittest_setup()
+    values = _meanfield_values(5)
+    results = {}
+    for mode in ("exact", "table", "rational"):
+        integrator = MeanfieldReferenceIntegrator(
+            values, values, 5, timestep_ms=0.1, erfc_mode=mode)
+        results[mode] = integrator.run(50)["Ve"][0]
+    assert numpy.allclose(results["table"], results["exact"], atol=1e-3)
+    assert numpy.allclose(results["rational"], results["exact"], atol=1e-2)
+
+
+def test_adaptive_steps():
+    unittest_setup()
+    values = _meanfield_values(2)
+    values["Timescale_inv"] = [2.0, 50.0]
+    integrator = MeanfieldReferenceIntegrator(
+        values, values, 2, timestep_ms=0.1, n_steps_per_timestep=16,
+        erfc_mode="exact", adaptive_tolerance=0.05)
+    integrator.run(20)
+    n_steps_taken = integrator.n_steps_taken
+    # The stiff unit divides its steps more, within the budget
+    assert 20 <= n_steps_taken[0] < n_steps_taken[1] <= 20 * 16
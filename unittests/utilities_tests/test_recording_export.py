@@ -0,0 +1,76 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from tempfile import mkdtemp
+import numpy
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.utilities.recording_export import (
+    read_event_chunks, read_signal_chunks, read_spike_chunks,
+    write_event_chunks, write_signal_chunks, write_spike_chunks)
+
+
+def test_spikes_round_trip():
+    unittest_setup()
+    directory = mkdtemp()
+    chunks = [(numpy.array([3, 1]), numpy.array([0.0, 1.0])),
+              (numpy.array([], dtype="int64"), numpy.array([])),
+              (numpy.array([1, 0]), numpy.array([0.5, 2.0]))]
+    stats = write_spike_chunks(directory, "spikes", chunks)
+    assert stats.n_chunks == 3
+    assert stats.n_bytes > 0
+    assert stats.bytes_per_second > 0
+    spikes = read_spike_chunks(directory)
+    assert numpy.array_equal(
+        spikes, [[0, 2.0], [1, 0.5], [1, 1.0], [3, 0.0]])
+
+    # A shorter export replaces all of the old one
+    write_spike_chunks(directory, "spikes", chunks[:1])
+    assert len(read_spike_chunks(directory)) == 2
+
+
+def test_signal_round_trip():
+    unittest_setup()
+    directory = mkdtemp()
+    data = numpy.arange(20, dtype="float64").reshape(5, 4)
+    # Two cores, each written in windows of at most 3 rows
+    chunks = [([0, 2], 0, data[0:3, 0:2]), ([0, 2], 3, data[3:5, 0:2]),
+              ([5, 7], 0, data[0:3, 2:4]), ([5, 7], 3, data[3:5, 2:4])]
+    write_signal_chunks(directory, "v", chunks, 0.5)
+    read_data, indexes, times = read_signal_chunks(directory, "v")
+    assert numpy.array_equal(read_data, data)
+    assert numpy.array_equal(indexes, [0, 2, 5, 7])
+    assert numpy.allclose(times, [0.0, 0.5, 1.0, 1.5, 2.0])
+
+
+def test_events_round_trip():
+    unittest_setup()
+    directory = mkdtemp()
+    events = numpy.array([[1.0, 4, 0, 1], [2.0, 1, 8, 0]])
+    write_event_chunks(directory, "rewiring", [events])
+    assert numpy.array_equal(
+        read_event_chunks(directory, "rewiring"), events)
+    assert len(read_event_chunks(directory, "other")) == 0
+
+
+def test_events_merged_in_order():
+    unittest_setup()
+    directory = mkdtemp()
+    events = numpy.array([
+        [1.0, 4, 0, 1], [1.0, 4, 9, 0], [2.0, 1, 8, 0], [3.0, 0, 2, 1]])
+    # Each core writes its own events in order, but not those of others
+    write_event_chunks(
+        directory, "rewiring", [events[[1, 3]], events[[0, 2]]])
+    assert numpy.array_equal(
+        read_event_chunks(directory, "rewiring"), events)
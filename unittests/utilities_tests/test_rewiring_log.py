@@ -0,0 +1,77 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.utilities.rewiring_log import RewiringLog
+
+# Time, pre, post and formation of each event
+_EVENTS = [
+    (1.0, 0, 1, 0),
+    (2.0, 2, 2, 1),
+    (2.0, 2, 2, 1),
+    (4.0, 2, 2, 0),
+    (5.0, 0, 1, 1),
+    (7.0, 1, 0, 0)]
+
+
+@pytest.mark.parametrize("checkpoint_interval", [1, 2, 4, 100])
+def test_connections_at(checkpoint_interval):
+    unittest_setup()
+    log = RewiringLog(
+        [0, 1], [1, 0], _EVENTS, checkpoint_interval=checkpoint_interval)
+    assert log.n_events == len(_EVENTS)
+
+    def connections(time):
+        sources, targets = log.connections_at(time)
+        return list(zip(sources.tolist(), targets.tolist()))
+
+    assert connections(0.0) == [(0, 1), (1, 0)]
+    assert connections(1.0) == [(1, 0)]
+    assert connections(3.0) == [(1, 0), (2, 2), (2, 2)]
+    assert connections(4.5) == [(1, 0), (2, 2)]
+    assert connections(6.0) == [(0, 1), (1, 0), (2, 2)]
+    assert connections(10.0) == [(0, 1), (2, 2)]
+    assert log.n_connections_at(10.0) == 2
+
+
+def test_lifetimes():
+    unittest_setup()
+    log = RewiringLog([0, 1], [1, 0], _EVENTS)
+    assert sorted(log.lifetimes().tolist()) == [1.0, 2.0, 7.0]
+    # Those still there at the end last until it
+    assert sorted(log.lifetimes(10.0).tolist()) == [1.0, 2.0, 5.0, 7.0, 8.0]
+    # Events after the end don't count
+    assert sorted(log.lifetimes(3.0).tolist()) == [1.0, 1.0, 1.0, 3.0]
+    counts, _ = log.lifetime_histogram(bins=[0, 4, 10])
+    assert counts.tolist() == [2, 1]
+
+
+@pytest.mark.parametrize("checkpoint_interval", [1, 100])
+def test_unknown_elimination(checkpoint_interval):
+    unittest_setup()
+    # The formation of (3, 3) was not recorded, so its elimination is
+    # ignored and the connection is there after it is formed again
+    log = RewiringLog(
+        [0], [1], [(1.0, 3, 3, 0), (2.0, 3, 3, 1), (3.0, 0, 1, 0)],
+        checkpoint_interval=checkpoint_interval)
+    sources, targets = log.connections_at(2.0)
+    assert list(zip(sources.tolist(), targets.tolist())) == [
+        (0, 1), (3, 3)]
+    sources, targets = log.connections_at(5.0)
+    assert list(zip(sources.tolist(), targets.tolist())) == [(3, 3)]
+    # Only the broken connection that was there has a lifetime
+    assert log.lifetimes().tolist() == [3.0]
+    assert sorted(log.lifetimes(5.0).tolist()) == [3.0, 3.0]